@@ -0,0 +1,116 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from array import array
+from awslabs.cloudwatch_logs_mcp_server.common import epoch_ms_to_utc_iso
+from collections import Counter
+from typing import Any, Dict, List
+
+
+# Variable tokens replaced by a wildcard when clustering messages into patterns, most specific first
+_VARIABLE_TOKENS = re.compile(
+    r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+    r'|\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?'
+    r'|\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b'
+    r'|\b0x[0-9a-fA-F]+\b'
+    r'|\b(?=[0-9a-fA-F]*\d)[0-9a-fA-F]{8,}\b'
+    r'|-?\b\d+(?:\.\d+)?\b'
+)
+
+ERROR_TERMS = re.compile(r'(?i)(error|exception|fail|timeout|fatal)')
+
+
+def message_pattern(message: str) -> str:
+    """Reduce a log message to a pattern by replacing variable tokens with <*>."""
+    return _VARIABLE_TOKENS.sub('<*>', message.strip())
+
+
+class LogEventAnalyzer:
+    """Incrementally summarizes raw log events as pages of them are read.
+
+    Event timestamps are buffered in a compact array of at most max_events entries for histograms,
+    while pattern, stream and error counts are updated as each page is added so a summary is
+    available at any point without re-scanning events.
+    """
+
+    def __init__(self, max_events: int, histogram_bin_seconds: int):
+        """Create an analyzer that buffers at most max_events events."""
+        self.max_events = max_events
+        self.histogram_bin_ms = histogram_bin_seconds * 1000
+        self.timestamps = array('q')
+        self.patterns: List[str] = []
+        self.samples: List[str] = []
+        self.streams: List[str] = []
+        self._pattern_index: Dict[str, int] = {}
+        self._stream_index: Dict[str, int] = {}
+        self.pattern_counts: Counter = Counter()
+        self.error_pattern_counts: Counter = Counter()
+        self.stream_counts: Counter = Counter()
+
+    @property
+    def full(self) -> bool:
+        """Whether the buffer has reached max_events."""
+        return len(self.timestamps) >= self.max_events
+
+    def add(self, events: List[Dict[str, Any]]) -> int:
+        """Add a page of filter_log_events events, returning how many were buffered."""
+        added = 0
+        for event in events:
+            if self.full:
+                break
+            message = event.get('message', '')
+            pattern = message_pattern(message)
+            pattern_id = self._pattern_index.get(pattern)
+            if pattern_id is None:
+                pattern_id = self._pattern_index[pattern] = len(self.patterns)
+                self.patterns.append(pattern)
+                self.samples.append(message)
+            stream = event.get('logStreamName', '')
+            stream_id = self._stream_index.get(stream)
+            if stream_id is None:
+                stream_id = self._stream_index[stream] = len(self.streams)
+                self.streams.append(stream)
+
+            self.timestamps.append(event.get('timestamp', 0))
+            self.pattern_counts[pattern_id] += 1
+            self.stream_counts[stream_id] += 1
+            if ERROR_TERMS.search(message):
+                self.error_pattern_counts[pattern_id] += 1
+            added += 1
+        return added
+
+    def top_patterns(self, k: int, errors_only: bool = False) -> List[Dict[str, Any]]:
+        """Return the k most common patterns in the same shape as cleaned up Insights pattern results."""
+        counts = self.error_pattern_counts if errors_only else self.pattern_counts
+        return [
+            {
+                '@pattern': self.patterns[pattern_id],
+                '@sampleCount': count,
+                '@logSamples': [self.samples[pattern_id]],
+            }
+            for pattern_id, count in counts.most_common(k)
+        ]
+
+    def top_log_streams(self, k: int) -> Dict[str, int]:
+        """Return the k log streams with the most events."""
+        return {
+            self.streams[stream_id]: count
+            for stream_id, count in self.stream_counts.most_common(k)
+        }
+
+    def histogram(self) -> Dict[str, int]:
+        """Return event counts per histogram bin, keyed by the ISO 8601 start of each bin."""
+        bins = Counter(ts - ts % self.histogram_bin_ms for ts in self.timestamps)
+        return {epoch_ms_to_utc_iso(start): bins[start] for start in sorted(bins)}
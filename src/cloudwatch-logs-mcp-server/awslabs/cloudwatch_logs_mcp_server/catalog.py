@@ -0,0 +1,121 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from awslabs.cloudwatch_logs_mcp_server.models import LogGroupMetadata, SavedQuery
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+
+# Sorts after every character that can appear in a log group name, so prefix + this bounds a prefix range
+_PREFIX_RANGE_END = chr(0x10FFFF)
+
+
+class _LogGroupIndex:
+    """Log groups of one describe scope, kept sorted by name for prefix range lookups."""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.log_groups: List[LogGroupMetadata] = []
+        # Prefixes that have been fully listed, with the time they were listed
+        self.refreshed: Dict[str, float] = {}
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        return (
+            bisect_left(self.names, prefix),
+            bisect_left(self.names, prefix + _PREFIX_RANGE_END),
+        )
+
+
+class LogGroupCatalog:
+    """In-memory catalog of log groups and saved query definitions with TTL based refresh.
+
+    Log groups are indexed per describe scope (account identifiers and whether linked accounts are
+    included) in name order, so any name prefix maps to a contiguous range found by binary search.
+    Refreshes are incremental: listing a prefix only replaces the log groups under that prefix, and
+    a fresh listing of a prefix also serves every longer prefix beneath it.
+    """
+
+    def __init__(self, ttl_seconds: float = 300):
+        """Create a catalog whose entries are refreshed after ttl_seconds."""
+        self.ttl_seconds = ttl_seconds
+        self._indexes: Dict[Tuple, _LogGroupIndex] = {}
+        self._saved_queries: Optional[List[SavedQuery]] = None
+        self._saved_queries_refreshed = 0.0
+
+    def _is_live(self, refreshed: float) -> bool:
+        return time.monotonic() - refreshed < self.ttl_seconds
+
+    def is_fresh(self, scope: Tuple, prefix: str) -> bool:
+        """Return whether log groups under prefix in scope can be served without listing them."""
+        index = self._indexes.get(scope)
+        if index is None:
+            return False
+        return any(
+            prefix.startswith(listed) and self._is_live(refreshed)
+            for listed, refreshed in index.refreshed.items()
+        )
+
+    def update(self, scope: Tuple, prefix: str, log_groups: List[LogGroupMetadata]):
+        """Replace the log groups under prefix in scope with a complete listing of that prefix."""
+        index = self._indexes.setdefault(scope, _LogGroupIndex())
+        listed = sorted(
+            (lg for lg in log_groups if lg.logGroupName.startswith(prefix)),
+            key=lambda lg: (lg.logGroupName, lg.logGroupArn),
+        )
+        start, end = index.prefix_range(prefix)
+        index.names[start:end] = [lg.logGroupName for lg in listed]
+        index.log_groups[start:end] = listed
+
+        # The new listing supersedes any listing of a longer prefix beneath it
+        index.refreshed = {
+            p: refreshed for p, refreshed in index.refreshed.items() if not p.startswith(prefix)
+        }
+        index.refreshed[prefix] = time.monotonic()
+
+    def search(
+        self,
+        scope: Tuple,
+        prefix: str,
+        log_group_class: Optional[str] = None,
+        max_items: Optional[int] = None,
+    ) -> List[LogGroupMetadata]:
+        """Return the cached log groups in scope under prefix, in name order."""
+        index = self._indexes.get(scope)
+        if index is None:
+            return []
+        start, end = index.prefix_range(prefix)
+        log_groups = [
+            lg
+            for lg in index.log_groups[start:end]
+            if not log_group_class or lg.logGroupClass == log_group_class
+        ]
+        return log_groups[:max_items] if max_items else log_groups
+
+    @property
+    def saved_queries(self) -> Optional[List[SavedQuery]]:
+        """The cached saved query definitions, or None if they need to be listed."""
+        if self._saved_queries is None or not self._is_live(self._saved_queries_refreshed):
+            return None
+        return self._saved_queries
+
+    @saved_queries.setter
+    def saved_queries(self, saved_queries: List[SavedQuery]):
+        self._saved_queries = saved_queries
+        self._saved_queries_refreshed = time.monotonic()
+
+    def clear(self):
+        """Remove all cached log groups and saved queries."""
+        self._indexes.clear()
+        self._saved_queries = None
@@ -14,7 +14,23 @@
 
 import datetime
 import json
-from typing import Dict, List, Set
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+
+# Aggregation functions whose per-slice results can be combined into an exact overall result
+MERGEABLE_AGGREGATIONS = {
+    'count': lambda a, b: a + b,
+    'sum': lambda a, b: a + b,
+    'min': min,
+    'max': max,
+}
+
+# Query windows must have ended at least this long ago before their results are cached, so logs
+# that are still being ingested for the window are not missed
+QUERY_CACHE_MIN_AGE_SECONDS = 300
 
 
 def remove_null_values(d: Dict):
@@ -43,3 +59,241 @@ def clean_up_pattern(pattern_result: List[Dict[str, str]]):
         entry.pop('@visualization', None)
         # limit to 1 sample
         entry['@logSamples'] = json.loads(entry.get('@logSamples', '[]'))[:1]
+
+
+def split_time_range(start: int, end: int, slices: int) -> List[Tuple[int, int]]:
+    """Split an inclusive [start, end] range of epoch seconds into contiguous, non-overlapping slices."""
+    if end <= start:
+        return [(start, end)]
+    slices = max(1, min(slices, end - start + 1))
+    step = (end - start + 1) / slices
+    bounds = [start + round(i * step) for i in range(slices)] + [end + 1]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(slices)]
+
+
+def _scan_query(query_string: str) -> Iterator[Tuple[str, bool]]:
+    """Yield each character of a query along with whether it is inside a string or regex literal."""
+    seen = ''
+    delimiter = None
+    for char in query_string:
+        if delimiter:
+            literal = True
+            if char == delimiter and not seen.endswith('\\'):
+                delimiter = None
+        elif char in '\'"`' or (
+            char == '/' and re.search(r'(\blike|=~)\s*$', seen, re.IGNORECASE)
+        ):
+            delimiter = char
+            literal = True
+        else:
+            literal = False
+        seen += char
+        yield char, literal
+
+
+def split_query_commands(query_string: str) -> List[str]:
+    """Split a Logs Insights query into its piped commands.
+
+    Pipes inside quoted strings and regular expression literals (e.g. ``like /(a|b)/``) are not
+    treated as command separators.
+    """
+    commands = ['']
+    for char, literal in _scan_query(query_string):
+        if char == '|' and not literal:
+            commands.append('')
+        else:
+            commands[-1] += char
+    return [command.strip() for command in commands if command.strip()]
+
+
+def normalize_query(query_string: str) -> str:
+    """Normalize a Logs Insights query by collapsing whitespace outside of string and regex literals."""
+    normalized = []
+    for command in split_query_commands(query_string):
+        text = ''
+        previous_space = False
+        for char, literal in _scan_query(command):
+            space = char.isspace() and not literal
+            if not (space and previous_space):
+                text += ' ' if space else char
+            previous_space = space
+        normalized.append(text)
+    return ' | '.join(normalized)
+
+
+def _split_top_level(text: str, separator: str = ',') -> List[str]:
+    """Split text on a separator, ignoring separators nested inside parentheses."""
+    parts = []
+    depth = 0
+    current = ''
+    for char in text:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if char == separator and depth == 0:
+            parts.append(current.strip())
+            current = ''
+        else:
+            current += char
+    parts.append(current.strip())
+    return [part for part in parts if part]
+
+
+def _output_name(expression: str) -> Tuple[str, str]:
+    """Return the (expression, output field name) of a stats term, honouring an `as` alias."""
+    match = re.match(r'^(.*?)\s+as\s+(\S+)$', expression, re.IGNORECASE)
+    if match:
+        return match.group(1).strip(), match.group(2).strip()
+    return expression, expression
+
+
+def parse_stats_command(command: str) -> Optional[Dict[str, Any]]:
+    """Parse a `stats` command into its aggregations and grouping fields.
+
+    Returns None if the command is not a stats command. Each aggregation is described by its
+    function name and output field name; grouping fields are described by their output field names.
+    """
+    match = re.match(r'^stats\s+(.*)$', command, re.IGNORECASE | re.DOTALL)
+    if not match:
+        return None
+
+    body = match.group(1)
+    by_match = re.search(r'\s+by\s+(?![^(]*\))', body, re.IGNORECASE)
+    aggregation_text, group_text = (
+        (body[: by_match.start()], body[by_match.end() :]) if by_match else (body, '')
+    )
+
+    aggregations = []
+    for term in _split_top_level(aggregation_text):
+        expression, name = _output_name(term)
+        function = expression.split('(', 1)[0].strip().lower()
+        aggregations.append({'function': function, 'field': name})
+
+    group_fields = [_output_name(term)[1] for term in _split_top_level(group_text)]
+    return {'aggregations': aggregations, 'group_fields': group_fields}
+
+
+def parse_sort_command(command: str) -> Optional[List[Tuple[str, bool]]]:
+    """Parse a `sort` command into a list of (field, descending) pairs, or None if not a sort."""
+    match = re.match(r'^sort\s+(.*)$', command, re.IGNORECASE | re.DOTALL)
+    if not match:
+        return None
+    keys = []
+    for term in _split_top_level(match.group(1)):
+        parts = term.split()
+        keys.append((parts[0], len(parts) > 1 and parts[1].lower() == 'desc'))
+    return keys
+
+
+def parse_limit_command(command: str) -> Optional[int]:
+    """Parse a `limit` command into its row count, or None if not a limit."""
+    match = re.match(r'^limit\s+(\d+)$', command, re.IGNORECASE)
+    return int(match.group(1)) if match else None
+
+
+def _sort_value(value: Any) -> Tuple[int, Any]:
+    """Sort key that orders numbers numerically, then strings, then missing values."""
+    if value is None:
+        return (2, '')
+    try:
+        return (0, float(value))
+    except (TypeError, ValueError):
+        return (1, str(value))
+
+
+def sort_results(
+    results: List[Dict[str, Any]], keys: List[Tuple[str, bool]]
+) -> List[Dict[str, Any]]:
+    """Sort result rows by the given (field, descending) keys, applying the least significant key first."""
+    for field, descending in reversed(keys):
+        present = [row for row in results if row.get(field) is not None]
+        missing = [row for row in results if row.get(field) is None]
+        results = sorted(present, key=lambda row: _sort_value(row[field]), reverse=descending)
+        results += missing
+    return results
+
+
+def _to_number(value: Any) -> float:
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+def merge_stats_results(
+    slice_results: List[List[Dict[str, Any]]], stats: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Re-aggregate the results of the same stats query run over several time slices.
+
+    Rows are combined on their grouping fields and each aggregation is combined with its
+    function from MERGEABLE_AGGREGATIONS.
+    """
+    merged: Dict[Tuple, Dict[str, Any]] = {}
+    for rows in slice_results:
+        for row in rows:
+            key = tuple(row.get(field) for field in stats['group_fields'])
+            if key not in merged:
+                merged[key] = dict(row)
+                continue
+            target = merged[key]
+            for aggregation in stats['aggregations']:
+                field = aggregation['field']
+                if row.get(field) is None:
+                    continue
+                if target.get(field) is None:
+                    target[field] = row[field]
+                    continue
+                combine = MERGEABLE_AGGREGATIONS[aggregation['function']]
+                try:
+                    target[field] = str(combine(_to_number(target[field]), _to_number(row[field])))
+                except ValueError:
+                    # min/max over non-numeric values such as timestamps compare as strings
+                    target[field] = combine(str(target[field]), str(row[field]))
+    return list(merged.values())
+
+
+class QueryResultCache:
+    """Bounded LRU cache of completed Logs Insights query responses.
+
+    Only queries whose time window is fully in the past are cached, since their results can no
+    longer change. Entries are keyed on the normalized query, log groups, absolute time range and
+    limit.
+    """
+
+    def __init__(self, max_entries: int = 100):
+        """Create a cache holding at most max_entries responses."""
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Tuple, Dict] = OrderedDict()
+
+    @staticmethod
+    def key(start_query_kwargs: Dict) -> Optional[Tuple]:
+        """Return the cache key for start_query arguments, or None if the results may still change."""
+        if start_query_kwargs['endTime'] > time.time() - QUERY_CACHE_MIN_AGE_SECONDS:
+            return None
+        return (
+            normalize_query(start_query_kwargs['queryString']),
+            tuple(sorted(start_query_kwargs.get('logGroupNames') or [])),
+            tuple(sorted(start_query_kwargs.get('logGroupIdentifiers') or [])),
+            start_query_kwargs['startTime'],
+            start_query_kwargs['endTime'],
+            start_query_kwargs.get('limit'),
+        )
+
+    def get(self, key: Tuple) -> Optional[Dict]:
+        """Return the cached response for key, if any."""
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: Tuple, response: Dict):
+        """Cache a completed response, evicting the least recently used entry if full."""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached responses."""
+        self._entries.clear()
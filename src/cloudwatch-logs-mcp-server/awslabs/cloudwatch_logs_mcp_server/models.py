@@ -185,6 +185,29 @@ class LogAnalysisResult(BaseModel):
     )
 
 
+class LogEventsAnalysisResult(BaseModel):
+    """Result of analyzing raw log events locally."""
+
+    events_analyzed: int = Field(..., description='Number of log events read and analyzed')
+    truncated: bool = Field(
+        ...,
+        description='True if more events matched than max_events, so only the earliest events were analyzed',
+    )
+    top_patterns: List[Dict[str, Any]] = Field(
+        ..., description='Most common message patterns, with their counts and one sample message'
+    )
+    top_patterns_containing_errors: List[Dict[str, Any]] = Field(
+        ...,
+        description='Most common patterns for messages containing error-related terms',
+    )
+    top_log_streams: Dict[str, int] = Field(
+        ..., description='Log streams with the most events, with their event counts'
+    )
+    histogram: Dict[str, int] = Field(
+        ..., description='Event counts per time bin, keyed by the ISO 8601 start of each bin'
+    )
+
+
 class CancelQueryResult(BaseModel):
     """Result of canceling a query."""
 
@@ -19,10 +19,22 @@ import boto3
 import datetime
 import os
 from awslabs.cloudwatch_logs_mcp_server import MCP_SERVER_VERSION
+from awslabs.cloudwatch_logs_mcp_server.analytics import LogEventAnalyzer
+from awslabs.cloudwatch_logs_mcp_server.catalog import LogGroupCatalog
 from awslabs.cloudwatch_logs_mcp_server.common import (
+    MERGEABLE_AGGREGATIONS,
+    QueryResultCache,
     clean_up_pattern,
+    epoch_ms_to_utc_iso,
     filter_by_prefixes,
+    merge_stats_results,
+    parse_limit_command,
+    parse_sort_command,
+    parse_stats_command,
     remove_null_values,
+    sort_results,
+    split_query_commands,
+    split_time_range,
 )
 from awslabs.cloudwatch_logs_mcp_server.models import (
     AnomalyDetector,
@@ -30,6 +42,7 @@ from awslabs.cloudwatch_logs_mcp_server.models import (
     LogAnalysisResult,
     LogAnomaly,
     LogAnomalyResults,
+    LogEventsAnalysisResult,
     LogGroupMetadata,
     LogMetadata,
     SavedQuery,
@@ -39,7 +52,7 @@ from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
 from timeit import default_timer as timer
-from typing import Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 
 mcp = FastMCP(
@@ -66,6 +79,102 @@ except Exception as e:
     logger.error(f'Error creating cloudwatch logs client: {str(e)}')
     raise
 
+# Completed results of queries over windows fully in the past, reused when a query is re-run
+query_result_cache = QueryResultCache(
+    max_entries=int(os.environ.get('CLOUDWATCH_LOGS_QUERY_CACHE_SIZE', '100'))
+)
+
+# Log groups and saved queries, re-listed once older than the TTL
+log_group_catalog = LogGroupCatalog(
+    ttl_seconds=float(os.environ.get('CLOUDWATCH_LOGS_CATALOG_TTL_SECONDS', '300'))
+)
+
+# Listings filling the catalog in the background after a capped answer, by scope and prefix
+catalog_fills: Dict[Tuple, asyncio.Task] = {}
+
+# Polling starts fast so short queries return promptly, then backs off up to this interval
+POLL_INITIAL_INTERVAL_SECONDS = 0.5
+POLL_MAX_INTERVAL_SECONDS = 5.0
+
+
+def format_query_results(response: Dict) -> List[Dict[str, str]]:
+    """Flatten the field/value pairs of a get_query_results response into one dictionary per row."""
+    return [
+        {field['field']: field['value'] for field in line} for line in response.get('results', [])
+    ]
+
+
+async def wait_for_query(query_id: str, max_timeout: float) -> Optional[Dict]:
+    """Poll a Logs Insights query until it finishes.
+
+    The polling interval grows gently while the query statistics show records still being scanned,
+    and doubles while the query is queued or making no progress.
+
+    Returns the final get_query_results response, or None if the query did not finish within
+    max_timeout seconds.
+    """
+    poll_start = timer()
+    interval = POLL_INITIAL_INTERVAL_SECONDS
+    records_scanned = None
+    while poll_start + max_timeout > timer():
+        response = await asyncio.to_thread(logs_client.get_query_results, queryId=query_id)
+        if response['status'] in {'Complete', 'Failed', 'Cancelled'}:
+            logger.info(f'Query {query_id} finished with status {response["status"]}')
+            return response
+
+        scanned = response.get('statistics', {}).get('recordsScanned')
+        growth = 1.25 if scanned and scanned != records_scanned else 2
+        records_scanned = scanned
+
+        remaining = poll_start + max_timeout - timer()
+        await asyncio.sleep(max(0, min(interval, remaining)))
+        interval = min(interval * growth, POLL_MAX_INTERVAL_SECONDS)
+
+    return None
+
+
+async def run_query(
+    start_query_kwargs: Dict, max_timeout: float, stop_unfinished: bool = False
+) -> Tuple[str, Optional[Dict]]:
+    """Start a Logs Insights query and wait for it to finish.
+
+    Completed results for windows fully in the past are served from, and saved to, the query
+    result cache so identical re-runs are not billed again. With stop_unfinished, a query that
+    does not finish in time, or whose polling fails or is cancelled, is stopped.
+
+    Returns the query ID and the final get_query_results response, or None if the query did not
+    finish within max_timeout seconds.
+    """
+    start_query_kwargs = remove_null_values(start_query_kwargs)
+    cache_key = QueryResultCache.key(start_query_kwargs)
+    if cache_key is not None:
+        cached = query_result_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f'Using cached results of query {cached["queryId"]}')
+            return cached['queryId'], cached
+
+    start_response = await asyncio.to_thread(logs_client.start_query, **start_query_kwargs)
+    query_id = start_response['queryId']
+    logger.info(f'Started query with ID: {query_id}')
+
+    response = None
+    try:
+        response = await wait_for_query(query_id, max_timeout)
+    finally:
+        if stop_unfinished and response is None:
+            await stop_query(query_id)
+    if cache_key is not None and response is not None and response['status'] == 'Complete':
+        query_result_cache.put(cache_key, {**response, 'queryId': query_id})
+    return query_id, response
+
+
+async def stop_query(query_id: str) -> None:
+    """Stop a Logs Insights query that is no longer waited for, ignoring queries that have ended."""
+    try:
+        await asyncio.to_thread(logs_client.stop_query, queryId=query_id)
+    except Exception as e:
+        logger.info(f'Could not stop query {query_id}: {str(e)}')
+
 
 @mcp.tool(name='describe_log_groups')
 async def describe_log_groups_tool(
@@ -121,27 +230,31 @@ async def describe_log_groups_tool(
             - logGroupArn: The Amazon Resource Name (ARN) of the log group. This version of the ARN doesn't include a trailing :* after the log group name.
         Any saved queries that are applicable to the returned log groups are also included.
     """
-
-    def describe_log_groups() -> List[LogGroupMetadata]:
+    scope = (tuple(sorted(account_identifiers or [])), bool(include_linked_accounts))
+    prefix = log_group_name_prefix or ''
+
+    def describe_log_groups(
+        log_group_class: Optional[str] = None, max_items: Optional[int] = None
+    ) -> List[LogGroupMetadata]:
+        # Without a class or max_items, every log group under the prefix is listed, so the listing
+        # is complete and can serve later calls from the catalog
         paginator = logs_client.get_paginator('describe_log_groups')
         kwargs = {
             'accountIdentifiers': account_identifiers,
             'includeLinkedAccounts': include_linked_accounts,
             'logGroupNamePrefix': log_group_name_prefix,
             'logGroupClass': log_group_class,
+            'PaginationConfig': {'MaxItems': max_items} if max_items else None,
         }
 
-        if max_items:
-            kwargs['PaginationConfig'] = {'MaxItems': max_items}
-
         log_groups = []
         for page in paginator.paginate(**remove_null_values(kwargs)):
             log_groups.extend(page.get('logGroups', []))
 
-        logger.info(f'Log groups: {log_groups}')
+        logger.info(f'Listed {len(log_groups)} log groups with prefix {prefix!r}')
         return [LogGroupMetadata.model_validate(lg) for lg in log_groups]
 
-    def get_filtered_saved_queries(log_groups: List[LogGroupMetadata]) -> List[SavedQuery]:
+    def describe_query_definitions() -> List[SavedQuery]:
         saved_queries = []
         next_token = None
 
@@ -157,20 +270,47 @@ async def describe_log_groups_tool(
                 break
 
         logger.info(f'Saved queries: {saved_queries}')
-        modeled_queries = [SavedQuery.model_validate(saved_query) for saved_query in saved_queries]
+        return [SavedQuery.model_validate(saved_query) for saved_query in saved_queries]
 
+    def get_filtered_saved_queries(
+        saved_queries: List[SavedQuery], log_groups: List[LogGroupMetadata]
+    ) -> List[SavedQuery]:
         log_group_targets = {lg.logGroupName for lg in log_groups}
         # filter to only saved queries applicable to log groups we're looking at
         return [
             query
-            for query in modeled_queries
+            for query in saved_queries
             if (query.logGroupNames & log_group_targets)
             or filter_by_prefixes(log_group_targets, query.logGroupPrefixes)
         ]
 
+    async def fill_catalog():
+        try:
+            log_group_catalog.update(scope, prefix, await asyncio.to_thread(describe_log_groups))
+        except Exception as e:
+            logger.warning(f'Failed to list log groups with prefix {prefix!r}: {str(e)}')
+        finally:
+            catalog_fills.pop((scope, prefix), None)
+
     try:
-        log_groups = describe_log_groups()
-        filtered_saved_queries = get_filtered_saved_queries(log_groups)
+        if log_group_catalog.is_fresh(scope, prefix):
+            log_groups = log_group_catalog.search(scope, prefix, log_group_class, max_items)
+        elif max_items:
+            # Answer from a listing capped at max_items and fill the catalog in the background, so
+            # a small lookup isn't held up by listing every log group under the prefix
+            log_groups = await asyncio.to_thread(describe_log_groups, log_group_class, max_items)
+            if (scope, prefix) not in catalog_fills:
+                catalog_fills[(scope, prefix)] = asyncio.create_task(fill_catalog())
+        else:
+            log_group_catalog.update(scope, prefix, await asyncio.to_thread(describe_log_groups))
+            log_groups = log_group_catalog.search(scope, prefix, log_group_class, max_items)
+
+        saved_queries = log_group_catalog.saved_queries
+        if saved_queries is None:
+            saved_queries = await asyncio.to_thread(describe_query_definitions)
+            log_group_catalog.saved_queries = saved_queries
+
+        filtered_saved_queries = get_filtered_saved_queries(saved_queries, log_groups)
         return LogMetadata(log_group_metadata=log_groups, saved_queries=filtered_saved_queries)
 
     except Exception as e:
@@ -229,27 +369,38 @@ async def analyze_log_group_tool(
         # Must be for this log group
         return log_group_arn in anomaly.logGroupArnList
 
-    async def get_applicable_anomalies() -> LogAnomalyResults:
+    def list_detectors() -> List[AnomalyDetector]:
         detectors: List[AnomalyDetector] = []
         paginator = logs_client.get_paginator('list_log_anomaly_detectors')
         for page in paginator.paginate(filterLogGroupArn=log_group_arn):
             detectors.extend(
                 [AnomalyDetector.model_validate(d) for d in page.get('anomalyDetectors', [])]
             )
+        return detectors
 
-        logger.info(f'Found {len(detectors)} anomaly detectors for log group')
-
-        # 2 & 3. Get and filter anomalies for each detector
+    def list_anomalies(detector: AnomalyDetector) -> List[LogAnomaly]:
         anomalies: List[LogAnomaly] = []
-        for detector in detectors:
-            paginator = logs_client.get_paginator('list_anomalies')
+        paginator = logs_client.get_paginator('list_anomalies')
+        for page in paginator.paginate(
+            anomalyDetectorArn=detector.anomalyDetectorArn, suppressionState='UNSUPPRESSED'
+        ):
+            anomalies.extend(
+                LogAnomaly.model_validate(anomaly) for anomaly in page.get('anomalies', [])
+            )
+        return anomalies
+
+    async def get_applicable_anomalies() -> LogAnomalyResults:
+        # boto3 is synchronous, so run paginators in worker threads to keep the event loop free
+        # for the Insights queries running alongside this coroutine.
+        detectors = await asyncio.to_thread(list_detectors)
+
+        logger.info(f'Found {len(detectors)} anomaly detectors for log group')
 
-            for page in paginator.paginate(
-                anomalyDetectorArn=detector.anomalyDetectorArn, suppressionState='UNSUPPRESSED'
-            ):
-                anomalies.extend(
-                    LogAnomaly.model_validate(anomaly) for anomaly in page.get('anomalies', [])
-                )
+        # 2 & 3. Get and filter anomalies for each detector, fanning out across detectors
+        anomalies_per_detector = await asyncio.gather(
+            *(asyncio.to_thread(list_anomalies, detector) for detector in detectors)
+        )
+        anomalies = [anomaly for batch in anomalies_per_detector for anomaly in batch]
 
         applicable_anomalies = [anomaly for anomaly in anomalies if is_applicable_anomaly(anomaly)]
         logger.info(
@@ -259,7 +410,10 @@ async def analyze_log_group_tool(
         return LogAnomalyResults(anomaly_detectors=detectors, anomalies=applicable_anomalies)
 
     try:
-        # Convert input times to timestamps for comparison
+        # Validate the time window up front so malformed input fails before any API calls are made
+        datetime.datetime.fromisoformat(start_time)
+        datetime.datetime.fromisoformat(end_time)
+
         # 1. Get anomaly detectors for this log group
 
         log_anomaly_results, pattern_query_result, error_pattern_result = await asyncio.gather(
@@ -301,6 +455,114 @@ async def analyze_log_group_tool(
         raise
 
 
+@mcp.tool(name='analyze_log_events')
+async def analyze_log_events_tool(
+    ctx: Context,
+    log_group_identifier: str = Field(
+        ...,
+        description='The name or ARN of the log group to read events from. If the log group is in a source account and you are using a monitoring account, you must use the ARN.',
+    ),
+    start_time: str = Field(
+        ...,
+        description=(
+            'ISO 8601 formatted start time of the events to analyze (e.g., "2025-04-19T20:00:00+00:00").'
+        ),
+    ),
+    end_time: str = Field(
+        ...,
+        description=(
+            'ISO 8601 formatted end time of the events to analyze (e.g., "2025-04-19T21:00:00+00:00").'
+        ),
+    ),
+    log_stream_names: Optional[List[str]] = Field(
+        None,
+        max_length=100,
+        description='Up to 100 log stream names to read events from. If omitted, all streams in the log group are read.',
+    ),
+    filter_pattern: Optional[str] = Field(
+        None,
+        description='A CloudWatch Logs filter pattern to select events, see https://docs.aws.amazon.com/AmazonCloudWatch/latest/logs/FilterAndPatternSyntax.html.',
+    ),
+    max_events: int = Field(
+        10000,
+        ge=1,
+        le=100000,
+        description='The maximum number of events to read and analyze.',
+    ),
+    top_k: int = Field(
+        10,
+        ge=1,
+        le=100,
+        description='The number of patterns and log streams to return.',
+    ),
+    histogram_bin_seconds: int = Field(
+        60,
+        ge=1,
+        description='The width in seconds of each histogram bin.',
+    ),
+) -> LogEventsAnalysisResult:
+    """Reads raw log events and analyzes them locally for common message patterns, busiest log streams and event volume over time.
+
+    Events are streamed page by page with FilterLogEvents and summarized incrementally as each page arrives, up to max_events.
+    Unlike Logs Insights queries this is not billed per GB scanned, so it is faster and cheaper for narrow reads, such as a few
+    log streams, a short time window, or a selective filter_pattern. Prefer execute_log_insights_query for broad scans of large
+    log groups.
+
+    Usage: Use this tool to quickly summarize what a specific set of log streams has been logging, for example to find the most
+    frequent errors from one task or instance during an incident.
+
+    Returns:
+    --------
+    A LogEventsAnalysisResult object containing:
+        - events_analyzed: Number of events read
+        - truncated: Whether more events matched than max_events
+        - top_patterns: The top_k most common message patterns, each with @pattern, @sampleCount and one @logSamples entry
+        - top_patterns_containing_errors: The top_k most common patterns containing error-related terms
+            (error, exception, fail, timeout, fatal)
+        - top_log_streams: The top_k log streams with the most events
+        - histogram: Event counts per histogram_bin_seconds bin
+    """
+    try:
+        kwargs = {
+            'logGroupIdentifier': log_group_identifier,
+            'startTime': int(datetime.datetime.fromisoformat(start_time).timestamp() * 1000),
+            'endTime': int(datetime.datetime.fromisoformat(end_time).timestamp() * 1000),
+            'logStreamNames': log_stream_names,
+            'filterPattern': filter_pattern,
+        }
+
+        analyzer = LogEventAnalyzer(max_events, histogram_bin_seconds)
+        pages = iter(
+            logs_client.get_paginator('filter_log_events').paginate(**remove_null_values(kwargs))
+        )
+        truncated = False
+        # Fetch each page off the event loop and fold it into the summary before requesting the
+        # next, so memory stays bounded by max_events rather than by the size of the log group
+        while (page := await asyncio.to_thread(next, pages, None)) is not None:
+            events = page.get('events', [])
+            if analyzer.add(events) < len(events):
+                truncated = True
+            await ctx.report_progress(len(analyzer.timestamps), max_events)
+            if analyzer.full:
+                truncated = truncated or bool(page.get('nextToken'))
+                break
+
+        logger.info(f'Analyzed {len(analyzer.timestamps)} log events')
+        return LogEventsAnalysisResult(
+            events_analyzed=len(analyzer.timestamps),
+            truncated=truncated,
+            top_patterns=analyzer.top_patterns(top_k),
+            top_patterns_containing_errors=analyzer.top_patterns(top_k, errors_only=True),
+            top_log_streams=analyzer.top_log_streams(top_k),
+            histogram=analyzer.histogram(),
+        )
+
+    except Exception as e:
+        logger.error(f'Error in analyze_log_events_tool: {str(e)}')
+        await ctx.error(f'Error analyzing log events: {str(e)}')
+        raise
+
+
 @mcp.tool(name='execute_log_insights_query')
 async def execute_log_insights_query_tool(
     ctx: Context,
@@ -381,29 +643,14 @@ async def execute_log_insights_query_tool(
             )
             raise
 
-        start_response = logs_client.start_query(**remove_null_values(kwargs))
-        query_id = start_response['queryId']
-        logger.info(f'Started query with ID: {query_id}')
-
-        # Seconds
-        poll_start = timer()
-        while poll_start + max_timeout > timer():
-            response = logs_client.get_query_results(queryId=query_id)
-            status = response['status']
-
-            if status in {'Complete', 'Failed', 'Cancelled'}:
-                logger.info(f'Query {query_id} finished with status {status}')
-                return {
-                    'queryId': query_id,
-                    'status': status,
-                    'statistics': response.get('statistics', {}),
-                    'results': [
-                        {field['field']: field['value'] for field in line}
-                        for line in response.get('results', [])
-                    ],
-                }
-
-            await asyncio.sleep(1)
+        query_id, response = await run_query(kwargs, max_timeout)
+        if response is not None:
+            return {
+                'queryId': query_id,
+                'status': response['status'],
+                'statistics': response.get('statistics', {}),
+                'results': format_query_results(response),
+            }
 
         msg = f'Query {query_id} did not complete within {max_timeout} seconds. Use get_query_results with the returned queryId to try again to retrieve query results.'
         logger.warning(msg)
@@ -420,6 +667,236 @@ async def execute_log_insights_query_tool(
         raise
 
 
+@mcp.tool(name='execute_sliced_log_insights_query')
+async def execute_sliced_log_insights_query_tool(
+    ctx: Context,
+    log_group_names: Optional[List[str]] = Field(
+        None,
+        max_length=50,
+        description='The list of up to 50 log group names to be queried. CRITICAL: Exactly one of [log_group_names, log_group_identifiers] should be non-null.',
+    ),
+    log_group_identifiers: Optional[List[str]] = Field(
+        None,
+        max_length=50,
+        description="The list of up to 50 logGroupIdentifiers to query. You can specify them by the log group name or ARN. If a log group that you're querying is in a source account and you're using a monitoring account, you must use the ARN. CRITICAL: Exactly one of [log_group_names, log_group_identifiers] should be non-null.",
+    ),
+    start_time: str = Field(
+        ...,
+        description=(
+            'ISO 8601 formatted start time for the CloudWatch Logs Insights query window (e.g., "2025-04-19T20:00:00+00:00").'
+        ),
+    ),
+    end_time: str = Field(
+        ...,
+        description=(
+            'ISO 8601 formatted end time for the CloudWatch Logs Insights query window (e.g., "2025-04-19T21:00:00+00:00").'
+        ),
+    ),
+    query_string: str = Field(
+        ...,
+        description='The query string in the Cloudwatch Log Insights Query Language. See https://docs.aws.amazon.com/AmazonCloudWatch/latest/logs/CWL_QuerySyntax.html.',
+    ),
+    limit: Optional[int] = Field(
+        None,
+        description='The maximum number of merged results to return. It is critical to use either this parameter or a `| limit <int>` operator in the query to avoid consuming too many tokens of the agent.',
+    ),
+    slice_count: int = Field(
+        4,
+        ge=1,
+        le=100,
+        description='The number of equal time slices to split the query window into. Each slice runs as its own query.',
+    ),
+    max_concurrent_queries: int = Field(
+        5,
+        ge=1,
+        le=30,
+        description='The maximum number of slice queries to run at once. Keep this below the account quota for concurrent Logs Insights queries.',
+    ),
+    max_timeout: int = Field(
+        120,
+        description='Maximum time in seconds to wait for all slices to complete before returning the results gathered so far. Slice queries still running then are stopped.',
+    ),
+) -> Dict:
+    """Executes a CloudWatch Logs Insights query over a long time window by splitting it into time slices run in parallel.
+
+    IMPORTANT: The operation must include exactly one of the following parameters: log_group_names, or log_group_identifiers.
+
+    Each slice is subject to its own 10,000 result cap, so this tool can return complete results over ranges where a single
+    execute_log_insights_query call would be truncated. Progress is reported as slices complete.
+
+    Results of all slices are merged:
+        - Queries without a stats command are re-sorted by the query's sort command (or by @timestamp descending) and limited.
+        - Queries with a single stats command using only count, sum, min and max, followed by nothing but sort and limit
+          commands, are re-aggregated across slices, then sorted and limited. Those trailing sort and limit commands are
+          applied after merging rather than per slice.
+        - Other stats queries (e.g. avg, pct, count_distinct, or stats followed by filter, fields or eval) cannot be
+          re-aggregated exactly. Their per-slice rows are returned with an @slice field identifying the slice start time.
+
+    Usage: Use instead of execute_log_insights_query when querying days of high-volume logs, for example:
+
+    ```
+    filter @message like /Exception/
+    | stats count(*) as exceptionCount by bin(1h)
+    | sort exceptionCount desc
+    ```
+
+    Returns:
+    --------
+        A dictionary containing the merged query results, including:
+            - status: Complete if every slice completed, Partial if only some did, otherwise Failed
+            - results: The merged results
+            - statistics: Query performance statistics summed over all slices
+            - slices: The time range, queryId, status, result count and any error of each slice
+            - message: Any informational messages about how the results were merged
+    """
+    try:
+        if bool(log_group_names) == bool(log_group_identifiers):
+            await ctx.error(
+                'Exactly one of log_group_names or log_group_identifiers must be provided'
+            )
+            raise ValueError(
+                'Exactly one of log_group_names or log_group_identifiers must be provided'
+            )
+
+        start = int(datetime.datetime.fromisoformat(start_time).timestamp())
+        end = int(datetime.datetime.fromisoformat(end_time).timestamp())
+
+        commands = split_query_commands(query_string)
+        stats_indexes = [i for i, c in enumerate(commands) if parse_stats_command(c) is not None]
+        stats = parse_stats_command(commands[stats_indexes[0]]) if stats_indexes else None
+        trailing_start = stats_indexes[-1] + 1 if stats_indexes else 0
+        mergeable = (
+            stats is not None
+            and len(stats_indexes) == 1
+            and all(
+                aggregation['function'] in MERGEABLE_AGGREGATIONS
+                for aggregation in stats['aggregations']
+            )
+            and all(
+                parse_sort_command(command) is not None or parse_limit_command(command) is not None
+                for command in commands[trailing_start:]
+            )
+        )
+
+        # Sort and limit commands after the final stats command must see the merged rows, so
+        # re-aggregatable queries run without them and they are applied once slices are merged.
+        slice_commands = commands[:trailing_start]
+        sort_keys: Optional[List] = None
+        row_limit = limit
+        for command in commands[trailing_start:]:
+            keys = parse_sort_command(command)
+            count = parse_limit_command(command)
+            if keys is not None:
+                sort_keys = keys
+            elif count is not None:
+                row_limit = min(row_limit, count) if row_limit else count
+            if not mergeable or (keys is None and count is None):
+                slice_commands.append(command)
+
+        time_slices = split_time_range(start, end, slice_count)
+        semaphore = asyncio.Semaphore(max_concurrent_queries)
+        deadline = timer() + max_timeout
+        completed = 0
+
+        async def run_slice(slice_start: int, slice_end: int) -> Dict[str, Any]:
+            nonlocal completed
+            slice_info: Dict[str, Any] = {
+                'startTime': epoch_ms_to_utc_iso(slice_start * 1000),
+                'endTime': epoch_ms_to_utc_iso(slice_end * 1000),
+            }
+            try:
+                async with semaphore:
+                    if timer() >= deadline:
+                        slice_info.update(status='Not Started', results=[])
+                        return slice_info
+
+                    kwargs = {
+                        'startTime': slice_start,
+                        'endTime': slice_end,
+                        'queryString': ' | '.join(slice_commands),
+                        'logGroupIdentifiers': log_group_identifiers,
+                        'logGroupNames': log_group_names,
+                        'limit': None if mergeable else limit,
+                    }
+                    # Nobody collects the results of a query abandoned at the deadline or on
+                    # cancellation, so it is stopped rather than left running
+                    query_id, response = await run_query(
+                        kwargs, deadline - timer(), stop_unfinished=True
+                    )
+            except Exception as e:
+                # One failing slice (e.g. throttling) doesn't abort the others
+                logger.warning(f'Slice {slice_info["startTime"]} failed: {str(e)}')
+                slice_info.update(status='Failed', error=str(e), results=[])
+            else:
+                slice_info['queryId'] = query_id
+                if response is None:
+                    slice_info.update(status='Polling Timeout', results=[])
+                else:
+                    slice_info.update(
+                        status=response['status'],
+                        statistics=response.get('statistics', {}),
+                        results=format_query_results(response),
+                    )
+
+            completed += 1
+            await ctx.report_progress(completed, len(time_slices))
+            await ctx.info(
+                f'Slice {slice_info["startTime"]} to {slice_info["endTime"]} finished with status '
+                f'{slice_info["status"]} and {len(slice_info["results"])} results'
+            )
+            return slice_info
+
+        slice_infos = await asyncio.gather(*(run_slice(s, e) for s, e in time_slices))
+
+        message = None
+        if mergeable and stats is not None:
+            results = merge_stats_results([info['results'] for info in slice_infos], stats)
+        else:
+            results = []
+            for info in slice_infos:
+                for row in info['results']:
+                    results.append({**row, '@slice': info['startTime']} if stats else row)
+            if stats:
+                message = 'Stats results could not be re-aggregated across slices; results are per slice.'
+            elif sort_keys is None:
+                sort_keys = [('@timestamp', True)]
+
+        if sort_keys:
+            results = sort_results(results, sort_keys)
+        if row_limit:
+            results = results[:row_limit]
+
+        statistics: Dict[str, float] = {}
+        for info in slice_infos:
+            for key, value in info.pop('statistics', {}).items():
+                statistics[key] = statistics.get(key, 0) + value
+        statuses = [info['status'] for info in slice_infos]
+        if all(status == 'Complete' for status in statuses):
+            status = 'Complete'
+        elif 'Complete' in statuses:
+            status = 'Partial'
+        else:
+            status = 'Failed'
+
+        for info in slice_infos:
+            info['resultCount'] = len(info.pop('results'))
+
+        result = {
+            'status': status,
+            'statistics': statistics,
+            'results': results,
+            'slices': slice_infos,
+        }
+        if message:
+            result['message'] = message
+        return result
+
+    except Exception as e:
+        logger.error(f'Error in execute_sliced_log_insights_query_tool: {str(e)}')
+        await ctx.error(f'Error executing sliced CloudWatch Logs Insights query: {str(e)}')
+        raise
+
+
 @mcp.tool(name='get_query_results')
 async def get_query_results_tool(
     ctx: Context,
@@ -442,7 +919,7 @@ async def get_query_results_tool(
             - messages: Any informational messages about the query
     """
     try:
-        response = logs_client.get_query_results(queryId=query_id)
+        response = await asyncio.to_thread(logs_client.get_query_results, queryId=query_id)
 
         logger.info(f'Retrieved results for query ID {query_id}')
 
@@ -450,10 +927,7 @@ async def get_query_results_tool(
             'queryId': query_id,
             'status': response['status'],
             'statistics': response.get('statistics', {}),
-            'results': [
-                {field['field']: field['value'] for field in line}
-                for line in response.get('results', [])
-            ],
+            'results': format_query_results(response),
         }
     except Exception as e:
         logger.error(f'Error in get_query_results_tool: {str(e)}')
@@ -479,7 +953,7 @@ async def cancel_query_tool(
         A CancelQueryResult with a "success" key, which is True if the query was successfully cancelled.
     """
     try:
-        response = logs_client.stop_query(queryId=query_id)
+        response = await asyncio.to_thread(logs_client.stop_query, queryId=query_id)
         return CancelQueryResult.model_validate(response)
     except Exception as e:
         logger.error(f'Error in get_query_results_tool: {str(e)}')
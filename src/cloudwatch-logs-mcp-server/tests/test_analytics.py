@@ -0,0 +1,84 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the cloudwatch-logs MCP Server local log analytics."""
+
+from awslabs.cloudwatch_logs_mcp_server.analytics import LogEventAnalyzer, message_pattern
+
+
+class TestMessagePattern:
+    """Tests for message_pattern."""
+
+    def test_variable_tokens_are_masked(self):
+        """Test numbers, ids, addresses and timestamps are replaced with wildcards."""
+        assert (
+            message_pattern(
+                '2025-01-01T00:00:00.123Z request 3f2b8c1e-0a4d-4b7e-9c1a-2b3c4d5e6f70 '
+                'from 10.0.0.12:443 took 35.2 ms (0xdeadbeef)'
+            )
+            == '<*> request <*> from <*> took <*> ms (<*>)'
+        )
+
+    def test_words_are_kept(self):
+        """Test plain words, including hex-looking words without digits, are kept."""
+        assert message_pattern('  Added cafebabe facade  ') == 'Added cafebabe facade'
+
+
+class TestLogEventAnalyzer:
+    """Tests for LogEventAnalyzer."""
+
+    def test_incremental_summary(self):
+        """Test patterns, streams and histogram accumulate across pages."""
+        analyzer = LogEventAnalyzer(max_events=100, histogram_bin_seconds=60)
+        analyzer.add(
+            [
+                {'timestamp': 0, 'logStreamName': 'a', 'message': 'user 1 logged in'},
+                {'timestamp': 1000, 'logStreamName': 'a', 'message': 'user 2 logged in'},
+            ]
+        )
+        analyzer.add(
+            [
+                {'timestamp': 61000, 'logStreamName': 'b', 'message': 'ERROR timeout after 30s'},
+                {'timestamp': 62000, 'logStreamName': 'a', 'message': 'user 3 logged in'},
+            ]
+        )
+
+        assert analyzer.top_patterns(1) == [
+            {
+                '@pattern': 'user <*> logged in',
+                '@sampleCount': 3,
+                '@logSamples': ['user 1 logged in'],
+            }
+        ]
+        assert analyzer.top_patterns(5, errors_only=True) == [
+            {
+                '@pattern': 'ERROR timeout after 30s',
+                '@sampleCount': 1,
+                '@logSamples': ['ERROR timeout after 30s'],
+            }
+        ]
+        assert analyzer.top_log_streams(5) == {'a': 3, 'b': 1}
+        assert analyzer.histogram() == {
+            '1970-01-01T00:00:00+00:00': 2,
+            '1970-01-01T00:01:00+00:00': 2,
+        }
+
+    def test_buffer_is_bounded(self):
+        """Test events beyond max_events are not added."""
+        analyzer = LogEventAnalyzer(max_events=2, histogram_bin_seconds=60)
+        added = analyzer.add([{'timestamp': i, 'message': f'event {i}'} for i in range(5)])
+
+        assert added == 2
+        assert analyzer.full
+        assert analyzer.top_patterns(5)[0]['@sampleCount'] == 2
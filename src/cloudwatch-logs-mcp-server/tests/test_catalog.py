@@ -0,0 +1,98 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the cloudwatch-logs MCP Server log group catalog."""
+
+from awslabs.cloudwatch_logs_mcp_server.catalog import LogGroupCatalog
+from awslabs.cloudwatch_logs_mcp_server.models import LogGroupMetadata, SavedQuery
+from unittest.mock import patch
+
+
+SCOPE = ((), False)
+
+
+def log_group(name: str, log_group_class: str = 'STANDARD') -> LogGroupMetadata:
+    """Build log group metadata for a name."""
+    return LogGroupMetadata.model_validate(
+        {
+            'logGroupName': name,
+            'creationTime': 0,
+            'metricFilterCount': 0,
+            'storedBytes': 0,
+            'logGroupClass': log_group_class,
+            'logGroupArn': f'arn:aws:logs:us-west-2:123456789012:log-group:{name}',
+        }
+    )
+
+
+def names(log_groups):
+    """Return the names of log groups."""
+    return [lg.logGroupName for lg in log_groups]
+
+
+class TestLogGroupCatalog:
+    """Tests for LogGroupCatalog."""
+
+    def test_prefix_search(self):
+        """Test searching returns the log groups under a prefix in name order."""
+        catalog = LogGroupCatalog()
+        catalog.update(SCOPE, '', [log_group(n) for n in ['/b/2', '/a/1', '/b/1', '/c']])
+
+        assert names(catalog.search(SCOPE, '/b/')) == ['/b/1', '/b/2']
+        assert names(catalog.search(SCOPE, '')) == ['/a/1', '/b/1', '/b/2', '/c']
+        assert names(catalog.search(SCOPE, '', max_items=2)) == ['/a/1', '/b/1']
+        assert catalog.search(SCOPE, '/d') == []
+        assert catalog.search(((), True), '') == []
+
+    def test_class_filter(self):
+        """Test searching can filter by log group class."""
+        catalog = LogGroupCatalog()
+        catalog.update(SCOPE, '', [log_group('/a'), log_group('/b', 'INFREQUENT_ACCESS')])
+
+        assert names(catalog.search(SCOPE, '', 'INFREQUENT_ACCESS')) == ['/b']
+
+    def test_incremental_prefix_refresh(self):
+        """Test refreshing a prefix only replaces the log groups beneath it."""
+        catalog = LogGroupCatalog()
+        catalog.update(SCOPE, '', [log_group(n) for n in ['/a/1', '/b/1', '/b/2', '/c']])
+        catalog.update(SCOPE, '/b/', [log_group('/b/3')])
+
+        assert names(catalog.search(SCOPE, '')) == ['/a/1', '/b/3', '/c']
+
+    def test_freshness_covers_longer_prefixes(self):
+        """Test a fresh listing of a prefix serves longer prefixes until the TTL expires."""
+        catalog = LogGroupCatalog(ttl_seconds=60)
+        assert not catalog.is_fresh(SCOPE, '/a')
+
+        with patch('time.monotonic', return_value=1000):
+            catalog.update(SCOPE, '/a', [log_group('/a/1')])
+        with patch('time.monotonic', return_value=1059):
+            assert catalog.is_fresh(SCOPE, '/a/1')
+            assert not catalog.is_fresh(SCOPE, '/b')
+            assert not catalog.is_fresh(SCOPE, '')
+        with patch('time.monotonic', return_value=1060):
+            assert not catalog.is_fresh(SCOPE, '/a')
+
+    def test_saved_queries_expire(self):
+        """Test saved queries are cached until the TTL expires."""
+        catalog = LogGroupCatalog(ttl_seconds=60)
+        saved_query = SavedQuery.model_validate({'name': 'q', 'queryString': 'fields @message'})
+        assert catalog.saved_queries is None
+
+        with patch('time.monotonic', return_value=1000):
+            catalog.saved_queries = [saved_query]
+        with patch('time.monotonic', return_value=1030):
+            assert catalog.saved_queries == [saved_query]
+        with patch('time.monotonic', return_value=1060):
+            assert catalog.saved_queries is None
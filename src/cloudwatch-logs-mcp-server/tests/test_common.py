@@ -0,0 +1,139 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the cloudwatch-logs MCP Server query helpers."""
+
+from awslabs.cloudwatch_logs_mcp_server.common import (
+    QueryResultCache,
+    merge_stats_results,
+    normalize_query,
+    parse_limit_command,
+    parse_sort_command,
+    parse_stats_command,
+    sort_results,
+    split_query_commands,
+    split_time_range,
+)
+
+
+class TestSplitTimeRange:
+    """Tests for split_time_range."""
+
+    def test_slices_are_contiguous_and_cover_range(self):
+        """Test slices do not overlap and cover the full range."""
+        slices = split_time_range(0, 99, 4)
+        assert slices == [(0, 24), (25, 49), (50, 74), (75, 99)]
+
+    def test_more_slices_than_seconds(self):
+        """Test slice count is capped by the number of seconds in the range."""
+        assert split_time_range(10, 12, 10) == [(10, 10), (11, 11), (12, 12)]
+
+    def test_empty_range(self):
+        """Test a range whose end is not after its start is returned as-is."""
+        assert split_time_range(10, 10, 4) == [(10, 10)]
+
+
+class TestQueryParsing:
+    """Tests for the Logs Insights query parsing helpers."""
+
+    def test_split_ignores_pipes_in_regex_and_strings(self):
+        """Test pipes inside regex literals and strings are not command separators."""
+        query = (
+            'fields @message | filter @message like /(error|fail)/ | filter x = "a|b" | limit 5'
+        )
+        assert split_query_commands(query) == [
+            'fields @message',
+            'filter @message like /(error|fail)/',
+            'filter x = "a|b"',
+            'limit 5',
+        ]
+
+    def test_parse_stats_with_aliases_and_grouping(self):
+        """Test aggregations and grouping fields are named as Insights names result fields."""
+        stats = parse_stats_command('stats count(*) as errors, max(latency) by bin(1h), host')
+        assert stats == {
+            'aggregations': [
+                {'function': 'count', 'field': 'errors'},
+                {'function': 'max', 'field': 'max(latency)'},
+            ],
+            'group_fields': ['bin(1h)', 'host'],
+        }
+
+    def test_parse_non_stats_commands(self):
+        """Test non-matching commands are rejected by each parser."""
+        assert parse_stats_command('fields @message') is None
+        assert parse_sort_command('limit 5') is None
+        assert parse_limit_command('sort @timestamp desc') is None
+
+    def test_parse_sort_and_limit(self):
+        """Test sort keys and limits are parsed."""
+        assert parse_sort_command('sort errors desc, host') == [('errors', True), ('host', False)]
+        assert parse_limit_command('limit 20') == 20
+
+
+class TestMergeResults:
+    """Tests for merging and sorting slice results."""
+
+    def test_merge_stats_results(self):
+        """Test count, sum, min and max are re-aggregated per group."""
+        stats = parse_stats_command(
+            'stats count(*) as c, sum(bytes) as s, min(latency) as lo, max(@timestamp) as t by host'
+        )
+        merged = merge_stats_results(
+            [
+                [
+                    {'host': 'a', 'c': '2', 's': '1.5', 'lo': '10', 't': '2025-01-01 00:00:00'},
+                    {'host': 'b', 'c': '1', 's': '1', 'lo': '3', 't': '2025-01-01 00:00:00'},
+                ],
+                [{'host': 'a', 'c': '3', 's': '2', 'lo': '7', 't': '2025-01-02 00:00:00'}],
+            ],
+            stats,
+        )
+        assert merged == [
+            {'host': 'a', 'c': '5', 's': '3.5', 'lo': '7', 't': '2025-01-02 00:00:00'},
+            {'host': 'b', 'c': '1', 's': '1', 'lo': '3', 't': '2025-01-01 00:00:00'},
+        ]
+
+    def test_sort_results(self):
+        """Test rows sort numerically with missing values last."""
+        rows = [{'n': '10'}, {'n': '9'}, {}, {'n': '11'}]
+        assert sort_results(rows, [('n', True)]) == [{'n': '11'}, {'n': '10'}, {'n': '9'}, {}]
+
+
+class TestQueryResultCache:
+    """Tests for normalize_query and QueryResultCache."""
+
+    def test_normalize_query_keeps_literals(self):
+        """Test whitespace is collapsed outside literals only."""
+        query = 'fields  @message\n|filter @message like /a  b/ |  filter x = "c  d"'
+        assert normalize_query(query) == (
+            'fields @message | filter @message like /a  b/ | filter x = "c  d"'
+        )
+
+    def test_key_requires_past_window(self):
+        """Test only windows that ended a while ago get a cache key."""
+        kwargs = {'queryString': 'fields @message', 'startTime': 0, 'endTime': 3600}
+        assert QueryResultCache.key(kwargs) == ('fields @message', (), (), 0, 3600, None)
+        assert QueryResultCache.key({**kwargs, 'endTime': 2**40}) is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the cache is bounded and evicts the least recently used entry."""
+        cache = QueryResultCache(max_entries=2)
+        cache.put(('a',), {'queryId': 'a'})
+        cache.put(('b',), {'queryId': 'b'})
+        cache.get(('a',))
+        cache.put(('c',), {'queryId': 'c'})
+        assert cache.get(('b',)) is None
+        assert cache.get(('a',)) == {'queryId': 'a'}
+        assert cache.get(('c',)) == {'queryId': 'c'}
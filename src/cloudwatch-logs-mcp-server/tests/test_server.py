@@ -13,8 +13,10 @@
 # limitations under the License.
 """Tests for the cloudwatch-logs MCP Server."""
 
+import asyncio
 import awslabs.cloudwatch_logs_mcp_server.server
 import boto3
+import datetime
 import importlib
 import os
 import pytest
@@ -23,13 +25,16 @@ import sys
 from awslabs.cloudwatch_logs_mcp_server.models import (
     CancelQueryResult,
     LogAnalysisResult,
+    LogEventsAnalysisResult,
     LogMetadata,
 )
 from awslabs.cloudwatch_logs_mcp_server.server import (
+    analyze_log_events_tool,
     analyze_log_group_tool,
     cancel_query_tool,
     describe_log_groups_tool,
     execute_log_insights_query_tool,
+    execute_sliced_log_insights_query_tool,
     get_query_results_tool,
 )
 from moto import mock_aws
@@ -74,8 +79,14 @@ async def logs_client(aws_credentials):
 
         # Patch into the server code
         awslabs.cloudwatch_logs_mcp_server.server.logs_client = client
+        awslabs.cloudwatch_logs_mcp_server.server.query_result_cache.clear()
+        awslabs.cloudwatch_logs_mcp_server.server.log_group_catalog.clear()
         yield client
 
+        # Don't leave catalog fills running against the mocked client
+        for task in awslabs.cloudwatch_logs_mcp_server.server.catalog_fills.values():
+            task.cancel()
+
 
 @pytest.mark.asyncio
 class TestDescribeLogGroups:
@@ -183,6 +194,62 @@ class TestDescribeLogGroups:
         assert len(result.saved_queries) == 1
         assert result.saved_queries[0].logGroupPrefixes == {'/aws/test/group', 'other_prefix'}
 
+    async def test_repeated_describe_uses_catalog(self, ctx, logs_client):
+        """Test repeated calls are served from the catalog without listing again."""
+        for name in ['/aws/test/group1', '/aws/test/group2', '/other/group']:
+            logs_client.create_log_group(logGroupName=name)
+        logs_client.describe_query_definitions = MagicMock(return_value={'queryDefinitions': []})
+        original_get_paginator = logs_client.get_paginator
+        logs_client.get_paginator = MagicMock(side_effect=original_get_paginator)
+
+        for prefix, expected in [('/aws', 2), ('/aws/test/group1', 1), ('/aws', 2)]:
+            result = await describe_log_groups_tool(
+                ctx,
+                account_identifiers=None,
+                include_linked_accounts=None,
+                log_group_class=None,
+                log_group_name_prefix=prefix,
+                max_items=None,
+            )
+            assert len(result.log_group_metadata) == expected
+
+        assert logs_client.get_paginator.call_count == 1
+        assert logs_client.describe_query_definitions.call_count == 1
+
+    async def test_cold_catalog_honors_max_items(self, ctx, logs_client):
+        """Test a cold lookup lists only max_items and fills the catalog in the background."""
+        for i in range(5):
+            logs_client.create_log_group(logGroupName=f'/aws/test/group{i}')
+        logs_client.describe_query_definitions = MagicMock(return_value={'queryDefinitions': []})
+        original_get_paginator = logs_client.get_paginator
+        paginators = []
+
+        def get_paginator(name):
+            paginator = MagicMock(wraps=original_get_paginator(name))
+            paginators.append(paginator)
+            return paginator
+
+        logs_client.get_paginator = get_paginator
+
+        async def describe(max_items):
+            result = await describe_log_groups_tool(
+                ctx,
+                account_identifiers=None,
+                include_linked_accounts=None,
+                log_group_class=None,
+                log_group_name_prefix='/aws',
+                max_items=max_items,
+            )
+            return [lg.logGroupName for lg in result.log_group_metadata]
+
+        assert await describe(2) == ['/aws/test/group0', '/aws/test/group1']
+        assert paginators[0].paginate.call_args.kwargs['PaginationConfig'] == {'MaxItems': 2}
+
+        await asyncio.gather(*awslabs.cloudwatch_logs_mcp_server.server.catalog_fills.values())
+        assert 'PaginationConfig' not in paginators[1].paginate.call_args.kwargs
+        assert len(await describe(None)) == 5
+        assert len(paginators) == 2
+
     async def test_describe_log_groups_exception_handling(self, ctx, logs_client):
         """Test exception handling in describe_log_groups_tool."""
 
@@ -295,6 +362,327 @@ class TestExecuteLogInsightsQuery:
         assert result['status'] == 'Polling Timeout'
         assert 'queryId' in result
 
+    async def test_completed_past_query_is_cached(self, ctx, logs_client):
+        """Test re-running an identical query over a past window reuses the completed results."""
+        start_query = MagicMock(return_value={'queryId': 'query-1'})
+        get_query_results = MagicMock(
+            return_value={
+                'status': 'Complete',
+                'statistics': {},
+                'results': [[{'field': '@message', 'value': 'hello'}]],
+            }
+        )
+        logs_client.start_query = start_query
+        logs_client.get_query_results = get_query_results
+
+        results = []
+        for query in ['fields @message  | limit 1', 'fields @message | limit 1']:
+            result = await execute_log_insights_query_tool(
+                ctx,
+                log_group_names=['/aws/test/cached'],
+                log_group_identifiers=None,
+                start_time='2020-01-01T00:00:00+00:00',
+                end_time='2020-01-01T01:00:00+00:00',
+                query_string=query,
+                limit=None,
+                max_timeout=10,
+            )
+            results.append(result)
+
+        assert start_query.call_count == 1
+        assert get_query_results.call_count == 1
+        assert results[0] == results[1]
+        assert results[1]['queryId'] == 'query-1'
+        # Returned rows are copies, so callers mutating them do not corrupt the cache
+        assert results[0]['results'] is not results[1]['results']
+
+    async def test_recent_query_is_not_cached(self, ctx, logs_client):
+        """Test queries whose window is not fully in the past are always re-run."""
+        start_query = MagicMock(return_value={'queryId': 'query-1'})
+        logs_client.start_query = start_query
+        logs_client.get_query_results = MagicMock(
+            return_value={'status': 'Complete', 'statistics': {}, 'results': []}
+        )
+        now = datetime.datetime.now(datetime.timezone.utc)
+
+        for _ in range(2):
+            await execute_log_insights_query_tool(
+                ctx,
+                log_group_names=['/aws/test/recent'],
+                log_group_identifiers=None,
+                start_time=(now - datetime.timedelta(hours=1)).isoformat(),
+                end_time=now.isoformat(),
+                query_string='fields @message',
+                limit=None,
+                max_timeout=10,
+            )
+
+        assert start_query.call_count == 2
+
+    async def test_polling_backs_off(self, ctx, logs_client, monkeypatch):
+        """Test the polling interval grows while a query is not making progress."""
+        statuses = iter(['Scheduled', 'Scheduled', 'Scheduled', 'Complete'])
+        logs_client.start_query = MagicMock(return_value={'queryId': 'query-1'})
+        logs_client.get_query_results = lambda **kwargs: {
+            'status': next(statuses),
+            'statistics': {'recordsScanned': 0.0},
+            'results': [],
+        }
+        sleeps = []
+
+        async def mock_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(awslabs.cloudwatch_logs_mcp_server.server.asyncio, 'sleep', mock_sleep)
+
+        result = await execute_log_insights_query_tool(
+            ctx,
+            log_group_names=['/aws/test/backoff'],
+            log_group_identifiers=None,
+            start_time='2020-01-01T00:00:00+00:00',
+            end_time='2020-01-01T01:00:00+00:00',
+            query_string='fields @message',
+            limit=None,
+            max_timeout=60,
+        )
+
+        assert result['status'] == 'Complete'
+        assert sleeps == [0.5, 1.0, 2.0]
+
+
+@pytest.mark.asyncio
+class TestExecuteSlicedLogInsightsQuery:
+    """Tests for execute_sliced_log_insights_query_tool."""
+
+    @pytest.fixture
+    def sliced_client(self, logs_client):
+        """Logs client whose queries return canned rows for the slice they cover."""
+        started = []
+
+        def mock_start_query(**kwargs):
+            started.append(kwargs)
+            return {'queryId': str(len(started) - 1)}
+
+        def mock_get_query_results(queryId):
+            kwargs = started[int(queryId)]
+            if 'stats' in kwargs['queryString']:
+                rows = [[{'field': 'host', 'value': 'a'}, {'field': 'c', 'value': '2'}]]
+            else:
+                rows = [[{'field': '@timestamp', 'value': str(kwargs['startTime'])}]]
+            return {
+                'status': 'Complete',
+                'statistics': {'recordsMatched': 1.0, 'bytesScanned': 10.0},
+                'results': rows,
+            }
+
+        logs_client.start_query = mock_start_query
+        logs_client.get_query_results = mock_get_query_results
+        return started
+
+    async def test_events_are_merged_by_timestamp(self, ctx, sliced_client):
+        """Test non-stats results from each slice are merged newest first and limited."""
+        result = await execute_sliced_log_insights_query_tool(
+            ctx,
+            log_group_names=['/aws/test/sliced'],
+            log_group_identifiers=None,
+            start_time='2020-01-01T00:00:00+00:00',
+            end_time='2020-01-01T03:59:59+00:00',
+            query_string='fields @timestamp, @message',
+            limit=3,
+            slice_count=4,
+            max_concurrent_queries=2,
+            max_timeout=10,
+        )
+
+        assert result['status'] == 'Complete'
+        assert len(sliced_client) == 4
+        assert all(kwargs['limit'] == 3 for kwargs in sliced_client)
+        assert [row['@timestamp'] for row in result['results']] == [
+            '1577847600',
+            '1577844000',
+            '1577840400',
+        ]
+        assert result['statistics'] == {'recordsMatched': 4.0, 'bytesScanned': 40.0}
+        assert [s['resultCount'] for s in result['slices']] == [1, 1, 1, 1]
+        assert ctx.report_progress.await_count == 4
+
+    async def test_stats_are_reaggregated(self, ctx, sliced_client):
+        """Test mergeable stats run without trailing sort/limit and are re-aggregated."""
+        result = await execute_sliced_log_insights_query_tool(
+            ctx,
+            log_group_names=['/aws/test/sliced'],
+            log_group_identifiers=None,
+            start_time='2020-01-01T00:00:00+00:00',
+            end_time='2020-01-01T03:59:59+00:00',
+            query_string='stats count(*) as c by host | sort c desc | limit 10',
+            limit=None,
+            slice_count=4,
+            max_concurrent_queries=5,
+            max_timeout=10,
+        )
+
+        assert {kwargs['queryString'] for kwargs in sliced_client} == {
+            'stats count(*) as c by host'
+        }
+        assert result['results'] == [{'host': 'a', 'c': '8'}]
+        assert 'message' not in result
+
+    async def test_non_mergeable_stats_are_returned_per_slice(self, ctx, sliced_client):
+        """Test stats that cannot be re-aggregated are returned per slice with a message."""
+        result = await execute_sliced_log_insights_query_tool(
+            ctx,
+            log_group_names=['/aws/test/sliced'],
+            log_group_identifiers=None,
+            start_time='2020-01-01T00:00:00+00:00',
+            end_time='2020-01-01T01:59:59+00:00',
+            query_string='stats avg(latency) as c by host',
+            limit=None,
+            slice_count=2,
+            max_concurrent_queries=5,
+            max_timeout=10,
+        )
+
+        assert len(result['results']) == 2
+        assert {row['@slice'] for row in result['results']} == {
+            '2020-01-01T00:00:00+00:00',
+            '2020-01-01T01:00:00+00:00',
+        }
+        assert 'message' in result
+
+    async def test_stats_followed_by_other_commands_are_not_merged(self, ctx, sliced_client):
+        """Test stats followed by commands other than sort and limit run unchanged per slice."""
+        result = await execute_sliced_log_insights_query_tool(
+            ctx,
+            log_group_names=['/aws/test/sliced'],
+            log_group_identifiers=None,
+            start_time='2020-01-01T00:00:00+00:00',
+            end_time='2020-01-01T01:59:59+00:00',
+            query_string='stats count(*) as c by host | filter c > 1 | sort c desc | limit 5',
+            limit=None,
+            slice_count=2,
+            max_concurrent_queries=5,
+            max_timeout=10,
+        )
+
+        assert {kwargs['queryString'] for kwargs in sliced_client} == {
+            'stats count(*) as c by host | filter c > 1 | sort c desc | limit 5'
+        }
+        assert [row['c'] for row in result['results']] == ['2', '2']
+        assert 'message' in result
+
+    async def test_slices_running_at_deadline_are_stopped(self, ctx, logs_client, monkeypatch):
+        """Test slice queries still running when the timeout expires are stopped."""
+        logs_client.start_query = MagicMock(side_effect=[{'queryId': 'done'}, {'queryId': 'slow'}])
+        logs_client.get_query_results = lambda queryId: {
+            'status': 'Complete' if queryId == 'done' else 'Running',
+            'statistics': {},
+            'results': [],
+        }
+        logs_client.stop_query = MagicMock(return_value={'success': True})
+
+        async def mock_sleep(seconds):
+            now[0] += seconds
+
+        now = [0.0]
+        monkeypatch.setattr(awslabs.cloudwatch_logs_mcp_server.server.asyncio, 'sleep', mock_sleep)
+        monkeypatch.setattr(awslabs.cloudwatch_logs_mcp_server.server, 'timer', lambda: now[0])
+
+        result = await execute_sliced_log_insights_query_tool(
+            ctx,
+            log_group_names=['/aws/test/sliced'],
+            log_group_identifiers=None,
+            start_time='2020-01-01T00:00:00+00:00',
+            end_time='2020-01-01T01:59:59+00:00',
+            query_string='fields @timestamp',
+            limit=None,
+            slice_count=2,
+            max_concurrent_queries=5,
+            max_timeout=10,
+        )
+
+        assert result['status'] == 'Partial'
+        assert [s['status'] for s in result['slices']] == ['Complete', 'Polling Timeout']
+        logs_client.stop_query.assert_called_once_with(queryId='slow')
+
+    async def test_failed_slice_does_not_abort_others(self, ctx, sliced_client, logs_client):
+        """Test a slice whose query fails to start is reported while the others complete."""
+        start_query = logs_client.start_query
+
+        def mock_start_query(**kwargs):
+            if len(sliced_client) == 1:
+                sliced_client.append(kwargs)
+                raise Exception('LimitExceededException')
+            return start_query(**kwargs)
+
+        logs_client.start_query = mock_start_query
+
+        result = await execute_sliced_log_insights_query_tool(
+            ctx,
+            log_group_names=['/aws/test/sliced'],
+            log_group_identifiers=None,
+            start_time='2020-01-01T00:00:00+00:00',
+            end_time='2020-01-01T02:59:59+00:00',
+            query_string='fields @timestamp',
+            limit=None,
+            slice_count=3,
+            max_concurrent_queries=1,
+            max_timeout=10,
+        )
+
+        assert result['status'] == 'Partial'
+        assert [s['status'] for s in result['slices']] == ['Complete', 'Failed', 'Complete']
+        assert result['slices'][1]['error'] == 'LimitExceededException'
+        assert len(result['results']) == 2
+        assert ctx.report_progress.await_count == 3
+
+    async def test_cancelled_query_stops_running_slices(self, ctx, logs_client):
+        """Test cancelling the tool call stops the slice queries that are running."""
+        logs_client.start_query = MagicMock(side_effect=[{'queryId': 'a'}, {'queryId': 'b'}])
+        logs_client.get_query_results = lambda queryId: {'status': 'Running', 'results': []}
+        logs_client.stop_query = MagicMock(return_value={'success': True})
+
+        task = asyncio.create_task(
+            execute_sliced_log_insights_query_tool(
+                ctx,
+                log_group_names=['/aws/test/sliced'],
+                log_group_identifiers=None,
+                start_time='2020-01-01T00:00:00+00:00',
+                end_time='2020-01-01T01:59:59+00:00',
+                query_string='fields @timestamp',
+                limit=None,
+                slice_count=2,
+                max_concurrent_queries=5,
+                max_timeout=60,
+            )
+        )
+        while logs_client.start_query.call_count < 2:
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert sorted(c.kwargs['queryId'] for c in logs_client.stop_query.call_args_list) == [
+            'a',
+            'b',
+        ]
+
+    async def test_missing_log_groups(self, ctx, sliced_client):
+        """Test exactly one of the log group parameters is required."""
+        with pytest.raises(ValueError):
+            await execute_sliced_log_insights_query_tool(
+                ctx,
+                log_group_names=None,
+                log_group_identifiers=None,
+                start_time='2020-01-01T00:00:00+00:00',
+                end_time='2020-01-01T01:00:00+00:00',
+                query_string='fields @timestamp',
+                limit=10,
+                slice_count=2,
+                max_concurrent_queries=5,
+                max_timeout=10,
+            )
+
 
 @pytest.mark.asyncio
 class TestGetQueryResults:
@@ -502,6 +890,64 @@ class TestAnalyzeLogGroup:
         assert isinstance(result.top_patterns, dict)
         assert isinstance(result.top_patterns_containing_errors, dict)
 
+    async def test_anomalies_from_multiple_detectors(self, ctx, logs_client):
+        """Test anomalies are collected from every detector of the log group."""
+        log_group_name = '/aws/test/multi-detector'
+        logs_client.create_log_group(logGroupName=log_group_name)
+        log_group_arn = f'arn:aws:logs:us-west-2:123456789012:log-group:{log_group_name}'
+        detector_arns = [f'{log_group_arn}:detector:{i}' for i in range(3)]
+
+        def paginate(operation_name, **kwargs):
+            if operation_name == 'list_log_anomaly_detectors':
+                return [
+                    {
+                        'anomalyDetectors': [
+                            {
+                                'anomalyDetectorArn': arn,
+                                'detectorName': arn.rsplit(':', 1)[-1],
+                                'anomalyDetectorStatus': 'ACTIVE',
+                            }
+                            for arn in detector_arns
+                        ]
+                    }
+                ]
+            return [
+                {
+                    'anomalies': [
+                        {
+                            'anomalyDetectorArn': kwargs['anomalyDetectorArn'],
+                            'logGroupArnList': [log_group_arn],
+                            'firstSeen': 1622505600000,
+                            'lastSeen': 1622509200000,
+                            'description': 'Test anomaly description',
+                            'priority': 'HIGH',
+                            'patternRegex': '.*error.*',
+                            'patternString': 'error pattern',
+                            'logSamples': [],
+                            'histogram': {},
+                        }
+                    ]
+                }
+            ]
+
+        logs_client.get_paginator = lambda operation_name: type(
+            'Paginator',
+            (),
+            {'paginate': lambda **kwargs: paginate(operation_name, **kwargs)},
+        )
+
+        result = await analyze_log_group_tool(
+            ctx,
+            log_group_arn=log_group_arn,
+            start_time='2021-01-01T00:00:00+00:00',
+            end_time='2022-01-01T01:00:00+00:00',
+        )
+
+        assert len(result.log_anomaly_results.anomaly_detectors) == 3
+        assert [a.anomalyDetectorArn for a in result.log_anomaly_results.anomalies] == (
+            detector_arns
+        )
+
     async def test_invalid_time_format(self, ctx, logs_client):
         """Test analysis with invalid time format."""
         log_group_arn = 'arn:aws:logs:us-west-2:123456789012:log-group:/aws/test/invalid'
@@ -515,6 +961,96 @@ class TestAnalyzeLogGroup:
             )
 
 
+@pytest.mark.asyncio
+class TestAnalyzeLogEvents:
+    """Tests for analyze_log_events_tool."""
+
+    @pytest.fixture
+    def log_events(self, logs_client):
+        """Create a log group with one stream of events, returning the hour they were logged in."""
+        hour = datetime.datetime.now(datetime.timezone.utc).replace(
+            minute=0, second=0, microsecond=0
+        ) - datetime.timedelta(hours=1)
+        original_filter_log_events = logs_client.filter_log_events
+
+        # moto only supports logGroupName for filter_log_events
+        def mock_filter_log_events(logGroupIdentifier, **kwargs):
+            return original_filter_log_events(logGroupName=logGroupIdentifier, **kwargs)
+
+        logs_client.filter_log_events = mock_filter_log_events
+        logs_client.create_log_group(logGroupName='/aws/test/events')
+        logs_client.create_log_stream(logGroupName='/aws/test/events', logStreamName='stream-1')
+        logs_client.put_log_events(
+            logGroupName='/aws/test/events',
+            logStreamName='stream-1',
+            logEvents=[
+                {'timestamp': int(hour.timestamp() * 1000) + i * 1000, 'message': message}
+                for i, message in enumerate(
+                    ['request 1 ok', 'request 2 ok', 'request 3 failed', 'request 4 ok']
+                )
+            ],
+        )
+        return hour
+
+    async def test_basic_analysis(self, ctx, logs_client, log_events):
+        """Test events are summarized into patterns, streams and a histogram."""
+        result = await analyze_log_events_tool(
+            ctx,
+            log_group_identifier='/aws/test/events',
+            start_time=log_events.isoformat(),
+            end_time=(log_events + datetime.timedelta(hours=1)).isoformat(),
+            log_stream_names=None,
+            filter_pattern=None,
+            max_events=100,
+            top_k=5,
+            histogram_bin_seconds=3600,
+        )
+
+        assert isinstance(result, LogEventsAnalysisResult)
+        assert result.events_analyzed == 4
+        assert not result.truncated
+        assert result.top_patterns[0]['@pattern'] == 'request <*> ok'
+        assert result.top_patterns[0]['@sampleCount'] == 3
+        assert [p['@pattern'] for p in result.top_patterns_containing_errors] == [
+            'request <*> failed'
+        ]
+        assert result.top_log_streams == {'stream-1': 4}
+        assert result.histogram == {log_events.isoformat(): 4}
+
+    async def test_max_events_truncates(self, ctx, logs_client, log_events):
+        """Test reading stops once max_events have been analyzed."""
+        result = await analyze_log_events_tool(
+            ctx,
+            log_group_identifier='/aws/test/events',
+            start_time=log_events.isoformat(),
+            end_time=(log_events + datetime.timedelta(hours=1)).isoformat(),
+            log_stream_names=['stream-1'],
+            filter_pattern=None,
+            max_events=2,
+            top_k=5,
+            histogram_bin_seconds=60,
+        )
+
+        assert result.events_analyzed == 2
+        assert result.truncated
+
+    async def test_exception_handling(self, ctx, logs_client):
+        """Test errors are reported to the context and raised."""
+        with pytest.raises(Exception):
+            await analyze_log_events_tool(
+                ctx,
+                log_group_identifier='/aws/test/missing',
+                start_time='2020-01-01T00:00:00+00:00',
+                end_time='2020-01-01T01:00:00+00:00',
+                log_stream_names=None,
+                filter_pattern=None,
+                max_events=100,
+                top_k=5,
+                histogram_bin_seconds=60,
+            )
+        ctx.error.assert_called_once()
+
+
 class TestAWSProfileInitialization:
     """Tests for AWS profile handling in server initialization."""
 
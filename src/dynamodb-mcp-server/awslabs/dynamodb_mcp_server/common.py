@@ -184,6 +184,22 @@ class PutItemInput(TypedDict, total=False):
     ReturnValuesOnConditionCheckFailure: Optional[Literal['ALL_OLD', 'NONE']]
 
 
+class KeysAndAttributes(TypedDict, total=False):
+    """Keys and read options for one table of a BatchGetItem operation."""
+
+    Keys: List[Dict[str, KeyAttributeValue]]  # required - at most 100 keys per request
+    ConsistentRead: Optional[bool]
+    ExpressionAttributeNames: Optional[Dict[str, str]]
+    ProjectionExpression: Optional[str]
+
+
+class WriteRequest(TypedDict, total=False):
+    """A single put or delete request of a BatchWriteItem operation."""
+
+    PutRequest: Dict[Literal['Item'], Dict[str, AttributeValue]]
+    DeleteRequest: Dict[Literal['Key'], Dict[str, KeyAttributeValue]]
+
+
 class AttributeDefinition(TypedDict):
     AttributeName: str
     AttributeType: Literal['S', 'N', 'B']
@@ -14,9 +14,14 @@
 
 #!/usr/bin/env python3
 
+import asyncio
 import boto3
+import hashlib
 import json
 import os
+import random
+import threading
+import time
 from awslabs.dynamodb_mcp_server.common import (
     AttributeDefinition,
     AttributeValue,
@@ -27,6 +32,7 @@ from awslabs.dynamodb_mcp_server.common import (
     GlobalSecondaryIndex,
     GlobalSecondaryIndexUpdate,
     KeyAttributeValue,
+    KeysAndAttributes,
     KeySchemaElement,
     OnDemandThroughput,
     ProvisionedThroughput,
@@ -43,13 +49,14 @@ from awslabs.dynamodb_mcp_server.common import (
     UpdateItemInput,
     UpdateTableInput,
     WarmThroughput,
+    WriteRequest,
     handle_exceptions,
     mutation_check,
 )
 from botocore.config import Config
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
-from typing import Any, Dict, List, Literal, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 
 app = FastMCP(
@@ -59,21 +66,130 @@ app = FastMCP(
 )
 
 
+# Environment variables and files that decide which credentials the default provider chain loads
+CREDENTIAL_ENV_VARS = (
+    'AWS_ACCESS_KEY_ID',
+    'AWS_SECRET_ACCESS_KEY',
+    'AWS_SESSION_TOKEN',
+    'AWS_PROFILE',
+    'AWS_DEFAULT_PROFILE',
+    'AWS_ROLE_ARN',
+    'AWS_WEB_IDENTITY_TOKEN_FILE',
+    'AWS_CONTAINER_CREDENTIALS_RELATIVE_URI',
+    'AWS_CONTAINER_CREDENTIALS_FULL_URI',
+)
+CREDENTIAL_FILES = (
+    ('AWS_SHARED_CREDENTIALS_FILE', '~/.aws/credentials'),
+    ('AWS_CONFIG_FILE', '~/.aws/config'),
+)
+
+_client_cache: Dict[Tuple[str, str], Any] = {}
+_client_cache_lock = threading.Lock()
+
+
+def credential_fingerprint() -> str:
+    """Return a digest of the credential sources, which changes whenever the user changes credentials.
+
+    Covers credential environment variables and the modification times of the shared credentials and
+    config files. Credentials that rotate behind an unchanged source (assumed roles, SSO, instance
+    metadata) are refreshed by botocore's refreshable credential providers on the cached session.
+    """
+    digest = hashlib.sha256()
+    for name in CREDENTIAL_ENV_VARS:
+        digest.update(f'{name}={os.environ.get(name, "")}\0'.encode())
+    for env_var, default_path in CREDENTIAL_FILES:
+        path = os.path.expanduser(os.environ.get(env_var, default_path))
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = 0
+        digest.update(f'{path}={mtime}\0'.encode())
+    return digest.hexdigest()
+
+
 def get_dynamodb_client(region_name: str | None):
-    """Create a boto3 DynamoDB client using credentials from environment variables. Falls back to 'us-west-2' if no region is specified or found in environment."""
+    """Return a boto3 DynamoDB client using credentials from the default provider chain. Falls back to 'us-west-2' if no region is specified or found in environment.
+
+    Clients are cached per region and credential fingerprint, so service models, credentials and
+    connection pools are reused across tool calls while credential changes still take effect on the
+    next call. The connection pool size can be set with the DDB-MCP-MAX-POOL-CONNECTIONS environment
+    variable.
+    """
     # Use provided region, or get from env, or fall back to us-west-2
     region = region_name or os.getenv('AWS_REGION') or 'us-west-2'
+    fingerprint = credential_fingerprint()
 
-    # Configure custom user agent to identify requests from LLM/MCP
-    config = Config(user_agent_extra='MCP/DynamoDBServer')
+    with _client_cache_lock:
+        client = _client_cache.get((region, fingerprint))
+        if client is not None:
+            return client
 
-    # Create a new session to force credentials to reload
-    # so that if user changes credential, it will be reflected immediately in the next call
-    session = boto3.Session()
+        # Credentials changed, so drop clients bound to the old ones
+        for cache_key in [k for k in _client_cache if k[1] != fingerprint]:
+            del _client_cache[cache_key]
 
-    # boto3 will automatically load credentials from environment variables:
-    # AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_SESSION_TOKEN
-    return session.client('dynamodb', region_name=region, config=config)
+        # Configure custom user agent to identify requests from LLM/MCP
+        config = Config(
+            user_agent_extra='MCP/DynamoDBServer',
+            max_pool_connections=int(os.getenv('DDB-MCP-MAX-POOL-CONNECTIONS', '10')),
+        )
+
+        # boto3 will automatically load credentials from environment variables:
+        # AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_SESSION_TOKEN
+        session = boto3.Session()
+        client = session.client('dynamodb', region_name=region, config=config)
+        _client_cache[(region, fingerprint)] = client
+        return client
+
+
+# Request size limits of BatchGetItem and BatchWriteItem
+BATCH_GET_ITEM_MAX_KEYS = 100
+BATCH_WRITE_ITEM_MAX_REQUESTS = 25
+
+# Retries of unprocessed keys or items, with full jitter exponential backoff between attempts
+BATCH_MAX_RETRIES = 8
+BATCH_RETRY_BASE_DELAY_SECONDS = 0.05
+BATCH_RETRY_MAX_DELAY_SECONDS = 5.0
+
+
+async def send_batch_with_retries(
+    operation: Callable[..., Dict[str, Any]],
+    request_items: Dict[str, Any],
+    unprocessed_field: str,
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]], float, Optional[str]]:
+    """Send a batch request, resending its unprocessed part with jittered exponential backoff.
+
+    Returns the response of every attempt, the request items still unprocessed after the last
+    retry (or None), the capacity units consumed by all attempts, and the error that stopped
+    the attempts (or None). On error, the unprocessed request items are the ones whose request
+    failed, so callers can tell them apart from the items that were processed.
+    """
+    responses = []
+    capacity_units = 0.0
+    for attempt in range(BATCH_MAX_RETRIES + 1):
+        if attempt:
+            await asyncio.sleep(
+                random.uniform(
+                    0,
+                    min(
+                        BATCH_RETRY_MAX_DELAY_SECONDS, BATCH_RETRY_BASE_DELAY_SECONDS * 2**attempt
+                    ),
+                )
+            )
+        try:
+            response = await asyncio.to_thread(
+                operation, RequestItems=request_items, ReturnConsumedCapacity='TOTAL'
+            )
+        except Exception as e:
+            return responses, request_items, capacity_units, str(e)
+        responses.append(response)
+        capacity_units += sum(
+            capacity.get('CapacityUnits', 0) for capacity in response.get('ConsumedCapacity', [])
+        )
+        request_items = response.get(unprocessed_field)
+        if not request_items:
+            return responses, None, capacity_units, None
+    return responses, request_items, capacity_units, None
 
 
 table_name = Field(description='Table Name or Amazon Resource Name (ARN)')
@@ -193,6 +309,154 @@ async def scan(
     }
 
 
+@app.tool()
+@handle_exceptions
+async def parallel_scan(
+    table_name: str = table_name,
+    index_name: str = index_name,
+    filter_expression: str = filter_expression,
+    projection_expression: str = projection_expression,
+    expression_attribute_names: Dict[str, str] = expression_attribute_names,
+    expression_attribute_values: Dict[str, AttributeValue] = expression_attribute_values,
+    select: Select = select,
+    total_segments: int = Field(
+        default=4,
+        description='The number of segments to split the table into. Segments are scanned in parallel, use 1 to scan sequentially.',
+        ge=1,
+        le=1000,
+    ),
+    max_concurrency: int = Field(
+        default=8, description='The maximum number of segments scanned at once', ge=1, le=64
+    ),
+    max_items: int = Field(
+        default=1000, description='The maximum number of items to return across all segments', ge=1
+    ),
+    max_bytes: int = Field(
+        default=None,
+        description='Stop requesting new pages once the returned items reach this approximate JSON encoded size in bytes',
+        ge=1,
+    ),
+    max_read_capacity_per_second: float = Field(
+        default=None,
+        description='Throttle requests so the scan consumes at most this many read capacity units per second on average',
+        gt=0,
+    ),
+    exclusive_start_keys: Dict[str, Union[Dict[str, KeyAttributeValue], None]] = Field(
+        default=None,
+        description='Use the UnfinishedSegments from the previous call, with the same total_segments, to resume the scan.',
+    ),
+    region_name: str = Field(default=None, description='The aws region to run the tool'),
+) -> dict:
+    """Scans a table or secondary index in parallel segments, following pagination until the table is exhausted or a budget is reached. Segments whose scan fails are returned under SegmentErrors and, to resume them, UnfinishedSegments. Use instead of repeated scan calls to read many items in one call."""
+    client = get_dynamodb_client(region_name)
+    base_params: ScanInput = {'TableName': table_name, 'TotalSegments': total_segments}
+
+    if index_name:
+        base_params['IndexName'] = index_name
+    if filter_expression:
+        base_params['FilterExpression'] = filter_expression
+    if projection_expression:
+        base_params['ProjectionExpression'] = projection_expression
+    if expression_attribute_names:
+        base_params['ExpressionAttributeNames'] = expression_attribute_names
+    if expression_attribute_values:
+        base_params['ExpressionAttributeValues'] = expression_attribute_values
+    if select:
+        base_params['Select'] = select
+    base_params['ReturnConsumedCapacity'] = 'TOTAL'
+
+    if exclusive_start_keys is not None:
+        segments = {}
+        for segment, key in exclusive_start_keys.items():
+            if not segment.isdigit() or int(segment) >= total_segments:
+                raise ValueError(
+                    f'Invalid segment {segment} in exclusive_start_keys, expected 0 to {total_segments - 1}'
+                )
+            segments[int(segment)] = key
+    else:
+        segments = dict.fromkeys(range(total_segments))
+
+    items: List[Dict[str, Any]] = []
+    unfinished: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    totals = {'Count': 0, 'ScannedCount': 0, 'CapacityUnits': 0.0, 'Bytes': 0}
+    budget = {'Reserved': 0, 'Active': len(segments)}
+    budget_changed = asyncio.Condition()
+    started = time.monotonic()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def reserve_page_limit() -> int:
+        # Reserve a share of the remaining item budget for one page before requesting it, so
+        # concurrent segments can never return more than max_items between them. Returns 0 once
+        # the budget is spent.
+        async with budget_changed:
+            while True:
+                if totals['Count'] >= max_items or (max_bytes and totals['Bytes'] >= max_bytes):
+                    return 0
+                available = max_items - totals['Count'] - budget['Reserved']
+                if available > 0:
+                    limit = max(1, available // min(max_concurrency, budget['Active']))
+                    budget['Reserved'] += limit
+                    return limit
+                await budget_changed.wait()
+
+    async def scan_segment(segment: int, start_key: Union[Dict[str, Any], None]):
+        async with semaphore:
+            while limit := await reserve_page_limit():
+                if max_read_capacity_per_second:
+                    # Wait until the average consumption falls back under the requested rate
+                    delay = totals['CapacityUnits'] / max_read_capacity_per_second - (
+                        time.monotonic() - started
+                    )
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                params: ScanInput = {**base_params, 'Segment': segment, 'Limit': limit}
+                if start_key:
+                    params['ExclusiveStartKey'] = start_key
+                try:
+                    response = await asyncio.to_thread(client.scan, **params)
+                except Exception as e:
+                    # The other segments carry on; this one is returned for resuming with its error
+                    async with budget_changed:
+                        budget['Reserved'] -= limit
+                        budget['Active'] -= 1
+                        budget_changed.notify_all()
+                    errors[str(segment)] = str(e)
+                    break
+
+                async with budget_changed:
+                    budget['Reserved'] -= limit
+                    page = response.get('Items', [])
+                    items.extend(page)
+                    totals['Count'] += response.get('Count', 0)
+                    totals['ScannedCount'] += response.get('ScannedCount', 0)
+                    totals['CapacityUnits'] += response.get('ConsumedCapacity', {}).get(
+                        'CapacityUnits', 0
+                    )
+                    if max_bytes:
+                        totals['Bytes'] += sum(len(json.dumps(item)) for item in page)
+                    start_key = response.get('LastEvaluatedKey')
+                    if not start_key:
+                        budget['Active'] -= 1
+                    budget_changed.notify_all()
+
+                if not start_key:
+                    return
+        unfinished[str(segment)] = start_key
+
+    await asyncio.gather(*(scan_segment(segment, key) for segment, key in segments.items()))
+
+    return {
+        'Items': items,
+        'Count': totals['Count'],
+        'ScannedCount': totals['ScannedCount'],
+        'ConsumedCapacity': {'TableName': table_name, 'CapacityUnits': totals['CapacityUnits']},
+        'UnfinishedSegments': dict(sorted(unfinished.items(), key=lambda s: int(s[0]))) or None,
+        'SegmentErrors': dict(sorted(errors.items(), key=lambda s: int(s[0]))) or None,
+    }
+
+
 @app.tool()
 @handle_exceptions
 async def query(
@@ -387,6 +651,134 @@ async def delete_item(
     }
 
 
+@app.tool()
+@handle_exceptions
+async def batch_get_item(
+    table_name: str = table_name,
+    keys: List[Dict[str, KeyAttributeValue]] = Field(
+        description='The primary keys of the items to retrieve. Any number of keys can be given, they are requested 100 at a time.'
+    ),
+    expression_attribute_names: Dict[str, str] = expression_attribute_names,
+    projection_expression: str = projection_expression,
+    consistent_read: bool = Field(
+        default=None,
+        description='Use strongly consistent reads instead of eventually consistent reads.',
+    ),
+    max_concurrency: int = Field(
+        default=4, description='The maximum number of batch requests sent at once', ge=1, le=64
+    ),
+    region_name: str = Field(default=None, description='The aws region to run the tool'),
+) -> dict:
+    """Returns the items with the given primary keys. Keys are split into BatchGetItem requests of up to 100 keys that run concurrently, and unprocessed keys are retried with backoff. Keys of requests that fail are returned under FailedKeys with the error. Use instead of repeated get_item calls to read many items."""
+    client = get_dynamodb_client(region_name)
+
+    # BatchGetItem rejects duplicate keys within a request
+    unique_keys = list({json.dumps(k, sort_keys=True): k for k in keys}.values())
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def get_chunk(chunk: List[Dict[str, KeyAttributeValue]]):
+        params: KeysAndAttributes = {'Keys': chunk}
+        if expression_attribute_names:
+            params['ExpressionAttributeNames'] = expression_attribute_names
+        if projection_expression:
+            params['ProjectionExpression'] = projection_expression
+        if consistent_read is not None:
+            params['ConsistentRead'] = consistent_read
+        async with semaphore:
+            return await send_batch_with_retries(
+                client.batch_get_item, {table_name: params}, 'UnprocessedKeys'
+            )
+
+    results = await asyncio.gather(
+        *(
+            get_chunk(unique_keys[i : i + BATCH_GET_ITEM_MAX_KEYS])
+            for i in range(0, len(unique_keys), BATCH_GET_ITEM_MAX_KEYS)
+        )
+    )
+
+    items = []
+    unprocessed_keys = []
+    failed_keys = []
+    capacity_units = 0.0
+    for responses, unprocessed, chunk_capacity_units, error in results:
+        for response in responses:
+            for table_items in response.get('Responses', {}).values():
+                items.extend(table_items)
+        chunk_keys = [k for table_keys in (unprocessed or {}).values() for k in table_keys['Keys']]
+        if error:
+            failed_keys.append({'Error': error, 'Keys': chunk_keys})
+        else:
+            unprocessed_keys.extend(chunk_keys)
+        capacity_units += chunk_capacity_units
+    return {
+        'Items': items,
+        'Count': len(items),
+        'UnprocessedKeys': unprocessed_keys or None,
+        'FailedKeys': failed_keys or None,
+        'ConsumedCapacity': {'TableName': table_name, 'CapacityUnits': capacity_units},
+    }
+
+
+@app.tool()
+@handle_exceptions
+@mutation_check
+async def batch_write_item(
+    table_name: str = table_name,
+    put_items: List[Dict[str, AttributeValue]] = Field(
+        default=None,
+        description='Items to create or replace, as maps of attribute name/value pairs.',
+    ),
+    delete_keys: List[Dict[str, KeyAttributeValue]] = Field(
+        default=None, description='The primary keys of items to delete.'
+    ),
+    max_concurrency: int = Field(
+        default=4, description='The maximum number of batch requests sent at once', ge=1, le=64
+    ),
+    region_name: str = Field(default=None, description='The aws region to run the tool'),
+) -> dict:
+    """Puts and deletes many items in a table. Requests are split into BatchWriteItem calls of up to 25 items that run concurrently, and unprocessed items are retried with backoff. Requests of batch calls that fail are returned under FailedRequests with the error; all other requests were written. Writes are not transactional and the same item cannot be both put and deleted in one call."""
+    client = get_dynamodb_client(region_name)
+    write_requests: List[WriteRequest] = [
+        {'PutRequest': {'Item': item}} for item in put_items or []
+    ]
+    write_requests += [{'DeleteRequest': {'Key': key}} for key in delete_keys or []]
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def write_chunk(chunk: List[WriteRequest]):
+        async with semaphore:
+            return await send_batch_with_retries(
+                client.batch_write_item, {table_name: chunk}, 'UnprocessedItems'
+            )
+
+    results = await asyncio.gather(
+        *(
+            write_chunk(write_requests[i : i + BATCH_WRITE_ITEM_MAX_REQUESTS])
+            for i in range(0, len(write_requests), BATCH_WRITE_ITEM_MAX_REQUESTS)
+        )
+    )
+
+    unprocessed_items = []
+    failed_requests = []
+    failed_count = 0
+    capacity_units = 0.0
+    for _, unprocessed, chunk_capacity_units, error in results:
+        chunk_requests = [
+            r for table_requests in (unprocessed or {}).values() for r in table_requests
+        ]
+        if error:
+            failed_requests.append({'Error': error, 'Requests': chunk_requests})
+            failed_count += len(chunk_requests)
+        else:
+            unprocessed_items.extend(chunk_requests)
+        capacity_units += chunk_capacity_units
+    return {
+        'ProcessedCount': len(write_requests) - len(unprocessed_items) - failed_count,
+        'UnprocessedItems': unprocessed_items or None,
+        'FailedRequests': failed_requests or None,
+        'ConsumedCapacity': {'TableName': table_name, 'CapacityUnits': capacity_units},
+    }
+
+
 @app.tool()
 @handle_exceptions
 @mutation_check
@@ -2,7 +2,10 @@ import asyncio
 import boto3
 import pytest
 import pytest_asyncio
+from awslabs.dynamodb_mcp_server import server
 from awslabs.dynamodb_mcp_server.server import (
+    batch_get_item,
+    batch_write_item,
     create_backup,
     create_table,
     delete_item,
@@ -18,6 +21,7 @@ from awslabs.dynamodb_mcp_server.server import (
     list_backups,
     list_tables,
     list_tags_of_resource,
+    parallel_scan,
     put_item,
     put_resource_policy,
     query,
@@ -533,6 +537,301 @@ async def test_scan(test_table):
         assert 'category' not in item
 
 
+async def put_numbered_items(count: int):
+    """Put count items with ids item0..item{count-1} into the test table."""
+    for i in range(count):
+        await put_item(
+            table_name='TestTable',
+            item={'id': {'S': f'item{i}'}, 'sort': {'S': 'data'}, 'n': {'N': str(i)}},
+            region_name='us-west-2',
+            condition_expression=None,
+            expression_attribute_names=None,
+            expression_attribute_values=None,
+        )
+
+
+@pytest.mark.asyncio
+async def test_parallel_scan(test_table):
+    """Test a parallel scan reads every item across segments."""
+    await put_numbered_items(20)
+
+    result = await parallel_scan(
+        table_name='TestTable',
+        index_name=None,
+        filter_expression='#n >= :min',
+        projection_expression=None,
+        expression_attribute_names={'#n': 'n'},
+        expression_attribute_values={':min': {'N': '5'}},
+        select=None,
+        total_segments=4,
+        max_concurrency=2,
+        max_items=1000,
+        max_bytes=None,
+        max_read_capacity_per_second=None,
+        exclusive_start_keys=None,
+        region_name='us-west-2',
+    )
+
+    if 'error' in result:
+        pytest.fail(f'Failed to scan in parallel: {result["error"]}')
+
+    assert result['Count'] == 15
+    assert sorted(int(item['n']['N']) for item in result['Items']) == list(range(5, 20))
+    assert result['ScannedCount'] == 20
+    assert result['ConsumedCapacity']['TableName'] == 'TestTable'
+    assert result['UnfinishedSegments'] is None
+
+
+@pytest.mark.asyncio
+async def test_parallel_scan_resumes_within_budget(test_table):
+    """Test the item budget is never exceeded and unfinished segments can be resumed."""
+    await put_numbered_items(20)
+
+    seen = []
+    exclusive_start_keys = None
+    for _ in range(10):
+        result = await parallel_scan(
+            table_name='TestTable',
+            index_name=None,
+            filter_expression=None,
+            projection_expression=None,
+            expression_attribute_names=None,
+            expression_attribute_values=None,
+            select=None,
+            total_segments=3,
+            max_concurrency=3,
+            max_items=7,
+            max_bytes=None,
+            max_read_capacity_per_second=1000,
+            exclusive_start_keys=exclusive_start_keys,
+            region_name='us-west-2',
+        )
+        if 'error' in result:
+            pytest.fail(f'Failed to scan in parallel: {result["error"]}')
+
+        assert result['Count'] <= 7
+        seen.extend(item['id']['S'] for item in result['Items'])
+        exclusive_start_keys = result['UnfinishedSegments']
+        if exclusive_start_keys is None:
+            break
+
+    assert sorted(seen) == sorted(f'item{i}' for i in range(20))
+
+
+@pytest.mark.asyncio
+async def test_parallel_scan_reports_failed_segments(test_table, monkeypatch):
+    """Test a failing segment is returned for resuming while the other segments finish."""
+    await put_numbered_items(20)
+    client = server.get_dynamodb_client('us-west-2')
+    scan = client.scan
+    failing = {1}
+
+    def scan_or_fail(**kwargs):
+        if kwargs['Segment'] in failing:
+            raise Exception('ProvisionedThroughputExceededException')
+        return scan(**kwargs)
+
+    monkeypatch.setattr(client, 'scan', scan_or_fail)
+    params = {
+        'table_name': 'TestTable',
+        'index_name': None,
+        'filter_expression': None,
+        'projection_expression': None,
+        'expression_attribute_names': None,
+        'expression_attribute_values': None,
+        'select': None,
+        'total_segments': 4,
+        'max_concurrency': 4,
+        'max_items': 1000,
+        'max_bytes': None,
+        'max_read_capacity_per_second': None,
+        'region_name': 'us-west-2',
+    }
+
+    result = await parallel_scan(**params, exclusive_start_keys=None)
+    assert result['SegmentErrors'] == {'1': 'ProvisionedThroughputExceededException'}
+    assert result['UnfinishedSegments'] == {'1': None}
+
+    failing.clear()
+    resumed = await parallel_scan(**params, exclusive_start_keys=result['UnfinishedSegments'])
+    assert resumed['SegmentErrors'] is None
+    assert result['Count'] + resumed['Count'] == 20
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('segment', ['4', '-1', 'one'])
+async def test_parallel_scan_rejects_invalid_segments(test_table, segment):
+    """Test resuming from a segment outside of total_segments is rejected."""
+    result = await parallel_scan(
+        table_name='TestTable',
+        index_name=None,
+        filter_expression=None,
+        projection_expression=None,
+        expression_attribute_names=None,
+        expression_attribute_values=None,
+        select=None,
+        total_segments=4,
+        max_concurrency=4,
+        max_items=1000,
+        max_bytes=None,
+        max_read_capacity_per_second=None,
+        exclusive_start_keys={segment: None},
+        region_name='us-west-2',
+    )
+    assert result['error'] == (
+        f'Invalid segment {segment} in exclusive_start_keys, expected 0 to 3'
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_write_and_get_item(test_table):
+    """Test batch writes and reads are split into chunks within the API limits."""
+    result = await batch_write_item(
+        table_name='TestTable',
+        put_items=[
+            {'id': {'S': f'item{i}'}, 'sort': {'S': 'data'}, 'n': {'N': str(i)}} for i in range(60)
+        ],
+        delete_keys=None,
+        max_concurrency=2,
+        region_name='us-west-2',
+    )
+    if 'error' in result:
+        pytest.fail(f'Failed to batch write: {result["error"]}')
+    assert result['ProcessedCount'] == 60
+    assert result['UnprocessedItems'] is None
+
+    result = await batch_write_item(
+        table_name='TestTable',
+        put_items=None,
+        delete_keys=[{'id': {'S': f'item{i}'}, 'sort': {'S': 'data'}} for i in range(50, 60)],
+        max_concurrency=2,
+        region_name='us-west-2',
+    )
+    assert result['ProcessedCount'] == 10
+
+    keys = [{'id': {'S': f'item{i}'}, 'sort': {'S': 'data'}} for i in range(150)]
+    result = await batch_get_item(
+        table_name='TestTable',
+        keys=keys + keys[:5],
+        expression_attribute_names={'#n': 'n'},
+        projection_expression='#n',
+        consistent_read=True,
+        max_concurrency=2,
+        region_name='us-west-2',
+    )
+    if 'error' in result:
+        pytest.fail(f'Failed to batch get: {result["error"]}')
+    assert result['Count'] == 50
+    assert sorted(int(item['n']['N']) for item in result['Items']) == list(range(50))
+    assert result['UnprocessedKeys'] is None
+    assert result['ConsumedCapacity']['TableName'] == 'TestTable'
+
+
+@pytest.mark.asyncio
+async def test_batch_write_item_retries_unprocessed_items(test_table, monkeypatch):
+    """Test unprocessed items are resent until written or retries run out."""
+    monkeypatch.setattr(server, 'BATCH_RETRY_BASE_DELAY_SECONDS', 0.001)
+    client = server.get_dynamodb_client('us-west-2')
+    batch_write = client.batch_write_item
+    calls = []
+
+    def write_first_request_only(RequestItems, **kwargs):
+        requests = RequestItems['TestTable']
+        calls.append(len(requests))
+        response = batch_write(RequestItems={'TestTable': requests[:1]}, **kwargs)
+        if requests[1:]:
+            response['UnprocessedItems'] = {'TestTable': requests[1:]}
+        return response
+
+    monkeypatch.setattr(client, 'batch_write_item', write_first_request_only)
+    items = [{'id': {'S': f'item{i}'}, 'sort': {'S': 'data'}} for i in range(12)]
+
+    result = await batch_write_item(
+        table_name='TestTable',
+        put_items=items[:3],
+        delete_keys=None,
+        max_concurrency=1,
+        region_name='us-west-2',
+    )
+    assert calls == [3, 2, 1]
+    assert result['ProcessedCount'] == 3
+    assert result['UnprocessedItems'] is None
+
+    result = await batch_write_item(
+        table_name='TestTable',
+        put_items=items,
+        delete_keys=None,
+        max_concurrency=1,
+        region_name='us-west-2',
+    )
+    assert result['ProcessedCount'] == server.BATCH_MAX_RETRIES + 1
+    assert len(result['UnprocessedItems']) == 12 - result['ProcessedCount']
+
+
+@pytest.mark.asyncio
+async def test_batch_item_reports_failed_chunks(test_table, monkeypatch):
+    """Test a failing batch request is reported with its items while other chunks complete."""
+    client = server.get_dynamodb_client('us-west-2')
+    batch_write = client.batch_write_item
+    batch_get = client.batch_get_item
+
+    def write_or_fail(RequestItems, **kwargs):
+        if RequestItems['TestTable'][0]['PutRequest']['Item']['id']['S'] == 'item25':
+            raise Exception('ProvisionedThroughputExceededException')
+        return batch_write(RequestItems=RequestItems, **kwargs)
+
+    def get_or_fail(RequestItems, **kwargs):
+        if RequestItems['TestTable']['Keys'][0]['id']['S'] == 'item0':
+            raise Exception('ProvisionedThroughputExceededException')
+        return batch_get(RequestItems=RequestItems, **kwargs)
+
+    monkeypatch.setattr(client, 'batch_write_item', write_or_fail)
+    monkeypatch.setattr(client, 'batch_get_item', get_or_fail)
+    items = [{'id': {'S': f'item{i}'}, 'sort': {'S': 'data'}} for i in range(60)]
+
+    result = await batch_write_item(
+        table_name='TestTable',
+        put_items=items,
+        delete_keys=None,
+        max_concurrency=2,
+        region_name='us-west-2',
+    )
+    assert 'error' not in result
+    assert result['ProcessedCount'] == 35
+    assert result['UnprocessedItems'] is None
+    [failure] = result['FailedRequests']
+    assert failure['Error'] == 'ProvisionedThroughputExceededException'
+    assert [r['PutRequest']['Item'] for r in failure['Requests']] == items[25:50]
+
+    result = await batch_get_item(
+        table_name='TestTable',
+        keys=items[:150] + [{'id': {'S': f'extra{i}'}, 'sort': {'S': 'data'}} for i in range(50)],
+        expression_attribute_names=None,
+        projection_expression=None,
+        consistent_read=None,
+        max_concurrency=2,
+        region_name='us-west-2',
+    )
+    assert 'error' not in result
+    assert result['Count'] == 0
+    [failure] = result['FailedKeys']
+    assert len(failure['Keys']) == 100
+
+
+@pytest.mark.asyncio
+async def test_batch_write_item_readonly(test_table, monkeypatch):
+    """Test batch writes are blocked in read-only mode."""
+    monkeypatch.setenv('DDB-MCP-READONLY', 'true')
+    result = await batch_write_item(
+        table_name='TestTable',
+        put_items=[{'id': {'S': 'item'}, 'sort': {'S': 'data'}}],
+        delete_keys=None,
+        max_concurrency=1,
+        region_name='us-west-2',
+    )
+    assert 'DDB-MCP-READONLY' in result['error']
+
+
 @pytest.mark.asyncio
 async def test_describe_table(test_table):
     """Test describing a table."""
@@ -887,3 +1186,30 @@ async def test_list_imports(test_table):
 
     # Should return a dict with ImportSummaryList and NextToken keys
     assert isinstance(result, dict)
+
+
+def test_get_dynamodb_client_is_cached(monkeypatch):
+    """Test clients are reused per region until the credentials change."""
+    from awslabs.dynamodb_mcp_server.server import get_dynamodb_client
+
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'first')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'secret')
+    client = get_dynamodb_client('us-west-2')
+    assert get_dynamodb_client('us-west-2') is client
+    assert get_dynamodb_client('us-east-1') is not client
+
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'second')
+    rotated = get_dynamodb_client('us-west-2')
+    assert rotated is not client
+    assert rotated._request_signer._credentials.access_key == 'second'
+
+
+def test_get_dynamodb_client_pool_size(monkeypatch):
+    """Test the connection pool size is configurable."""
+    from awslabs.dynamodb_mcp_server.server import get_dynamodb_client
+
+    monkeypatch.setenv('DDB-MCP-MAX-POOL-CONNECTIONS', '32')
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'pool-size')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'secret')
+    client = get_dynamodb_client('us-west-2')
+    assert client.meta.config.max_pool_connections == 32
@@ -123,13 +123,14 @@ ACTIONS = {
     "fetch_task_failures": {
         "func": fetch_task_failures,
         "required_params": ["app_name", "cluster_name"],
-        "optional_params": ["time_window", "start_time", "end_time"],
+        "optional_params": ["time_window", "start_time", "end_time", "incremental"],
         "transformer": lambda app_name, params: {
             "app_name": app_name,
             "cluster_name": params["cluster_name"],
             "time_window": params.get("time_window", 3600),
             "start_time": params.get("start_time"),
             "end_time": params.get("end_time"),
+            "incremental": params.get("incremental", False),
         },
         "description": "Task-level diagnostics for ECS task failures",
         "param_descriptions": {
@@ -144,6 +145,10 @@ ACTIONS = {
                 "Explicit end time for the analysis window "
                 "(UTC, defaults to current time if not provided)"
             ),
+            "incremental": (
+                "Only report stopped tasks not seen by earlier incremental calls for the "
+                "cluster, with rolling failure category counts (default: false)"
+            ),
         },
         "example": (
             'action="fetch_task_failures", '
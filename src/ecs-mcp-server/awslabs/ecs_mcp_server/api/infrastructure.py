@@ -19,7 +19,7 @@ API for creating ECS infrastructure using CloudFormation/CDK.
 import logging
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from awslabs.ecs_mcp_server.utils.aws import (
     get_aws_account_id,
@@ -116,6 +116,7 @@ async def create_infrastructure(
     desired_count: Optional[int] = None,
     container_port: Optional[int] = None,
     health_check_path: Optional[str] = None,
+    progress: Optional[Callable[[str], Awaitable[None]]] = None,
 ) -> Dict[str, Any]:
     """
     Creates complete ECS infrastructure using CloudFormation.
@@ -139,6 +140,7 @@ async def create_infrastructure(
         desired_count: Desired number of tasks (optional, default: 1)
         container_port: Port the container listens on (optional, default: 80)
         health_check_path: Path for ALB health checks (optional, default: "/")
+        progress: Callback receiving each line of Docker build and push output (optional)
 
     Returns:
         Dict containing infrastructure creation results or template paths
@@ -306,7 +308,10 @@ async def create_infrastructure(
             logger.info(f"Using ECR push/pull role ARN: {ecr_role_arn}")
 
             image_tag = await build_and_push_image(
-                app_path=app_path, repository_uri=ecr_repo_uri, role_arn=ecr_role_arn
+                app_path=app_path,
+                repository_uri=ecr_repo_uri,
+                role_arn=ecr_role_arn,
+                progress=progress,
             )
             logger.info(f"Image successfully built and pushed with tag: {image_tag}")
 
@@ -19,13 +19,148 @@ This module provides functions for listing and describing ECS resources
 using a consistent interface.
 """
 
+import asyncio
+import copy
+import functools
+import json
 import logging
-from typing import Any, Dict, Optional
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from awslabs.ecs_mcp_server.utils.aws import get_aws_client
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of clusters, services and tasks per describe call (API limits)
+DESCRIBE_CLUSTERS_BATCH_SIZE = 100
+DESCRIBE_SERVICES_BATCH_SIZE = 10
+DESCRIBE_TASKS_BATCH_SIZE = 100
+DESCRIBE_CONTAINER_INSTANCES_BATCH_SIZE = 100
+
+# Maximum number of clusters inventoried at once
+MAX_CONCURRENT_CLUSTERS = 10
+
+# Inventory snapshots, keyed by operation, region, profile and filters
+_inventory_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def get_inventory_cache_ttl() -> float:
+    """Gets the seconds inventory snapshots are reused for, from ECS_INVENTORY_CACHE_TTL."""
+    try:
+        return float(os.environ.get("ECS_INVENTORY_CACHE_TTL", "0"))
+    except ValueError:
+        logger.warning("Ignoring invalid ECS_INVENTORY_CACHE_TTL")
+        return 0
+
+
+def clear_inventory_cache() -> None:
+    """Drops all inventory snapshots."""
+    _inventory_cache.clear()
+
+
+def cached_inventory(func: Callable) -> Callable:
+    """
+    Reuses successful results of an inventory listing for ECS_INVENTORY_CACHE_TTL seconds.
+
+    The cache is disabled unless ECS_INVENTORY_CACHE_TTL is set, and results with an error are
+    never cached.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(filters: Dict[str, Any]) -> Dict[str, Any]:
+        ttl = get_inventory_cache_ttl()
+        if ttl <= 0:
+            return await func(filters)
+
+        key = json.dumps(
+            [
+                func.__name__,
+                os.environ.get("AWS_REGION", "us-east-1"),
+                os.environ.get("AWS_PROFILE", "default"),
+                filters,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        now = time.monotonic()
+        cached = _inventory_cache.get(key)
+        if cached and cached[0] > now:
+            return copy.deepcopy(cached[1])
+
+        result = await func(filters)
+        if "error" not in result:
+            _inventory_cache[key] = (now + ttl, copy.deepcopy(result))
+        return result
+
+    return wrapper
+
+
+def list_all(method: Callable, key: str, **params) -> List[Any]:
+    """
+    Calls a list_* API until it returns no nextToken.
+
+    Args:
+        method: Client method to call
+        key: Response key holding the listed items
+        **params: Parameters for the call
+
+    Returns:
+        All listed items
+    """
+    items = []
+    while True:
+        response = method(**params)
+        items.extend(response.get(key, []))
+        next_token = response.get("nextToken")
+        if not next_token:
+            return items
+        params["nextToken"] = next_token
+
+
+def describe_in_batches(
+    method: Callable, key: str, param: str, identifiers: List[str], batch_size: int, **params
+) -> List[Any]:
+    """
+    Describes resources in batches of at most batch_size identifiers.
+
+    Args:
+        method: Client describe method to call
+        key: Response key holding the described resources
+        param: Parameter the identifiers are passed in
+        identifiers: Resource names or ARNs to describe
+        batch_size: Maximum number of identifiers per call
+        **params: Other parameters for every call
+
+    Returns:
+        Described resources, in the order of the batches
+    """
+    resources = []
+    for i in range(0, len(identifiers), batch_size):
+        response = method(**{param: identifiers[i : i + batch_size]}, **params)
+        resources.extend(response.get(key, []))
+    return resources
+
+
+async def map_clusters(func: Callable, clusters: List[str]) -> List[Any]:
+    """
+    Runs a blocking per-cluster function for every cluster concurrently.
+
+    Args:
+        func: Function taking a cluster name or ARN
+        clusters: Clusters to run it for
+
+    Returns:
+        Results in the order of clusters
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CLUSTERS)
+
+    async def run(cluster: str) -> Any:
+        async with semaphore:
+            return await asyncio.to_thread(func, cluster)
+
+    return await asyncio.gather(*(run(cluster) for cluster in clusters))
+
 
 async def ecs_resource_management(
     action: str,
@@ -124,6 +259,7 @@ async def ecs_resource_management(
 # ============ CLUSTER OPERATIONS ============
 
 
+@cached_inventory
 async def list_clusters(filters: Dict[str, Any]) -> Dict[str, Any]:
     """
     Lists all ECS clusters with optional filtering.
@@ -138,19 +274,17 @@ async def list_clusters(filters: Dict[str, Any]) -> Dict[str, Any]:
 
     try:
         ecs_client = await get_aws_client("ecs")
-        response = ecs_client.list_clusters()
-        cluster_arns = response.get("clusterArns", [])
-
-        # If we have clusters, get more details
-        clusters = []
-        if cluster_arns:
-            # Describe clusters in batches of 100 (API limit)
-            for i in range(0, len(cluster_arns), 100):
-                batch = cluster_arns[i : i + 100]
-                cluster_details = ecs_client.describe_clusters(
-                    clusters=batch, include=["ATTACHMENTS", "SETTINGS", "STATISTICS", "TAGS"]
-                )
-                clusters.extend(cluster_details.get("clusters", []))
+        cluster_arns = list_all(ecs_client.list_clusters, "clusterArns")
+
+        # Describe clusters in batches of 100 (API limit)
+        clusters = describe_in_batches(
+            ecs_client.describe_clusters,
+            "clusters",
+            "clusters",
+            cluster_arns,
+            DESCRIBE_CLUSTERS_BATCH_SIZE,
+            include=["ATTACHMENTS", "SETTINGS", "STATISTICS", "TAGS"],
+        )
 
         return {
             "clusters": clusters,
@@ -190,21 +324,22 @@ async def describe_cluster(cluster: str, filters: Dict[str, Any]) -> Dict[str, A
         task_count = 0
 
         # Get service count
-        services_response = ecs_client.list_services(cluster=cluster)
-        service_count = len(services_response.get("serviceArns", []))
+        service_count = len(list_all(ecs_client.list_services, "serviceArns", cluster=cluster))
 
         # Get task count (both running and stopped)
-        running_tasks_response = ecs_client.list_tasks(cluster=cluster, desiredStatus="RUNNING")
-        stopped_tasks_response = ecs_client.list_tasks(cluster=cluster, desiredStatus="STOPPED")
-        running_tasks = len(running_tasks_response.get("taskArns", []))
-        stopped_tasks = len(stopped_tasks_response.get("taskArns", []))
+        running_tasks = len(
+            list_all(ecs_client.list_tasks, "taskArns", cluster=cluster, desiredStatus="RUNNING")
+        )
+        stopped_tasks = len(
+            list_all(ecs_client.list_tasks, "taskArns", cluster=cluster, desiredStatus="STOPPED")
+        )
         task_count = running_tasks + stopped_tasks
 
         return {
             "cluster": cluster_details,
             "service_count": service_count,
             "task_count": task_count,
-            "running_task_count": len(running_tasks_response.get("taskArns", [])),
+            "running_task_count": running_tasks,
         }
     except Exception as e:
         logger.error(f"Error describing ECS cluster: {e}")
@@ -214,6 +349,7 @@ async def describe_cluster(cluster: str, filters: Dict[str, Any]) -> Dict[str, A
 # ============ SERVICE OPERATIONS ============
 
 
+@cached_inventory
 async def list_services(filters: Dict[str, Any]) -> Dict[str, Any]:
     """
     Lists ECS services with optional filtering by cluster.
@@ -231,34 +367,33 @@ async def list_services(filters: Dict[str, Any]) -> Dict[str, Any]:
         ecs_client = await get_aws_client("ecs")
         cluster_name = filters.get("cluster")
 
-        services = []
-
         # If no cluster specified, get all clusters first
-        clusters = []
         if cluster_name:
             clusters = [cluster_name]
         else:
-            clusters_response = ecs_client.list_clusters()
-            clusters = clusters_response.get("clusterArns", [])
+            clusters = list_all(ecs_client.list_clusters, "clusterArns")
 
-        for cluster in clusters:
-            # Get services for this cluster
+        def list_cluster_services(cluster: str) -> List[Dict[str, Any]]:
+            # Use the paginator to get all services
             service_arns = []
             paginator = ecs_client.get_paginator("list_services")
-
-            # Use the paginator to get all services
             for page in paginator.paginate(cluster=cluster):
                 service_arns.extend(page.get("serviceArns", []))
 
-            # If we found services, describe them
-            if service_arns:
-                # Describe services in batches of 10 (API limit)
-                for i in range(0, len(service_arns), 10):
-                    batch = service_arns[i : i + 10]
-                    service_details = ecs_client.describe_services(
-                        cluster=cluster, services=batch, include=["TAGS"]
-                    )
-                    services.extend(service_details.get("services", []))
+            # Describe services in batches of 10 (API limit)
+            return describe_in_batches(
+                ecs_client.describe_services,
+                "services",
+                "services",
+                service_arns,
+                DESCRIBE_SERVICES_BATCH_SIZE,
+                cluster=cluster,
+                include=["TAGS"],
+            )
+
+        services = []
+        for cluster_services in await map_clusters(list_cluster_services, clusters):
+            services.extend(cluster_services)
 
         return {
             "services": services,
@@ -323,6 +458,7 @@ async def describe_service(service: str, filters: Dict[str, Any]) -> Dict[str, A
 # ============ TASK OPERATIONS ============
 
 
+@cached_inventory
 async def list_tasks(filters: Dict[str, Any]) -> Dict[str, Any]:
     """
     Lists ECS tasks with optional filtering.
@@ -344,17 +480,13 @@ async def list_tasks(filters: Dict[str, Any]) -> Dict[str, Any]:
         service_name = filters.get("service")
         status = filters.get("status", "").upper()  # Default to all
 
-        tasks = []
-
         # If no cluster specified, get all clusters first
-        clusters = []
         if cluster_name:
             clusters = [cluster_name]
         else:
-            clusters_response = ecs_client.list_clusters()
-            clusters = clusters_response.get("clusterArns", [])
+            clusters = list_all(ecs_client.list_clusters, "clusterArns")
 
-        for cluster in clusters:
+        def list_cluster_tasks(cluster: str) -> List[Dict[str, Any]]:
             params = {"cluster": cluster}
             if service_name:
                 params["serviceName"] = service_name
@@ -363,18 +495,23 @@ async def list_tasks(filters: Dict[str, Any]) -> Dict[str, Any]:
 
             task_arns = []
             paginator = ecs_client.get_paginator("list_tasks")
-
             for page in paginator.paginate(**params):
                 task_arns.extend(page.get("taskArns", []))
 
-            if task_arns:
-                # Describe tasks in batches of 100 (API limit)
-                for i in range(0, len(task_arns), 100):
-                    batch = task_arns[i : i + 100]
-                    task_details = ecs_client.describe_tasks(
-                        cluster=cluster, tasks=batch, include=["TAGS"]
-                    )
-                    tasks.extend(task_details.get("tasks", []))
+            # Describe tasks in batches of 100 (API limit)
+            return describe_in_batches(
+                ecs_client.describe_tasks,
+                "tasks",
+                "tasks",
+                task_arns,
+                DESCRIBE_TASKS_BATCH_SIZE,
+                cluster=cluster,
+                include=["TAGS"],
+            )
+
+        tasks = []
+        for cluster_tasks in await map_clusters(list_cluster_tasks, clusters):
+            tasks.extend(cluster_tasks)
 
         # Count by status
         running_count = sum(1 for task in tasks if task.get("lastStatus") == "RUNNING")
@@ -600,21 +737,23 @@ async def list_container_instances(filters: Dict[str, Any]) -> Dict[str, Any]:
         if "status" in filters and filters["status"] in ["ACTIVE", "DRAINING"]:
             params["status"] = filters["status"]
 
-        response = ecs_client.list_container_instances(**params)
-        container_instance_arns = response.get("containerInstanceArns", [])
+        container_instance_arns = list_all(
+            ecs_client.list_container_instances, "containerInstanceArns", **params
+        )
 
-        # Get details for container instances
-        container_instances = []
-        if container_instance_arns:
-            ci_details = ecs_client.describe_container_instances(
-                cluster=cluster, containerInstances=container_instance_arns
-            )
-            container_instances = ci_details.get("containerInstances", [])
+        # Describe container instances in batches of 100 (API limit)
+        container_instances = describe_in_batches(
+            ecs_client.describe_container_instances,
+            "containerInstances",
+            "containerInstances",
+            container_instance_arns,
+            DESCRIBE_CONTAINER_INSTANCES_BATCH_SIZE,
+            cluster=cluster,
+        )
 
         return {
             "container_instances": container_instances,
             "count": len(container_instances),
-            "next_token": response.get("nextToken"),
         }
     except Exception as e:
         logger.error(f"Error listing container instances: {e}")
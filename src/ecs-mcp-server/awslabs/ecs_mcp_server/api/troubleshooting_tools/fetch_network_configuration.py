@@ -19,8 +19,11 @@ This module provides the main entry point for network analysis functionality,
 focusing on collecting raw data that can be interpreted by an LLM.
 """
 
+import asyncio
+import functools
 import inspect
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -30,11 +33,32 @@ from awslabs.ecs_mcp_server.utils.aws import get_aws_client
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of AWS API calls in flight at once across network diagnostics
+MAX_CONCURRENT_API_CALLS = 8
+
+# Maximum number of load balancer ARNs per elbv2 DescribeTags call
+DESCRIBE_TAGS_MAX_ARNS = 20
+
+# Bounded pool the blocking boto3 calls run on, so independent describes run concurrently
+# without blocking the event loop
+_api_executor = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_API_CALLS, thread_name_prefix="ecs-network-diagnostics"
+)
+
 
 async def handle_aws_api_call(func, error_value=None, *args, **kwargs):
-    """Execute AWS API calls with standardized error handling."""
+    """Execute AWS API calls with standardized error handling.
+
+    Blocking calls run on a bounded thread pool, so several calls can be awaited concurrently.
+    """
     try:
-        result = func(*args, **kwargs)
+        if inspect.iscoroutinefunction(func):
+            result = func(*args, **kwargs)
+        else:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                _api_executor, functools.partial(func, *args, **kwargs)
+            )
         if inspect.iscoroutine(result):
             result = await result
         return result
@@ -110,20 +134,19 @@ async def get_network_data(
         # Identify relevant VPCs
         vpc_ids = [vpc_id] if vpc_id else []
         if not vpc_ids:
-            # VPC discovery from ECS tasks
-            discovered_vpcs = await discover_vpcs_from_clusters(clusters)
+            # Discover VPCs from ECS tasks, load balancers, CloudFormation stacks and VPC tags
+            # concurrently
+            discovered_vpcs, lb_vpcs, cf_vpcs, vpc_response = await asyncio.gather(
+                discover_vpcs_from_clusters(clusters, ecs=ecs, ec2=ec2),
+                discover_vpcs_from_loadbalancers(app_name, elbv2=elbv2),
+                discover_vpcs_from_cloudformation(app_name),
+                handle_aws_api_call(ec2.describe_vpcs, {"Vpcs": []}),
+            )
             vpc_ids.extend(discovered_vpcs)
-
-            # VPC discovery from load balancers
-            lb_vpcs = await discover_vpcs_from_loadbalancers(app_name)
             vpc_ids.extend(lb_vpcs)
-
-            # VPC discovery from CloudFormation tags
-            cf_vpcs = await discover_vpcs_from_cloudformation(app_name)
             vpc_ids.extend(cf_vpcs)
 
             # Direct VPC search by tags
-            vpc_response = await handle_aws_api_call(ec2.describe_vpcs, {"Vpcs": []})
             vpc_response = vpc_response or {}
 
             for vpc in vpc_response.get("Vpcs", []):
@@ -147,37 +170,33 @@ async def get_network_data(
                 "timestamp": datetime.now().isoformat(),
             }
 
-        # Get all network data in a structured way
+        # Get all network data in a structured way, describing the resources concurrently
+        raw_resource_calls = {
+            # EC2 resources
+            "vpcs": get_ec2_resource(ec2, "describe_vpcs", vpc_ids=vpc_ids),
+            "subnets": get_ec2_resource(ec2, "describe_subnets", vpc_ids=vpc_ids),
+            "security_groups": get_ec2_resource(ec2, "describe_security_groups", vpc_ids=vpc_ids),
+            "route_tables": get_ec2_resource(ec2, "describe_route_tables", vpc_ids=vpc_ids),
+            "network_interfaces": get_ec2_resource(
+                ec2, "describe_network_interfaces", vpc_ids=vpc_ids
+            ),
+            "nat_gateways": get_ec2_resource(ec2, "describe_nat_gateways", vpc_ids=vpc_ids),
+            "internet_gateways": get_ec2_resource(
+                ec2, "describe_internet_gateways", vpc_ids=vpc_ids
+            ),
+            # ELB resources
+            "load_balancers": get_elb_resources(elbv2, "describe_load_balancers", vpc_ids),
+            "target_groups": get_associated_target_groups(elbv2, app_name, vpc_ids),
+        }
+        raw_resource_values = await asyncio.gather(*raw_resource_calls.values())
+        raw_resources = dict(zip(raw_resource_calls, raw_resource_values, strict=True))
+
         data = {
             "timestamp": datetime.now().isoformat(),
             "app_name": app_name,
             "vpc_ids": vpc_ids,
             "clusters": clusters,
-            "raw_resources": {
-                # EC2 resources
-                "vpcs": await get_ec2_resource(ec2, "describe_vpcs", vpc_ids=vpc_ids),
-                "subnets": await get_ec2_resource(ec2, "describe_subnets", vpc_ids=vpc_ids),
-                "security_groups": await get_ec2_resource(
-                    ec2, "describe_security_groups", vpc_ids=vpc_ids
-                ),
-                "route_tables": await get_ec2_resource(
-                    ec2, "describe_route_tables", vpc_ids=vpc_ids
-                ),
-                "network_interfaces": await get_ec2_resource(
-                    ec2, "describe_network_interfaces", vpc_ids=vpc_ids
-                ),
-                "nat_gateways": await get_ec2_resource(
-                    ec2, "describe_nat_gateways", vpc_ids=vpc_ids
-                ),
-                "internet_gateways": await get_ec2_resource(
-                    ec2, "describe_internet_gateways", vpc_ids=vpc_ids
-                ),
-                # ELB resources
-                "load_balancers": await get_elb_resources(
-                    elbv2, "describe_load_balancers", vpc_ids
-                ),
-                "target_groups": await get_associated_target_groups(elbv2, app_name, vpc_ids),
-            },
+            "raw_resources": raw_resources,
         }
 
         # Add analysis guidance for the LLM
@@ -190,79 +209,88 @@ async def get_network_data(
         return {"status": "error", "error": str(e)}
 
 
-async def discover_vpcs_from_clusters(clusters: List[str]) -> List[str]:
-    """Discover VPC IDs associated with ECS clusters."""
+async def discover_vpcs_from_clusters(clusters: List[str], ecs=None, ec2=None) -> List[str]:
+    """Discover VPC IDs associated with ECS clusters, examining the clusters concurrently."""
     vpc_ids = []
 
     try:
-        ecs = await get_aws_client("ecs")
-        ec2 = await get_aws_client("ec2")
+        ecs = ecs or await get_aws_client("ecs")
+        ec2 = ec2 or await get_aws_client("ec2")
 
-        for cluster in clusters:
-            # List tasks in the cluster
-            tasks_response = await handle_aws_api_call(
-                ecs.list_tasks, {"taskArns": []}, cluster=cluster
-            )
-            tasks_response = tasks_response or {}
+        for cluster_vpc_ids in await asyncio.gather(
+            *(discover_vpcs_from_cluster(ecs, ec2, cluster) for cluster in clusters)
+        ):
+            vpc_ids.extend(cluster_vpc_ids)
 
-            if not tasks_response.get("taskArns"):
-                continue
+    except Exception as e:
+        logger.warning(f"Error discovering VPCs from clusters: {e}")
 
-            # Describe tasks to get network configuration
-            task_arns = tasks_response.get("taskArns", [])[:100]  # Limit to 100 tasks
-            tasks = await handle_aws_api_call(
-                ecs.describe_tasks,
-                {"tasks": []},
-                cluster=cluster,
-                tasks=task_arns,
-            )
-            tasks = tasks or {}
+    return vpc_ids
 
-            # Extract network interface IDs from tasks
-            eni_ids = []
-            for task in tasks.get("tasks", []):
-                if task is None:
-                    continue
-                for attachment in task.get("attachments", []):
-                    if attachment is None:
-                        continue
-                    if attachment.get("type") == "ElasticNetworkInterface":
-                        for detail in attachment.get("details", []):
-                            if detail is None:
-                                continue
-                            if detail.get("name") == "networkInterfaceId":
-                                value = detail.get("value")
-                                if value:
-                                    eni_ids.append(value)
-
-            # Get VPC IDs from network interfaces
-            if eni_ids:
-                eni_response = await handle_aws_api_call(
-                    ec2.describe_network_interfaces,
-                    {"NetworkInterfaces": []},
-                    NetworkInterfaceIds=eni_ids,
-                )
-                eni_response = eni_response or {}
 
-                for eni in eni_response.get("NetworkInterfaces", []):
-                    if eni is None:
+async def discover_vpcs_from_cluster(ecs, ec2, cluster: str) -> List[str]:
+    """Discover VPC IDs from the network interfaces of the tasks of an ECS cluster."""
+    vpc_ids = []
+
+    # List tasks in the cluster
+    tasks_response = await handle_aws_api_call(ecs.list_tasks, {"taskArns": []}, cluster=cluster)
+    tasks_response = tasks_response or {}
+
+    if not tasks_response.get("taskArns"):
+        return vpc_ids
+
+    # Describe tasks to get network configuration
+    task_arns = tasks_response.get("taskArns", [])[:100]  # Limit to 100 tasks
+    tasks = await handle_aws_api_call(
+        ecs.describe_tasks,
+        {"tasks": []},
+        cluster=cluster,
+        tasks=task_arns,
+    )
+    tasks = tasks or {}
+
+    # Extract network interface IDs from tasks
+    eni_ids = []
+    for task in tasks.get("tasks", []):
+        if task is None:
+            continue
+        for attachment in task.get("attachments", []):
+            if attachment is None:
+                continue
+            if attachment.get("type") == "ElasticNetworkInterface":
+                for detail in attachment.get("details", []):
+                    if detail is None:
                         continue
-                    vpc_id = eni.get("VpcId")
-                    if vpc_id:
-                        vpc_ids.append(vpc_id)
+                    if detail.get("name") == "networkInterfaceId":
+                        value = detail.get("value")
+                        if value:
+                            eni_ids.append(value)
+
+    # Get VPC IDs from network interfaces
+    if eni_ids:
+        eni_response = await handle_aws_api_call(
+            ec2.describe_network_interfaces,
+            {"NetworkInterfaces": []},
+            NetworkInterfaceIds=eni_ids,
+        )
+        eni_response = eni_response or {}
 
-    except Exception as e:
-        logger.warning(f"Error discovering VPCs from clusters: {e}")
+        for eni in eni_response.get("NetworkInterfaces", []):
+            if eni is None:
+                continue
+            vpc_id = eni.get("VpcId")
+            if vpc_id:
+                vpc_ids.append(vpc_id)
 
     return vpc_ids
 
 
-async def discover_vpcs_from_loadbalancers(app_name: str) -> List[str]:
+async def discover_vpcs_from_loadbalancers(app_name: str, elbv2=None) -> List[str]:
     """Discover VPC IDs associated with load balancers related to the application."""
     vpc_ids = []
 
     try:
-        elbv2 = await get_aws_client("elbv2")
+        elbv2 = elbv2 or await get_aws_client("elbv2")
 
         # Describe load balancers
         lb_response = await handle_aws_api_call(
@@ -270,6 +298,7 @@ async def discover_vpcs_from_loadbalancers(app_name: str) -> List[str]:
         )
         lb_response = lb_response or {}
 
+        untagged_vpcs = {}
         for lb in lb_response.get("LoadBalancers", []):
             if lb is None:
                 continue
@@ -282,30 +311,38 @@ async def discover_vpcs_from_loadbalancers(app_name: str) -> List[str]:
             # Also check tags if name doesn't match
             else:
                 lb_arn = lb.get("LoadBalancerArn")
-                if not lb_arn:
-                    continue
-
-                tags_response = await handle_aws_api_call(
+                if lb_arn:
+                    untagged_vpcs[lb_arn] = lb.get("VpcId")
+
+        # Describe the tags of the remaining load balancers in concurrent batches
+        lb_arns = list(untagged_vpcs)
+        tags_responses = await asyncio.gather(
+            *(
+                handle_aws_api_call(
                     elbv2.describe_tags,
                     {"TagDescriptions": []},
-                    ResourceArns=[lb_arn],
+                    ResourceArns=lb_arns[i : i + DESCRIBE_TAGS_MAX_ARNS],
                 )
-                tags_response = tags_response or {}
+                for i in range(0, len(lb_arns), DESCRIBE_TAGS_MAX_ARNS)
+            )
+        )
 
-                for tag_desc in tags_response.get("TagDescriptions", []):
-                    if tag_desc is None:
+        for tags_response in tags_responses:
+            tags_response = tags_response or {}
+            for tag_desc in tags_response.get("TagDescriptions", []):
+                if tag_desc is None:
+                    continue
+                for tag in tag_desc.get("Tags", []):
+                    if tag is None:
                         continue
-                    for tag in tag_desc.get("Tags", []):
-                        if tag is None:
-                            continue
-                        if (
-                            tag.get("Key") == "Name"
-                            and app_name.lower() in tag.get("Value", "").lower()
-                        ):
-                            vpc_id = lb.get("VpcId")
-                            if vpc_id:
-                                vpc_ids.append(vpc_id)
-                            break
+                    if (
+                        tag.get("Key") == "Name"
+                        and app_name.lower() in tag.get("Value", "").lower()
+                    ):
+                        vpc_id = untagged_vpcs.get(tag_desc.get("ResourceArn"))
+                        if vpc_id:
+                            vpc_ids.append(vpc_id)
+                        break
 
     except Exception as e:
         logger.warning(f"Error discovering VPCs from load balancers: {e}")
@@ -357,11 +394,16 @@ async def discover_vpcs_from_cloudformation(app_name: str) -> List[str]:
                 if stack_name:
                     app_stacks.append(stack_name)
 
-        # Describe resources in each stack
-        for stack_name in app_stacks:
-            resources = await handle_aws_api_call(
-                cfn.list_stack_resources, {"StackResourceSummaries": []}, StackName=stack_name
+        # Describe resources in each stack concurrently
+        stack_resources = await asyncio.gather(
+            *(
+                handle_aws_api_call(
+                    cfn.list_stack_resources, {"StackResourceSummaries": []}, StackName=stack_name
+                )
+                for stack_name in app_stacks
             )
+        )
+        for resources in stack_resources:
             resources = resources or {}
 
             for resource in resources.get("StackResourceSummaries", []):
@@ -455,21 +497,24 @@ async def get_associated_target_groups(client, app_name: str, vpc_ids: List[str]
         if name_matched_tgs:
             target_groups = name_matched_tgs
 
-        # Get target health for each group
+        # Get target health for each group concurrently
         result = {"TargetGroups": target_groups, "TargetHealth": {}}
 
-        for tg in target_groups:
-            if tg is None:
-                continue
-            tg_arn = tg.get("TargetGroupArn")
-            if tg_arn:
-                health_response = await handle_aws_api_call(
+        tg_arns = [tg.get("TargetGroupArn") for tg in target_groups if tg is not None]
+        tg_arns = [tg_arn for tg_arn in tg_arns if tg_arn]
+        health_responses = await asyncio.gather(
+            *(
+                handle_aws_api_call(
                     client.describe_target_health,
                     {"TargetHealthDescriptions": []},
                     TargetGroupArn=tg_arn,
                 )
-                health_response = health_response or {}
-                result["TargetHealth"][tg_arn] = health_response.get("TargetHealthDescriptions", [])
+                for tg_arn in tg_arns
+            )
+        )
+        for tg_arn, health_response in zip(tg_arns, health_responses, strict=True):
+            health_response = health_response or {}
+            result["TargetHealth"][tg_arn] = health_response.get("TargetHealthDescriptions", [])
 
         return result
 
@@ -19,8 +19,11 @@ common failure reasons to help diagnose container-level issues.
 """
 
 import datetime
+import json
 import logging
-from typing import Any, Dict, Optional
+import os
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
 
 from botocore.exceptions import ClientError
 
@@ -32,6 +35,210 @@ logger = logging.getLogger(__name__)
 # Explicitly add get_aws_client as an attribute for mocking in tests
 get_aws_client = aws_get_aws_client
 
+# Seconds a stopped task stays in a task failure cursor and its rolling failure counts
+TASK_FAILURE_CURSOR_RETENTION_SECONDS = 24 * 3600
+
+# Maximum number of tasks per describe_tasks call (API limit)
+DESCRIBE_TASKS_BATCH_SIZE = 100
+
+
+class TaskFailureCursor:
+    """
+    Stopped tasks of one cluster that incremental analysis has already described.
+
+    Each seen task keeps its stop time and failure categories for
+    TASK_FAILURE_CURSOR_RETENTION_SECONDS, and category_counts counts the failure categories
+    of the tasks still retained.
+    """
+
+    def __init__(self, tasks: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Creates a cursor.
+
+        Parameters
+        ----------
+        tasks : Dict[str, Dict[str, Any]], optional
+            Seen tasks by ARN, each with its "stopped_at" epoch seconds and "categories"
+        """
+        self.tasks = tasks or {}
+        self.category_counts = Counter(
+            category for task in self.tasks.values() for category in task["categories"]
+        )
+
+    def __contains__(self, task_arn: str) -> bool:
+        """Whether the task has already been described."""
+        return task_arn in self.tasks
+
+    def add(self, task_arn: str, stopped_at: float, categories: List[str]) -> None:
+        """Records a described stopped task and counts its failure categories."""
+        if task_arn in self.tasks:
+            return
+        self.tasks[task_arn] = {"stopped_at": stopped_at, "categories": categories}
+        self.category_counts.update(categories)
+
+    def prune(self, now: float) -> None:
+        """Forgets tasks stopped more than TASK_FAILURE_CURSOR_RETENTION_SECONDS before now."""
+        cutoff = now - TASK_FAILURE_CURSOR_RETENTION_SECONDS
+        for task_arn in [arn for arn, task in self.tasks.items() if task["stopped_at"] < cutoff]:
+            self.category_counts.subtract(self.tasks.pop(task_arn)["categories"])
+        self.category_counts = +self.category_counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the cursor in the form saved to disk."""
+        return {"tasks": self.tasks}
+
+
+# Task failure cursors, keyed by region and cluster name
+_task_failure_cursors: Dict[str, TaskFailureCursor] = {}
+_task_failure_cursors_loaded = False
+
+
+def get_task_failure_cursor_file() -> Optional[str]:
+    """Gets the file task failure cursors persist to, from ECS_TASK_FAILURE_CURSOR_FILE."""
+    return os.environ.get("ECS_TASK_FAILURE_CURSOR_FILE") or None
+
+
+def get_task_failure_cursor(cluster_name: str) -> TaskFailureCursor:
+    """
+    Gets the task failure cursor of a cluster in the current region.
+
+    Cursors are loaded from ECS_TASK_FAILURE_CURSOR_FILE, when set, on first use.
+    """
+    global _task_failure_cursors_loaded
+
+    cursor_file = get_task_failure_cursor_file()
+    if not _task_failure_cursors_loaded and cursor_file and os.path.exists(cursor_file):
+        try:
+            with open(cursor_file, "r") as f:
+                for key, data in json.load(f).items():
+                    _task_failure_cursors[key] = TaskFailureCursor(data.get("tasks"))
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable task failure cursor file {cursor_file}: {e}")
+    _task_failure_cursors_loaded = True
+
+    key = f"{os.environ.get('AWS_REGION', 'us-east-1')}/{cluster_name}"
+    return _task_failure_cursors.setdefault(key, TaskFailureCursor())
+
+
+def save_task_failure_cursors() -> None:
+    """Writes all task failure cursors to ECS_TASK_FAILURE_CURSOR_FILE, when set."""
+    cursor_file = get_task_failure_cursor_file()
+    if not cursor_file:
+        return
+
+    temp_file = f"{cursor_file}.tmp"
+    try:
+        with open(temp_file, "w") as f:
+            json.dump({key: c.to_dict() for key, c in _task_failure_cursors.items()}, f)
+        os.replace(temp_file, cursor_file)
+    except OSError as e:
+        logger.warning(f"Could not save task failure cursors to {cursor_file}: {e}")
+
+
+def reset_task_failure_cursors() -> None:
+    """Forgets all task failure cursors held in memory."""
+    global _task_failure_cursors_loaded
+
+    _task_failure_cursors.clear()
+    _task_failure_cursors_loaded = False
+
+
+def categorize_container_failure(container: Dict[str, Any]) -> str:
+    """
+    Categorizes why a container of a stopped task stopped.
+
+    Parameters
+    ----------
+    container : Dict[str, Any]
+        Container from a describe_tasks response
+
+    Returns
+    -------
+    str
+        The failure category
+    """
+    reason = container.get("reason", "")
+
+    # Image pull failures
+    if "CannotPullContainerError" in reason or "ImagePull" in reason:
+        return "image_pull_failure"
+
+    # Resource constraints
+    if "resource" in reason.lower() and (
+        "constraint" in reason.lower() or "exceed" in reason.lower()
+    ):
+        return "resource_constraint"
+
+    # Exit code 137 (OOM killed)
+    if container.get("exitCode") == 137:
+        return "out_of_memory"
+
+    # Exit code 139 (segmentation fault)
+    if container.get("exitCode") == 139:
+        return "segmentation_fault"
+
+    # Exit code 1 or other non-zero (application error)
+    if container.get("exitCode", 0) != 0 and container.get("exitCode") not in [None, "N/A"]:
+        return "application_error"
+
+    # Task stopped by user or deployment
+    if "Essential container" in reason:
+        return "dependent_container_stopped"
+
+    # Catch-all for uncategorized failures
+    return "other"
+
+
+def analyze_stopped_task(task: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Extracts the failure information of a stopped task.
+
+    Parameters
+    ----------
+    task : Dict[str, Any]
+        Stopped task from a describe_tasks response
+
+    Returns
+    -------
+    Tuple[Dict[str, Any], List[str]]
+        The task failure and the failure category of each of its containers
+    """
+    task_failure = {
+        "task_id": task["taskArn"].split("/")[-1],
+        "task_definition": task["taskDefinitionArn"].split("/")[-1],
+        "stopped_at": (
+            task["stoppedAt"].isoformat()
+            if isinstance(task["stoppedAt"], datetime.datetime)
+            else task["stoppedAt"]
+        ),
+        "started_at": task.get("startedAt", "N/A"),
+        "containers": [],
+    }
+
+    categories = []
+    for container in task["containers"]:
+        task_failure["containers"].append(
+            {
+                "name": container["name"],
+                "exit_code": container.get("exitCode", "N/A"),
+                "reason": container.get("reason", "No reason provided"),
+            }
+        )
+        categories.append(categorize_container_failure(container))
+
+    return task_failure, categories
+
+
+def get_stopped_at(task: Dict[str, Any]) -> Optional[datetime.datetime]:
+    """Gets the timezone-aware stop time of a task, or None if it has not stopped yet."""
+    stopped_at = task.get("stoppedAt")
+    if not isinstance(stopped_at, datetime.datetime):
+        return None
+    # Make stopped_at timezone-aware if it's naive
+    if stopped_at.tzinfo is None:
+        stopped_at = stopped_at.replace(tzinfo=datetime.timezone.utc)
+    return stopped_at
+
 
 async def fetch_task_failures(
     app_name: str,
@@ -39,6 +246,7 @@ async def fetch_task_failures(
     time_window: int = 3600,
     start_time: Optional[datetime.datetime] = None,
     end_time: Optional[datetime.datetime] = None,
+    incremental: bool = False,
 ) -> Dict[str, Any]:
     """
     Task-level diagnostics for ECS task failures.
@@ -56,6 +264,9 @@ async def fetch_task_failures(
         (UTC, takes precedence over time_window if provided)
     end_time : datetime, optional
         Explicit end time for the analysis window (UTC, defaults to current time if not provided)
+    incremental : bool, optional
+        Only describe and report stopped tasks not seen by an earlier incremental call for this
+        cluster, and include rolling failure category counts (default: False)
 
     Returns
     -------
@@ -190,109 +401,71 @@ async def fetch_task_failures(
                 }
 
             # Get recently stopped tasks
-            stopped_tasks = []
             paginator = ecs.get_paginator("list_tasks")
-            for page in paginator.paginate(cluster=cluster_name, desiredStatus="STOPPED"):
-                if page["taskArns"]:
-                    # Get detailed task information
-                    tasks_detail = ecs.describe_tasks(cluster=cluster_name, tasks=page["taskArns"])
-                    for task in tasks_detail["tasks"]:
-                        # Check if the task was stopped within the time window
-                        if "stoppedAt" in task:
-                            stopped_at = task["stoppedAt"]
-                            # Handle timezone-aware vs naive datetime objects
-                            if isinstance(stopped_at, datetime.datetime):
-                                # Make stopped_at timezone-aware if it's naive
-                                if stopped_at.tzinfo is None:
-                                    stopped_at = stopped_at.replace(tzinfo=datetime.timezone.utc)
-                                if stopped_at >= actual_start_time:
-                                    stopped_tasks.append(task)
-
-            # Get running tasks for comparison
-            running_tasks = []
+            if incremental:
+                cursor = get_task_failure_cursor(cluster_name)
+                stopped_task_arns = []
+                for page in paginator.paginate(cluster=cluster_name, desiredStatus="STOPPED"):
+                    stopped_task_arns.extend(page["taskArns"])
+
+                # Only describe the stopped tasks not seen before
+                new_task_arns = [arn for arn in stopped_task_arns if arn not in cursor]
+                described_tasks = []
+                for i in range(0, len(new_task_arns), DESCRIBE_TASKS_BATCH_SIZE):
+                    batch = new_task_arns[i : i + DESCRIBE_TASKS_BATCH_SIZE]
+                    tasks_detail = ecs.describe_tasks(cluster=cluster_name, tasks=batch)
+                    described_tasks.extend(tasks_detail["tasks"])
+            else:
+                described_tasks = []
+                for page in paginator.paginate(cluster=cluster_name, desiredStatus="STOPPED"):
+                    if page["taskArns"]:
+                        # Get detailed task information
+                        tasks_detail = ecs.describe_tasks(
+                            cluster=cluster_name, tasks=page["taskArns"]
+                        )
+                        described_tasks.extend(tasks_detail["tasks"])
+
+            # Count running tasks for comparison
+            running_tasks_count = 0
             for page in paginator.paginate(cluster=cluster_name, desiredStatus="RUNNING"):
-                if page["taskArns"]:
-                    tasks_detail = ecs.describe_tasks(cluster=cluster_name, tasks=page["taskArns"])
-                    running_tasks.extend(tasks_detail["tasks"])
+                running_tasks_count += len(page["taskArns"])
 
-            response["raw_data"]["running_tasks_count"] = len(running_tasks)
+            response["raw_data"]["running_tasks_count"] = running_tasks_count
 
             # Process stopped tasks to extract failure information
-            for task in stopped_tasks:
-                task_failure = {
-                    "task_id": task["taskArn"].split("/")[-1],
-                    "task_definition": task["taskDefinitionArn"].split("/")[-1],
-                    "stopped_at": (
-                        task["stoppedAt"].isoformat()
-                        if isinstance(task["stoppedAt"], datetime.datetime)
-                        else task["stoppedAt"]
-                    ),
-                    "started_at": task.get("startedAt", "N/A"),
-                    "containers": [],
-                }
-
-                # Process container information
-                for container in task["containers"]:
-                    container_info = {
-                        "name": container["name"],
-                        "exit_code": container.get("exitCode", "N/A"),
-                        "reason": container.get("reason", "No reason provided"),
-                    }
-                    task_failure["containers"].append(container_info)
-
-                    # Categorize failures
-                    categorized = False
-
-                    # Image pull failures
-                    if "CannotPullContainerError" in container.get(
-                        "reason", ""
-                    ) or "ImagePull" in container.get("reason", ""):
-                        category = "image_pull_failure"
-                        categorized = True
-
-                    # Resource constraints
-                    elif "resource" in container.get("reason", "").lower() and (
-                        "constraint" in container.get("reason", "").lower()
-                        or "exceed" in container.get("reason", "").lower()
-                    ):
-                        category = "resource_constraint"
-                        categorized = True
-
-                    # Exit code 137 (OOM killed)
-                    elif container.get("exitCode") == 137:
-                        category = "out_of_memory"
-                        categorized = True
-
-                    # Exit code 139 (segmentation fault)
-                    elif container.get("exitCode") == 139:
-                        category = "segmentation_fault"
-                        categorized = True
-
-                    # Exit code 1 or other non-zero (application error)
-                    elif container.get("exitCode", 0) != 0 and container.get("exitCode") not in [
-                        None,
-                        "N/A",
-                    ]:
-                        category = "application_error"
-                        categorized = True
-
-                    # Task stopped by user or deployment
-                    elif "Essential container" in container.get("reason", ""):
-                        category = "dependent_container_stopped"
-                        categorized = True
-
-                    # Catch-all for uncategorized failures
-                    else:
-                        category = "other"
-                        categorized = True
-
-                    if categorized:
-                        if category not in response["failure_categories"]:
-                            response["failure_categories"][category] = []
-                        response["failure_categories"][category].append(task_failure)
+            new_stopped_tasks = 0
+            for task in described_tasks:
+                stopped_at = get_stopped_at(task)
+                if stopped_at is None:
+                    # Still stopping; an incremental call describes it again next time
+                    continue
+
+                task_failure, categories = analyze_stopped_task(task)
+                if incremental:
+                    cursor.add(task["taskArn"], stopped_at.timestamp(), categories)
+                    new_stopped_tasks += 1
+
+                # Check if the task was stopped within the time window
+                if stopped_at < actual_start_time:
+                    continue
+
+                for category in categories:
+                    if category not in response["failure_categories"]:
+                        response["failure_categories"][category] = []
+                    response["failure_categories"][category].append(task_failure)
 
                 response["failed_tasks"].append(task_failure)
 
+            if incremental:
+                cursor.prune(datetime.datetime.now(datetime.timezone.utc).timestamp())
+                save_task_failure_cursors()
+                response["incremental"] = {
+                    "new_stopped_tasks": new_stopped_tasks,
+                    "previously_seen_tasks": len(stopped_task_arns) - len(new_task_arns),
+                    "rolling_window_seconds": TASK_FAILURE_CURSOR_RETENTION_SECONDS,
+                    "rolling_failure_counts": dict(cursor.category_counts),
+                }
+
         except ClientError as e:
             response["ecs_error"] = str(e)
 
@@ -19,7 +19,7 @@ This module provides tools and prompts for creating ECS infrastructure.
 
 from typing import Any, Dict, List, Optional
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
 
 from awslabs.ecs_mcp_server.api.infrastructure import create_infrastructure
@@ -30,6 +30,7 @@ def register_module(mcp: FastMCP) -> None:
 
     @mcp.tool(name="create_ecs_infrastructure")
     async def mcp_create_ecs_infrastructure(
+        ctx: Context,
         app_name: str = Field(
             ...,
             description="Name of the application",
@@ -135,6 +136,15 @@ def register_module(mcp: FastMCP) -> None:
         Returns:
             Dictionary containing infrastructure details or template paths
         """
+        lines_seen = 0
+
+        async def progress(line: str) -> None:
+            # Stream Docker build and push output to the client as it is produced
+            nonlocal lines_seen
+            lines_seen += 1
+            await ctx.report_progress(lines_seen)
+            await ctx.info(line)
+
         return await create_infrastructure(
             app_name=app_name,
             app_path=app_path,
@@ -148,6 +158,7 @@ def register_module(mcp: FastMCP) -> None:
             desired_count=desired_count,
             container_port=container_port,
             health_check_path=health_check_path,
+            progress=progress,
         )
 
     # Prompt patterns for deployment
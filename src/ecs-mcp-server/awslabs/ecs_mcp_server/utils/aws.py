@@ -16,9 +16,15 @@
 AWS utility functions.
 """
 
+import copy
+import json
 import logging
 import os
-from typing import Any, Dict, List
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 from botocore.config import Config
@@ -37,12 +43,168 @@ def get_aws_config() -> Config:
     return Config(user_agent_extra="awslabs/mcp/ecs-mcp-server/0.1.0")
 
 
+# Seconds a read-only response is reused for identical calls on the same client
+AWS_RESPONSE_CACHE_TTL_SECONDS = 5
+
+# Seconds a call waits for an identical in-flight call before making the request itself
+AWS_COALESCED_CALL_TIMEOUT_SECONDS = 60
+
+# Operations whose responses may be shared between identical calls
+COALESCED_OPERATION_PREFIXES = ("Describe", "List", "Get")
+
+# Request context keys used by RequestCoalescer
+_COALESCING_KEY = "ecs_mcp_coalescing_key"
+_COALESCING_SHARED = "ecs_mcp_coalescing_shared"
+_COALESCING_WRITE = "ecs_mcp_coalescing_write"
+
+# Clients shared by the whole process, keyed by (service, region, profile)
+_aws_clients: Dict[Tuple[str, str, str], Any] = {}
+_aws_clients_lock = threading.Lock()
+
+
+class RequestCoalescer:
+    """
+    Shares read-only AWS API calls made through one client.
+
+    Registered on the client's event system, it lets concurrent identical Describe*, List* and
+    Get* calls share a single in-flight request, and answers repeats of a successful call from a
+    short-TTL cache. Every caller gets its own copy of the response, and errors are raised to
+    every caller that shared the request.
+
+    Any other call may change what reads return, so it drops the cache, and reads made after it
+    starts never share a response with reads made before it finished.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = AWS_RESPONSE_CACHE_TTL_SECONDS,
+        wait_timeout_seconds: float = AWS_COALESCED_CALL_TIMEOUT_SECONDS,
+    ):
+        """
+        Creates a coalescer.
+
+        Args:
+            ttl_seconds: Seconds a successful response is reused for; 0 only coalesces
+                in-flight calls
+            wait_timeout_seconds: Seconds a call waits for an identical in-flight call before
+                making the request itself
+        """
+        self.ttl_seconds = ttl_seconds
+        self.wait_timeout_seconds = wait_timeout_seconds
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._responses: Dict[str, Tuple[float, Any, Dict[str, Any]]] = {}
+        self._in_flight: Dict[str, Future] = {}
+
+    def register(self, client) -> None:
+        """Registers the coalescer on a boto3 client."""
+        events = client.meta.events
+        events.register("before-parameter-build", self._build_key)
+        events.register("before-call", self._before_call)
+        events.register("after-call", self._after_call)
+        events.register("after-call-error", self._after_call_error)
+
+    def _invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._responses.clear()
+
+    def _build_key(self, params, model, context, **kwargs) -> None:
+        if model.name.startswith(COALESCED_OPERATION_PREFIXES) and not model.has_streaming_output:
+            request = model.name + json.dumps(params, sort_keys=True, default=str)
+            context[_COALESCING_KEY] = f"{self._generation}:{request}"
+        else:
+            context[_COALESCING_WRITE] = True
+            self._invalidate()
+
+    def _before_call(self, context, **kwargs) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        key = context.get(_COALESCING_KEY)
+        if key is None:
+            return None
+
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached and cached[0] > time.monotonic():
+                context[_COALESCING_SHARED] = True
+                return cached[1], copy.deepcopy(cached[2])
+            future = self._in_flight.get(key)
+            if future is None:
+                # This call makes the request; identical calls wait for its response
+                self._in_flight[key] = Future()
+                return None
+
+        try:
+            http_response, parsed = future.result(timeout=self.wait_timeout_seconds)
+        except FutureTimeoutError:
+            # The call making the request never finished, so stop waiting on it
+            logger.warning(f"Timed out waiting for an identical in-flight call to {key}")
+            with self._lock:
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+            return None
+        context[_COALESCING_SHARED] = True
+        return http_response, copy.deepcopy(parsed)
+
+    def _after_call(self, http_response, parsed, context, **kwargs) -> None:
+        if context.get(_COALESCING_WRITE):
+            self._invalidate()
+            return
+        key = context.get(_COALESCING_KEY)
+        if key is None or context.get(_COALESCING_SHARED):
+            return
+
+        snapshot = copy.deepcopy(parsed)
+        with self._lock:
+            future = self._in_flight.pop(key, None)
+            if self.ttl_seconds > 0 and http_response.status_code < 300:
+                now = time.monotonic()
+                for expired in [k for k, v in self._responses.items() if v[0] <= now]:
+                    del self._responses[expired]
+                self._responses[key] = (now + self.ttl_seconds, http_response, snapshot)
+        if future is not None:
+            future.set_result((http_response, snapshot))
+
+    def _after_call_error(self, exception, context, **kwargs) -> None:
+        if context.get(_COALESCING_WRITE):
+            self._invalidate()
+            return
+        key = context.get(_COALESCING_KEY)
+        if key is None or context.get(_COALESCING_SHARED):
+            return
+
+        with self._lock:
+            future = self._in_flight.pop(key, None)
+        if future is not None:
+            future.set_exception(exception)
+
+
 async def get_aws_client(service_name: str):
-    """Gets an AWS service client."""
+    """
+    Gets an AWS service client.
+
+    Clients are created once per (service, region, profile) and shared by the whole process, with
+    a RequestCoalescer registered so identical read-only calls share responses.
+    """
     region = os.environ.get("AWS_REGION", "us-east-1")
     profile = os.environ.get("AWS_PROFILE", "default")
-    logger.info(f"Using AWS profile: {profile} and region: {region}")
-    return boto3.client(service_name, region_name=region, config=get_aws_config())
+    key = (service_name, region, profile)
+
+    client = _aws_clients.get(key)
+    if client is None:
+        with _aws_clients_lock:
+            client = _aws_clients.get(key)
+            if client is None:
+                logger.info(f"Using AWS profile: {profile} and region: {region}")
+                client = boto3.client(service_name, region_name=region, config=get_aws_config())
+                RequestCoalescer().register(client)
+                _aws_clients[key] = client
+    return client
+
+
+def clear_aws_client_cache() -> None:
+    """Drops all shared AWS clients and the responses cached on them."""
+    with _aws_clients_lock:
+        _aws_clients.clear()
 
 
 async def get_aws_account_id() -> str:
@@ -16,17 +16,27 @@
 Docker utility functions.
 """
 
+import asyncio
 import base64
 import logging
 import os
+import pathlib
+import shutil
 import subprocess
+import tempfile
 import time
-from typing import Optional
+from typing import Awaitable, Callable, List, Optional
 
 from awslabs.ecs_mcp_server.utils.aws import get_aws_account_id, get_aws_client
 
 logger = logging.getLogger(__name__)
 
+# Callback receiving each line of output of a build pipeline as it is produced
+ProgressCallback = Callable[[str], Awaitable[None]]
+
+# Marker in buildx output when the builder cannot export a layer cache
+CACHE_EXPORT_UNSUPPORTED = "cache export is not supported"
+
 
 async def get_ecr_login_password(role_arn: Optional[str] = None) -> str:
     """
@@ -68,17 +78,106 @@ async def get_ecr_login_password(role_arn: Optional[str] = None) -> str:
         raise
 
 
+async def run_command(
+    cmd: List[str], input: Optional[str] = None, progress: Optional[ProgressCallback] = None
+) -> subprocess.CompletedProcess:
+    """
+    Runs a command without blocking the event loop, streaming its output.
+
+    Args:
+        cmd: Command and arguments
+        input: Text written to the command's standard input
+        progress: Callback receiving each line of stdout and stderr as it is produced
+
+    Returns:
+        CompletedProcess with the return code and the complete stdout and stderr
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    async def read_lines(stream: asyncio.StreamReader, lines: List[str]) -> None:
+        async for raw_line in stream:
+            line = raw_line.decode("utf-8", errors="replace")
+            lines.append(line)
+            if progress:
+                await progress(line.rstrip("\n"))
+
+    stdout: List[str] = []
+    stderr: List[str] = []
+    try:
+        if input is not None:
+            process.stdin.write(input.encode("utf-8"))
+            await process.stdin.drain()
+            process.stdin.close()
+        await asyncio.gather(read_lines(process.stdout, stdout), read_lines(process.stderr, stderr))
+        returncode = await process.wait()
+    except BaseException:
+        # Don't leave the command running when the caller is cancelled
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+
+    return subprocess.CompletedProcess(cmd, returncode, "".join(stdout), "".join(stderr))
+
+
+def get_build_cache_dir(repository_uri: str) -> str:
+    """
+    Gets the local directory BuildKit layer caches of a repository's images are kept in.
+
+    The root is ECS_DOCKER_BUILD_CACHE_DIR, defaulting to ~/.cache/ecs-mcp-server/buildkit.
+    """
+    root = os.environ.get("ECS_DOCKER_BUILD_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "ecs-mcp-server", "buildkit"
+    )
+    return os.path.join(root, repository_uri.split("/")[-1])
+
+
+def replace_build_cache(new_cache_dir: str, cache_dir: str) -> None:
+    """
+    Moves a freshly exported BuildKit cache into place of a repository's current cache.
+
+    The current cache is first renamed aside, so a build reading it or a concurrent build
+    swapping in its own cache never sees a half-deleted directory. If another build wins
+    the race, its cache is kept and this one is discarded by the caller.
+    """
+    cache_root, cache_name = os.path.split(cache_dir)
+    stale_cache_dir = tempfile.mkdtemp(prefix=f"{cache_name}-old-", dir=cache_root)
+    try:
+        try:
+            os.replace(cache_dir, stale_cache_dir)
+        except FileNotFoundError:
+            pass
+        os.replace(new_cache_dir, cache_dir)
+    except OSError as e:
+        logger.warning(f"Could not replace the build cache at {cache_dir}: {e}")
+    finally:
+        shutil.rmtree(stale_cache_dir, ignore_errors=True)
+
+
 async def build_and_push_image(
-    app_path: str, repository_uri: str, tag: Optional[str] = None, role_arn: Optional[str] = None
+    app_path: str,
+    repository_uri: str,
+    tag: Optional[str] = None,
+    role_arn: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None,
 ) -> str:
     """
     Builds and pushes a Docker image to ECR.
 
+    Commands run as subprocesses without blocking the event loop, and buildx imports and exports
+    its layer cache from a local directory per repository so rebuilds reuse unchanged layers.
+
     Args:
         app_path: Path to the application directory containing the Dockerfile
         repository_uri: ECR repository URI
         tag: Image tag (if None, uses epoch timestamp)
         role_arn: IAM role ARN to use for ECR authentication
+        progress: Callback receiving each line of build and push output as it is produced
 
     Returns:
         Image tag
@@ -134,14 +233,7 @@ async def build_and_push_image(
             registry_url,
         ]
 
-        docker_login_result = subprocess.run(
-            docker_login_cmd,
-            input=ecr_password,
-            capture_output=True,
-            text=True,
-            shell=False,
-            check=False,
-        )
+        docker_login_result = await run_command(docker_login_cmd, input=ecr_password)
 
         if docker_login_result.returncode != 0:
             logger.error(f"Docker login failed: {docker_login_result.stderr}")
@@ -153,32 +245,47 @@ async def build_and_push_image(
         # This ensures compatibility with ECS which runs on x86_64 architecture
         logger.info(f"Building Docker image at {app_path} for linux/amd64 platform...")
 
-        # Try buildx first which allows platform specification
-        try:
-            # Use list arguments instead of shell=True for security
-            buildx_cmd = [
-                "docker",
-                "buildx",
-                "build",
-                "--platform",
-                "linux/amd64",
-                "-t",
-                f"{repository_uri}:{tag}",
-                "--load",
-                app_path,
-            ]
+        # Try buildx first which allows platform specification and a local layer cache.
+        # The cache is exported to a new directory that replaces the old one after a successful
+        # build, since BuildKit's local cache otherwise grows without bound. Each build exports
+        # to its own directory so concurrent builds of a repository don't clobber each other.
+        cache_dir = get_build_cache_dir(repository_uri)
+        cache_root, cache_name = os.path.split(cache_dir)
+        pathlib.Path(cache_root).mkdir(parents=True, exist_ok=True)
+        new_cache_dir = tempfile.mkdtemp(prefix=f"{cache_name}-new-", dir=cache_root)
+        buildx_cmd = [
+            "docker",
+            "buildx",
+            "build",
+            "--platform",
+            "linux/amd64",
+            "-t",
+            f"{repository_uri}:{tag}",
+            "--load",
+        ]
+        cache_args = ["--cache-to", f"type=local,dest={new_cache_dir},mode=max"]
+        if os.path.isdir(cache_dir):
+            cache_args.extend(["--cache-from", f"type=local,src={cache_dir}"])
 
-            logger.info(f"Attempting buildx command: {' '.join(buildx_cmd)}")
-            build_result = subprocess.run(
-                buildx_cmd, capture_output=True, text=True, shell=False, check=False
+        logger.info(f"Attempting buildx command: {' '.join(buildx_cmd + cache_args)}")
+        try:
+            build_result = await run_command(
+                buildx_cmd + cache_args + [app_path], progress=progress
             )
-
-            if build_result.returncode != 0:
-                logger.warning(f"Docker buildx failed: {build_result.stderr}")
-                raise subprocess.CalledProcessError(build_result.returncode, buildx_cmd)
-
-        except (subprocess.CalledProcessError, FileNotFoundError):
+            if CACHE_EXPORT_UNSUPPORTED in build_result.stderr.lower():
+                # The default docker driver can't export caches, so build without one
+                logger.warning("Docker buildx cannot export a layer cache, building without it")
+                build_result = await run_command(buildx_cmd + [app_path], progress=progress)
+            elif build_result.returncode == 0 and os.listdir(new_cache_dir):
+                replace_build_cache(new_cache_dir, cache_dir)
+        except FileNotFoundError as e:
+            build_result = subprocess.CompletedProcess(buildx_cmd, 1, "", str(e))
+        finally:
+            shutil.rmtree(new_cache_dir, ignore_errors=True)
+
+        if build_result.returncode != 0:
             # Fallback to regular build with platform args if buildx fails
+            logger.warning(f"Docker buildx failed: {build_result.stderr}")
             logger.warning("Docker buildx failed, trying alternative approach")
 
             # Use list arguments instead of shell=True for security
@@ -193,9 +300,7 @@ async def build_and_push_image(
             ]
 
             logger.info(f"Attempting alternative build command: {' '.join(build_cmd)}")
-            build_result = subprocess.run(
-                build_cmd, capture_output=True, text=True, shell=False, check=False
-            )
+            build_result = await run_command(build_cmd, progress=progress)
 
             if build_result.returncode != 0:
                 logger.error(f"Docker build failed: {build_result.stderr}")
@@ -210,9 +315,7 @@ async def build_and_push_image(
         # Use list arguments instead of shell=True for security
         push_cmd = ["docker", "push", f"{repository_uri}:{tag}"]
 
-        push_result = subprocess.run(
-            push_cmd, capture_output=True, text=True, shell=False, check=False
-        )
+        push_result = await run_command(push_cmd, progress=progress)
 
         if push_result.returncode != 0:
             logger.error(f"Docker push failed: {push_result.stderr}")
@@ -244,9 +347,7 @@ async def build_and_push_image(
         if role_arn:
             verify_cmd.extend(["--role-arn", role_arn])
 
-        verify_result = subprocess.run(
-            verify_cmd, capture_output=True, text=True, shell=False, check=False
-        )
+        verify_result = await run_command(verify_cmd)
 
         if verify_result.returncode != 0:
             logger.warning(f"Could not verify image push: {verify_result.stderr}")
@@ -88,6 +88,7 @@ class TestEcsTroubleshootingTool:
             "time_window": 3600,
             "start_time": None,
             "end_time": None,
+            "incremental": False,
         }
         assert result == expected
 
@@ -381,7 +382,7 @@ class TestGuardrails:
             "get_ecs_troubleshooting_guidance": {"required": 1, "optional": 1},
             "fetch_cloudformation_status": {"required": 1, "optional": 0},
             "fetch_service_events": {"required": 3, "optional": 3},
-            "fetch_task_failures": {"required": 2, "optional": 3},
+            "fetch_task_failures": {"required": 2, "optional": 4},
             "fetch_task_logs": {"required": 2, "optional": 5},
             "detect_image_pull_failures": {"required": 1, "optional": 0},
             "fetch_network_configuration": {"required": 1, "optional": 2},
@@ -1,11 +1,16 @@
 """Tests for the simplified fetch_network_configuration function."""
 
+import asyncio
+import sys
+import threading
 import unittest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from awslabs.ecs_mcp_server.api.troubleshooting_tools.fetch_network_configuration import (
+    discover_vpcs_from_clusters,
+    discover_vpcs_from_loadbalancers,
     get_associated_target_groups,
     get_ec2_resource,
     get_elb_resources,
@@ -222,6 +227,85 @@ class TestFetchNetworkConfiguration(unittest.IsolatedAsyncioTestCase):
         )
         self.assertIn(tg_arn, result["TargetHealth"])
 
+    async def test_handle_aws_api_call_runs_blocking_calls_concurrently(self):
+        """Test that blocking API calls run off the event loop and overlap."""
+        from awslabs.ecs_mcp_server.api.troubleshooting_tools.fetch_network_configuration import (
+            handle_aws_api_call,
+        )
+
+        barrier = threading.Barrier(2, timeout=5)
+        event_loop_thread = threading.get_ident()
+
+        def describe(**kwargs):
+            # Both calls must be in flight at once for the barrier to release
+            barrier.wait()
+            return {"thread": threading.get_ident(), **kwargs}
+
+        results = await asyncio.gather(
+            handle_aws_api_call(describe, {}, Name="a"),
+            handle_aws_api_call(describe, {}, Name="b"),
+        )
+
+        self.assertEqual([r["Name"] for r in results], ["a", "b"])
+        self.assertTrue(all(r["thread"] != event_loop_thread for r in results))
+
+    async def test_discover_vpcs_from_clusters_with_shared_clients(self):
+        """Test VPC discovery across clusters using the clients passed in."""
+        mock_ecs = MagicMock()
+        mock_ec2 = MagicMock()
+        mock_ecs.list_tasks.side_effect = lambda cluster: {"taskArns": [f"{cluster}-task"]}
+        mock_ecs.describe_tasks.side_effect = lambda cluster, tasks: {
+            "tasks": [
+                {
+                    "attachments": [
+                        {
+                            "type": "ElasticNetworkInterface",
+                            "details": [{"name": "networkInterfaceId", "value": f"eni-{cluster}"}],
+                        }
+                    ]
+                }
+            ]
+        }
+        mock_ec2.describe_network_interfaces.side_effect = lambda NetworkInterfaceIds: {
+            "NetworkInterfaces": [{"VpcId": f"vpc-{NetworkInterfaceIds[0][4:]}"}]
+        }
+
+        # The package re-exports a function of the same name, so patch the module object
+        module = sys.modules[discover_vpcs_from_clusters.__module__]
+        with patch.object(module, "get_aws_client") as mock_get_aws_client:
+            vpc_ids = await discover_vpcs_from_clusters(
+                ["cluster-1", "cluster-2"], ecs=mock_ecs, ec2=mock_ec2
+            )
+
+        mock_get_aws_client.assert_not_called()
+        self.assertEqual(vpc_ids, ["vpc-cluster-1", "vpc-cluster-2"])
+
+    async def test_discover_vpcs_from_loadbalancers_batches_tags(self):
+        """Test that load balancer tags are described in batches of ARNs."""
+        mock_elbv2 = MagicMock()
+        mock_elbv2.describe_load_balancers.return_value = {
+            "LoadBalancers": [
+                {"LoadBalancerName": f"lb-{i}", "LoadBalancerArn": f"arn-{i}", "VpcId": f"vpc-{i}"}
+                for i in range(25)
+            ]
+            + [{"LoadBalancerName": "test-app-lb", "VpcId": "vpc-app"}]
+        }
+        mock_elbv2.describe_tags.side_effect = lambda ResourceArns: {
+            "TagDescriptions": [
+                {"ResourceArn": arn, "Tags": [{"Key": "Name", "Value": "test-app"}]}
+                for arn in ResourceArns
+                if arn == "arn-22"
+            ]
+        }
+
+        vpc_ids = await discover_vpcs_from_loadbalancers("test-app", elbv2=mock_elbv2)
+
+        self.assertEqual(vpc_ids, ["vpc-app", "vpc-22"])
+        batch_sizes = [
+            len(call.kwargs["ResourceArns"]) for call in mock_elbv2.describe_tags.call_args_list
+        ]
+        self.assertEqual(batch_sizes, [20, 5])
+
     def test_generate_analysis_guide(self):
         """Test that analysis guide is generated with the expected structure."""
         # Import the function directly
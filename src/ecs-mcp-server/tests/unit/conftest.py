@@ -4,6 +4,8 @@ Pytest configuration for unit tests.
 
 import pytest
 
+from awslabs.ecs_mcp_server.utils.aws import clear_aws_client_cache
+
 
 # Configure pytest to handle async tests
 @pytest.fixture
@@ -21,3 +23,11 @@ def event_loop():
 def anyio_backend():
     """Configure anyio to only use asyncio backend."""
     return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def reset_aws_clients():
+    """Drop shared AWS clients so each test creates its own."""
+    clear_aws_client_cache()
+    yield
+    clear_aws_client_cache()
@@ -2,13 +2,17 @@
 Unit tests for AWS utility functions.
 """
 
+import threading
+import time
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
+import boto3
 import pytest
 from botocore.exceptions import ClientError
 
 from awslabs.ecs_mcp_server.utils.aws import (
+    RequestCoalescer,
     create_ecr_repository,
     get_aws_account_id,
     get_aws_client,
@@ -208,5 +212,143 @@ class TestAWSUtils(unittest.TestCase):
         self.assertEqual(password, "ecrpassword")
 
 
+class TestSharedAWSClients:
+    """Tests for the shared client cache and request coalescing."""
+
+    @pytest.mark.anyio
+    async def test_get_aws_client_shares_clients(self, monkeypatch):
+        """Test that clients are shared per service, region and profile."""
+        monkeypatch.setenv("AWS_REGION", "us-west-2")
+        with patch("boto3.client", side_effect=lambda *args, **kwargs: MagicMock()) as mock_client:
+            ecs = await get_aws_client("ecs")
+            assert await get_aws_client("ecs") is ecs
+            assert await get_aws_client("ec2") is not ecs
+
+            monkeypatch.setenv("AWS_REGION", "eu-west-1")
+            assert await get_aws_client("ecs") is not ecs
+
+        assert mock_client.call_count == 3
+        ecs.meta.events.register.assert_any_call("before-call", ANY)
+
+    @pytest.fixture
+    def ecs(self):
+        """ECS client with a coalescer and a fake transport that counts requests."""
+        client = boto3.client(
+            "ecs",
+            region_name="us-east-1",
+            aws_access_key_id="test",
+            aws_secret_access_key="test",
+        )
+        client.coalescer = RequestCoalescer()
+        client.coalescer.register(client)
+        client.requests = []
+        client.release = threading.Event()
+        client.release.set()
+        client.status_code = 200
+        client.interrupt = False
+
+        def send(params, **kwargs):
+            client.requests.append(params["body"])
+            if client.interrupt:
+                client.interrupt = False
+                raise KeyboardInterrupt
+            client.release.wait(5)
+            if client.status_code >= 300:
+                return MagicMock(status_code=400), {
+                    "Error": {"Code": "ClientException", "Message": "denied"}
+                }
+            return MagicMock(status_code=200), {"clusters": [{"clusterName": "a"}]}
+
+        # Registered after the coalescer, so it only sees calls the coalescer lets through
+        client.meta.events.register("before-call", send)
+        return client
+
+    def test_concurrent_identical_calls_share_request(self, ecs):
+        """Test that concurrent identical calls share one in-flight request."""
+        ecs.release.clear()
+        results = []
+
+        def describe():
+            results.append(ecs.describe_clusters(clusters=["a"]))
+
+        threads = [threading.Thread(target=describe) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+            while not ecs.requests:
+                time.sleep(0.01)
+        ecs.release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(ecs.requests) == 1
+        assert len(results) == 3
+        assert results[0] == results[1] == results[2]
+        assert results[0] is not results[1]
+
+    def test_repeated_calls_use_cache(self, ecs):
+        """Test that repeated calls within the TTL reuse the response."""
+        first = ecs.describe_clusters(clusters=["a"])
+        first["clusters"].clear()
+
+        assert ecs.describe_clusters(clusters=["a"]) == {"clusters": [{"clusterName": "a"}]}
+        assert len(ecs.requests) == 1
+
+        ecs.describe_clusters(clusters=["b"])
+        assert len(ecs.requests) == 2
+
+    def test_errors_are_not_cached(self, ecs):
+        """Test that failed calls raise and are retried on the next call."""
+        ecs.status_code = 400
+        for _ in range(2):
+            with pytest.raises(ClientError, match="denied"):
+                ecs.describe_clusters(clusters=["a"])
+
+        assert len(ecs.requests) == 2
+
+    def test_write_calls_drop_cache(self, ecs):
+        """Test that reads after a write don't reuse responses from before it."""
+        ecs.describe_clusters(clusters=["a"])
+        ecs.update_cluster_settings(
+            cluster="a", settings=[{"name": "containerInsights", "value": "enabled"}]
+        )
+        ecs.describe_clusters(clusters=["a"])
+
+        assert len(ecs.requests) == 3
+
+        ecs.status_code = 400
+        with pytest.raises(ClientError):
+            ecs.delete_cluster(cluster="a")
+        ecs.status_code = 200
+        ecs.describe_clusters(clusters=["a"])
+
+        assert len(ecs.requests) == 5
+
+    def test_read_in_flight_during_write_is_not_shared(self, ecs):
+        """Test that a read started before a write isn't shared with reads made after it."""
+        ecs.release.clear()
+        reader = threading.Thread(target=ecs.describe_clusters, kwargs={"clusters": ["a"]})
+        reader.start()
+        while not ecs.requests:
+            time.sleep(0.01)
+
+        ecs.coalescer._invalidate()
+        ecs.release.set()
+        ecs.describe_clusters(clusters=["a"])
+        reader.join(5)
+
+        assert len(ecs.requests) == 2
+
+    def test_abandoned_in_flight_call_times_out(self, ecs):
+        """Test that callers stop waiting on an in-flight call that never finished."""
+        ecs.coalescer.wait_timeout_seconds = 0.1
+        ecs.interrupt = True
+        with pytest.raises(KeyboardInterrupt):
+            ecs.describe_clusters(clusters=["a"])
+
+        assert ecs.describe_clusters(clusters=["a"]) == {"clusters": [{"clusterName": "a"}]}
+        assert len(ecs.requests) == 2
+        assert not ecs.coalescer._in_flight
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,9 @@
 Pytest-style unit tests for docker utils module.
 """
 
+import os
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,11 +13,19 @@ from awslabs.ecs_mcp_server.utils.aws import get_aws_account_id
 from awslabs.ecs_mcp_server.utils.docker import (
     build_and_push_image,
     get_ecr_login_password,
+    replace_build_cache,
+    run_command,
 )
 
 
+@pytest.fixture(autouse=True)
+def build_cache_dir(tmp_path, monkeypatch):
+    """Keep BuildKit cache directories created by builds out of the home directory."""
+    monkeypatch.setenv("ECS_DOCKER_BUILD_CACHE_DIR", str(tmp_path))
+
+
 @pytest.mark.anyio
-@patch("awslabs.ecs_mcp_server.utils.docker.subprocess.run")
+@patch("awslabs.ecs_mcp_server.utils.docker.run_command")
 @patch("awslabs.ecs_mcp_server.utils.docker.os.path.exists")
 @patch("awslabs.ecs_mcp_server.utils.docker.get_aws_account_id")
 @patch("awslabs.ecs_mcp_server.utils.docker.get_ecr_login_password")
@@ -31,7 +42,7 @@ async def test_build_and_push_image_success(
     # Mock get_ecr_login_password
     mock_get_ecr_login_password.return_value = "password"
 
-    # Mock subprocess.run with different return values for different commands
+    # Mock run_command with different return values for different commands
     mock_run.side_effect = [
         MagicMock(returncode=0),  # docker login
         MagicMock(returncode=0),  # docker buildx build
@@ -52,7 +63,7 @@ async def test_build_and_push_image_success(
     # Verify os.path.exists was called
     mock_exists.assert_called_once_with("/path/to/app/Dockerfile")
 
-    # Verify subprocess.run was called multiple times
+    # Verify run_command was called multiple times
     assert mock_run.call_count == 4
 
     # Verify the result
@@ -60,7 +71,7 @@ async def test_build_and_push_image_success(
 
 
 @pytest.mark.anyio
-@patch("awslabs.ecs_mcp_server.utils.docker.subprocess.run")
+@patch("awslabs.ecs_mcp_server.utils.docker.run_command")
 @patch("awslabs.ecs_mcp_server.utils.docker.os.path.exists")
 @patch("awslabs.ecs_mcp_server.utils.docker.get_aws_account_id")
 async def test_build_and_push_image_dockerfile_not_found(
@@ -85,12 +96,12 @@ async def test_build_and_push_image_dockerfile_not_found(
     # Verify the error message
     assert "Dockerfile not found" in str(excinfo.value)
 
-    # Verify subprocess.run was not called
+    # Verify run_command was not called
     mock_run.assert_not_called()
 
 
 @pytest.mark.anyio
-@patch("awslabs.ecs_mcp_server.utils.docker.subprocess.run")
+@patch("awslabs.ecs_mcp_server.utils.docker.run_command")
 @patch("awslabs.ecs_mcp_server.utils.docker.os.path.exists")
 @patch("awslabs.ecs_mcp_server.utils.docker.get_aws_account_id")
 @patch("awslabs.ecs_mcp_server.utils.docker.get_ecr_login_password")
@@ -107,7 +118,7 @@ async def test_build_and_push_image_build_error(
     # Mock get_ecr_login_password
     mock_get_ecr_login_password.return_value = "password"
 
-    # Mock subprocess.run for each command
+    # Mock run_command for each command
     mock_run.side_effect = [
         MagicMock(returncode=0),  # docker login
         MagicMock(returncode=1, stderr="Error: failed to build image"),  # docker buildx build
@@ -130,7 +141,7 @@ async def test_build_and_push_image_build_error(
 
 
 @pytest.mark.anyio
-@patch("awslabs.ecs_mcp_server.utils.docker.subprocess.run")
+@patch("awslabs.ecs_mcp_server.utils.docker.run_command")
 @patch("awslabs.ecs_mcp_server.utils.docker.os.path.exists")
 @patch("awslabs.ecs_mcp_server.utils.docker.get_aws_account_id")
 @patch("awslabs.ecs_mcp_server.utils.docker.get_ecr_login_password")
@@ -147,7 +158,7 @@ async def test_build_and_push_image_push_error(
     # Mock get_ecr_login_password
     mock_get_ecr_login_password.return_value = "password"
 
-    # Mock subprocess.run for each command
+    # Mock run_command for each command
     mock_run.side_effect = [
         MagicMock(returncode=0),  # docker login
         MagicMock(returncode=0),  # docker buildx build
@@ -167,6 +178,131 @@ async def test_build_and_push_image_push_error(
     assert "Failed to push Docker image" in str(excinfo.value)
 
 
+@pytest.mark.anyio
+async def test_run_command_streams_output():
+    """Test run_command passes input and streams each output line as it is produced."""
+    lines = []
+
+    async def progress(line):
+        lines.append(line)
+
+    script = "import sys; print(sys.stdin.read().upper()); print('done', file=sys.stderr)"
+    result = await run_command([sys.executable, "-c", script], input="build", progress=progress)
+
+    assert result.returncode == 0
+    assert result.stdout == "BUILD\n"
+    assert result.stderr == "done\n"
+    assert sorted(lines) == ["BUILD", "done"]
+
+
+def completed(returncode=0, stdout="", stderr=""):
+    """Result of a command run by the mocked run_command."""
+    return subprocess.CompletedProcess([], returncode, stdout, stderr)
+
+
+@pytest.mark.anyio
+@patch("awslabs.ecs_mcp_server.utils.docker.run_command")
+@patch("awslabs.ecs_mcp_server.utils.docker.os.path.exists", return_value=True)
+@patch("awslabs.ecs_mcp_server.utils.docker.get_aws_account_id", return_value="123456789012")
+@patch("awslabs.ecs_mcp_server.utils.docker.get_ecr_login_password", return_value="password")
+async def test_build_and_push_image_uses_local_cache(
+    mock_get_ecr_login_password,
+    mock_get_aws_account_id,
+    mock_exists,
+    mock_run,
+    tmp_path,
+):
+    """Test buildx imports and rotates the local layer cache of the repository."""
+    (tmp_path / "test-app").mkdir()
+
+    exports = []
+
+    def run(cmd, input=None, progress=None):
+        if "buildx" in cmd:
+            # BuildKit exports the new cache next to the old one
+            dest = cmd[cmd.index("--cache-to") + 1].split(",")[1].removeprefix("dest=")
+            (tmp_path / dest / "index.json").write_text("{}")
+            exports.append(dest)
+        return completed(stdout='{"imageTag": "latest"}')
+
+    mock_run.side_effect = run
+    progress = MagicMock()
+
+    await build_and_push_image(
+        app_path="/path/to/app",
+        repository_uri="123456789012.dkr.ecr.us-west-2.amazonaws.com/test-app",
+        tag="latest",
+        role_arn="arn:aws:iam::123456789012:role/test-ecr-push-pull-role",
+        progress=progress,
+    )
+
+    buildx_cmd = mock_run.call_args_list[1].args[0]
+    assert f"type=local,src={tmp_path / 'test-app'}" in buildx_cmd
+    assert exports[0].startswith(str(tmp_path / "test-app-new-"))
+    assert mock_run.call_args_list[1].kwargs["progress"] is progress
+    assert (tmp_path / "test-app" / "index.json").is_file()
+    assert sorted(os.listdir(tmp_path)) == ["test-app"]
+
+
+def test_replace_build_cache_keeps_concurrent_cache(tmp_path):
+    """Test a cache swapped in by a concurrent build is kept rather than clobbered."""
+    cache_dir = tmp_path / "test-app"
+    (cache_dir / "blobs").mkdir(parents=True)
+    new_cache_dir = tmp_path / "test-app-new-1"
+    new_cache_dir.mkdir()
+    (new_cache_dir / "index.json").write_text("{}")
+
+    real_replace = os.replace
+
+    def replace(src, dst):
+        real_replace(src, dst)
+        if dst == str(cache_dir):
+            return
+        # Another build swaps in its cache between the two renames
+        (cache_dir / "concurrent").mkdir(parents=True)
+
+    with patch("awslabs.ecs_mcp_server.utils.docker.os.replace", side_effect=replace):
+        replace_build_cache(str(new_cache_dir), str(cache_dir))
+
+    assert os.listdir(cache_dir) == ["concurrent"]
+    assert sorted(os.listdir(tmp_path)) == ["test-app", "test-app-new-1"]
+
+
+@pytest.mark.anyio
+@patch("awslabs.ecs_mcp_server.utils.docker.run_command")
+@patch("awslabs.ecs_mcp_server.utils.docker.os.path.exists", return_value=True)
+@patch("awslabs.ecs_mcp_server.utils.docker.get_aws_account_id", return_value="123456789012")
+@patch("awslabs.ecs_mcp_server.utils.docker.get_ecr_login_password", return_value="password")
+async def test_build_and_push_image_without_cache_export(
+    mock_get_ecr_login_password,
+    mock_get_aws_account_id,
+    mock_exists,
+    mock_run,
+    tmp_path,
+):
+    """Test buildx is retried without a cache when its driver cannot export one."""
+    mock_run.side_effect = [
+        completed(),  # docker login
+        completed(1, stderr="ERROR: Cache export is not supported for the docker driver."),
+        completed(),  # docker buildx build without cache
+        completed(),  # docker push
+        completed(stdout='{"imageTag": "latest"}'),  # aws ecr list-images
+    ]
+
+    await build_and_push_image(
+        app_path="/path/to/app",
+        repository_uri="123456789012.dkr.ecr.us-west-2.amazonaws.com/test-app",
+        tag="latest",
+        role_arn="arn:aws:iam::123456789012:role/test-ecr-push-pull-role",
+    )
+
+    retry_cmd = mock_run.call_args_list[2].args[0]
+    assert "buildx" in retry_cmd
+    assert "--cache-to" not in retry_cmd
+    assert mock_run.call_count == 5
+    assert os.listdir(tmp_path) == []
+
+
 @pytest.mark.anyio
 @patch("awslabs.ecs_mcp_server.utils.aws.get_aws_client_with_role")
 async def test_get_ecr_login_password_success(mock_get_aws_client_with_role):
@@ -244,6 +244,7 @@ async def test_create_infrastructure_step_2(
         app_path="/path/to/app",
         repository_uri="123456789012.dkr.ecr.us-west-2.amazonaws.com/test-app",
         role_arn="arn:aws:iam::123456789012:role/test-app-ecr-pushpull-role",
+        progress=None,
     )
 
     # Verify the result
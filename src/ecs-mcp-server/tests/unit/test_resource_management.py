@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from awslabs.ecs_mcp_server.api.resource_management import (
+    clear_inventory_cache,
     describe_cluster,
     describe_container_instance,
     describe_service,
@@ -245,6 +246,77 @@ async def test_list_clusters(mock_get_client):
     assert result["count"] == 2
 
 
+def describe_named(key, param):
+    """Fake describe_* call returning one named resource per identifier."""
+    return lambda **kwargs: {key: [{"name": arn} for arn in kwargs[param]]}
+
+
+@pytest.mark.anyio
+@patch("awslabs.ecs_mcp_server.api.resource_management.get_aws_client")
+async def test_list_clusters_paginates_and_batches(mock_get_client):
+    """Test list_clusters follows nextToken and describes clusters in batches of 100."""
+    arns = [f"cluster-{i}" for i in range(150)]
+    mock_ecs = MagicMock()
+    mock_ecs.list_clusters.side_effect = [
+        {"clusterArns": arns[:100], "nextToken": "page-2"},
+        {"clusterArns": arns[100:]},
+    ]
+    mock_ecs.describe_clusters.side_effect = describe_named("clusters", "clusters")
+    mock_get_client.return_value = mock_ecs
+
+    result = await list_clusters({})
+
+    assert mock_ecs.list_clusters.call_args_list[1].kwargs == {"nextToken": "page-2"}
+    batch_sizes = [len(c.kwargs["clusters"]) for c in mock_ecs.describe_clusters.call_args_list]
+    assert batch_sizes == [100, 50]
+    assert [c["name"] for c in result["clusters"]] == arns
+    assert result["count"] == 150
+
+
+@pytest.mark.anyio
+@patch("awslabs.ecs_mcp_server.api.resource_management.get_aws_client")
+async def test_list_services_all_clusters_batches(mock_get_client):
+    """Test list_services describes each cluster's services in batches of 10, in cluster order."""
+    mock_ecs = MagicMock()
+    mock_ecs.list_clusters.return_value = {"clusterArns": ["cluster-1", "cluster-2"]}
+    mock_ecs.get_paginator.return_value.paginate.side_effect = lambda cluster: [
+        {"serviceArns": [f"{cluster}/service-{i}" for i in range(25)]}
+    ]
+    mock_ecs.describe_services.side_effect = describe_named("services", "services")
+    mock_get_client.return_value = mock_ecs
+
+    result = await list_services({})
+
+    assert mock_ecs.describe_services.call_count == 6
+    assert all(len(c.kwargs["services"]) <= 10 for c in mock_ecs.describe_services.call_args_list)
+    assert [s["name"] for s in result["services"]] == [
+        f"cluster-{c}/service-{i}" for c in (1, 2) for i in range(25)
+    ]
+
+
+@pytest.mark.anyio
+@patch("awslabs.ecs_mcp_server.api.resource_management.get_aws_client")
+async def test_list_clusters_inventory_cache(mock_get_client, monkeypatch):
+    """Test that inventory snapshots are reused while ECS_INVENTORY_CACHE_TTL allows."""
+    mock_ecs = MagicMock()
+    mock_ecs.list_clusters.return_value = {"clusterArns": ["cluster-1"]}
+    mock_ecs.describe_clusters.side_effect = describe_named("clusters", "clusters")
+    mock_get_client.return_value = mock_ecs
+
+    clear_inventory_cache()
+    try:
+        await list_clusters({})
+        monkeypatch.setenv("ECS_INVENTORY_CACHE_TTL", "60")
+        first = await list_clusters({})
+        first["clusters"].clear()
+        second = await list_clusters({})
+    finally:
+        clear_inventory_cache()
+
+    assert mock_ecs.list_clusters.call_count == 2
+    assert second["clusters"] == [{"name": "cluster-1"}]
+
+
 @pytest.mark.anyio
 @patch("awslabs.ecs_mcp_server.api.resource_management.get_aws_client")
 async def test_list_clusters_empty(mock_get_client):
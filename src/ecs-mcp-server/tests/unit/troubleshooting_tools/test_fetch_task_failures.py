@@ -3,6 +3,7 @@ Unit tests for the fetch_task_failures function using pytest's native async test
 """
 
 import datetime
+import sys
 from unittest import mock
 
 import pytest
@@ -364,3 +365,103 @@ async def test_with_start_and_end_time(mock_get_aws_client):
     # Verify the result
     assert result["status"] == "success"
     assert result["cluster_exists"]
+
+
+task_failures_module = sys.modules[fetch_task_failures.__module__]
+
+
+def stopped_task(task_id, exit_code, stopped_at):
+    """Build a describe_tasks task stopped at the given time."""
+    return {
+        "taskArn": f"arn:aws:ecs:us-west-2:123456789012:task/test-cluster/{task_id}",
+        "taskDefinitionArn": "arn:aws:ecs:us-west-2:123456789012:task-definition/test-app:1",
+        "stoppedAt": stopped_at,
+        "containers": [{"name": "app", "exitCode": exit_code, "reason": "Exited"}],
+    }
+
+
+@pytest.fixture
+def incremental_ecs_client():
+    """ECS client listing stopped tasks from a mutable dict of tasks by ARN."""
+    client = mock.Mock()
+    client.stopped_tasks = {}
+    client.describe_clusters.return_value = {"clusters": [{"clusterName": "test-cluster"}]}
+
+    def paginate(cluster, desiredStatus):
+        if desiredStatus == "RUNNING":
+            return [{"taskArns": ["running-1", "running-2"]}]
+        return [{"taskArns": list(client.stopped_tasks)}]
+
+    client.get_paginator.return_value.paginate.side_effect = paginate
+    client.describe_tasks.side_effect = lambda cluster, tasks: {
+        "tasks": [client.stopped_tasks[arn] for arn in tasks]
+    }
+    task_failures_module.reset_task_failure_cursors()
+    with mock.patch.object(task_failures_module, "aws_get_aws_client", return_value=client):
+        yield client
+    task_failures_module.reset_task_failure_cursors()
+
+
+@pytest.mark.anyio
+async def test_incremental_describes_only_new_tasks(incremental_ecs_client, monkeypatch):
+    """Test that incremental calls skip stopped tasks seen before and keep rolling counts."""
+    monkeypatch.delenv("ECS_TASK_FAILURE_CURSOR_FILE", raising=False)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    first = stopped_task("task-1", 1, now - datetime.timedelta(minutes=5))
+    incremental_ecs_client.stopped_tasks[first["taskArn"]] = first
+
+    result = await fetch_task_failures("test-app", "test-cluster", incremental=True)
+
+    assert [t["task_id"] for t in result["failed_tasks"]] == ["task-1"]
+    assert result["raw_data"]["running_tasks_count"] == 2
+    assert result["incremental"]["rolling_failure_counts"] == {"application_error": 1}
+
+    second = stopped_task("task-2", 137, now - datetime.timedelta(minutes=1))
+    incremental_ecs_client.stopped_tasks[second["taskArn"]] = second
+
+    result = await fetch_task_failures("test-app", "test-cluster", incremental=True)
+
+    incremental_ecs_client.describe_tasks.assert_called_with(
+        cluster="test-cluster", tasks=[second["taskArn"]]
+    )
+    assert [t["task_id"] for t in result["failed_tasks"]] == ["task-2"]
+    assert list(result["failure_categories"]) == ["out_of_memory"]
+    assert result["incremental"]["new_stopped_tasks"] == 1
+    assert result["incremental"]["previously_seen_tasks"] == 1
+    assert result["incremental"]["rolling_failure_counts"] == {
+        "application_error": 1,
+        "out_of_memory": 1,
+    }
+
+
+@pytest.mark.anyio
+async def test_incremental_cursor_persists(incremental_ecs_client, monkeypatch, tmp_path):
+    """Test that cursors are saved to and reloaded from ECS_TASK_FAILURE_CURSOR_FILE."""
+    cursor_file = tmp_path / "cursors.json"
+    monkeypatch.setenv("ECS_TASK_FAILURE_CURSOR_FILE", str(cursor_file))
+    now = datetime.datetime.now(datetime.timezone.utc)
+    task = stopped_task("task-1", 1, now - datetime.timedelta(minutes=5))
+    incremental_ecs_client.stopped_tasks[task["taskArn"]] = task
+
+    await fetch_task_failures("test-app", "test-cluster", incremental=True)
+    task_failures_module.reset_task_failure_cursors()
+    result = await fetch_task_failures("test-app", "test-cluster", incremental=True)
+
+    assert cursor_file.exists()
+    assert incremental_ecs_client.describe_tasks.call_count == 1
+    assert result["failed_tasks"] == []
+    assert result["incremental"]["rolling_failure_counts"] == {"application_error": 1}
+
+
+def test_task_failure_cursor_prunes_old_tasks():
+    """Test that tasks leave the cursor and its counts after the retention window."""
+    cursor = task_failures_module.TaskFailureCursor()
+    retention = task_failures_module.TASK_FAILURE_CURSOR_RETENTION_SECONDS
+    cursor.add("old", 0, ["other", "out_of_memory"])
+    cursor.add("new", retention, ["out_of_memory"])
+
+    cursor.prune(retention + 1)
+
+    assert "old" not in cursor
+    assert "new" in cursor
+    assert cursor.category_counts == {"out_of_memory": 1}
@@ -14,16 +14,82 @@
 
 """CloudWatch handler for the EKS MCP Server."""
 
+import asyncio
 import datetime
 import json
-import time
+import re
 from awslabs.eks_mcp_server.aws_helper import AwsHelper
+from awslabs.eks_mcp_server.consts import MAX_CONCURRENT_LOG_QUERIES, MAX_METRIC_DATA_QUERIES
 from awslabs.eks_mcp_server.logging_helper import LogLevel, log_with_request_id
-from awslabs.eks_mcp_server.models import CloudWatchLogsResponse, CloudWatchMetricsResponse
+from awslabs.eks_mcp_server.models import (
+    CloudWatchLogsBatchResponse,
+    CloudWatchLogsResponse,
+    CloudWatchMetricsBatchResponse,
+    CloudWatchMetricsResponse,
+    CloudWatchResourceLogs,
+    MetricQuery,
+    MetricSeries,
+)
 from mcp.server.fastmcp import Context
 from mcp.types import TextContent
 from pydantic import Field
-from typing import Optional, Union
+from typing import Any, Dict, List, Optional, Union
+
+
+# Metric data query ids, which metric math expressions reference queries by
+METRIC_QUERY_ID = re.compile(r'\b[a-z][a-zA-Z0-9_]*\b')
+
+
+def pack_metric_queries(
+    queries: List[Dict[str, Any]], max_queries: int = MAX_METRIC_DATA_QUERIES
+) -> List[List[Dict[str, Any]]]:
+    """Pack metric data queries into as few GetMetricData requests as possible.
+
+    Queries referenced by a metric math expression are kept in the same request as the
+    expression, as expressions can only reference queries of their own request.
+
+    Args:
+        queries: MetricDataQueries entries, each with a unique Id
+        max_queries: Maximum number of queries per request
+
+    Returns:
+        Lists of queries, one per request
+
+    Raises:
+        ValueError: If more than max_queries queries depend on each other
+    """
+    ids = {query['Id'] for query in queries}
+    parents = {query_id: query_id for query_id in ids}
+
+    def find(query_id):
+        while parents[query_id] != query_id:
+            parents[query_id] = parents[parents[query_id]]
+            query_id = parents[query_id]
+        return query_id
+
+    # Group expressions with the queries they reference
+    for query in queries:
+        for referenced_id in set(METRIC_QUERY_ID.findall(query.get('Expression', ''))) & ids:
+            parents[find(referenced_id)] = find(query['Id'])
+
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for query in queries:
+        groups.setdefault(find(query['Id']), []).append(query)
+
+    # Place each group in the first request with room for it
+    batches: List[List[Dict[str, Any]]] = []
+    for group in groups.values():
+        if len(group) > max_queries:
+            raise ValueError(
+                f'{len(group)} metric queries reference each other, more than the '
+                f'{max_queries} allowed in a single request'
+            )
+        batch = next((b for b in batches if len(b) + len(group) <= max_queries), None)
+        if batch is None:
+            batches.append(list(group))
+        else:
+            batch.extend(group)
+    return batches
 
 
 class CloudWatchHandler:
@@ -45,7 +111,11 @@ class CloudWatchHandler:
 
         # Register tools
         self.mcp.tool(name='get_cloudwatch_logs')(self.get_cloudwatch_logs)
+        self.mcp.tool(name='get_cloudwatch_logs_for_resources')(
+            self.get_cloudwatch_logs_for_resources
+        )
         self.mcp.tool(name='get_cloudwatch_metrics')(self.get_cloudwatch_metrics)
+        self.mcp.tool(name='get_cloudwatch_metrics_batch')(self.get_cloudwatch_metrics_batch)
 
     def resolve_time_range(
         self,
@@ -199,33 +269,10 @@ class CloudWatchHandler:
             # Create CloudWatch Logs client
             logs = AwsHelper.create_boto3_client('logs')
 
-            # Determine the log group based on log_type
-            known_types = {'application', 'host', 'performance', 'dataplane'}
-            if log_type in known_types:
-                log_group = f'/aws/containerinsights/{cluster_name}/{log_type}'
-            elif log_type == 'control-plane':
-                log_group = f'/aws/eks/{cluster_name}/cluster'
-            else:
-                log_group = log_type  # Assume user passed full log group name
-
-            # Determine fields to include
-            query_fields = fields if fields else '@timestamp, @message'
-
-            # Construct the base query
-            query = f"""
-            fields {query_fields}
-            """
-
-            # This prevents filtering by cluster name twice when the resource type is "cluster"
-            if resource_type != 'cluster' and resource_name is not None:
-                query += f"\n| filter @message like '{resource_name}'"
-
-            # Add additional filter pattern if provided
-            if filter_pattern:
-                query += f'\n| {filter_pattern}'
-
-            # Add sorting and limit
-            query += f'\n| sort @timestamp desc\n| limit {limit}'
+            log_group = self._resolve_log_group(cluster_name, log_type)
+            query = self._build_logs_query(
+                resource_type, resource_name, limit, filter_pattern, fields
+            )
 
             resource_str = (
                 f'{resource_type} {resource_name} in ' if resource_name is not None else ''
@@ -239,29 +286,10 @@ class CloudWatchHandler:
                 end_time=end_dt.isoformat(),
             )
 
-            # Start the query
-            start_query_response = logs.start_query(
-                logGroupName=log_group,
-                startTime=int(start_dt.timestamp()),
-                endTime=int(end_dt.timestamp()),
-                queryString=query,
+            log_entries = await self._run_logs_query(
+                ctx, logs, log_group, query, start_dt, end_dt, resource_type, resource_name
             )
 
-            query_id = start_query_response['queryId']
-
-            # Poll for results
-            query_response = self._poll_query_results(
-                ctx, logs, query_id, resource_type, resource_name
-            )
-
-            # Process results
-            results = query_response['results']
-            log_entries = []
-
-            for result in results:
-                entry = self._build_log_entry(result)
-                log_entries.append(entry)
-
             log_with_request_id(
                 ctx,
                 LogLevel.INFO,
@@ -305,6 +333,298 @@ class CloudWatchHandler:
                 log_entries=[],
             )
 
+    async def get_cloudwatch_logs_for_resources(
+        self,
+        ctx: Context,
+        resource_type: str = Field(
+            ...,
+            description='Resource type to search logs for. Valid values: "pod", "node", "container". This determines how logs are filtered.',
+        ),
+        cluster_name: str = Field(
+            ...,
+            description='Name of the EKS cluster where the resources are located. Used to construct the CloudWatch log group name.',
+        ),
+        log_type: str = Field(
+            ...,
+            description="""Log type to query. Options:
+            - "application": Container/application logs
+            - "host": Node-level system logs
+            - "performance": Performance metrics logs
+            - "control-plane": EKS control plane logs
+            - Or provide a custom CloudWatch log group name directly""",
+        ),
+        resource_names: List[str] = Field(
+            ...,
+            description='Resource names to search for in log messages (e.g., pod names, node names). One query is run for each resource.',
+            min_length=1,
+        ),
+        minutes: int = Field(
+            15,
+            description='Number of minutes to look back for logs. Default: 15. Ignored if start_time is provided.',
+        ),
+        start_time: Optional[str] = Field(
+            None,
+            description='Start time in ISO format (e.g., "2023-01-01T00:00:00Z"). If provided, overrides the minutes parameter.',
+        ),
+        end_time: Optional[str] = Field(
+            None,
+            description='End time in ISO format (e.g., "2023-01-01T01:00:00Z"). If not provided, defaults to current time.',
+        ),
+        limit: int = Field(
+            50,
+            description='Maximum number of log entries to return for each resource.',
+        ),
+        filter_pattern: Optional[str] = Field(
+            None,
+            description='Additional CloudWatch Logs filter pattern to apply to each query. Uses CloudWatch Logs Insights syntax (e.g., "ERROR", "field=value").',
+        ),
+        fields: Optional[str] = Field(
+            None,
+            description='Custom fields to include in the query results (defaults to "@timestamp, @message"). Use CloudWatch Logs Insights field syntax.',
+        ),
+    ) -> CloudWatchLogsBatchResponse:
+        """Get logs from CloudWatch for several resources of a cluster at once.
+
+        This tool runs a CloudWatch Logs Insights query for each of several Kubernetes resources
+        in an EKS cluster concurrently, such as all nodes of a node group or all pods of a
+        deployment, and returns the log entries of each resource separately.
+
+        IMPORTANT: Use this tool instead of calling get_cloudwatch_logs once per resource.
+
+        ## Requirements
+        - The server must be run with the `--allow-sensitive-data-access` flag
+        - The EKS cluster must have CloudWatch logging enabled
+
+        ## Response Information
+        The response includes the log group and time range queried, and for each resource its
+        log entries, or an error message if its query failed. A failed query does not affect
+        the results of the other resources.
+
+        Args:
+            ctx: MCP context
+            resource_type: Resource type (pod, node, container)
+            cluster_name: Name of the EKS cluster
+            log_type: Log type (application, host, performance, control-plane, or custom)
+            resource_names: Resource names to search for in log messages
+            minutes: Number of minutes to look back
+            start_time: Start time in ISO format (overrides minutes)
+            end_time: End time in ISO format (defaults to now)
+            limit: Maximum number of log entries to return for each resource
+            filter_pattern: Additional CloudWatch Logs filter pattern
+            fields: Custom fields to include in the query results
+
+        Returns:
+            CloudWatchLogsBatchResponse with the log entries of each resource
+        """
+        try:
+            # Check if sensitive data access is allowed
+            if not self.allow_sensitive_data_access:
+                error_message = (
+                    'Access to CloudWatch logs requires --allow-sensitive-data-access flag'
+                )
+                log_with_request_id(ctx, LogLevel.ERROR, error_message)
+                return CloudWatchLogsBatchResponse(
+                    isError=True,
+                    content=[TextContent(type='text', text=error_message)],
+                    resource_type=resource_type,
+                    cluster_name=cluster_name,
+                    log_type=log_type,
+                    log_group='',
+                    start_time='',
+                    end_time='',
+                    resources=[],
+                )
+
+            start_dt, end_dt = self.resolve_time_range(start_time, end_time, minutes)
+
+            # Create CloudWatch Logs client
+            logs = AwsHelper.create_boto3_client('logs')
+            log_group = self._resolve_log_group(cluster_name, log_type)
+            names = list(dict.fromkeys(resource_names))
+
+            log_with_request_id(
+                ctx,
+                LogLevel.INFO,
+                f'Starting {len(names)} CloudWatch Logs queries for {resource_type} resources '
+                f'in cluster {cluster_name}',
+                log_group=log_group,
+                start_time=start_dt.isoformat(),
+                end_time=end_dt.isoformat(),
+            )
+
+            # Bound the number of queries running at once, Logs Insights limits concurrent queries
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOG_QUERIES)
+
+            async def query_resource(resource_name):
+                query = self._build_logs_query(
+                    resource_type, resource_name, limit, filter_pattern, fields
+                )
+                async with semaphore:
+                    return await self._run_logs_query(
+                        ctx, logs, log_group, query, start_dt, end_dt, resource_type, resource_name
+                    )
+
+            outcomes = await asyncio.gather(
+                *(query_resource(resource_name) for resource_name in names),
+                return_exceptions=True,
+            )
+
+            resources = []
+            for resource_name, outcome in zip(names, outcomes):
+                if isinstance(outcome, Exception):
+                    resources.append(
+                        CloudWatchResourceLogs(
+                            resource_name=resource_name, log_entries=[], error=str(outcome)
+                        )
+                    )
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                else:
+                    resources.append(
+                        CloudWatchResourceLogs(resource_name=resource_name, log_entries=outcome)
+                    )
+
+            entry_count = sum(len(resource.log_entries) for resource in resources)
+            failed = sum(1 for resource in resources if resource.error is not None)
+            message = (
+                f'Retrieved {entry_count} log entries for {len(resources)} {resource_type} '
+                f'resources in cluster {cluster_name}'
+            )
+            if failed:
+                message += f' ({failed} queries failed)'
+            log_with_request_id(ctx, LogLevel.INFO, message)
+
+            return CloudWatchLogsBatchResponse(
+                isError=failed == len(resources),
+                content=[TextContent(type='text', text=message)],
+                resource_type=resource_type,
+                cluster_name=cluster_name,
+                log_type=log_type,
+                log_group=log_group,
+                start_time=start_dt.isoformat(),
+                end_time=end_dt.isoformat(),
+                resources=resources,
+            )
+
+        except Exception as e:
+            error_message = f'Failed to get logs for {resource_type} resources: {str(e)}'
+            log_with_request_id(ctx, LogLevel.ERROR, error_message)
+
+            return CloudWatchLogsBatchResponse(
+                isError=True,
+                content=[TextContent(type='text', text=error_message)],
+                resource_type=resource_type,
+                cluster_name=cluster_name,
+                log_type=log_type,
+                log_group='',
+                start_time='',
+                end_time='',
+                resources=[],
+            )
+
+    def _resolve_log_group(self, cluster_name: str, log_type: str) -> str:
+        """Get the CloudWatch log group of a log type of a cluster.
+
+        Args:
+            cluster_name: Name of the EKS cluster
+            log_type: Log type (application, host, performance, control-plane, or custom)
+
+        Returns:
+            CloudWatch log group name
+        """
+        known_types = {'application', 'host', 'performance', 'dataplane'}
+        if log_type in known_types:
+            return f'/aws/containerinsights/{cluster_name}/{log_type}'
+        elif log_type == 'control-plane':
+            return f'/aws/eks/{cluster_name}/cluster'
+        else:
+            return log_type  # Assume user passed full log group name
+
+    def _build_logs_query(
+        self,
+        resource_type: str,
+        resource_name: Optional[str],
+        limit: int,
+        filter_pattern: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> str:
+        """Build a CloudWatch Logs Insights query for the logs of a resource.
+
+        Args:
+            resource_type: Resource type (pod, node, container, cluster)
+            resource_name: Resource name to search for in log messages (optional)
+            limit: Maximum number of log entries to return
+            filter_pattern: Additional CloudWatch Logs filter pattern (optional)
+            fields: Custom fields to include in the query results (optional)
+
+        Returns:
+            Logs Insights query string
+        """
+        # Determine fields to include
+        query_fields = fields if fields else '@timestamp, @message'
+
+        # Construct the base query
+        query = f"""
+            fields {query_fields}
+            """
+
+        # This prevents filtering by cluster name twice when the resource type is "cluster"
+        if resource_type != 'cluster' and resource_name is not None:
+            query += f"\n| filter @message like '{resource_name}'"
+
+        # Add additional filter pattern if provided
+        if filter_pattern:
+            query += f'\n| {filter_pattern}'
+
+        # Add sorting and limit
+        query += f'\n| sort @timestamp desc\n| limit {limit}'
+        return query
+
+    async def _run_logs_query(
+        self,
+        ctx,
+        logs_client,
+        log_group: str,
+        query: str,
+        start_dt: datetime.datetime,
+        end_dt: datetime.datetime,
+        resource_type: str,
+        resource_name: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """Run a CloudWatch Logs Insights query and return its log entries.
+
+        Args:
+            ctx: MCP context
+            logs_client: Boto3 CloudWatch Logs client
+            log_group: Log group to query
+            query: Logs Insights query string
+            start_dt: Start time of the query
+            end_dt: End time of the query
+            resource_type: Resource type for logging
+            resource_name: Resource name for logging
+
+        Returns:
+            Log entries of the query results
+        """
+        # Start the query
+        start_query_response = await asyncio.to_thread(
+            logs_client.start_query,
+            logGroupName=log_group,
+            startTime=int(start_dt.timestamp()),
+            endTime=int(end_dt.timestamp()),
+            queryString=query,
+        )
+
+        query_id = start_query_response['queryId']
+
+        # Poll for results
+        query_response = await self._poll_query_results(
+            ctx, logs_client, query_id, resource_type, resource_name
+        )
+
+        # Process results
+        return [self._build_log_entry(result) for result in query_response['results']]
+
     async def get_cloudwatch_metrics(
         self,
         ctx: Context,
@@ -525,7 +845,262 @@ class CloudWatchHandler:
                 data_points=[],
             )
 
-    def _poll_query_results(
+    async def get_cloudwatch_metrics_batch(
+        self,
+        ctx: Context,
+        cluster_name: str = Field(
+            ...,
+            description='Name of the EKS cluster to get metrics for.',
+        ),
+        queries: List[MetricQuery] = Field(
+            ...,
+            description="""Metrics and metric math expressions to retrieve. Each query either specifies a metric
+            (metric_name, namespace, dimensions, stat) or a metric math expression over the ids of other queries
+            (e.g., {"id": "util", "expression": "m1 / m2 * 100"}). Set return_data to false for queries only
+            used as inputs to expressions.""",
+            min_length=1,
+        ),
+        minutes: int = Field(
+            15,
+            description='Number of minutes to look back for metrics. Default: 15. Ignored if start_time is provided.',
+        ),
+        start_time: Optional[str] = Field(
+            None,
+            description='Start time in ISO format (e.g., "2023-01-01T00:00:00Z"). If provided, overrides the minutes parameter.',
+        ),
+        end_time: Optional[str] = Field(
+            None,
+            description='End time in ISO format (e.g., "2023-01-01T01:00:00Z"). If not provided, defaults to current time.',
+        ),
+        period: int = Field(
+            60,
+            description='Period in seconds for the metric data points of queries that do not specify one. Default: 60 (1 minute).',
+        ),
+    ) -> CloudWatchMetricsBatchResponse:
+        """Get many CloudWatch metrics and metric math expressions for a cluster in one call.
+
+        This tool retrieves any number of metrics, dimension and statistic combinations and
+        metric math expressions for resources in an EKS cluster, such as the CPU and memory of
+        every node or pod of a workload. Queries are packed into as few CloudWatch GetMetricData
+        requests as possible, and all pages of results are retrieved.
+
+        IMPORTANT: Use this tool instead of calling get_cloudwatch_metrics once per metric or resource.
+
+        IMPORTANT: Use the get_eks_metrics_guidance tool first to determine the correct dimensions for metric queries.
+
+        ## Requirements
+        - The EKS cluster must have CloudWatch Container Insights enabled
+        - The metrics must be available in the specified namespaces
+
+        ## Response Information
+        The response includes a single list of timestamps, in ascending order, and one series of
+        values per returned query, aligned with the timestamps. Values are null at timestamps
+        where a series has no data point.
+
+        ## Usage Tips
+        - Give queries ids to reference them in expressions, and labels to tell series apart
+        - Use expressions to compute utilization or rates server-side (e.g., "m1 / m2 * 100", "RATE(m1)")
+        - Use the same period for all queries to get densely aligned series
+
+        Args:
+            ctx: MCP context
+            cluster_name: Name of the EKS cluster
+            queries: Metric and expression queries
+            minutes: Number of minutes to look back
+            start_time: Start time in ISO format (overrides minutes)
+            end_time: End time in ISO format (defaults to now)
+            period: Default period in seconds for the metric data points
+
+        Returns:
+            CloudWatchMetricsBatchResponse with the timestamps and the values of each series
+        """
+        try:
+            start_dt, end_dt = self.resolve_time_range(start_time, end_time, minutes)
+            metric_data_queries = self._build_metric_data_queries(cluster_name, queries, period)
+            batches = pack_metric_queries(metric_data_queries)
+
+            log_with_request_id(
+                ctx,
+                LogLevel.INFO,
+                f'Getting {len(metric_data_queries)} CloudWatch metric queries for cluster '
+                f'{cluster_name} in {len(batches)} requests',
+                start_time=start_dt.isoformat(),
+                end_time=end_dt.isoformat(),
+            )
+
+            # Create CloudWatch client
+            cloudwatch = AwsHelper.create_boto3_client('cloudwatch')
+
+            # Retrieve the batches concurrently, each request is paginated separately
+            batch_results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        self._get_metric_data_pages, cloudwatch, batch, start_dt, end_dt
+                    )
+                    for batch in batches
+                )
+            )
+            results: Dict[str, Dict[str, Any]] = {}
+            for batch_result in batch_results:
+                results.update(batch_result)
+
+            # Align all series on the union of their timestamps
+            timestamps = sorted({ts for result in results.values() for ts in result['Timestamps']})
+            series = []
+            for query in metric_data_queries:
+                if not query['ReturnData']:
+                    continue
+                result = results.get(query['Id'], {})
+                values_by_timestamp = dict(
+                    zip(result.get('Timestamps', []), result.get('Values', []))
+                )
+                series.append(
+                    MetricSeries(
+                        id=query['Id'],
+                        label=result.get('Label') or query.get('Label'),
+                        status_code=result.get('StatusCode'),
+                        values=[values_by_timestamp.get(ts) for ts in timestamps],
+                    )
+                )
+
+            success_message = (
+                f'Successfully retrieved {len(series)} metric series with {len(timestamps)} '
+                f'timestamps in cluster {cluster_name}'
+            )
+            log_with_request_id(ctx, LogLevel.INFO, success_message)
+
+            return CloudWatchMetricsBatchResponse(
+                isError=False,
+                content=[TextContent(type='text', text=success_message)],
+                cluster_name=cluster_name,
+                start_time=start_dt.isoformat(),
+                end_time=end_dt.isoformat(),
+                timestamps=[ts.isoformat() for ts in timestamps],
+                series=series,
+            )
+
+        except Exception as e:
+            error_message = f'Failed to get metrics: {str(e)}'
+            log_with_request_id(ctx, LogLevel.ERROR, error_message)
+
+            return CloudWatchMetricsBatchResponse(
+                isError=True,
+                content=[TextContent(type='text', text=error_message)],
+                cluster_name=cluster_name,
+                start_time='',
+                end_time='',
+                timestamps=[],
+                series=[],
+            )
+
+    def _build_metric_data_queries(
+        self, cluster_name: str, queries: List[MetricQuery], period: int
+    ) -> List[Dict[str, Any]]:
+        """Convert metric queries to GetMetricData MetricDataQueries entries.
+
+        Args:
+            cluster_name: Name of the EKS cluster, which ClusterName dimensions must match
+            queries: Metric and expression queries
+            period: Period in seconds of metric queries that do not specify one
+
+        Returns:
+            List of MetricDataQueries entries
+
+        Raises:
+            ValueError: If a query is invalid
+        """
+        metric_data_queries = []
+        ids = set()
+        for index, query in enumerate(queries, start=1):
+            query_id = query.id or f'm{index}'
+            if not re.fullmatch(r'[a-z][a-zA-Z0-9_]*', query_id):
+                raise ValueError(
+                    f"Invalid query id '{query_id}', ids must start with a lowercase letter "
+                    'and contain only letters, numbers and underscores'
+                )
+            if query_id in ids:
+                raise ValueError(f"Duplicate query id '{query_id}'")
+            ids.add(query_id)
+
+            metric_data_query: Dict[str, Any] = {'Id': query_id, 'ReturnData': query.return_data}
+            if query.label:
+                metric_data_query['Label'] = query.label
+
+            if query.expression:
+                if query.metric_name:
+                    raise ValueError(
+                        f"Query '{query_id}' must specify either a metric or an expression"
+                    )
+                metric_data_query['Expression'] = query.expression
+                if query.period:
+                    metric_data_query['Period'] = query.period
+            else:
+                if not query.metric_name or not query.namespace:
+                    raise ValueError(
+                        f"Query '{query_id}' must specify a metric_name and namespace, or an expression"
+                    )
+                cluster_dimension = query.dimensions.get('ClusterName')
+                if cluster_dimension is not None and cluster_dimension != cluster_name:
+                    raise ValueError(
+                        f"Provided cluster_name '{cluster_name}' does not match ClusterName "
+                        f"dimension '{cluster_dimension}' of query '{query_id}'"
+                    )
+                metric_data_query['MetricStat'] = {
+                    'Metric': {
+                        'Namespace': query.namespace,
+                        'MetricName': query.metric_name,
+                        'Dimensions': [
+                            {'Name': name, 'Value': value}
+                            for name, value in query.dimensions.items()
+                        ],
+                    },
+                    'Period': query.period or period,
+                    'Stat': query.stat,
+                }
+            metric_data_queries.append(metric_data_query)
+        return metric_data_queries
+
+    def _get_metric_data_pages(
+        self,
+        cloudwatch,
+        metric_data_queries: List[Dict[str, Any]],
+        start_dt: datetime.datetime,
+        end_dt: datetime.datetime,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get all pages of metric data for a single GetMetricData request.
+
+        Args:
+            cloudwatch: CloudWatch client
+            metric_data_queries: MetricDataQueries entries of the request
+            start_dt: Start time of the data points
+            end_dt: End time of the data points
+
+        Returns:
+            Results by query id, with the Label, StatusCode, Timestamps and Values of all pages
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        params: Dict[str, Any] = {
+            'MetricDataQueries': metric_data_queries,
+            'StartTime': start_dt,
+            'EndTime': end_dt,
+            'ScanBy': 'TimestampAscending',
+        }
+        while True:
+            response = cloudwatch.get_metric_data(**params)
+            for metric_data in response.get('MetricDataResults', []):
+                result = results.setdefault(
+                    metric_data['Id'], {'Label': None, 'Timestamps': [], 'Values': []}
+                )
+                result['Label'] = metric_data.get('Label') or result['Label']
+                result['StatusCode'] = metric_data.get('StatusCode')
+                result['Timestamps'].extend(metric_data.get('Timestamps', []))
+                result['Values'].extend(metric_data.get('Values', []))
+            next_token = response.get('NextToken')
+            if not next_token:
+                return results
+            params['NextToken'] = next_token
+
+    async def _poll_query_results(
         self,
         ctx,
         logs_client,
@@ -537,6 +1112,9 @@ class CloudWatchHandler:
     ):
         """Poll for CloudWatch Logs query results with exponential backoff.
 
+        Polling waits without blocking the event loop. If polling is cancelled or times out,
+        the query is stopped so it does not keep running in CloudWatch Logs.
+
         Args:
             ctx: MCP context
             logs_client: Boto3 CloudWatch Logs client
@@ -563,48 +1141,66 @@ class CloudWatchHandler:
 
         resource_name_str = f' {resource_name}' if resource_name is not None else ''
 
-        while attempts < max_attempts:
-            query_response = logs_client.get_query_results(queryId=query_id)
-            status = query_response.get('status')
-
-            if status == 'Complete':
-                log_with_request_id(
-                    ctx,
-                    LogLevel.INFO,
-                    f'CloudWatch Logs query completed successfully after {attempts + 1} attempts',
-                )
-                return query_response
-            elif status == 'Failed':
-                error_message = (
-                    f'CloudWatch Logs query failed for {resource_type}{resource_name_str}'
-                )
-                log_with_request_id(ctx, LogLevel.ERROR, error_message)
-                raise Exception(error_message)
-            elif status == 'Cancelled':
-                error_message = (
-                    f'CloudWatch Logs query was cancelled for {resource_type}{resource_name_str}'
-                )
-                log_with_request_id(ctx, LogLevel.ERROR, error_message)
-                raise Exception(error_message)
-
-            # Log progress periodically
-            if attempts % 5 == 0:
-                log_with_request_id(
-                    ctx,
-                    LogLevel.INFO,
-                    f'Waiting for CloudWatch Logs query to complete (attempt {attempts + 1}/{max_attempts})',
+        try:
+            while attempts < max_attempts:
+                query_response = await asyncio.to_thread(
+                    logs_client.get_query_results, queryId=query_id
                 )
+                status = query_response.get('status')
 
-            # Sleep with exponential backoff (capped at 5 seconds)
-            time.sleep(min(delay, 5))
-            delay = min(delay * 1.5, 5)  # Exponential backoff with a cap
-            attempts += 1
+                if status == 'Complete':
+                    log_with_request_id(
+                        ctx,
+                        LogLevel.INFO,
+                        f'CloudWatch Logs query completed successfully after {attempts + 1} attempts',
+                    )
+                    return query_response
+                elif status == 'Failed':
+                    error_message = (
+                        f'CloudWatch Logs query failed for {resource_type}{resource_name_str}'
+                    )
+                    log_with_request_id(ctx, LogLevel.ERROR, error_message)
+                    raise Exception(error_message)
+                elif status == 'Cancelled':
+                    error_message = f'CloudWatch Logs query was cancelled for {resource_type}{resource_name_str}'
+                    log_with_request_id(ctx, LogLevel.ERROR, error_message)
+                    raise Exception(error_message)
+
+                # Log progress periodically
+                if attempts % 5 == 0:
+                    log_with_request_id(
+                        ctx,
+                        LogLevel.INFO,
+                        f'Waiting for CloudWatch Logs query to complete (attempt {attempts + 1}/{max_attempts})',
+                    )
+
+                # Sleep with exponential backoff (capped at 5 seconds)
+                await asyncio.sleep(min(delay, 5))
+                delay = min(delay * 1.5, 5)  # Exponential backoff with a cap
+                attempts += 1
+        except asyncio.CancelledError:
+            await self._stop_query(logs_client, query_id)
+            raise
 
-        # If we've exhausted all attempts, raise a timeout error
+        # If we've exhausted all attempts, stop the query and raise a timeout error
+        await self._stop_query(logs_client, query_id)
         error_message = f'CloudWatch Logs query timed out after {max_attempts} attempts for {resource_type}{resource_name_str}'
         log_with_request_id(ctx, LogLevel.ERROR, error_message)
         raise TimeoutError(error_message)
 
+    async def _stop_query(self, logs_client, query_id):
+        """Stop a CloudWatch Logs query that is no longer polled for, ignoring failures.
+
+        Args:
+            logs_client: Boto3 CloudWatch Logs client
+            query_id: ID of the query to stop
+        """
+        try:
+            await asyncio.to_thread(logs_client.stop_query, queryId=query_id)
+        except Exception:
+            # The query may already have finished
+            pass
+
     def _build_log_entry(self, result):
         """Build a log entry from CloudWatch Logs query result.
 
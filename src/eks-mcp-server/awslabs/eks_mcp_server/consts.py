@@ -28,6 +28,18 @@ CFN_CREATED_BY_TAG = 'EksMcpServer'
 CFN_STACK_TAG_KEY = 'CreatedBy'
 CFN_STACK_TAG_VALUE = 'EksMcpServer'
 
+# Number of resources requested per page when listing Kubernetes resources
+K8S_LIST_PAGE_SIZE = 500
+
+# Maximum number of concurrent Kubernetes API requests per cluster
+K8S_MAX_CONCURRENT_REQUESTS_PER_CLUSTER = 4
+
+# Maximum number of CloudWatch Logs Insights queries run at once by a single tool call
+MAX_CONCURRENT_LOG_QUERIES = 10
+
+# Maximum number of metric data queries in a single CloudWatch GetMetricData request
+MAX_METRIC_DATA_QUERIES = 500
+
 # Error message templates
 STACK_NOT_OWNED_ERROR_TEMPLATE = (
     'Stack {stack_name} exists but was not created by {tool_name}. '
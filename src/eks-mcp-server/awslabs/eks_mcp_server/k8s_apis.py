@@ -15,12 +15,92 @@
 """Kubernetes API client for the EKS MCP Server."""
 
 import base64
+import glob
+import hashlib
 import os
+import re
 import tempfile
 from awslabs.eks_mcp_server import __version__
 from awslabs.eks_mcp_server.models import Operation
 from loguru import logger
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+
+# Asks the API server for PartialObjectMetadataList responses, which only contain the metadata
+# of each resource, falling back to full resources on servers that do not support them
+METADATA_ONLY_ACCEPT_HEADER = (
+    'application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json'
+)
+
+# Size of the chunks pod logs are read in when streaming them
+LOG_STREAM_CHUNK_SIZE = 16 * 1024
+
+# Directory of the API discovery cache files, one per cluster endpoint and server version
+DISCOVERY_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.kube', 'cache', 'eks-mcp-server')
+
+
+class PodLogStream:
+    """Iterator over the lines of a streamed pod log response, which it owns.
+
+    The response connection is released once the lines are exhausted or fail, or when the stream
+    is closed or garbage collected, whether or not any line was read.
+    """
+
+    def __init__(self, response: Any):
+        """Initialize the stream.
+
+        Args:
+            response: Unread urllib3 response of a log request made with _preload_content=False
+        """
+        self._response = response
+        # Not a bound method, so dropping the stream frees it at once rather than in a GC cycle
+        self._lines = self._split_lines(response)
+        self._closed = False
+
+    @staticmethod
+    def _split_lines(response: Any) -> Iterator[str]:
+        pending = b''
+        for chunk in response.stream(LOG_STREAM_CHUNK_SIZE):
+            *lines, pending = (pending + chunk).split(b'\n')
+            for line in lines:
+                yield line.decode('utf-8', errors='replace')
+        if pending:
+            yield pending.decode('utf-8', errors='replace')
+
+    def __iter__(self) -> 'PodLogStream':
+        """Return the stream itself."""
+        return self
+
+    def __next__(self) -> str:
+        """Return the next log line, without its line ending."""
+        try:
+            return next(self._lines)
+        except BaseException:
+            # Includes StopIteration once the log is exhausted
+            self.close()
+            raise
+
+    def close(self):
+        """Close the response and release its connection, if not done yet."""
+        if self._closed:
+            return
+        self._closed = True
+        self._lines.close()
+        self._response.close()
+        self._response.release_conn()
+
+    def __enter__(self) -> 'PodLogStream':
+        """Return the stream, closing it when the block exits."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the stream."""
+        self.close()
+
+    def __del__(self):
+        """Release the connection of a stream dropped without being closed."""
+        if hasattr(self, '_closed'):
+            self.close()
 
 
 class K8sApis:
@@ -41,6 +121,10 @@ class K8sApis:
         try:
             from kubernetes import client, dynamic
 
+            # Kept to tell whether a refreshed token can be applied to this client in place
+            self.endpoint = endpoint
+            self.ca_data = ca_data
+
             configuration = client.Configuration()
             configuration.host = endpoint
             configuration.api_key = {'authorization': f'Bearer {token}'}
@@ -79,13 +163,66 @@ class K8sApis:
             # Set user-agent directly on the ApiClient
             self.api_client.user_agent = f'awslabs/mcp/eks-mcp-server/{__version__}'
 
-            # Create dynamic client
-            self.dynamic_client = dynamic.DynamicClient(self.api_client)
+            # Create dynamic client, reusing API discovery results cached for this server version
+            self.dynamic_client = dynamic.DynamicClient(
+                self.api_client, cache_file=self._discovery_cache_file(client, endpoint)
+            )
 
         except ImportError:
             logger.error('kubernetes package not installed')
             raise
 
+    def _discovery_cache_file(self, client, endpoint: str) -> Optional[str]:
+        """Get the API discovery cache file for the cluster's current server version.
+
+        Discovery results only change when the cluster is upgraded or API extensions are
+        installed, so they are cached per endpoint and server version. Resources missing from the
+        cache are discovered again on lookup. Cache files of other server versions are removed.
+
+        Args:
+            client: The kubernetes client module
+            endpoint: Kubernetes API endpoint
+
+        Returns:
+            Path of the cache file, or None to use the dynamic client's default cache
+        """
+        try:
+            server_version = client.VersionApi(self.api_client).get_code().git_version
+            if not isinstance(server_version, str):
+                return None
+
+            os.makedirs(DISCOVERY_CACHE_DIR, exist_ok=True)
+            cluster_id = hashlib.sha256(endpoint.encode('utf-8')).hexdigest()[:16]
+            cache_file = os.path.join(
+                DISCOVERY_CACHE_DIR,
+                f'{cluster_id}-{re.sub(r"[^A-Za-z0-9.+_-]", "_", server_version)}.json',
+            )
+            for stale_file in glob.glob(os.path.join(DISCOVERY_CACHE_DIR, f'{cluster_id}-*.json')):
+                if stale_file != cache_file:
+                    os.unlink(stale_file)
+            return cache_file
+        except Exception as e:
+            logger.warning(f'Error preparing API discovery cache: {str(e)}')
+            return None
+
+    def update_token(self, token: str):
+        """Replace the authentication token used by this client.
+
+        Args:
+            token: New authentication token
+        """
+        self.api_client.configuration.api_key = {'authorization': f'Bearer {token}'}
+
+    def close(self):
+        """Close the API client connections and remove the temporary CA certificate file."""
+        try:
+            self.api_client.close()
+        except Exception as e:
+            logger.warning(f'Error closing Kubernetes API client: {str(e)}')
+        if self._ca_cert_file_path and os.path.exists(self._ca_cert_file_path):
+            os.unlink(self._ca_cert_file_path)
+        self._ca_cert_file_path = None
+
     def _patch_resource(
         self,
         resource,
@@ -209,6 +346,9 @@ class K8sApis:
         namespace: Optional[str] = None,
         label_selector: Optional[str] = None,
         field_selector: Optional[str] = None,
+        limit: Optional[int] = None,
+        continue_token: Optional[str] = None,
+        metadata_only: bool = False,
         **kwargs,
     ) -> Any:
         """List Kubernetes resources of a specific kind using dynamic client.
@@ -219,10 +359,14 @@ class K8sApis:
             namespace: Namespace to list resources from (optional)
             label_selector: Label selector to filter resources (optional)
             field_selector: Field selector to filter resources (optional)
+            limit: Maximum number of resources to return in one page (optional)
+            continue_token: Continue token of the previous page to list the next page (optional)
+            metadata_only: Whether to only retrieve the metadata of each resource (default: False)
             **kwargs: Additional arguments for the API call
 
         Returns:
-            The API response containing the list of resources
+            The API response containing the list of resources. When limit is set and more
+            resources match, metadata.continue holds the token of the next page.
         """
         try:
             # Get the API resource
@@ -234,6 +378,12 @@ class K8sApis:
                 list_kwargs['label_selector'] = label_selector
             if field_selector:
                 list_kwargs['field_selector'] = field_selector
+            if limit:
+                list_kwargs['limit'] = limit
+            if continue_token:
+                list_kwargs['_continue'] = continue_token
+            if metadata_only:
+                list_kwargs['header_params'] = {'Accept': METADATA_ONLY_ACCEPT_HEADER}
 
             # Add any additional kwargs
             list_kwargs.update(kwargs)
@@ -248,6 +398,35 @@ class K8sApis:
             # Re-raise with more context
             raise ValueError(f'Error listing {kind} resources: {str(e)}')
 
+    def watch_resources(
+        self,
+        kind: str,
+        api_version: str,
+        namespace: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        timeout_seconds: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Watch Kubernetes resources of a specific kind using dynamic client.
+
+        Args:
+            kind: Resource kind (e.g., 'Pod', 'Service')
+            api_version: API version (e.g., 'v1', 'apps/v1')
+            namespace: Namespace to watch resources in (optional, defaults to all namespaces)
+            resource_version: Only return events after this resourceVersion (optional)
+            timeout_seconds: Server side timeout of the watch request (optional)
+
+        Returns:
+            Iterator of watch events with 'type', 'raw_object' and 'object' keys. API errors,
+            such as 410 Gone for an expired resourceVersion, are raised unchanged.
+        """
+        resource = self.dynamic_client.resources.get(api_version=api_version, kind=kind)
+        return resource.watch(
+            namespace=namespace,
+            resource_version=resource_version,
+            timeout=timeout_seconds,
+            allow_watch_bookmarks=True,
+        )
+
     def apply_from_yaml(
         self, yaml_objects: list, namespace: str = 'default', force: bool = True, **kwargs
     ) -> tuple:
@@ -361,36 +540,38 @@ class K8sApis:
             else:
                 events_response = event_resource.get(field_selector=field_selector)
 
-            # Process events
-            result = []
-            for event in events_response.items:
-                # Dynamic client resources always have to_dict()
-                event_dict = event.to_dict()
-
-                # Extract relevant fields and handle camelCase field names
-                first_timestamp = event_dict.get('firstTimestamp')
-                last_timestamp = event_dict.get('lastTimestamp')
-                source = event_dict.get('source', {})
-
-                result.append(
-                    {
-                        'first_timestamp': str(first_timestamp) if first_timestamp else None,
-                        'last_timestamp': str(last_timestamp) if last_timestamp else None,
-                        'count': event_dict.get('count'),
-                        'message': event_dict.get('message', ''),
-                        'reason': event_dict.get('reason'),
-                        'reporting_component': source.get('component'),
-                        'type': event_dict.get('type'),
-                    }
-                )
-
-            return result
+            # Process events, dynamic client resources always have to_dict()
+            return [self.summarize_event(event.to_dict()) for event in events_response.items]
 
         except Exception as e:
             # Re-raise with more context
             resource_name = f'{namespace + "/" if namespace else ""}{name}'
             raise ValueError(f'Error getting events for {kind} {resource_name}: {str(e)}')
 
+    @staticmethod
+    def summarize_event(event_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the relevant fields of an Event resource.
+
+        Args:
+            event_dict: Event resource as a dictionary with camelCase field names
+
+        Returns:
+            Dictionary of the event timestamps, count, message, reason, source and type
+        """
+        first_timestamp = event_dict.get('firstTimestamp')
+        last_timestamp = event_dict.get('lastTimestamp')
+        source = event_dict.get('source') or {}
+
+        return {
+            'first_timestamp': str(first_timestamp) if first_timestamp else None,
+            'last_timestamp': str(last_timestamp) if last_timestamp else None,
+            'count': event_dict.get('count'),
+            'message': event_dict.get('message', ''),
+            'reason': event_dict.get('reason'),
+            'reporting_component': source.get('component'),
+            'type': event_dict.get('type'),
+        }
+
     def get_pod_logs(
         self,
         pod_name: str,
@@ -441,6 +622,53 @@ class K8sApis:
             # Re-raise with more context
             raise ValueError(f'Error getting logs from pod {namespace}/{pod_name}: {str(e)}')
 
+    def stream_pod_logs(
+        self,
+        pod_name: str,
+        namespace: str,
+        container_name: Optional[str] = None,
+        since_seconds: Optional[int] = None,
+        tail_lines: Optional[int] = None,
+    ) -> PodLogStream:
+        """Stream the log lines of a pod container as they are read from the API server.
+
+        Lines are prefixed by their RFC 3339 timestamp and a space. Only one chunk of the log is
+        held in memory at a time, and closing the stream, even before reading from it, releases
+        the connection.
+
+        Args:
+            pod_name: Name of the pod
+            namespace: Namespace of the pod
+            container_name: Container name (optional, if pod contains more than one container)
+            since_seconds: Only return logs newer than this many seconds (optional)
+            tail_lines: Number of lines to return from the end of the logs (optional)
+
+        Returns:
+            Stream of the timestamped log lines, without line endings
+        """
+        try:
+            from kubernetes import client
+
+            # Create CoreV1Api client
+            core_v1_api = client.CoreV1Api(self.api_client)
+
+            params: Dict[str, Any] = {'timestamps': True, '_preload_content': False}
+            if container_name:
+                params['container'] = container_name
+            if since_seconds:
+                params['since_seconds'] = since_seconds
+            if tail_lines:
+                params['tail_lines'] = tail_lines
+
+            response = core_v1_api.read_namespaced_pod_log(
+                name=pod_name, namespace=namespace, **params
+            )
+        except Exception as e:
+            # Re-raise with more context
+            raise ValueError(f'Error getting logs from pod {namespace}/{pod_name}: {str(e)}')
+
+        return PodLogStream(response)
+
     def get_api_versions(self) -> List[str]:
         """Get preferred API versions from the Kubernetes cluster.
 
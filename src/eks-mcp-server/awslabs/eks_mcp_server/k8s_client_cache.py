@@ -15,9 +15,11 @@
 """Kubernetes client cache for the EKS MCP Server."""
 
 import base64
+import threading
+import weakref
 from awslabs.eks_mcp_server.aws_helper import AwsHelper
 from awslabs.eks_mcp_server.k8s_apis import K8sApis
-from cachetools import TTLCache
+from cachetools import LRUCache, TTLCache
 
 
 # Presigned url timeout in seconds
@@ -28,12 +30,21 @@ K8S_AWS_ID_HEADER = 'x-k8s-aws-id'
 # 14 minutes in seconds (buffer before the 15-minute token expiration)
 TOKEN_TTL = 14 * 60
 
+# Maximum number of clusters whose clients are kept, least recently used clients are dropped
+MAX_CLIENTS = 100
+
 
 class K8sClientCache:
     """Singleton class for managing Kubernetes API client cache.
 
     This class provides a centralized cache for Kubernetes API clients
-    to avoid creating multiple clients for the same cluster.
+    to avoid creating multiple clients for the same cluster. When a client's
+    token expires, the new token is applied to the existing client so its
+    connections and API discovery results are reused.
+
+    Clients may be requested from several threads at once. Credentials of
+    different clusters are retrieved concurrently, while concurrent requests
+    for the same cluster wait for a single retrieval.
     """
 
     # Singleton instance
@@ -53,12 +64,22 @@ class K8sClientCache:
             return
 
         # Client cache with TTL to handle token expiration
-        self._client_cache = TTLCache(maxsize=100, ttl=TOKEN_TTL)
+        self._client_cache = TTLCache(maxsize=MAX_CLIENTS, ttl=TOKEN_TTL)
+
+        # Recently used clients, including those whose token expired, so they can be refreshed in
+        # place. Dropped clients are not closed, as a request may still be using them; their
+        # connections are closed once they are garbage collected.
+        self._clients: LRUCache = LRUCache(maxsize=MAX_CLIENTS)
 
         # Clients for credential retrieval
         self._eks_client = None
         self._sts_client = None
 
+        # Guards the caches, and serializes credential retrieval per cluster. A cluster lock only
+        # lives while a thread is retrieving the cluster's credentials.
+        self._lock = threading.Lock()
+        self._cluster_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
         self._initialized = True
 
     def _get_eks_client(self):
@@ -147,7 +168,22 @@ class K8sClientCache:
             ValueError: If the cluster credentials are invalid
             Exception: If there's an error getting the cluster credentials
         """
-        if cluster_name not in self._client_cache:
+        with self._lock:
+            client = self._client_cache.get(cluster_name)
+            if client is not None:
+                # Keep the client of a cluster in use from being dropped
+                self._clients.get(cluster_name)
+                return client
+            cluster_lock = self._cluster_locks.setdefault(cluster_name, threading.Lock())
+
+        with cluster_lock:
+            # Another thread may have created the client while this one waited
+            with self._lock:
+                client = self._client_cache.get(cluster_name)
+                if client is not None:
+                    return client
+                previous_client = self._clients.get(cluster_name)
+
             try:
                 # Create a new client
                 endpoint, token, ca_data = self._get_cluster_credentials(cluster_name)
@@ -156,7 +192,15 @@ class K8sClientCache:
                 if not endpoint or not token or endpoint is None or token is None:
                     raise ValueError('Invalid cluster credentials')
 
-                self._client_cache[cluster_name] = K8sApis(endpoint, token, ca_data)
+                client = previous_client
+                if client is not None and (client.endpoint, client.ca_data) == (endpoint, ca_data):
+                    # Refresh the token of the existing client
+                    client.update_token(token)
+                else:
+                    # The cluster was recreated or its CA rotated, replace the client
+                    if client is not None:
+                        client.close()
+                    client = K8sApis(endpoint, token, ca_data)
             except ValueError:
                 # Re-raise ValueError for invalid credentials
                 raise
@@ -164,4 +208,7 @@ class K8sClientCache:
                 # Re-raise any other exceptions
                 raise Exception(f'Failed to get cluster credentials: {str(e)}')
 
-        return self._client_cache[cluster_name]
+            with self._lock:
+                self._clients[cluster_name] = client
+                self._client_cache[cluster_name] = client
+            return client
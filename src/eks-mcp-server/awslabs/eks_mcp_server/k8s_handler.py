@@ -14,10 +14,20 @@
 
 """Kubernetes handler for the EKS MCP Server."""
 
+import asyncio
+import copy
+import functools
+import heapq
 import os
+import re
 import yaml
+from awslabs.eks_mcp_server.consts import (
+    K8S_LIST_PAGE_SIZE,
+    K8S_MAX_CONCURRENT_REQUESTS_PER_CLUSTER,
+)
 from awslabs.eks_mcp_server.k8s_apis import K8sApis
 from awslabs.eks_mcp_server.k8s_client_cache import K8sClientCache
+from awslabs.eks_mcp_server.k8s_informer import K8sInformers, ResourceInformer
 from awslabs.eks_mcp_server.logging_helper import LogLevel, log_with_request_id
 from awslabs.eks_mcp_server.models import (
     ApiVersionsResponse,
@@ -27,14 +37,28 @@ from awslabs.eks_mcp_server.models import (
     GenerateAppManifestResponse,
     KubernetesResourceListResponse,
     KubernetesResourceResponse,
+    MultiClusterResourceListResponse,
     Operation,
+    PodLogLine,
     PodLogsResponse,
+    PodsLogsResponse,
     ResourceSummary,
+    ResourceSummaryList,
 )
+from concurrent.futures import ThreadPoolExecutor
 from mcp.server.fastmcp import Context
 from mcp.types import TextContent
 from pydantic import Field
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+
+T = TypeVar('T')
+
+
+def log_timestamp_key(timestamp: str) -> str:
+    """Return a key that sorts RFC 3339 UTC log timestamps with any fractional precision."""
+    seconds, _, fraction = timestamp.rstrip('Z').partition('.')
+    return f'{seconds}.{fraction.ljust(9, "0")}'
 
 
 class K8sHandler:
@@ -49,6 +73,7 @@ class K8sHandler:
         mcp,
         allow_write: bool = False,
         allow_sensitive_data_access: bool = False,
+        informer_resources: Optional[List[str]] = None,
     ):
         """Initialize the Kubernetes handler.
 
@@ -56,15 +81,25 @@ class K8sHandler:
             mcp: The MCP server instance
             allow_write: Whether to enable write access (default: False)
             allow_sensitive_data_access: Whether to allow access to sensitive data (default: False)
+            informer_resources: Resources to serve reads of from watch-backed informers, as
+                apiVersion/kind strings such as 'v1/Pod' (default: None, read from the API server)
         """
         self.mcp = mcp
         self.client_cache = K8sClientCache()
         self.allow_write = allow_write
         self.allow_sensitive_data_access = allow_sensitive_data_access
+        self.informers = (
+            K8sInformers(self.get_client, informer_resources) if informer_resources else None
+        )
+
+        # Bounded thread pools per cluster for blocking Kubernetes client calls
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
 
         # Register tools
         self.mcp.tool(name='list_k8s_resources')(self.list_k8s_resources)
+        self.mcp.tool(name='list_k8s_resources_in_clusters')(self.list_k8s_resources_in_clusters)
         self.mcp.tool(name='get_pod_logs')(self.get_pod_logs)
+        self.mcp.tool(name='get_pods_logs')(self.get_pods_logs)
         self.mcp.tool(name='get_k8s_events')(self.get_k8s_events)
         self.mcp.tool(name='list_api_versions')(self.list_api_versions)
         self.mcp.tool(name='manage_k8s_resource')(self.manage_k8s_resource)
@@ -86,6 +121,72 @@ class K8sHandler:
         """
         return self.client_cache.get_client(cluster_name)
 
+    async def run_in_cluster(
+        self, cluster_name: str, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Run a blocking Kubernetes client call on the thread pool of a cluster.
+
+        Each cluster gets its own pool of at most K8S_MAX_CONCURRENT_REQUESTS_PER_CLUSTER
+        threads, so calls to a slow API server neither block the event loop nor starve
+        calls to other clusters.
+
+        Args:
+            cluster_name: Name of the EKS cluster the call is made to
+            func: The blocking function to call
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            The return value of the function
+        """
+        executor = self._executors.get(cluster_name)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=K8S_MAX_CONCURRENT_REQUESTS_PER_CLUSTER,
+                thread_name_prefix=f'k8s-{cluster_name}',
+            )
+            self._executors[cluster_name] = executor
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def get_informer(
+        self, cluster_name: str, kind: str, api_version: str
+    ) -> Optional[ResourceInformer]:
+        """Get a synced informer to serve reads of a resource kind from, if one is configured.
+
+        Args:
+            cluster_name: Name of the EKS cluster
+            kind: Kind of the Kubernetes resources
+            api_version: API version of the Kubernetes resources
+
+        Returns:
+            ResourceInformer instance, or None if reads must go to the API server
+        """
+        if self.informers is None or not self.informers.is_informed(kind, api_version):
+            return None
+        # Starting an informer lists the resources, and waiting for it to catch up blocks
+        return await self.run_in_cluster(
+            cluster_name, self.informers.get, cluster_name, kind, api_version
+        )
+
+    def observe_write(self, cluster_name: str, response: Any):
+        """Record the resourceVersion of a written resource so informer reads include the write.
+
+        Args:
+            cluster_name: Name of the EKS cluster
+            response: The API response of the write
+        """
+        if self.informers is None:
+            return
+        resource = response.to_dict()
+        self.informers.observe_write(
+            cluster_name,
+            resource.get('kind'),
+            resource.get('apiVersion'),
+            (resource.get('metadata') or {}).get('resourceVersion'),
+        )
+
     async def apply_yaml(
         self,
         ctx: Context,
@@ -150,7 +251,7 @@ class K8sHandler:
                 )
 
             # Get Kubernetes client for the cluster
-            k8s_client = self.get_client(cluster_name)
+            k8s_client = await self.run_in_cluster(cluster_name, self.get_client, cluster_name)
 
             # Read the YAML content from the local file
             log_with_request_id(ctx, LogLevel.INFO, f'Reading YAML content from file: {yaml_path}')
@@ -190,11 +291,15 @@ class K8sHandler:
             # Apply all resources using our custom implementation
             try:
                 # Apply the YAML objects
-                results, created_count, updated_count = k8s_client.apply_from_yaml(
+                results, created_count, updated_count = await self.run_in_cluster(
+                    cluster_name,
+                    k8s_client.apply_from_yaml,
                     yaml_objects=yaml_objects,
                     namespace=namespace,
                     force=force,
                 )
+                for result in results:
+                    self.observe_write(cluster_name, result)
 
                 # If we get here, all resources were applied successfully
                 success_msg = (
@@ -428,18 +533,30 @@ class K8sHandler:
                     resource=None,
                 )
 
-            # Get Kubernetes client for the cluster
-            k8s_client = self.get_client(cluster_name)
-
-            # Call the manage_resource method
-            response = k8s_client.manage_resource(
-                operation_enum,
-                kind,
-                api_version,
-                name=name,
-                namespace=namespace,
-                body=body,
-            )
+            # Serve reads from the informer when the resource kind is cached
+            cached_resource = None
+            if operation_enum == Operation.READ:
+                informer = await self.get_informer(cluster_name, kind, api_version)
+                if informer is not None:
+                    cached_resource = informer.get(name, namespace)
+
+            if cached_resource is None:
+                # Get Kubernetes client for the cluster
+                k8s_client = await self.run_in_cluster(cluster_name, self.get_client, cluster_name)
+
+                # Call the manage_resource method
+                response = await self.run_in_cluster(
+                    cluster_name,
+                    k8s_client.manage_resource,
+                    operation_enum,
+                    kind,
+                    api_version,
+                    name=name,
+                    namespace=namespace,
+                    body=body,
+                )
+                if operation_enum != Operation.READ:
+                    self.observe_write(cluster_name, response)
 
             # Format resource name for logging
             resource_name = f'{namespace + "/" if namespace else ""}{name}'
@@ -460,7 +577,11 @@ class K8sHandler:
             # For read operation, convert response to dict and clean up the response
             resource_data = None
             if operation_enum == Operation.READ:
-                resource_data = self.cleanup_resource_response(response.to_dict())
+                resource_data = self.cleanup_resource_response(
+                    copy.deepcopy(cached_resource)
+                    if cached_resource is not None
+                    else response.to_dict()
+                )
                 log_with_request_id(
                     ctx,
                     LogLevel.INFO,
@@ -502,6 +623,88 @@ class K8sHandler:
                 resource=None,
             )
 
+    async def _list_resource_summaries(
+        self,
+        cluster_name: str,
+        kind: str,
+        api_version: str,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        limit: Optional[int] = None,
+        continue_token: Optional[str] = None,
+    ) -> Tuple[List[ResourceSummary], Optional[str]]:
+        """List summaries of Kubernetes resources from an informer or the API server.
+
+        Args:
+            cluster_name: Name of the EKS cluster
+            kind: Kind of the Kubernetes resources
+            api_version: API version of the Kubernetes resources
+            namespace: Namespace of the Kubernetes resources (optional)
+            label_selector: Label selector to filter resources (optional)
+            field_selector: Field selector to filter resources (optional)
+            limit: Maximum number of resources to return (optional)
+            continue_token: Continue token of the previous page (optional)
+
+        Returns:
+            Tuple of (resource summaries, continue token of the next page or None)
+        """
+        # Pages are served by the API server, informers only serve complete listings
+        informer = None
+        if not limit and not continue_token:
+            informer = await self.get_informer(cluster_name, kind, api_version)
+
+        next_continue_token = None
+        if informer is not None:
+            item_dicts = informer.list(namespace, label_selector, field_selector)
+        else:
+            # Get Kubernetes client for the cluster
+            k8s_client = await self.run_in_cluster(cluster_name, self.get_client, cluster_name)
+
+            # List resource metadata only, in pages of at most K8S_LIST_PAGE_SIZE resources
+            # unless the caller asked for a single page
+            item_dicts = []
+            next_continue_token = continue_token
+            while True:
+                response = await self.run_in_cluster(
+                    cluster_name,
+                    k8s_client.list_resources,
+                    kind,
+                    api_version,
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    field_selector=field_selector,
+                    limit=limit or K8S_LIST_PAGE_SIZE,
+                    continue_token=next_continue_token,
+                    metadata_only=True,
+                )
+                response = response.to_dict()
+                item_dicts.extend(response.get('items') or [])
+                next_continue_token = (response.get('metadata') or {}).get('continue')
+                if limit or not next_continue_token:
+                    break
+
+        # Extract summaries from items
+        summaries = []
+        for item_dict in item_dicts:
+            metadata = item_dict.get('metadata') or {}
+
+            # Dynamic client uses camelCase field names
+            creation_timestamp = metadata.get('creationTimestamp')
+            if creation_timestamp is not None:
+                creation_timestamp = str(creation_timestamp)
+
+            summary = ResourceSummary(
+                name=metadata.get('name', ''),
+                namespace=metadata.get('namespace'),
+                creation_timestamp=creation_timestamp,
+                labels=metadata.get('labels'),
+                annotations=metadata.get('annotations'),
+            )
+            summaries.append(summary)
+
+        return summaries, next_continue_token
+
     async def list_k8s_resources(
         self,
         ctx: Context,
@@ -533,6 +736,16 @@ class K8sHandler:
             description="""Field selector to filter resources (e.g., 'metadata.name=my-pod,status.phase=Running').
             Uses the same syntax as kubectl's --field-selector flag.""",
         ),
+        limit: Optional[int] = Field(
+            None,
+            description="""Maximum number of resources to return. If more resources match, the response includes a continue_token for the next page.
+            If not provided, all matching resources are returned.""",
+            ge=1,
+        ),
+        continue_token: Optional[str] = Field(
+            None,
+            description='The continue_token of a previous response, to list the next page of resources with the same filters.',
+        ),
     ) -> KubernetesResourceListResponse:
         """List Kubernetes resources of a specific kind.
 
@@ -553,6 +766,7 @@ class K8sHandler:
         - For non-namespaced resources (like Nodes), the namespace parameter is ignored
         - Combine label and field selectors for more precise filtering
         - Results are summarized to avoid overwhelming responses
+        - Use limit and continue_token to page through large numbers of resources
 
         Args:
             ctx: MCP context
@@ -562,45 +776,22 @@ class K8sHandler:
             namespace: Namespace of the Kubernetes resources (optional)
             label_selector: Label selector to filter resources (optional)
             field_selector: Field selector to filter resources (optional)
+            limit: Maximum number of resources to return (optional)
+            continue_token: Continue token of the previous page (optional)
 
         Returns:
             KubernetesResourceListResponse with operation result
         """
         try:
-            # Get Kubernetes client for the cluster
-            k8s_client = self.get_client(cluster_name)
-
-            # List resources
-            response = k8s_client.list_resources(
+            summaries, next_continue_token = await self._list_resource_summaries(
+                cluster_name,
                 kind,
                 api_version,
-                namespace=namespace,
-                label_selector=label_selector,
-                field_selector=field_selector,
-            )
-
-            # Extract summaries from items and clean up the responses
-            summaries = []
-            for item in response.items:
-                item_dict = self.cleanup_resource_response(item.to_dict())
-                metadata = item_dict.get('metadata', {})
-
-                # Dynamic client uses camelCase field names
-                creation_timestamp = metadata.get('creationTimestamp')
-                if creation_timestamp is not None:
-                    creation_timestamp = str(creation_timestamp)
-
-                summary = ResourceSummary(
-                    name=metadata.get('name', ''),
-                    namespace=metadata.get('namespace'),
-                    creation_timestamp=creation_timestamp,
-                    labels=metadata.get('labels'),
-                    annotations=metadata.get('annotations'),
-                )
-                summaries.append(summary)
-
-            log_with_request_id(
-                ctx, LogLevel.INFO, f'Cleaned up resource responses for {kind} resources'
+                namespace,
+                label_selector,
+                field_selector,
+                limit,
+                continue_token,
             )
 
             # Log success
@@ -623,6 +814,7 @@ class K8sHandler:
                 namespace=namespace,
                 count=len(summaries),
                 items=summaries,
+                continue_token=next_continue_token,
             )
 
         except Exception as e:
@@ -641,6 +833,131 @@ class K8sHandler:
                 items=[],
             )
 
+    async def list_k8s_resources_in_clusters(
+        self,
+        ctx: Context,
+        cluster_names: List[str] = Field(
+            ...,
+            description='Names of the EKS clusters to list the resources in.',
+            min_length=1,
+        ),
+        kind: str = Field(
+            ...,
+            description='Kind of the Kubernetes resources to list (e.g., Pod, Service, Deployment).',
+        ),
+        api_version: str = Field(
+            ...,
+            description="""API version of the Kubernetes resources (e.g., v1, apps/v1, networking.k8s.io/v1).
+            Use the list_api_versions tool to find available API versions.""",
+        ),
+        namespaces: Optional[List[str]] = Field(
+            None,
+            description="""Namespaces to list the resources in, in each cluster.
+            If not provided, resources will be listed across all namespaces (for namespaced resources).""",
+        ),
+        label_selector: Optional[str] = Field(
+            None,
+            description="""Label selector to filter resources (e.g., 'app=nginx,tier=frontend').
+            Uses the same syntax as kubectl's --selector flag.""",
+        ),
+        field_selector: Optional[str] = Field(
+            None,
+            description="""Field selector to filter resources (e.g., 'metadata.name=my-pod,status.phase=Running').
+            Uses the same syntax as kubectl's --field-selector flag.""",
+        ),
+    ) -> MultiClusterResourceListResponse:
+        """List Kubernetes resources of a specific kind across several clusters and namespaces.
+
+        This tool lists Kubernetes resources of a specified kind in multiple EKS clusters
+        at once, querying every cluster and namespace concurrently. It returns a summary
+        of each resource grouped by cluster and namespace, useful for checking a fleet of
+        clusters, such as finding which clusters run a deployment or comparing node counts.
+
+        IMPORTANT: Use this tool instead of running 'kubectl get' against each cluster in turn.
+
+        ## Response Information
+        The response includes one result per cluster and namespace, each with the summaries
+        of its resources, or an error message if the cluster or namespace could not be listed.
+        A failure in one cluster does not affect the results of the others.
+
+        ## Usage Tips
+        - The API version must be served by every cluster listed
+        - For non-namespaced resources (like Nodes), do not provide namespaces
+        - Use list_k8s_resources to page through large numbers of resources in a single cluster
+
+        Args:
+            ctx: MCP context
+            cluster_names: Names of the EKS clusters
+            kind: Kind of the Kubernetes resources (e.g., 'Pod', 'Service')
+            api_version: API version of the Kubernetes resources (e.g., 'v1', 'apps/v1')
+            namespaces: Namespaces of the Kubernetes resources (optional)
+            label_selector: Label selector to filter resources (optional)
+            field_selector: Field selector to filter resources (optional)
+
+        Returns:
+            MultiClusterResourceListResponse with the resources of each cluster and namespace
+        """
+        # Requests to each cluster are bounded by its thread pool
+        clusters = list(dict.fromkeys(cluster_names))
+        targets = [
+            (cluster_name, namespace)
+            for cluster_name in clusters
+            for namespace in (dict.fromkeys(namespaces) if namespaces else [None])
+        ]
+        outcomes = await asyncio.gather(
+            *(
+                self._list_resource_summaries(
+                    cluster_name, kind, api_version, namespace, label_selector, field_selector
+                )
+                for cluster_name, namespace in targets
+            ),
+            return_exceptions=True,
+        )
+
+        results = []
+        for (cluster_name, namespace), outcome in zip(targets, outcomes):
+            if isinstance(outcome, BaseException):
+                log_with_request_id(
+                    ctx,
+                    LogLevel.ERROR,
+                    f'Failed to list {kind} resources in cluster {cluster_name}: {str(outcome)}',
+                )
+                results.append(
+                    ResourceSummaryList(
+                        cluster_name=cluster_name,
+                        namespace=namespace,
+                        count=0,
+                        items=[],
+                        error=str(outcome),
+                    )
+                )
+            else:
+                summaries, _ = outcome
+                results.append(
+                    ResourceSummaryList(
+                        cluster_name=cluster_name,
+                        namespace=namespace,
+                        count=len(summaries),
+                        items=summaries,
+                    )
+                )
+
+        count = sum(result.count for result in results)
+        failed = sum(1 for result in results if result.error is not None)
+        message = f'Listed {count} {kind} resources in {len(clusters)} clusters'
+        if failed:
+            message += f' ({failed} of {len(results)} listings failed)'
+        log_with_request_id(ctx, LogLevel.INFO, message)
+
+        return MultiClusterResourceListResponse(
+            isError=failed == len(results),
+            content=[TextContent(type='text', text=message)],
+            kind=kind,
+            api_version=api_version,
+            count=count,
+            results=results,
+        )
+
     async def generate_app_manifest(
         self,
         ctx: Context,
@@ -924,10 +1241,12 @@ class K8sHandler:
 
         try:
             # Get Kubernetes client for the cluster
-            k8s_client = self.get_client(cluster_name)
+            k8s_client = await self.run_in_cluster(cluster_name, self.get_client, cluster_name)
 
             # Get pod logs
-            logs = k8s_client.get_pod_logs(
+            logs = await self.run_in_cluster(
+                cluster_name,
+                k8s_client.get_pod_logs,
                 pod_name=pod_name,
                 namespace=namespace,
                 container_name=container_name,
@@ -988,6 +1307,252 @@ class K8sHandler:
                 log_lines=[],
             )
 
+    @staticmethod
+    def _read_pod_logs(
+        k8s_client: K8sApis,
+        pod_name: str,
+        namespace: str,
+        container_names: List[str],
+        pattern: Optional[re.Pattern],
+        since_seconds: Optional[int],
+        tail_lines: Optional[int],
+        limit_bytes: int,
+    ) -> Tuple[List[List[Tuple[str, str, str, str]]], bool]:
+        """Stream the logs of a pod's containers, keeping matching lines up to a byte limit.
+
+        Args:
+            k8s_client: Kubernetes client of the cluster
+            pod_name: Name of the pod
+            namespace: Namespace of the pod
+            container_names: Names of the containers to read the logs of
+            pattern: Regular expression log messages must match (optional)
+            since_seconds: Only read logs newer than this many seconds (optional)
+            tail_lines: Number of lines to read from the end of each container's logs (optional)
+            limit_bytes: Maximum number of bytes of log messages to keep for the pod
+
+        Returns:
+            Tuple of (lines of each container as (sort key, timestamp, container, message) in
+            timestamp order, whether the logs were cut off at the byte limit)
+        """
+        remaining_bytes = limit_bytes
+        container_lines = []
+        for container_name in container_names:
+            lines = []
+            container_lines.append(lines)
+            stream = k8s_client.stream_pod_logs(
+                pod_name,
+                namespace,
+                container_name=container_name,
+                since_seconds=since_seconds,
+                tail_lines=tail_lines,
+            )
+            try:
+                for line in stream:
+                    timestamp, _, message = line.partition(' ')
+                    if pattern is not None and not pattern.search(message):
+                        continue
+                    remaining_bytes -= len(message.encode('utf-8')) + 1
+                    if remaining_bytes < 0:
+                        return container_lines, True
+                    lines.append(
+                        (log_timestamp_key(timestamp), timestamp, container_name, message)
+                    )
+            finally:
+                # Stop reading the rest of the log once the byte limit is reached
+                stream.close()
+        return container_lines, False
+
+    async def get_pods_logs(
+        self,
+        ctx: Context,
+        cluster_name: str = Field(
+            ..., description='Name of the EKS cluster where the pods are running.'
+        ),
+        namespace: str = Field(
+            ..., description='Kubernetes namespace where the pods are located.'
+        ),
+        label_selector: str = Field(
+            ...,
+            description="""Label selector of the pods to retrieve logs from (e.g., 'app=nginx').
+            Uses the same syntax as kubectl's --selector flag.""",
+        ),
+        container_name: Optional[str] = Field(
+            None,
+            description='Name of the container to get logs from. If not provided, logs of all containers of each pod are retrieved.',
+        ),
+        pattern: Optional[str] = Field(
+            None,
+            description="""Regular expression to filter log messages by (e.g., 'ERROR|WARN').
+            Only matching log lines are returned and count towards the byte limit.""",
+        ),
+        since_seconds: Optional[int] = Field(
+            None,
+            description='Only return logs newer than this many seconds.',
+        ),
+        tail_lines: int = Field(
+            100,
+            description='Number of lines to read from the end of the logs of each container, before filtering. Default: 100.',
+        ),
+        limit_bytes_per_pod: int = Field(
+            10240,
+            description='Maximum number of bytes of log messages to return per pod. Default: 10KB (10240 bytes).',
+        ),
+    ) -> PodsLogsResponse:
+        """Get the logs of all pods matching a label selector, merged by timestamp.
+
+        This tool retrieves logs from every pod that matches a label selector in an EKS
+        cluster, reading all pods concurrently, and merges them into a single timeline.
+        It's useful for debugging replicated workloads such as deployments, where an issue
+        may appear in any replica.
+
+        IMPORTANT: Use this tool instead of 'kubectl logs -l' commands, or calling get_pod_logs for each pod.
+
+        ## Requirements
+        - The server must be run with the `--allow-sensitive-data-access` flag
+        - The EKS cluster must exist and be accessible
+
+        ## Response Information
+        The response includes the number of matching pods and their log lines ordered by
+        timestamp, each with its pod name, container name and timestamp. Pods whose logs
+        were cut off at the byte limit or could not be read are listed separately.
+
+        ## Usage Tips
+        - Use pattern to return only relevant lines, such as errors, from many pods
+        - Logs are filtered while they are read, so only matching lines count towards limit_bytes_per_pod
+
+        Args:
+            ctx: MCP context
+            cluster_name: Name of the EKS cluster
+            namespace: Namespace of the pods
+            label_selector: Label selector of the pods
+            container_name: Container name (optional, defaults to all containers)
+            pattern: Regular expression to filter log messages by (optional)
+            since_seconds: Only return logs newer than this many seconds (optional)
+            tail_lines: Number of lines to read from the end of each container's logs (defaults to 100)
+            limit_bytes_per_pod: Maximum number of bytes to return per pod (defaults to 10KB)
+
+        Returns:
+            PodsLogsResponse with the merged pod logs
+        """
+        # Check if sensitive data access is disabled
+        if not self.allow_sensitive_data_access:
+            error_msg = 'Access to pod logs requires --allow-sensitive-data-access flag'
+            log_with_request_id(ctx, LogLevel.ERROR, error_msg)
+            return PodsLogsResponse(
+                isError=True,
+                content=[TextContent(type='text', text=error_msg)],
+                namespace=namespace,
+                label_selector=label_selector,
+                pod_count=0,
+                log_lines=[],
+            )
+
+        try:
+            compiled_pattern = re.compile(pattern) if pattern else None
+
+            # Get Kubernetes client for the cluster
+            k8s_client = await self.run_in_cluster(cluster_name, self.get_client, cluster_name)
+
+            # Find the pods, and their containers
+            informer = await self.get_informer(cluster_name, 'Pod', 'v1')
+            if informer is not None:
+                pods = informer.list(namespace, label_selector)
+            else:
+                response = await self.run_in_cluster(
+                    cluster_name,
+                    k8s_client.list_resources,
+                    'Pod',
+                    'v1',
+                    namespace=namespace,
+                    label_selector=label_selector,
+                )
+                pods = response.to_dict().get('items') or []
+
+            pod_containers = {}
+            for pod in pods:
+                containers = (pod.get('spec') or {}).get('containers') or []
+                names = [container_name] if container_name else [c['name'] for c in containers]
+                pod_containers[pod['metadata']['name']] = names
+
+            # Stream the logs of each pod, bounded by the thread pool of the cluster
+            outcomes = await asyncio.gather(
+                *(
+                    self.run_in_cluster(
+                        cluster_name,
+                        self._read_pod_logs,
+                        k8s_client,
+                        pod_name,
+                        namespace,
+                        names,
+                        compiled_pattern,
+                        since_seconds,
+                        tail_lines,
+                        limit_bytes_per_pod,
+                    )
+                    for pod_name, names in pod_containers.items()
+                ),
+                return_exceptions=True,
+            )
+
+            streams = []
+            truncated_pods = []
+            errors = {}
+            for pod_name, outcome in zip(pod_containers, outcomes):
+                if isinstance(outcome, BaseException):
+                    errors[pod_name] = str(outcome)
+                    continue
+                container_lines, truncated = outcome
+                if truncated:
+                    truncated_pods.append(pod_name)
+                streams.extend([(line, pod_name) for line in lines] for lines in container_lines)
+
+            # Each container's logs are in timestamp order, merge them into a single timeline
+            log_lines = [
+                PodLogLine(
+                    timestamp=timestamp,
+                    pod_name=pod_name,
+                    container_name=line_container_name,
+                    message=message,
+                )
+                for (_, timestamp, line_container_name, message), pod_name in heapq.merge(
+                    *streams, key=lambda entry: entry[0][0]
+                )
+            ]
+
+            success_msg = (
+                f'Retrieved {len(log_lines)} log lines from {len(pod_containers)} pods '
+                f'matching {label_selector} in {namespace}'
+            )
+            if errors:
+                success_msg += f' ({len(errors)} pods could not be read)'
+            log_with_request_id(ctx, LogLevel.INFO, success_msg)
+
+            return PodsLogsResponse(
+                isError=bool(pod_containers) and len(errors) == len(pod_containers),
+                content=[TextContent(type='text', text=success_msg)],
+                namespace=namespace,
+                label_selector=label_selector,
+                pod_count=len(pod_containers),
+                log_lines=log_lines,
+                truncated_pods=truncated_pods,
+                errors=errors,
+            )
+
+        except Exception as e:
+            error_msg = (
+                f'Failed to get logs from pods matching {label_selector} in {namespace}: {str(e)}'
+            )
+            log_with_request_id(ctx, LogLevel.ERROR, error_msg)
+
+            return PodsLogsResponse(
+                isError=True,
+                content=[TextContent(type='text', text=error_msg)],
+                namespace=namespace,
+                label_selector=label_selector,
+                pod_count=0,
+                log_lines=[],
+            )
+
     async def get_k8s_events(
         self,
         ctx: Context,
@@ -1053,15 +1618,27 @@ class K8sHandler:
             )
 
         try:
-            # Get Kubernetes client for the cluster
-            k8s_client = self.get_client(cluster_name)
-
-            # Get events
-            events = k8s_client.get_events(
-                kind=kind,
-                name=name,
-                namespace=namespace,
-            )
+            informer = await self.get_informer(cluster_name, 'Event', 'v1')
+            if informer is not None:
+                events = [
+                    K8sApis.summarize_event(event)
+                    for event in informer.list(
+                        namespace,
+                        field_selector=f'involvedObject.kind={kind},involvedObject.name={name}',
+                    )
+                ]
+            else:
+                # Get Kubernetes client for the cluster
+                k8s_client = await self.run_in_cluster(cluster_name, self.get_client, cluster_name)
+
+                # Get events
+                events = await self.run_in_cluster(
+                    cluster_name,
+                    k8s_client.get_events,
+                    kind=kind,
+                    name=name,
+                    namespace=namespace,
+                )
 
             # Format resource name for logging
             resource_name = f'{namespace + "/" if namespace else ""}{name}'
@@ -1070,13 +1647,13 @@ class K8sHandler:
             cleaned_events = [self.cleanup_resource_response(event) for event in events]
             event_items = [
                 EventItem(
-                    first_timestamp=event['first_timestamp'],
-                    last_timestamp=event['last_timestamp'],
-                    count=event['count'],
+                    first_timestamp=event.get('first_timestamp'),
+                    last_timestamp=event.get('last_timestamp'),
+                    count=event.get('count'),
                     message=event['message'],
-                    reason=event['reason'],
-                    reporting_component=event['reporting_component'],
-                    type=event['type'],
+                    reason=event.get('reason'),
+                    reporting_component=event.get('reporting_component'),
+                    type=event.get('type'),
                 )
                 for event in cleaned_events
             ]
@@ -1159,10 +1736,10 @@ class K8sHandler:
         """
         try:
             # Get Kubernetes client for the cluster
-            k8s_client = self.get_client(cluster_name)
+            k8s_client = await self.run_in_cluster(cluster_name, self.get_client, cluster_name)
 
             # Get API versions from the cluster (excluding core APIs)
-            api_versions = k8s_client.get_api_versions()
+            api_versions = await self.run_in_cluster(cluster_name, k8s_client.get_api_versions)
 
             # Log success
             log_with_request_id(
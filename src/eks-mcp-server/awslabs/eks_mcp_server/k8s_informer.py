@@ -0,0 +1,488 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Watch-backed Kubernetes resource cache for the EKS MCP Server."""
+
+import re
+import threading
+from awslabs.eks_mcp_server.consts import K8S_LIST_PAGE_SIZE
+from awslabs.eks_mcp_server.k8s_apis import K8sApis
+from collections import defaultdict
+from loguru import logger
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# Server side timeout of each watch request. The watch is then re-established from the last
+# observed resourceVersion with a client fetched from the client cache, so tokens stay fresh.
+WATCH_TIMEOUT_SECONDS = 300
+
+# Delay before listing again after a failed list or watch
+RETRY_DELAY_SECONDS = 5
+
+# How long a read waits for an informer to catch up before falling back to the API server
+SYNC_TIMEOUT_SECONDS = 5
+
+_SET_REQUIREMENT = re.compile(r'^([^\s!=()]+)\s+(in|notin)\s+\(([^()]*)\)$')
+_EQUALITY_REQUIREMENT = re.compile(r'^([^\s!=()]+)\s*(==|=|!=)\s*([^\s!=()]*)$')
+_EXISTS_REQUIREMENT = re.compile(r'^(!?)\s*([^\s!=()]+)$')
+
+ObjectKey = Tuple[str, str]
+Requirement = Tuple[str, str, Set[str]]
+
+
+def _split_requirements(selector: str) -> List[str]:
+    """Split a selector on the commas that are not inside a set of values."""
+    requirements, current, depth = [], '', 0
+    for char in selector:
+        if char == ',' and depth == 0:
+            requirements.append(current.strip())
+            current = ''
+            continue
+        depth += {'(': 1, ')': -1}.get(char, 0)
+        current += char
+    requirements.append(current.strip())
+    return [r for r in requirements if r]
+
+
+def parse_label_selector(selector: Optional[str]) -> List[Requirement]:
+    """Parse a label selector into (key, operator, values) requirements.
+
+    Supports equality (=, ==, !=), set (in, notin) and existence (key, !key) requirements.
+    Equality requirements are returned as in/notin requirements with a single value.
+
+    Raises:
+        ValueError: If the selector is not valid
+    """
+    requirements: List[Requirement] = []
+    for requirement in _split_requirements(selector or ''):
+        if match := _SET_REQUIREMENT.match(requirement):
+            key, operator, values = match.groups()
+            requirements.append((key, operator, {v.strip() for v in values.split(',')}))
+        elif match := _EQUALITY_REQUIREMENT.match(requirement):
+            key, operator, value = match.groups()
+            requirements.append((key, 'notin' if operator == '!=' else 'in', {value}))
+        elif match := _EXISTS_REQUIREMENT.match(requirement):
+            negated, key = match.groups()
+            requirements.append((key, '!' if negated else 'exists', set()))
+        else:
+            raise ValueError(f'Invalid label selector requirement: {requirement}')
+    return requirements
+
+
+def parse_field_selector(selector: Optional[str]) -> List[Tuple[str, bool, str]]:
+    """Parse a field selector into (field path, equals, value) requirements.
+
+    Raises:
+        ValueError: If the selector is not valid
+    """
+    requirements = []
+    for requirement in _split_requirements(selector or ''):
+        match = _EQUALITY_REQUIREMENT.match(requirement)
+        if not match:
+            raise ValueError(f'Invalid field selector requirement: {requirement}')
+        path, operator, value = match.groups()
+        requirements.append((path, operator != '!=', value))
+    return requirements
+
+
+def _field_value(obj: Dict[str, Any], path: str) -> str:
+    """Return the value at a dotted field path as a field selector would compare it."""
+    value: Any = obj
+    for part in path.split('.'):
+        value = value.get(part) if isinstance(value, dict) else None
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+def _matches_labels(labels: Dict[str, str], requirements: List[Requirement]) -> bool:
+    for key, operator, values in requirements:
+        if operator == 'in' and labels.get(key) not in values:
+            return False
+        if operator == 'notin' and labels.get(key) in values:
+            return False
+        if operator == 'exists' and key not in labels:
+            return False
+        if operator == '!' and key in labels:
+            return False
+    return True
+
+
+def _is_older(resource_version: Optional[str], other: Optional[str]) -> bool:
+    """Whether resource_version is known to be older than other.
+
+    Resource versions are opaque strings, but in practice they are increasing integers. Versions
+    that cannot be compared are never considered older.
+    """
+    if not other:
+        return False
+    if not resource_version:
+        return True
+    if resource_version.isdigit() and other.isdigit():
+        return int(resource_version) < int(other)
+    return False
+
+
+class ResourceStore:
+    """Objects of one resource kind, indexed by namespace, label and owner.
+
+    Objects are stored as API dictionaries without their managed fields. The store is not thread
+    safe; ResourceInformer guards it with its own lock.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self.objects: Dict[ObjectKey, Dict[str, Any]] = {}
+        self.resource_version: Optional[str] = None
+        self._by_namespace: Dict[str, Set[ObjectKey]] = defaultdict(set)
+        self._by_label: Dict[Tuple[str, str], Set[ObjectKey]] = defaultdict(set)
+        self._by_owner: Dict[str, Set[ObjectKey]] = defaultdict(set)
+
+    @staticmethod
+    def _key(obj: Dict[str, Any]) -> ObjectKey:
+        metadata = obj.get('metadata') or {}
+        return metadata.get('namespace') or '', metadata.get('name') or ''
+
+    @staticmethod
+    def _index_entries(obj: Dict[str, Any]):
+        metadata = obj.get('metadata') or {}
+        labels = (metadata.get('labels') or {}).items()
+        owners = [ref.get('uid') for ref in metadata.get('ownerReferences') or []]
+        return labels, [uid for uid in owners if uid]
+
+    def _index(self, key: ObjectKey, obj: Dict[str, Any]):
+        labels, owners = self._index_entries(obj)
+        self._by_namespace[key[0]].add(key)
+        for label in labels:
+            self._by_label[label].add(key)
+        for uid in owners:
+            self._by_owner[uid].add(key)
+
+    def _unindex(self, key: ObjectKey, obj: Dict[str, Any]):
+        labels, owners = self._index_entries(obj)
+        entries = [(self._by_namespace, key[0])]
+        entries += [(self._by_label, label) for label in labels]
+        entries += [(self._by_owner, uid) for uid in owners]
+        for index, entry in entries:
+            index[entry].discard(key)
+            if not index[entry]:
+                del index[entry]
+
+    def replace(self, objects: Iterable[Dict[str, Any]], resource_version: Optional[str]):
+        """Replace the contents of the store with a complete listing."""
+        self.objects.clear()
+        self._by_namespace.clear()
+        self._by_label.clear()
+        self._by_owner.clear()
+        for obj in objects:
+            self.upsert(obj)
+        self.resource_version = resource_version
+
+    def upsert(self, obj: Dict[str, Any]):
+        """Add an object, or replace the stored object with the same namespace and name."""
+        (obj.get('metadata') or {}).pop('managedFields', None)
+        key = self._key(obj)
+        previous = self.objects.get(key)
+        if previous is not None:
+            self._unindex(key, previous)
+        self.objects[key] = obj
+        self._index(key, obj)
+
+    def delete(self, obj: Dict[str, Any]):
+        """Remove an object if it is stored."""
+        key = self._key(obj)
+        previous = self.objects.pop(key, None)
+        if previous is not None:
+            self._unindex(key, previous)
+
+    def get(self, name: str, namespace: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return the stored object with the given name and namespace, if any."""
+        return self.objects.get((namespace or '', name))
+
+    def list(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        owner_uid: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return the stored objects matching the filters, ordered by namespace and name.
+
+        Equality and set based label requirements, the namespace and the owner narrow the
+        candidates through the indexes before the remaining requirements are checked.
+
+        Raises:
+            ValueError: If a selector is not valid
+        """
+        label_requirements = parse_label_selector(label_selector)
+        field_requirements = parse_field_selector(field_selector)
+
+        candidate_sets = []
+        if namespace:
+            candidate_sets.append(self._by_namespace.get(namespace, set()))
+        if owner_uid:
+            candidate_sets.append(self._by_owner.get(owner_uid, set()))
+        for key, operator, values in label_requirements:
+            if operator == 'in':
+                candidate_sets.append(
+                    set().union(*(self._by_label.get((key, value), set()) for value in values))
+                )
+
+        if candidate_sets:
+            smallest, *others = sorted(candidate_sets, key=len)
+            candidates = smallest.intersection(*others)
+        else:
+            candidates = self.objects.keys()
+
+        result = []
+        for key in sorted(candidates):
+            obj = self.objects[key]
+            labels = (obj.get('metadata') or {}).get('labels') or {}
+            if not _matches_labels(labels, label_requirements):
+                continue
+            if any(
+                (_field_value(obj, path) == value) != equals
+                for path, equals, value in field_requirements
+            ):
+                continue
+            result.append(obj)
+        return result
+
+
+class ResourceInformer:
+    """Keeps a ResourceStore of one resource kind in sync with a cluster.
+
+    The informer lists the resources once, then watches them from the listed resourceVersion in a
+    background thread, applying each event to the store. If the watch fails or its resourceVersion
+    expires, the resources are listed again and the store replaced.
+    """
+
+    def __init__(self, get_client: Callable[[], K8sApis], kind: str, api_version: str):
+        """Initialize the informer.
+
+        Args:
+            get_client: Returns a Kubernetes client for the cluster, called for each list and watch
+            kind: Resource kind (e.g., 'Pod', 'Service')
+            api_version: API version (e.g., 'v1', 'apps/v1')
+        """
+        self.kind = kind
+        self.api_version = api_version
+        self.store = ResourceStore()
+        self._get_client = get_client
+        self._changed = threading.Condition()
+        self._synced = False
+        self._min_resource_version: Optional[str] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """List the resources, then keep watching them in a background thread."""
+        self._list()
+        self._thread = threading.Thread(
+            target=self._run, name=f'informer-{self.api_version}-{self.kind}', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop watching once the current watch request ends."""
+        with self._changed:
+            self._stopped.set()
+            self._changed.notify_all()
+
+    def _list(self):
+        # List in pages; every page of a paginated list is served from the same snapshot
+        client = self._get_client()
+        items: List[Dict[str, Any]] = []
+        continue_token = None
+        while True:
+            response = client.list_resources(
+                self.kind,
+                self.api_version,
+                limit=K8S_LIST_PAGE_SIZE,
+                continue_token=continue_token,
+            ).to_dict()
+            items.extend(response.get('items') or [])
+            metadata = response.get('metadata') or {}
+            continue_token = metadata.get('continue')
+            if not continue_token:
+                break
+
+        with self._changed:
+            self.store.replace(items, metadata.get('resourceVersion'))
+            self._synced = True
+            self._changed.notify_all()
+
+    def _apply(self, event: Dict[str, Any]):
+        event_type = event.get('type')
+        obj = event.get('raw_object') or {}
+        if event_type == 'ERROR':
+            # Raised like a failed request, so an expired resourceVersion (410) relists at once
+            from kubernetes.client.exceptions import ApiException
+
+            raise ApiException(status=obj.get('code'), reason=obj.get('message', str(obj)))
+
+        with self._changed:
+            if event_type in ('ADDED', 'MODIFIED'):
+                self.store.upsert(obj)
+            elif event_type == 'DELETED':
+                self.store.delete(obj)
+            resource_version = (obj.get('metadata') or {}).get('resourceVersion')
+            if resource_version:
+                self.store.resource_version = resource_version
+            self._changed.notify_all()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                if not self._synced:
+                    self._list()
+                for event in self._get_client().watch_resources(
+                    self.kind,
+                    self.api_version,
+                    resource_version=self.store.resource_version,
+                    timeout_seconds=WATCH_TIMEOUT_SECONDS,
+                ):
+                    self._apply(event)
+                    if self._stopped.is_set():
+                        return
+            except Exception as e:
+                with self._changed:
+                    self._synced = False
+                if getattr(e, 'status', None) == 410:
+                    logger.info(f'Watch of {self.kind} resources expired, listing them again')
+                    continue
+                logger.warning(f'Watch of {self.kind} resources failed: {str(e)}')
+                self._stopped.wait(RETRY_DELAY_SECONDS)
+
+    def observe_write(self, resource_version: Optional[str]):
+        """Record the resourceVersion returned by a write, so later reads include the write."""
+        with self._changed:
+            if _is_older(self._min_resource_version, resource_version):
+                self._min_resource_version = resource_version
+
+    def wait_for_sync(self, timeout: float = SYNC_TIMEOUT_SECONDS) -> bool:
+        """Wait until the store is synced and has observed every recorded write.
+
+        Returns:
+            Whether the store can serve reads; if not, callers should read from the API server
+        """
+
+        def synced():
+            return self._synced and not _is_older(
+                self.store.resource_version, self._min_resource_version
+            )
+
+        with self._changed:
+            self._changed.wait_for(lambda: self._stopped.is_set() or synced(), timeout)
+            return not self._stopped.is_set() and synced()
+
+    def list(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        owner_uid: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return the cached objects matching the filters. See ResourceStore.list."""
+        with self._changed:
+            return self.store.list(namespace, label_selector, field_selector, owner_uid)
+
+    def get(self, name: str, namespace: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return the cached object with the given name and namespace, if any."""
+        with self._changed:
+            return self.store.get(name, namespace)
+
+
+class K8sInformers:
+    """Informers for selected resource kinds, started per cluster on first use.
+
+    Resources are selected as '<apiVersion>/<kind>' strings, e.g. 'v1/Pod' or 'apps/v1/Deployment'.
+    """
+
+    def __init__(self, get_client: Callable[[str], K8sApis], resources: Iterable[str]):
+        """Initialize the informers.
+
+        Args:
+            get_client: Returns a Kubernetes client for a cluster name
+            resources: Resources to inform on, as '<apiVersion>/<kind>' strings
+
+        Raises:
+            ValueError: If a resource is not in '<apiVersion>/<kind>' form
+        """
+        self._get_client = get_client
+        self._resources: Set[Tuple[str, str]] = set()
+        for resource in resources:
+            api_version, _, kind = resource.rpartition('/')
+            if not api_version or not kind:
+                raise ValueError(f'Invalid informer resource {resource}, expected apiVersion/kind')
+            self._resources.add((api_version, kind))
+        self._informers: Dict[Tuple[str, str, str], ResourceInformer] = {}
+        self._lock = threading.Lock()
+
+    def is_informed(self, kind: str, api_version: str) -> bool:
+        """Whether resources of this kind are served by informers."""
+        return (api_version, kind) in self._resources
+
+    def get(self, cluster_name: str, kind: str, api_version: str) -> Optional[ResourceInformer]:
+        """Return a synced informer for the resources, starting it if needed.
+
+        Returns:
+            The informer, or None if the kind is not informed or the informer cannot serve reads
+        """
+        if not self.is_informed(kind, api_version):
+            return None
+
+        key = (cluster_name, api_version, kind)
+        with self._lock:
+            informer = self._informers.get(key)
+            starting = informer is None
+            if starting:
+                informer = ResourceInformer(
+                    lambda: self._get_client(cluster_name), kind, api_version
+                )
+                self._informers[key] = informer
+
+        if starting:
+            # Start outside the lock, so the initial list doesn't block other informers. Concurrent
+            # readers of this one wait for its sync, and are woken up by stop if the start fails.
+            try:
+                informer.start()
+            except Exception as e:
+                logger.warning(
+                    f'Failed to start {kind} informer for cluster {cluster_name}: {str(e)}'
+                )
+                with self._lock:
+                    if self._informers.get(key) is informer:
+                        del self._informers[key]
+                informer.stop()
+                return None
+
+        return informer if informer.wait_for_sync() else None
+
+    def observe_write(
+        self, cluster_name: str, kind: str, api_version: str, resource_version: Optional[str]
+    ):
+        """Record the resourceVersion of a write to an informed resource."""
+        informer = self._informers.get((cluster_name, api_version, kind))
+        if informer is not None:
+            informer.observe_write(resource_version)
+
+    def stop(self):
+        """Stop all informers."""
+        with self._lock:
+            for informer in self._informers.values():
+                informer.stop()
+            self._informers.clear()
@@ -97,6 +97,30 @@ class KubernetesResourceListResponse(CallToolResult):
     namespace: Optional[str] = Field(None, description='Namespace of the Kubernetes resources')
     count: int = Field(..., description='Number of resources found')
     items: List[ResourceSummary] = Field(..., description='List of resources')
+    continue_token: Optional[str] = Field(
+        None, description='Token to pass as continue_token to list the next page of resources'
+    )
+
+
+class ResourceSummaryList(BaseModel):
+    """Resources listed from one cluster and namespace."""
+
+    cluster_name: str = Field(..., description='Name of the EKS cluster')
+    namespace: Optional[str] = Field(None, description='Namespace of the Kubernetes resources')
+    count: int = Field(..., description='Number of resources found')
+    items: List[ResourceSummary] = Field(..., description='List of resources')
+    error: Optional[str] = Field(None, description='Error message if listing failed')
+
+
+class MultiClusterResourceListResponse(CallToolResult):
+    """Response model for list_k8s_resources_in_clusters tool."""
+
+    kind: str = Field(..., description='Kind of the Kubernetes resources')
+    api_version: str = Field(..., description='API version of the Kubernetes resources')
+    count: int = Field(..., description='Total number of resources found')
+    results: List[ResourceSummaryList] = Field(
+        ..., description='Resources listed from each cluster and namespace'
+    )
 
 
 class ApiVersionsResponse(CallToolResult):
@@ -122,6 +146,32 @@ class PodLogsResponse(CallToolResult):
     log_lines: List[str] = Field(..., description='Pod log lines')
 
 
+class PodLogLine(BaseModel):
+    """Log line of a pod container."""
+
+    timestamp: str = Field(..., description='RFC 3339 timestamp of the log line')
+    pod_name: str = Field(..., description='Name of the pod')
+    container_name: str = Field(..., description='Name of the container')
+    message: str = Field(..., description='Log message')
+
+
+class PodsLogsResponse(CallToolResult):
+    """Response model for get_pods_logs tool."""
+
+    namespace: str = Field(..., description='Namespace of the pods')
+    label_selector: str = Field(..., description='Label selector the pods were selected by')
+    pod_count: int = Field(..., description='Number of pods matching the label selector')
+    log_lines: List[PodLogLine] = Field(
+        ..., description='Log lines of all pods and containers, ordered by timestamp'
+    )
+    truncated_pods: List[str] = Field(
+        default_factory=list, description='Pods whose logs were cut off at the byte limit'
+    )
+    errors: Dict[str, str] = Field(
+        default_factory=dict, description='Error messages of pods whose logs could not be read'
+    )
+
+
 class EventsResponse(CallToolResult):
     """Response model for get_k8s_events tool."""
 
@@ -166,6 +216,36 @@ class CloudWatchLogsResponse(CallToolResult):
     )
 
 
+class CloudWatchResourceLogs(BaseModel):
+    """Log entries of a single resource in a get_cloudwatch_logs_for_resources response."""
+
+    resource_name: str = Field(..., description='Resource name')
+    log_entries: List[Dict[str, Any]] = Field(
+        ..., description='Log entries with timestamps and messages'
+    )
+    error: Optional[str] = Field(None, description='Error message if the query failed')
+
+
+class CloudWatchLogsBatchResponse(CallToolResult):
+    """Response model for get_cloudwatch_logs_for_resources tool.
+
+    This model contains the responses of CloudWatch logs queries for several resources,
+    sharing a log group and time range.
+    """
+
+    resource_type: str = Field(..., description='Resource type (pod, node, container)')
+    cluster_name: str = Field(..., description='Name of the EKS cluster')
+    log_type: str = Field(
+        ..., description='Log type (application, host, performance, control-plane, or custom)'
+    )
+    log_group: str = Field(..., description='CloudWatch log group name')
+    start_time: str = Field(..., description='Start time in ISO format')
+    end_time: str = Field(..., description='End time in ISO format')
+    resources: List[CloudWatchResourceLogs] = Field(
+        ..., description='Log entries of each resource'
+    )
+
+
 class CloudWatchDataPoint(BaseModel):
     """Model for a CloudWatch metric data point.
 
@@ -194,6 +274,67 @@ class CloudWatchMetricsResponse(CallToolResult):
     )
 
 
+class MetricQuery(BaseModel):
+    """A metric, or metric math expression, to retrieve with get_cloudwatch_metrics_batch.
+
+    Each query either retrieves a metric (metric_name, namespace and dimensions) or computes
+    a metric math expression over the ids of other queries.
+    """
+
+    id: Optional[str] = Field(
+        None,
+        description='Identifier of the query, used to reference it in expressions. Must start with a lowercase letter. Defaults to m<index>.',
+    )
+    metric_name: Optional[str] = Field(None, description='Metric name (e.g., cpu_usage_total)')
+    namespace: Optional[str] = Field(
+        None, description='CloudWatch namespace of the metric (e.g., ContainerInsights)'
+    )
+    dimensions: Dict[str, str] = Field(
+        default_factory=dict, description='Dimensions of the metric (e.g., ClusterName, PodName)'
+    )
+    stat: str = Field('Average', description='Statistic of the metric (e.g., Average, Maximum)')
+    period: Optional[int] = Field(
+        None,
+        description='Period in seconds of the metric data points, overrides the request period',
+    )
+    expression: Optional[str] = Field(
+        None, description='Metric math expression over other query ids (e.g., "m1 / m2 * 100")'
+    )
+    label: Optional[str] = Field(None, description='Label of the returned series')
+    return_data: bool = Field(
+        True, description='Whether to return the series, false for inputs to expressions only'
+    )
+
+
+class MetricSeries(BaseModel):
+    """Values of a metric query, aligned with the timestamps of the response."""
+
+    id: str = Field(..., description='Identifier of the query')
+    label: Optional[str] = Field(None, description='Label of the series')
+    status_code: Optional[str] = Field(
+        None, description='Status of the series (Complete, PartialData, InternalError, Forbidden)'
+    )
+    values: List[Optional[float]] = Field(
+        ..., description='Values at each timestamp of the response, null where there is no data'
+    )
+
+
+class CloudWatchMetricsBatchResponse(CallToolResult):
+    """Response model for get_cloudwatch_metrics_batch tool.
+
+    Series are returned as columns aligned with a single list of timestamps, so each
+    timestamp is only included once however many series are requested.
+    """
+
+    cluster_name: str = Field(..., description='Name of the EKS cluster')
+    start_time: str = Field(..., description='Start time in ISO format')
+    end_time: str = Field(..., description='End time in ISO format')
+    timestamps: List[str] = Field(
+        ..., description='Timestamps of the data points in ISO format, in ascending order'
+    )
+    series: List[MetricSeries] = Field(..., description='Values of each returned query')
+
+
 class StackSummary(BaseModel):
     """Summary of a CloudFormation stack."""
 
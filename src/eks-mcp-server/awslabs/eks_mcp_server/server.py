@@ -123,6 +123,13 @@ def main():
         default=False,
         help='Enable sensitive data access (required for reading logs, events, and Kubernetes Secrets)',
     )
+    parser.add_argument(
+        '--informer-resources',
+        nargs='*',
+        default=None,
+        metavar='API_VERSION/KIND',
+        help='Kubernetes resources to cache with watch-backed informers and serve reads of locally (e.g., v1/Pod apps/v1/Deployment)',
+    )
 
     args = parser.parse_args()
 
@@ -146,7 +153,7 @@ def main():
     CloudWatchHandler(mcp, allow_sensitive_data_access)
     EKSKnowledgeBaseHandler(mcp)
     EksStackHandler(mcp, allow_write)
-    K8sHandler(mcp, allow_write, allow_sensitive_data_access)
+    K8sHandler(mcp, allow_write, allow_sensitive_data_access, args.informer_resources)
     IAMHandler(mcp, allow_write)
     CloudWatchMetricsHandler(mcp)
 
@@ -14,12 +14,15 @@
 # ruff: noqa: D101, D102, D103
 """Tests for the CloudWatchHandler class."""
 
+import asyncio
 import datetime
 import pytest
-from awslabs.eks_mcp_server.cloudwatch_handler import CloudWatchHandler
+import threading
+from awslabs.eks_mcp_server.cloudwatch_handler import CloudWatchHandler, pack_metric_queries
+from awslabs.eks_mcp_server.models import MetricQuery
 from mcp.server.fastmcp import Context
 from mcp.types import TextContent
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 @pytest.fixture
@@ -48,17 +51,21 @@ class TestCloudWatchHandler:
         assert handler.mcp == mock_mcp
         assert handler.allow_sensitive_data_access is False
 
-        # Verify that both tools are registered
-        assert mock_mcp.tool.call_count == 2
+        # Verify that all tools are registered
+        assert mock_mcp.tool.call_count == 4
 
         # Get all call args
         call_args_list = mock_mcp.tool.call_args_list
 
         # Verify that get_cloudwatch_logs was registered
         assert call_args_list[0][1]['name'] == 'get_cloudwatch_logs'
+        assert call_args_list[1][1]['name'] == 'get_cloudwatch_logs_for_resources'
 
         # Verify that get_cloudwatch_metrics was registered
-        assert call_args_list[1][1]['name'] == 'get_cloudwatch_metrics'
+        assert call_args_list[2][1]['name'] == 'get_cloudwatch_metrics'
+
+        # Verify that get_cloudwatch_metrics_batch was registered
+        assert call_args_list[3][1]['name'] == 'get_cloudwatch_metrics_batch'
 
     def test_resolve_time_range_defaults(self):
         """Test resolve_time_range with default values."""
@@ -899,6 +906,156 @@ class TestCloudWatchHandler:
                 assert len(result.data_points) == 1
                 assert result.data_points[0]['value'] == 1024
 
+    def test_pack_metric_queries(self):
+        """Test metric queries are packed with the queries their expressions reference."""
+        queries = [
+            {'Id': 'a'},
+            {'Id': 'b'},
+            {'Id': 'c'},
+            {'Id': 'total', 'Expression': 'a + c'},
+            {'Id': 'd'},
+        ]
+
+        batches = pack_metric_queries(queries, max_queries=3)
+
+        assert [[q['Id'] for q in batch] for batch in batches] == [['a', 'c', 'total'], ['b', 'd']]
+
+    def test_pack_metric_queries_group_too_large(self):
+        """Test packing fails when dependent queries do not fit in one request."""
+        queries = [{'Id': 'a'}, {'Id': 'b'}, {'Id': 'e', 'Expression': 'SUM([a, b])'}]
+
+        with pytest.raises(ValueError, match='3 metric queries reference each other'):
+            pack_metric_queries(queries, max_queries=2)
+
+    @pytest.mark.asyncio
+    async def test_get_cloudwatch_metrics_batch(self, mock_context, mock_mcp):
+        """Test get_cloudwatch_metrics_batch follows pages and aligns series."""
+        handler = CloudWatchHandler(mock_mcp)
+
+        t1 = datetime.datetime(2025, 1, 1, 12, 0, 0)
+        t2 = datetime.datetime(2025, 1, 1, 12, 1, 0)
+        mock_cloudwatch_client = MagicMock()
+        mock_cloudwatch_client.get_metric_data.side_effect = [
+            {
+                'MetricDataResults': [
+                    {'Id': 'cpu', 'Label': 'cpu', 'Timestamps': [t1], 'Values': [10.0]},
+                    {'Id': 'util', 'Label': 'util', 'Timestamps': [t1], 'Values': [50.0]},
+                ],
+                'NextToken': 'token-1',
+            },
+            {
+                'MetricDataResults': [
+                    {
+                        'Id': 'cpu',
+                        'Timestamps': [t2],
+                        'Values': [20.0],
+                        'StatusCode': 'Complete',
+                    },
+                    {
+                        'Id': 'm3',
+                        'Label': 'memory',
+                        'Timestamps': [t2],
+                        'Values': [128.0],
+                        'StatusCode': 'Complete',
+                    },
+                ],
+            },
+        ]
+
+        start_dt = datetime.datetime(2025, 1, 1, 11, 45, 0)
+        end_dt = datetime.datetime(2025, 1, 1, 12, 0, 0)
+        with (
+            patch.object(handler, 'resolve_time_range', return_value=(start_dt, end_dt)),
+            patch(
+                'awslabs.eks_mcp_server.cloudwatch_handler.AwsHelper.create_boto3_client',
+                return_value=mock_cloudwatch_client,
+            ),
+        ):
+            result = await handler.get_cloudwatch_metrics_batch(
+                mock_context,
+                cluster_name='test-cluster',
+                queries=[
+                    MetricQuery(
+                        id='cpu',
+                        metric_name='node_cpu_utilization',
+                        namespace='ContainerInsights',
+                        dimensions={'ClusterName': 'test-cluster'},
+                    ),
+                    MetricQuery(id='util', expression='cpu / 2', period=300),
+                    MetricQuery(
+                        metric_name='node_memory_working_set',
+                        namespace='ContainerInsights',
+                        stat='Maximum',
+                        return_data=False,
+                    ),
+                ],
+                minutes=15,
+                start_time=None,
+                end_time=None,
+                period=60,
+            )
+
+        assert not result.isError
+        assert result.timestamps == [t1.isoformat(), t2.isoformat()]
+        assert [(s.id, s.label, s.status_code, s.values) for s in result.series] == [
+            ('cpu', 'cpu', 'Complete', [10.0, 20.0]),
+            ('util', 'util', None, [50.0, None]),
+        ]
+
+        assert mock_cloudwatch_client.get_metric_data.call_count == 2
+        first_call, second_call = mock_cloudwatch_client.get_metric_data.call_args_list
+        assert 'NextToken' not in first_call.kwargs
+        assert second_call.kwargs['NextToken'] == 'token-1'
+        assert first_call.kwargs['ScanBy'] == 'TimestampAscending'
+        queries = first_call.kwargs['MetricDataQueries']
+        assert queries[0]['MetricStat'] == {
+            'Metric': {
+                'Namespace': 'ContainerInsights',
+                'MetricName': 'node_cpu_utilization',
+                'Dimensions': [{'Name': 'ClusterName', 'Value': 'test-cluster'}],
+            },
+            'Period': 60,
+            'Stat': 'Average',
+        }
+        assert queries[1] == {
+            'Id': 'util',
+            'ReturnData': True,
+            'Expression': 'cpu / 2',
+            'Period': 300,
+        }
+        assert queries[2]['Id'] == 'm3'
+        assert queries[2]['ReturnData'] is False
+        assert queries[2]['MetricStat']['Stat'] == 'Maximum'
+
+    @pytest.mark.asyncio
+    async def test_get_cloudwatch_metrics_batch_invalid_query(self, mock_context, mock_mcp):
+        """Test get_cloudwatch_metrics_batch rejects invalid queries before calling CloudWatch."""
+        handler = CloudWatchHandler(mock_mcp)
+
+        with patch(
+            'awslabs.eks_mcp_server.cloudwatch_handler.AwsHelper.create_boto3_client'
+        ) as mock_create_client:
+            result = await handler.get_cloudwatch_metrics_batch(
+                mock_context,
+                cluster_name='test-cluster',
+                queries=[
+                    MetricQuery(
+                        metric_name='node_cpu_utilization',
+                        namespace='ContainerInsights',
+                        dimensions={'ClusterName': 'other-cluster'},
+                    )
+                ],
+                minutes=15,
+                start_time=None,
+                end_time=None,
+                period=60,
+            )
+
+        mock_create_client.assert_not_called()
+        assert result.isError
+        assert result.series == []
+        assert "does not match ClusterName dimension 'other-cluster'" in result.content[0].text
+
     @pytest.mark.asyncio
     async def test_get_cloudwatch_logs_with_json_message(self, mock_context, mock_mcp):
         """Test get_cloudwatch_logs with JSON message."""
@@ -1088,7 +1245,8 @@ class TestCloudWatchHandler:
         result = dict(handler._format_nested_json(obj))
         assert result['key'] == '{invalid json}'
 
-    def test_poll_query_results_complete(self, mock_context, mock_mcp):
+    @pytest.mark.asyncio
+    async def test_poll_query_results_complete(self, mock_context, mock_mcp):
         """Test _poll_query_results with Complete status."""
         # Initialize the CloudWatch handler
         handler = CloudWatchHandler(mock_mcp)
@@ -1106,7 +1264,7 @@ class TestCloudWatchHandler:
         }
 
         # Call the _poll_query_results method
-        result = handler._poll_query_results(
+        result = await handler._poll_query_results(
             mock_context, mock_logs_client, 'test-query-id', 'pod', 'test-pod'
         )
 
@@ -1121,7 +1279,8 @@ class TestCloudWatchHandler:
         assert result['results'][0][1]['field'] == '@message'
         assert result['results'][0][1]['value'] == 'Test log message'
 
-    def test_poll_query_results_failed(self, mock_context, mock_mcp):
+    @pytest.mark.asyncio
+    async def test_poll_query_results_failed(self, mock_context, mock_mcp):
         """Test _poll_query_results with Failed status."""
         # Initialize the CloudWatch handler
         handler = CloudWatchHandler(mock_mcp)
@@ -1134,14 +1293,15 @@ class TestCloudWatchHandler:
 
         # Call the _poll_query_results method and expect an exception
         with pytest.raises(Exception) as excinfo:
-            handler._poll_query_results(
+            await handler._poll_query_results(
                 mock_context, mock_logs_client, 'test-query-id', 'pod', 'test-pod'
             )
 
         # Verify the exception message
         assert 'CloudWatch Logs query failed for pod test-pod' in str(excinfo.value)
 
-    def test_poll_query_results_cancelled(self, mock_context, mock_mcp):
+    @pytest.mark.asyncio
+    async def test_poll_query_results_cancelled(self, mock_context, mock_mcp):
         """Test _poll_query_results with Cancelled status."""
         # Initialize the CloudWatch handler
         handler = CloudWatchHandler(mock_mcp)
@@ -1154,14 +1314,15 @@ class TestCloudWatchHandler:
 
         # Call the _poll_query_results method and expect an exception
         with pytest.raises(Exception) as excinfo:
-            handler._poll_query_results(
+            await handler._poll_query_results(
                 mock_context, mock_logs_client, 'test-query-id', 'pod', 'test-pod'
             )
 
         # Verify the exception message
         assert 'CloudWatch Logs query was cancelled for pod test-pod' in str(excinfo.value)
 
-    def test_poll_query_results_timeout(self, mock_context, mock_mcp):
+    @pytest.mark.asyncio
+    async def test_poll_query_results_timeout(self, mock_context, mock_mcp):
         """Test _poll_query_results with timeout."""
         # Initialize the CloudWatch handler
         handler = CloudWatchHandler(mock_mcp)
@@ -1174,7 +1335,7 @@ class TestCloudWatchHandler:
 
         # Call the _poll_query_results method with a small max_attempts value and expect a timeout
         with pytest.raises(TimeoutError) as excinfo:
-            handler._poll_query_results(
+            await handler._poll_query_results(
                 mock_context, mock_logs_client, 'test-query-id', 'pod', 'test-pod', max_attempts=2
             )
 
@@ -1183,7 +1344,8 @@ class TestCloudWatchHandler:
             excinfo.value
         )
 
-    def test_poll_query_results_exponential_backoff(self, mock_context, mock_mcp):
+    @pytest.mark.asyncio
+    async def test_poll_query_results_exponential_backoff(self, mock_context, mock_mcp):
         """Test _poll_query_results with exponential backoff."""
         # Initialize the CloudWatch handler
         handler = CloudWatchHandler(mock_mcp)
@@ -1197,15 +1359,147 @@ class TestCloudWatchHandler:
             {'status': 'Complete', 'results': []},
         ]
 
-        # Mock time.sleep to track calls
-        with patch('time.sleep') as mock_sleep:
+        # Mock asyncio.sleep to track calls
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
             # Call the _poll_query_results method
-            handler._poll_query_results(
+            await handler._poll_query_results(
                 mock_context, mock_logs_client, 'test-query-id', 'pod', 'test-pod', initial_delay=1
             )
 
-            # Verify that time.sleep was called with the correct delay
+            # Verify that asyncio.sleep was called with the correct delay
             mock_sleep.assert_called_once_with(1)  # Initial delay
 
         # Verify that get_query_results was called twice
         assert mock_logs_client.get_query_results.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_poll_query_results_timeout_stops_query(self, mock_context, mock_mcp):
+        """Test _poll_query_results stops the query when it times out."""
+        handler = CloudWatchHandler(mock_mcp)
+
+        mock_logs_client = MagicMock()
+        mock_logs_client.get_query_results.return_value = {'status': 'Running'}
+        stop_threads = []
+        mock_logs_client.stop_query.side_effect = lambda **kwargs: stop_threads.append(
+            threading.get_ident()
+        )
+
+        with patch('asyncio.sleep', new_callable=AsyncMock):
+            with pytest.raises(TimeoutError):
+                await handler._poll_query_results(
+                    mock_context,
+                    mock_logs_client,
+                    'test-query-id',
+                    'pod',
+                    'test-pod',
+                    max_attempts=1,
+                )
+
+        mock_logs_client.stop_query.assert_called_once_with(queryId='test-query-id')
+        # The blocking call runs off the event loop thread
+        assert stop_threads != [threading.get_ident()]
+
+    @pytest.mark.asyncio
+    async def test_poll_query_results_cancelled_task_stops_query(self, mock_context, mock_mcp):
+        """Test cancelling a poll stops the query without blocking the event loop."""
+        handler = CloudWatchHandler(mock_mcp)
+
+        mock_logs_client = MagicMock()
+        mock_logs_client.get_query_results.return_value = {'status': 'Running'}
+        mock_logs_client.stop_query.side_effect = Exception('Query already finished')
+
+        task = asyncio.create_task(
+            handler._poll_query_results(
+                mock_context, mock_logs_client, 'test-query-id', 'pod', 'test-pod'
+            )
+        )
+        # The event loop keeps running other tasks while the query is polled
+        while not mock_logs_client.get_query_results.called:
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        mock_logs_client.stop_query.assert_called_once_with(queryId='test-query-id')
+
+    @pytest.mark.asyncio
+    async def test_get_cloudwatch_logs_for_resources(self, mock_context, mock_mcp):
+        """Test get_cloudwatch_logs_for_resources queries each resource concurrently."""
+        handler = CloudWatchHandler(mock_mcp, allow_sensitive_data_access=True)
+
+        mock_logs_client = MagicMock()
+
+        def start_query(queryString, **kwargs):
+            if "'node-2'" in queryString:
+                raise Exception('LimitExceededException')
+            node = 'node-1' if "'node-1'" in queryString else 'node-3'
+            return {'queryId': f'query-{node}'}
+
+        mock_logs_client.start_query.side_effect = start_query
+        mock_logs_client.get_query_results.side_effect = lambda queryId: {
+            'status': 'Complete',
+            'results': [
+                [
+                    {'field': '@timestamp', 'value': '2025-01-01 12:00:00.000'},
+                    {'field': '@message', 'value': f'Message from {queryId}'},
+                ]
+            ],
+        }
+
+        start_dt = datetime.datetime(2025, 1, 1, 11, 45, 0)
+        end_dt = datetime.datetime(2025, 1, 1, 12, 0, 0)
+        with (
+            patch.object(handler, 'resolve_time_range', return_value=(start_dt, end_dt)),
+            patch(
+                'awslabs.eks_mcp_server.cloudwatch_handler.AwsHelper.create_boto3_client',
+                return_value=mock_logs_client,
+            ),
+        ):
+            result = await handler.get_cloudwatch_logs_for_resources(
+                mock_context,
+                resource_type='node',
+                cluster_name='test-cluster',
+                log_type='host',
+                resource_names=['node-1', 'node-2', 'node-3', 'node-1'],
+                minutes=15,
+                start_time=None,
+                end_time=None,
+                limit=10,
+                filter_pattern='filter @message like /ERROR/',
+                fields=None,
+            )
+
+        assert not result.isError
+        assert result.log_group == '/aws/containerinsights/test-cluster/host'
+        assert [(r.resource_name, r.error) for r in result.resources] == [
+            ('node-1', None),
+            ('node-2', 'LimitExceededException'),
+            ('node-3', None),
+        ]
+        assert result.resources[0].log_entries[0]['message'] == 'Message from query-node-1'
+        assert result.resources[2].log_entries[0]['message'] == 'Message from query-node-3'
+        assert '1 queries failed' in result.content[0].text
+        assert mock_logs_client.start_query.call_count == 3
+        for call in mock_logs_client.start_query.call_args_list:
+            assert '| filter @message like /ERROR/' in call.kwargs['queryString']
+            assert 'limit 10' in call.kwargs['queryString']
+
+    @pytest.mark.asyncio
+    async def test_get_cloudwatch_logs_for_resources_sensitive_data_access_disabled(
+        self, mock_context, mock_mcp
+    ):
+        """Test get_cloudwatch_logs_for_resources with sensitive data access disabled."""
+        handler = CloudWatchHandler(mock_mcp)
+
+        result = await handler.get_cloudwatch_logs_for_resources(
+            mock_context,
+            resource_type='pod',
+            cluster_name='test-cluster',
+            log_type='application',
+            resource_names=['test-pod'],
+        )
+
+        assert result.isError
+        assert result.resources == []
+        assert 'requires --allow-sensitive-data-access flag' in result.content[0].text
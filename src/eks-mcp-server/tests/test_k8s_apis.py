@@ -164,9 +164,11 @@ class TestK8sApisInitialization:
         # Mock import error by patching the import mechanism
         with patch(
             'builtins.__import__',
-            side_effect=lambda name, *args, **kwargs: __import__(name, *args, **kwargs)
-            if name != 'kubernetes'
-            else exec('raise ImportError("kubernetes package not installed")'),
+            side_effect=lambda name, *args, **kwargs: (
+                __import__(name, *args, **kwargs)
+                if name != 'kubernetes'
+                else exec('raise ImportError("kubernetes package not installed")')
+            ),
         ):
             # Initialize K8sApis - should raise ImportError
             with pytest.raises(ImportError, match='kubernetes package not installed'):
@@ -214,6 +216,51 @@ class TestK8sApisInitialization:
             # Call __del__ method - should not raise an exception
             K8sApis.__del__(apis)
 
+    def test_update_token(self, k8s_apis):
+        """Test the token is replaced on the existing API client configuration."""
+        k8s_apis.update_token('new-token')
+
+        assert k8s_apis.api_client.configuration.api_key == {'authorization': 'Bearer new-token'}
+
+    def test_close(self, k8s_apis):
+        """Test close releases connections and removes the CA certificate file."""
+        k8s_apis._ca_cert_file_path = '/tmp/ca-cert-file'
+
+        with patch('os.path.exists', return_value=True), patch('os.unlink') as mock_unlink:
+            k8s_apis.close()
+
+        k8s_apis.api_client.close.assert_called_once()
+        mock_unlink.assert_called_once_with('/tmp/ca-cert-file')
+        assert k8s_apis._ca_cert_file_path is None
+
+    def test_discovery_cache_file(self, k8s_apis, tmp_path):
+        """Test discovery is cached per endpoint and server version."""
+        mock_client = MagicMock()
+        mock_client.VersionApi.return_value.get_code.return_value.git_version = 'v1.30.1-eks-1'
+
+        with patch('awslabs.eks_mcp_server.k8s_apis.DISCOVERY_CACHE_DIR', str(tmp_path)):
+            cache_file = k8s_apis._discovery_cache_file(mock_client, 'https://test-endpoint')
+            with open(cache_file, 'w') as f:
+                f.write('{}')
+
+            # An upgrade selects a new cache file and removes the stale one
+            mock_client.VersionApi.return_value.get_code.return_value.git_version = 'v1.31.0'
+            upgraded_cache_file = k8s_apis._discovery_cache_file(
+                mock_client, 'https://test-endpoint'
+            )
+
+        assert cache_file.startswith(str(tmp_path))
+        assert cache_file.endswith('-v1.30.1-eks-1.json')
+        assert upgraded_cache_file.endswith('-v1.31.0.json')
+        assert [p.name for p in tmp_path.iterdir()] == []
+
+    def test_discovery_cache_file_version_error(self, k8s_apis):
+        """Test the default discovery cache is used when the server version is unavailable."""
+        mock_client = MagicMock()
+        mock_client.VersionApi.return_value.get_code.side_effect = Exception('Forbidden')
+
+        assert k8s_apis._discovery_cache_file(mock_client, 'https://test-endpoint') is None
+
 
 class TestK8sApisOperations:
     """Tests for K8sApis operations."""
@@ -420,6 +467,45 @@ class TestK8sApisOperations:
         args, kwargs = mock_resource.get.call_args
         assert 'namespace' not in kwargs
 
+    def test_list_resources_paginated_metadata_only(self, k8s_apis):
+        """Test list_resources method with pagination and metadata only retrieval."""
+        # Mock the dynamic client and resources
+        mock_resource = MagicMock()
+        mock_resources = MagicMock()
+        mock_resources.get.return_value = mock_resource
+        k8s_apis.dynamic_client.resources = mock_resources
+
+        # Test list operation of a page of metadata
+        k8s_apis.list_resources(
+            'Pod', 'v1', limit=100, continue_token='next-page', metadata_only=True
+        )
+
+        args, kwargs = mock_resource.get.call_args
+        assert kwargs['limit'] == 100
+        assert kwargs['_continue'] == 'next-page'
+        assert 'as=PartialObjectMetadataList' in kwargs['header_params']['Accept']
+
+    def test_watch_resources(self, k8s_apis):
+        """Test watch_resources method."""
+        # Mock the dynamic client and resources
+        mock_resource = MagicMock()
+        mock_resource.watch.return_value = iter([{'type': 'ADDED'}])
+        mock_resources = MagicMock()
+        mock_resources.get.return_value = mock_resource
+        k8s_apis.dynamic_client.resources = mock_resources
+
+        # Test watch operation from a resourceVersion
+        events = list(
+            k8s_apis.watch_resources('Pod', 'v1', resource_version='10', timeout_seconds=60)
+        )
+
+        # Verify the dynamic client was used correctly
+        mock_resources.get.assert_called_once_with(api_version='v1', kind='Pod')
+        mock_resource.watch.assert_called_once_with(
+            namespace=None, resource_version='10', timeout=60, allow_watch_bookmarks=True
+        )
+        assert events == [{'type': 'ADDED'}]
+
     def test_get_pod_logs(self, k8s_apis):
         """Test get_pod_logs method."""
         # Mock the CoreV1Api client
@@ -486,6 +572,80 @@ class TestK8sApisOperations:
                 namespace='test-namespace',
             )
 
+    def test_stream_pod_logs(self, k8s_apis):
+        """Test stream_pod_logs splits streamed chunks into lines and releases the connection."""
+        with patch('kubernetes.client') as mock_client:
+            mock_core_v1_api = MagicMock()
+            mock_client.CoreV1Api.return_value = mock_core_v1_api
+            mock_response = MagicMock()
+            mock_response.stream.return_value = iter(
+                [
+                    b'2024-01-01T00:00:00Z first\n2024-01-01T00:00:01Z sec',
+                    b'ond\n2024-01-01T00:00:02Z',
+                ]
+            )
+            mock_core_v1_api.read_namespaced_pod_log.return_value = mock_response
+
+            lines = list(
+                k8s_apis.stream_pod_logs(
+                    'test-pod', 'test-namespace', container_name='app', tail_lines=10
+                )
+            )
+
+            assert lines == [
+                '2024-01-01T00:00:00Z first',
+                '2024-01-01T00:00:01Z second',
+                '2024-01-01T00:00:02Z',
+            ]
+            mock_core_v1_api.read_namespaced_pod_log.assert_called_once_with(
+                name='test-pod',
+                namespace='test-namespace',
+                timestamps=True,
+                _preload_content=False,
+                container='app',
+                tail_lines=10,
+            )
+            mock_response.close.assert_called_once()
+            mock_response.release_conn.assert_called_once()
+
+    def test_stream_pod_logs_closed_early(self, k8s_apis):
+        """Test closing a log stream early releases the connection."""
+        with patch('kubernetes.client') as mock_client:
+            mock_response = MagicMock()
+            mock_response.stream.return_value = iter([b'a\nb\n', b'c\n'])
+            mock_client.CoreV1Api.return_value.read_namespaced_pod_log.return_value = mock_response
+
+            stream = k8s_apis.stream_pod_logs('test-pod', 'test-namespace')
+            assert next(stream) == 'a'
+            stream.close()
+
+            mock_response.release_conn.assert_called_once()
+
+    def test_stream_pod_logs_released_without_reading(self, k8s_apis):
+        """Test a log stream closed or dropped before reading a line releases the connection."""
+        with patch('kubernetes.client') as mock_client:
+            responses = [MagicMock(), MagicMock()]
+            mock_client.CoreV1Api.return_value.read_namespaced_pod_log.side_effect = responses
+
+            k8s_apis.stream_pod_logs('test-pod', 'test-namespace').close()
+            responses[0].release_conn.assert_called_once()
+            responses[0].stream.assert_not_called()
+
+            stream = k8s_apis.stream_pod_logs('test-pod', 'test-namespace')
+            del stream
+            responses[1].close.assert_called_once()
+            responses[1].release_conn.assert_called_once()
+
+    def test_stream_pod_logs_error(self, k8s_apis):
+        """Test stream_pod_logs raises a ValueError when the request fails."""
+        with patch('kubernetes.client') as mock_client:
+            mock_client.CoreV1Api.return_value.read_namespaced_pod_log.side_effect = Exception(
+                'Not found'
+            )
+
+            with pytest.raises(ValueError, match='test-namespace/test-pod: Not found'):
+                k8s_apis.stream_pod_logs('test-pod', 'test-namespace')
+
     def _create_mock_event(self):
         """Create a mock event for testing."""
         mock_event_item = MagicMock()
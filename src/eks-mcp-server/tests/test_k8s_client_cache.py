@@ -17,6 +17,8 @@
 import pytest
 import time
 from awslabs.eks_mcp_server.k8s_client_cache import K8S_AWS_ID_HEADER, K8sClientCache
+from cachetools import LRUCache
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 
@@ -333,6 +335,110 @@ class TestK8sClientCache:
                     # Verify that we got different client instances
                     assert client1 != client2
 
+    def test_get_client_refreshes_token_in_place(self):
+        """Test an expired token is refreshed on the existing client."""
+        cache = K8sClientCache()
+        cache._client_cache.clear()
+
+        # An existing client whose token has expired
+        mock_k8s_apis = MagicMock()
+        mock_k8s_apis.endpoint = 'https://test-endpoint'
+        mock_k8s_apis.ca_data = 'test-ca-data'
+        cache._clients['test-cluster'] = mock_k8s_apis
+
+        with (
+            patch.object(
+                cache,
+                '_get_cluster_credentials',
+                return_value=('https://test-endpoint', 'new-token', 'test-ca-data'),
+            ),
+            patch('awslabs.eks_mcp_server.k8s_client_cache.K8sApis') as mock_k8s_apis_class,
+        ):
+            client = cache.get_client('test-cluster')
+
+        mock_k8s_apis_class.assert_not_called()
+        mock_k8s_apis.update_token.assert_called_once_with('new-token')
+        mock_k8s_apis.close.assert_not_called()
+        assert client is mock_k8s_apis
+        assert cache._client_cache['test-cluster'] is mock_k8s_apis
+
+    def test_get_client_concurrent_requests_share_credentials(self):
+        """Test concurrent requests for a cluster retrieve its credentials once."""
+        cache = K8sClientCache()
+        cache._client_cache.clear()
+        cache._clients.clear()
+
+        def get_cluster_credentials(cluster_name):
+            time.sleep(0.05)
+            return f'https://{cluster_name}', 'test-token', 'test-ca-data'
+
+        with (
+            patch.object(
+                cache, '_get_cluster_credentials', side_effect=get_cluster_credentials
+            ) as mock_get_credentials,
+            patch('awslabs.eks_mcp_server.k8s_client_cache.K8sApis') as mock_k8s_apis_class,
+            ThreadPoolExecutor(max_workers=6) as executor,
+        ):
+            clients = list(executor.map(cache.get_client, ['cluster-a'] * 4 + ['cluster-b'] * 2))
+
+        assert mock_get_credentials.call_count == 2
+        assert mock_k8s_apis_class.call_count == 2
+        assert len({id(client) for client in clients[:4]}) == 1
+        assert clients[4] is clients[5]
+
+    def test_get_client_replaces_client_when_ca_changes(self):
+        """Test a client is replaced and closed when the cluster CA changes."""
+        cache = K8sClientCache()
+        cache._client_cache.clear()
+
+        old_k8s_apis = MagicMock()
+        old_k8s_apis.endpoint = 'https://test-endpoint'
+        old_k8s_apis.ca_data = 'old-ca-data'
+        cache._clients['test-cluster'] = old_k8s_apis
+
+        with (
+            patch.object(
+                cache,
+                '_get_cluster_credentials',
+                return_value=('https://test-endpoint', 'new-token', 'new-ca-data'),
+            ),
+            patch('awslabs.eks_mcp_server.k8s_client_cache.K8sApis') as mock_k8s_apis_class,
+        ):
+            client = cache.get_client('test-cluster')
+
+        old_k8s_apis.close.assert_called_once()
+        mock_k8s_apis_class.assert_called_once_with(
+            'https://test-endpoint', 'new-token', 'new-ca-data'
+        )
+        assert client is mock_k8s_apis_class.return_value
+        assert cache._clients['test-cluster'] is client
+
+    def test_get_client_drops_least_recently_used_clients(self):
+        """Test clients are bounded, dropping those of the least recently used clusters."""
+        cache = K8sClientCache()
+        cache._client_cache.clear()
+        clients = cache._clients
+        cache._clients = LRUCache(maxsize=2)
+
+        try:
+            with (
+                patch.object(
+                    cache,
+                    '_get_cluster_credentials',
+                    side_effect=lambda name: (f'https://{name}', 'test-token', 'test-ca-data'),
+                ),
+                patch('awslabs.eks_mcp_server.k8s_client_cache.K8sApis'),
+            ):
+                for cluster_name in ['cluster-a', 'cluster-b', 'cluster-a', 'cluster-c']:
+                    cache.get_client(cluster_name)
+
+            assert sorted(cache._clients) == ['cluster-a', 'cluster-c']
+            # Cluster locks don't outlive credential retrieval
+            assert len(cache._cluster_locks) == 0
+        finally:
+            cache._clients = clients
+            cache._client_cache.clear()
+
     def test_get_cluster_credentials(self):
         """Test _get_cluster_credentials method."""
         # Create a K8sClientCache instance
@@ -16,6 +16,11 @@
 
 import os
 import pytest
+import threading
+from awslabs.eks_mcp_server.consts import (
+    K8S_LIST_PAGE_SIZE,
+    K8S_MAX_CONCURRENT_REQUESTS_PER_CLUSTER,
+)
 from awslabs.eks_mcp_server.k8s_apis import K8sApis
 from awslabs.eks_mcp_server.k8s_handler import K8sHandler
 from mcp.server.fastmcp import Context
@@ -70,7 +75,7 @@ class TestK8sHandler:
             assert handler.allow_sensitive_data_access is False
 
         # Verify that the tools were registered
-        assert mock_mcp.tool.call_count == 7
+        assert mock_mcp.tool.call_count == 9
 
         # Get all call args
         call_args_list = mock_mcp.tool.call_args_list
@@ -80,10 +85,12 @@ class TestK8sHandler:
 
         # Verify that expected tools were registered
         assert 'list_k8s_resources' in tool_names
+        assert 'list_k8s_resources_in_clusters' in tool_names
         assert 'generate_app_manifest' in tool_names
         assert 'apply_yaml' in tool_names
         assert 'manage_k8s_resource' in tool_names
         assert 'get_pod_logs' in tool_names
+        assert 'get_pods_logs' in tool_names
         assert 'get_k8s_events' in tool_names
 
     def test_init_with_sensitive_data_access(self, mock_mcp, mock_client_cache):
@@ -101,7 +108,7 @@ class TestK8sHandler:
             assert handler.allow_sensitive_data_access is True
 
         # Verify that the tools were registered
-        assert mock_mcp.tool.call_count == 7
+        assert mock_mcp.tool.call_count == 9
 
         # Get all call args
         call_args_list = mock_mcp.tool.call_args_list
@@ -111,7 +118,9 @@ class TestK8sHandler:
 
         # Verify that expected tools were registered
         assert 'list_k8s_resources' in tool_names
+        assert 'list_k8s_resources_in_clusters' in tool_names
         assert 'get_pod_logs' in tool_names
+        assert 'get_pods_logs' in tool_names
         assert 'get_k8s_events' in tool_names
         assert 'list_api_versions' in tool_names
         assert 'manage_k8s_resource' in tool_names
@@ -753,8 +762,7 @@ metadata:
         mock_k8s_apis = MagicMock()
 
         # Mock response with items
-        mock_item1 = MagicMock()
-        mock_item1.to_dict.return_value = {
+        mock_item1 = {
             'metadata': {
                 'name': 'test-pod-1',
                 'namespace': 'test-namespace',
@@ -763,8 +771,7 @@ metadata:
                 'annotations': {'description': 'Test pod 1'},
             }
         }
-        mock_item2 = MagicMock()
-        mock_item2.to_dict.return_value = {
+        mock_item2 = {
             'metadata': {
                 'name': 'test-pod-2',
                 'namespace': 'test-namespace',
@@ -775,7 +782,10 @@ metadata:
         }
 
         mock_response = MagicMock()
-        mock_response.items = [mock_item1, mock_item2]
+        mock_response.to_dict.return_value = {
+            'items': [mock_item1, mock_item2],
+            'metadata': {'resourceVersion': '1'},
+        }
         mock_k8s_apis.list_resources.return_value = mock_response
 
         with patch.object(handler, 'get_client', return_value=mock_k8s_apis) as mock_client:
@@ -786,6 +796,9 @@ metadata:
                 api_version='v1',
                 namespace='test-namespace',
                 label_selector='app=test',
+                field_selector=None,
+                limit=None,
+                continue_token=None,
             )
 
             # Verify that get_client was called
@@ -804,6 +817,9 @@ metadata:
             # Verify the keyword args
             assert kwargs['namespace'] == 'test-namespace'
             assert kwargs['label_selector'] == 'app=test'
+            assert kwargs['limit'] == K8S_LIST_PAGE_SIZE
+            assert kwargs['continue_token'] is None
+            assert kwargs['metadata_only'] is True
 
             # Verify the result
             assert not result.isError
@@ -818,11 +834,189 @@ metadata:
             assert result.items[0].labels == {'app': 'test'}
             assert result.items[0].annotations == {'description': 'Test pod 1'}
             assert result.items[1].name == 'test-pod-2'
+            assert result.continue_token is None
             assert isinstance(result.content[0], TextContent)
             assert (
                 'Successfully listed 2 Pod resources in test-namespace/' in result.content[0].text
             )
 
+    @pytest.mark.asyncio
+    async def test_list_k8s_resources_follows_continue_tokens(
+        self, mock_context, mock_mcp, mock_client_cache
+    ):
+        """Test list_k8s_resources lists every page when no limit is given."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp)
+
+        pages = [
+            {'items': [{'metadata': {'name': 'pod-1'}}], 'metadata': {'continue': 'token-1'}},
+            {'items': [{'metadata': {'name': 'pod-2'}}], 'metadata': {}},
+        ]
+        mock_k8s_apis = MagicMock()
+        mock_k8s_apis.list_resources.side_effect = [
+            MagicMock(**{'to_dict.return_value': page}) for page in pages
+        ]
+
+        with patch.object(handler, 'get_client', return_value=mock_k8s_apis):
+            result = await handler.list_k8s_resources(
+                mock_context,
+                cluster_name='test-cluster',
+                kind='Pod',
+                api_version='v1',
+                namespace=None,
+                label_selector=None,
+                field_selector=None,
+                limit=None,
+                continue_token=None,
+            )
+
+        assert [item.name for item in result.items] == ['pod-1', 'pod-2']
+        assert result.continue_token is None
+        continue_tokens = [
+            call.kwargs['continue_token'] for call in mock_k8s_apis.list_resources.call_args_list
+        ]
+        assert continue_tokens == [None, 'token-1']
+
+    @pytest.mark.asyncio
+    async def test_list_k8s_resources_with_limit(self, mock_context, mock_mcp, mock_client_cache):
+        """Test list_k8s_resources returns one page and its continue token when limited."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp)
+
+        mock_k8s_apis = MagicMock()
+        mock_k8s_apis.list_resources.return_value.to_dict.return_value = {
+            'items': [{'metadata': {'name': 'pod-3'}}],
+            'metadata': {'continue': 'token-3'},
+        }
+
+        with patch.object(handler, 'get_client', return_value=mock_k8s_apis):
+            result = await handler.list_k8s_resources(
+                mock_context,
+                cluster_name='test-cluster',
+                kind='Pod',
+                api_version='v1',
+                namespace=None,
+                label_selector=None,
+                field_selector=None,
+                limit=1,
+                continue_token='token-2',
+            )
+
+        mock_k8s_apis.list_resources.assert_called_once()
+        kwargs = mock_k8s_apis.list_resources.call_args.kwargs
+        assert kwargs['limit'] == 1
+        assert kwargs['continue_token'] == 'token-2'
+        assert result.count == 1
+        assert result.continue_token == 'token-3'
+
+    @pytest.mark.asyncio
+    async def test_list_k8s_resources_in_clusters(self, mock_context, mock_mcp, mock_client_cache):
+        """Test list_k8s_resources_in_clusters lists every cluster and namespace."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp)
+
+        def get_client(cluster_name):
+            if cluster_name == 'broken-cluster':
+                raise Exception('Unauthorized')
+            mock_k8s_apis = MagicMock()
+            mock_k8s_apis.list_resources.side_effect = lambda kind, api_version, **kwargs: (
+                MagicMock(
+                    **{
+                        'to_dict.return_value': {
+                            'items': [
+                                {
+                                    'metadata': {
+                                        'name': f'{cluster_name}-pod',
+                                        'namespace': kwargs['namespace'],
+                                    }
+                                }
+                            ],
+                            'metadata': {},
+                        }
+                    }
+                )
+            )
+            return mock_k8s_apis
+
+        with patch.object(handler, 'get_client', side_effect=get_client):
+            result = await handler.list_k8s_resources_in_clusters(
+                mock_context,
+                cluster_names=['cluster-a', 'cluster-b', 'broken-cluster', 'cluster-a'],
+                kind='Pod',
+                api_version='v1',
+                namespaces=['default', 'kube-system'],
+                label_selector=None,
+                field_selector=None,
+            )
+
+        assert not result.isError
+        assert result.count == 4
+        assert [(r.cluster_name, r.namespace, r.count) for r in result.results] == [
+            ('cluster-a', 'default', 1),
+            ('cluster-a', 'kube-system', 1),
+            ('cluster-b', 'default', 1),
+            ('cluster-b', 'kube-system', 1),
+            ('broken-cluster', 'default', 0),
+            ('broken-cluster', 'kube-system', 0),
+        ]
+        assert result.results[3].items[0].name == 'cluster-b-pod'
+        assert result.results[3].items[0].namespace == 'kube-system'
+        assert result.results[4].error == 'Unauthorized'
+        assert '2 of 6 listings failed' in result.content[0].text
+
+    @pytest.mark.asyncio
+    async def test_list_k8s_resources_in_clusters_all_failed(
+        self, mock_context, mock_mcp, mock_client_cache
+    ):
+        """Test list_k8s_resources_in_clusters is an error when no cluster could be listed."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp)
+
+        with patch.object(handler, 'get_client', side_effect=Exception('Cluster not found')):
+            result = await handler.list_k8s_resources_in_clusters(
+                mock_context,
+                cluster_names=['cluster-a'],
+                kind='Node',
+                api_version='v1',
+                namespaces=None,
+                label_selector=None,
+                field_selector=None,
+            )
+
+        assert result.isError
+        assert result.count == 0
+        assert result.results[0].namespace is None
+        assert result.results[0].error == 'Cluster not found'
+
+    @pytest.mark.asyncio
+    async def test_run_in_cluster_uses_a_pool_per_cluster(self, mock_mcp, mock_client_cache):
+        """Test run_in_cluster runs calls off the event loop on a pool per cluster."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp)
+
+        def thread_name(suffix=''):
+            return threading.current_thread().name + suffix
+
+        assert (await handler.run_in_cluster('cluster-a', thread_name, suffix='!')).startswith(
+            'k8s-cluster-a'
+        )
+        assert (await handler.run_in_cluster('cluster-b', thread_name)).startswith('k8s-cluster-b')
+        await handler.run_in_cluster('cluster-a', thread_name)
+        assert set(handler._executors) == {'cluster-a', 'cluster-b'}
+        assert (
+            handler._executors['cluster-a']._max_workers == K8S_MAX_CONCURRENT_REQUESTS_PER_CLUSTER
+        )
+
     @pytest.mark.asyncio
     async def test_list_k8s_resources_empty(self, mock_context, mock_mcp, mock_client_cache):
         """Test list_k8s_resources method with empty result."""
@@ -837,7 +1031,7 @@ metadata:
 
         # Mock response with no items
         mock_response = MagicMock()
-        mock_response.items = []
+        mock_response.to_dict.return_value = {'items': [], 'metadata': {}}
         mock_k8s_apis.list_resources.return_value = mock_response
 
         with patch.object(handler, 'get_client', return_value=mock_k8s_apis):
@@ -847,6 +1041,10 @@ metadata:
                 kind='Pod',
                 api_version='v1',
                 namespace='test-namespace',
+                label_selector=None,
+                field_selector=None,
+                limit=None,
+                continue_token=None,
             )
 
             # Verify the result
@@ -879,6 +1077,10 @@ metadata:
                 kind='Pod',
                 api_version='v1',
                 namespace='test-namespace',
+                label_selector=None,
+                field_selector=None,
+                limit=None,
+                continue_token=None,
             )
 
             # Verify the result
@@ -1189,7 +1391,7 @@ metadata:
             K8sHandler(mock_mcp, allow_write=True, allow_sensitive_data_access=True)
 
         # Verify that the tools were registered
-        assert mock_mcp.tool.call_count == 7
+        assert mock_mcp.tool.call_count == 9
 
         # Get all call args
         call_args_list = mock_mcp.tool.call_args_list
@@ -1199,6 +1401,7 @@ metadata:
 
         # Verify that get_pod_logs and get_k8s_events were registered
         assert 'get_pod_logs' in tool_names
+        assert 'get_pods_logs' in tool_names
         assert 'get_k8s_events' in tool_names
 
     def test_init_write_access_disabled(self, mock_mcp, mock_client_cache):
@@ -1213,7 +1416,7 @@ metadata:
         assert handler.allow_write is False
 
         # Verify that the tools were registered
-        assert mock_mcp.tool.call_count == 7
+        assert mock_mcp.tool.call_count == 9
 
         # Get all call args
         call_args_list = mock_mcp.tool.call_args_list
@@ -1223,7 +1426,9 @@ metadata:
 
         # Verify that all tools are registered
         assert 'list_k8s_resources' in tool_names
+        assert 'list_k8s_resources_in_clusters' in tool_names
         assert 'get_pod_logs' in tool_names
+        assert 'get_pods_logs' in tool_names
         assert 'get_k8s_events' in tool_names
         assert 'manage_k8s_resource' in tool_names
         assert 'apply_yaml' in tool_names
@@ -1413,6 +1618,128 @@ metadata:
                 in result.content[0].text
             )
 
+    @pytest.mark.asyncio
+    async def test_get_pods_logs(self, mock_context, mock_mcp, mock_client_cache):
+        """Test get_pods_logs filters, caps and merges the logs of all matching pods."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp, allow_sensitive_data_access=True)
+
+        def pod(name, *containers):
+            return {
+                'metadata': {'name': name},
+                'spec': {'containers': [{'name': c} for c in containers]},
+            }
+
+        logs = {
+            ('web-1', 'app'): [
+                '2024-01-01T00:00:01.5Z ERROR timeout',
+                '2024-01-01T00:00:03Z INFO ok',
+            ],
+            ('web-1', 'sidecar'): ['2024-01-01T00:00:02.000000001Z ERROR proxy'],
+            ('web-2', 'app'): [
+                '2024-01-01T00:00:01.25Z ERROR refused',
+                '2024-01-01T00:00:04Z ERROR ' + 'x' * 100,
+                '2024-01-01T00:00:05Z ERROR never read',
+            ],
+        }
+        closed = []
+
+        def stream_pod_logs(pod_name, namespace, container_name=None, **kwargs):
+            if pod_name == 'web-3':
+                raise ValueError('Pod is pending')
+
+            def lines():
+                try:
+                    yield from logs[(pod_name, container_name)]
+                finally:
+                    closed.append((pod_name, container_name))
+
+            return lines()
+
+        mock_k8s_apis = MagicMock()
+        mock_k8s_apis.list_resources.return_value.to_dict.return_value = {
+            'items': [pod('web-1', 'app', 'sidecar'), pod('web-2', 'app'), pod('web-3', 'app')]
+        }
+        mock_k8s_apis.stream_pod_logs.side_effect = stream_pod_logs
+
+        with patch.object(handler, 'get_client', return_value=mock_k8s_apis):
+            result = await handler.get_pods_logs(
+                mock_context,
+                cluster_name='test-cluster',
+                namespace='test-namespace',
+                label_selector='app=web',
+                container_name=None,
+                pattern='ERROR',
+                since_seconds=None,
+                tail_lines=100,
+                limit_bytes_per_pod=50,
+            )
+
+        mock_k8s_apis.list_resources.assert_called_once_with(
+            'Pod', 'v1', namespace='test-namespace', label_selector='app=web'
+        )
+        assert not result.isError
+        assert result.pod_count == 3
+        assert [
+            (line.pod_name, line.container_name, line.message) for line in result.log_lines
+        ] == [
+            ('web-2', 'app', 'ERROR refused'),
+            ('web-1', 'app', 'ERROR timeout'),
+            ('web-1', 'sidecar', 'ERROR proxy'),
+        ]
+        assert result.log_lines[0].timestamp == '2024-01-01T00:00:01.25Z'
+        assert result.truncated_pods == ['web-2']
+        assert result.errors == {'web-3': 'Pod is pending'}
+        assert sorted(closed) == sorted(logs)
+
+    @pytest.mark.asyncio
+    async def test_get_pods_logs_sensitive_data_access_disabled(
+        self, mock_context, mock_mcp, mock_client_cache
+    ):
+        """Test get_pods_logs method with sensitive data access disabled."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp, allow_sensitive_data_access=False)
+
+        result = await handler.get_pods_logs(
+            mock_context,
+            cluster_name='test-cluster',
+            namespace='test-namespace',
+            label_selector='app=web',
+        )
+
+        assert result.isError
+        assert result.log_lines == []
+        assert 'requires --allow-sensitive-data-access flag' in result.content[0].text
+
+    @pytest.mark.asyncio
+    async def test_get_pods_logs_invalid_pattern(self, mock_context, mock_mcp, mock_client_cache):
+        """Test get_pods_logs returns an error for an invalid regular expression."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp, allow_sensitive_data_access=True)
+
+        with patch.object(handler, 'get_client') as mock_client:
+            result = await handler.get_pods_logs(
+                mock_context,
+                cluster_name='test-cluster',
+                namespace='test-namespace',
+                label_selector='app=web',
+                container_name=None,
+                pattern='(',
+                since_seconds=None,
+                tail_lines=100,
+                limit_bytes_per_pod=10240,
+            )
+
+        mock_client.assert_not_called()
+        assert result.isError
+        assert 'Failed to get logs from pods matching app=web' in result.content[0].text
+
     @pytest.mark.asyncio
     async def test_get_k8s_events_success(self, mock_context, mock_mcp, mock_client_cache):
         """Test get_k8s_events method with successful event retrieval."""
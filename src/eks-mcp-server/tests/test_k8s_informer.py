@@ -0,0 +1,359 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ruff: noqa: D101, D102, D103
+"""Tests for the Kubernetes informer cache."""
+
+import pytest
+import queue
+import threading
+from awslabs.eks_mcp_server.k8s_handler import K8sHandler
+from awslabs.eks_mcp_server.k8s_informer import (
+    K8sInformers,
+    ResourceInformer,
+    ResourceStore,
+    parse_field_selector,
+    parse_label_selector,
+)
+from unittest.mock import MagicMock, patch
+
+
+def pod(name, namespace='default', labels=None, owner_uid=None, resource_version='1', **fields):
+    metadata = {'name': name, 'namespace': namespace, 'resourceVersion': resource_version}
+    if labels:
+        metadata['labels'] = labels
+    if owner_uid:
+        metadata['ownerReferences'] = [{'uid': owner_uid, 'kind': 'ReplicaSet'}]
+    metadata['managedFields'] = [{'manager': 'kubectl'}]
+    return {'metadata': metadata, **fields}
+
+
+class FakeClient:
+    """Kubernetes client whose watch streams events pushed onto a queue."""
+
+    def __init__(self, items, resource_version):
+        """Initialize the client with the items and resourceVersion returned by list."""
+        self.items = items
+        self.resource_version = resource_version
+        self.events = queue.Queue()
+        self.list_calls = 0
+        self.watch_resource_versions = []
+
+    def list_resources(self, kind, api_version, limit=None, continue_token=None):
+        # Serve the items one per page to exercise paginated listing
+        self.list_calls += 1
+        index = int(continue_token or 0)
+        metadata = {'resourceVersion': self.resource_version}
+        if index + 1 < len(self.items):
+            metadata['continue'] = str(index + 1)
+        response = MagicMock()
+        response.to_dict.return_value = {
+            'items': self.items[index : index + 1],
+            'metadata': metadata,
+        }
+        return response
+
+    def watch_resources(self, kind, api_version, resource_version=None, timeout_seconds=None):
+        self.watch_resource_versions.append(resource_version)
+        while True:
+            event = self.events.get()
+            if event is None:
+                return
+            if isinstance(event, Exception):
+                raise event
+            yield event
+
+
+class TestSelectors:
+    def test_parse_label_selector(self):
+        assert parse_label_selector('app=web, tier!=db,env in (prod, dev),canary,!legacy') == [
+            ('app', 'in', {'web'}),
+            ('tier', 'notin', {'db'}),
+            ('env', 'in', {'prod', 'dev'}),
+            ('canary', 'exists', set()),
+            ('legacy', '!', set()),
+        ]
+        assert parse_label_selector(None) == []
+
+    def test_parse_label_selector_invalid(self):
+        with pytest.raises(ValueError, match='Invalid label selector'):
+            parse_label_selector('app in prod')
+
+    def test_parse_field_selector(self):
+        assert parse_field_selector('metadata.name=a,status.phase!=Running') == [
+            ('metadata.name', True, 'a'),
+            ('status.phase', False, 'Running'),
+        ]
+
+
+class TestResourceStore:
+    @pytest.fixture
+    def store(self):
+        store = ResourceStore()
+        store.replace(
+            [
+                pod('web-1', labels={'app': 'web', 'env': 'prod'}, owner_uid='rs-1'),
+                pod('web-2', labels={'app': 'web', 'env': 'dev'}, owner_uid='rs-1'),
+                pod('db-1', namespace='data', labels={'app': 'db'}, status={'phase': 'Pending'}),
+                pod('job-1', spec={'hostNetwork': True}),
+            ],
+            '10',
+        )
+        return store
+
+    def test_list_filters(self, store):
+        def names(**kwargs):
+            return [obj['metadata']['name'] for obj in store.list(**kwargs)]
+
+        assert names() == ['db-1', 'job-1', 'web-1', 'web-2']
+        assert names(namespace='default') == ['job-1', 'web-1', 'web-2']
+        assert names(label_selector='app=web,env notin (dev)') == ['web-1']
+        assert names(label_selector='!app') == ['job-1']
+        assert names(label_selector='app in (db, web)', namespace='data') == ['db-1']
+        assert names(owner_uid='rs-1') == ['web-1', 'web-2']
+        assert names(field_selector='status.phase=Pending') == ['db-1']
+        assert names(field_selector='spec.hostNetwork=true') == ['job-1']
+        assert names(field_selector='metadata.namespace!=default') == ['db-1']
+
+    def test_managed_fields_removed(self, store):
+        assert 'managedFields' not in store.get('web-1', 'default')['metadata']
+
+    def test_upsert_reindexes(self, store):
+        store.upsert(pod('web-1', labels={'app': 'api'}))
+
+        assert [o['metadata']['name'] for o in store.list(label_selector='app=web')] == ['web-2']
+        assert store.list(owner_uid='rs-1')[0]['metadata']['name'] == 'web-2'
+        assert store.get('web-1', 'default')['metadata']['labels'] == {'app': 'api'}
+
+    def test_delete(self, store):
+        store.delete(pod('db-1', namespace='data'))
+
+        assert store.get('db-1', 'data') is None
+        assert store.list(namespace='data') == []
+        assert store.list(label_selector='app=db') == []
+
+
+class TestResourceInformer:
+    @pytest.fixture
+    def informer(self):
+        client = FakeClient([pod('web-1', resource_version='5'), pod('web-0')], '10')
+        informer = ResourceInformer(lambda: client, 'Pod', 'v1')
+        informer.start()
+        yield informer, client
+        informer.stop()
+        client.events.put(None)
+
+    def test_applies_watch_events(self, informer):
+        informer, client = informer
+        assert informer.wait_for_sync()
+        assert [o['metadata']['name'] for o in informer.list()] == ['web-0', 'web-1']
+
+        client.events.put({'type': 'ADDED', 'raw_object': pod('web-2', resource_version='11')})
+        client.events.put({'type': 'DELETED', 'raw_object': pod('web-1', resource_version='12')})
+        client.events.put({'type': 'DELETED', 'raw_object': pod('web-0', resource_version='12')})
+        informer.observe_write('12')
+
+        assert informer.wait_for_sync()
+        assert [o['metadata']['name'] for o in informer.list()] == ['web-2']
+        assert client.watch_resource_versions == ['10']
+
+    def test_waits_for_observed_write(self, informer):
+        informer, _ = informer
+        informer.observe_write('20')
+
+        assert not informer.wait_for_sync(timeout=0.05)
+
+    def test_relists_when_watch_expires(self, informer):
+        informer, client = informer
+        expired = Exception('Gone')
+        expired.status = 410
+        client.items = [pod('web-3', resource_version='30')]
+        client.resource_version = '30'
+        client.events.put(expired)
+        informer.observe_write('30')
+
+        assert informer.wait_for_sync()
+        assert client.list_calls == 3
+        assert [o['metadata']['name'] for o in informer.list()] == ['web-3']
+
+    def test_relists_on_expired_watch_event(self, informer):
+        informer, client = informer
+        client.items = [pod('web-3', resource_version='30')]
+        client.resource_version = '30'
+        client.events.put(
+            {
+                'type': 'ERROR',
+                'raw_object': {'kind': 'Status', 'code': 410, 'message': 'too old'},
+            }
+        )
+        informer.observe_write('30')
+
+        # Well within the retry delay, so the informer must relist without backing off
+        assert informer.wait_for_sync(timeout=2)
+        assert client.list_calls == 3
+
+    def test_stop_wakes_waiting_readers(self, informer):
+        informer, _ = informer
+        informer.observe_write('20')
+        threading.Timer(0.05, informer.stop).start()
+
+        assert not informer.wait_for_sync(timeout=2)
+
+
+class TestK8sInformers:
+    def test_invalid_resource(self):
+        with pytest.raises(ValueError, match='expected apiVersion/kind'):
+            K8sInformers(MagicMock(), ['Pod'])
+
+    def test_get_starts_informer_once(self):
+        client = FakeClient([pod('web-1')], '10')
+        get_client = MagicMock(return_value=client)
+        informers = K8sInformers(get_client, ['v1/Pod', 'apps/v1/Deployment'])
+
+        assert informers.is_informed('Deployment', 'apps/v1')
+        assert informers.get('cluster', 'Service', 'v1') is None
+        informer = informers.get('cluster', 'Pod', 'v1')
+        assert informer is informers.get('cluster', 'Pod', 'v1')
+        assert client.list_calls == 1
+        get_client.assert_called_with('cluster')
+
+        informers.stop()
+        client.events.put(None)
+
+    def test_get_starts_informers_outside_registry_lock(self):
+        listing = threading.Event()
+        release = threading.Event()
+        slow_client = FakeClient([pod('web-1')], '10')
+        slow_list = slow_client.list_resources
+
+        def list_resources(*args, **kwargs):
+            listing.set()
+            release.wait(5)
+            return slow_list(*args, **kwargs)
+
+        slow_client.list_resources = list_resources
+        fast_client = FakeClient([pod('db-1')], '20')
+        clients = {'slow': slow_client, 'fast': fast_client}
+        informers = K8sInformers(lambda cluster_name: clients[cluster_name], ['v1/Pod'])
+
+        results = []
+        starter = threading.Thread(
+            target=lambda: results.append(informers.get('slow', 'Pod', 'v1'))
+        )
+        starter.start()
+        assert listing.wait(5)
+
+        # Another cluster is served while the first informer is still listing
+        assert informers.get('fast', 'Pod', 'v1') is not None
+        waiter = threading.Thread(
+            target=lambda: results.append(informers.get('slow', 'Pod', 'v1'))
+        )
+        waiter.start()
+        release.set()
+        starter.join(5)
+        waiter.join(5)
+
+        assert len(results) == 2 and results[0] is results[1] is not None
+        assert slow_client.list_calls == 1
+
+        informers.stop()
+        slow_client.events.put(None)
+        fast_client.events.put(None)
+
+    def test_get_returns_none_when_list_fails(self):
+        client = MagicMock()
+        client.list_resources.side_effect = Exception('Unauthorized')
+        informers = K8sInformers(lambda cluster_name: client, ['v1/Pod'])
+
+        assert informers.get('cluster', 'Pod', 'v1') is None
+        assert informers.get('cluster', 'Pod', 'v1') is None
+        assert client.list_resources.call_count == 2
+
+
+class TestK8sHandlerInformers:
+    @pytest.fixture
+    def handler(self):
+        with patch('awslabs.eks_mcp_server.k8s_handler.K8sClientCache'):
+            handler = K8sHandler(MagicMock(), informer_resources=['v1/Pod', 'v1/Event'])
+        handler.informers = MagicMock()
+        handler.informers.is_informed.return_value = True
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_list_k8s_resources_from_informer(self, handler):
+        informer = MagicMock()
+        informer.list.return_value = [pod('web-1', labels={'app': 'web'})]
+        handler.informers.get.return_value = informer
+
+        with patch.object(handler, 'get_client') as mock_get_client:
+            result = await handler.list_k8s_resources(
+                MagicMock(),
+                cluster_name='cluster',
+                kind='Pod',
+                api_version='v1',
+                namespace='default',
+                label_selector='app=web',
+                field_selector=None,
+                limit=None,
+                continue_token=None,
+            )
+
+        mock_get_client.assert_not_called()
+        informer.list.assert_called_once_with('default', 'app=web', None)
+        assert not result.isError
+        assert result.items[0].name == 'web-1'
+        assert result.items[0].labels == {'app': 'web'}
+
+    @pytest.mark.asyncio
+    async def test_read_falls_back_to_api_when_not_cached(self, handler):
+        informer = MagicMock()
+        informer.get.return_value = None
+        handler.informers.get.return_value = informer
+        k8s_client = MagicMock()
+        k8s_client.manage_resource.return_value.to_dict.return_value = pod('web-1')
+
+        with patch.object(handler, 'get_client', return_value=k8s_client):
+            result = await handler.manage_k8s_resource(
+                MagicMock(),
+                operation='read',
+                cluster_name='cluster',
+                kind='Pod',
+                api_version='v1',
+                name='web-1',
+                namespace='default',
+                body=None,
+            )
+
+        informer.get.assert_called_once_with('web-1', 'default')
+        k8s_client.manage_resource.assert_called_once()
+        assert result.resource['metadata']['name'] == 'web-1'
+
+    @pytest.mark.asyncio
+    async def test_get_k8s_events_from_informer(self, handler):
+        handler.allow_sensitive_data_access = True
+        informer = MagicMock()
+        informer.list.return_value = [
+            {'reason': 'Scheduled', 'message': 'Assigned', 'source': {'component': 'scheduler'}}
+        ]
+        handler.informers.get.return_value = informer
+
+        result = await handler.get_k8s_events(
+            MagicMock(), cluster_name='cluster', kind='Pod', name='web-1', namespace='default'
+        )
+
+        handler.informers.get.assert_called_once_with('cluster', 'Event', 'v1')
+        informer.list.assert_called_once_with(
+            'default', field_selector='involvedObject.kind=Pod,involvedObject.name=web-1'
+        )
+        assert result.count == 1
+        assert result.events[0].reporting_component == 'scheduler'
@@ -55,7 +55,9 @@ async def test_command_line_args():
     with patch.object(argparse.ArgumentParser, 'parse_args') as mock_parse_args:
         # Test with default args (read-only mode by default)
         mock_parse_args.return_value = argparse.Namespace(
-            allow_write=False, allow_sensitive_data_access=False
+            allow_write=False,
+            allow_sensitive_data_access=False,
+            informer_resources=None,
         )
 
         # Mock AWS client creation
@@ -79,7 +81,9 @@ async def test_command_line_args():
     # Test with write access enabled
     with patch.object(argparse.ArgumentParser, 'parse_args') as mock_parse_args:
         mock_parse_args.return_value = argparse.Namespace(
-            allow_write=True, allow_sensitive_data_access=False
+            allow_write=True,
+            allow_sensitive_data_access=False,
+            informer_resources=None,
         )
 
         # Mock AWS client creation
@@ -111,7 +115,9 @@ async def test_command_line_args():
                                 # Verify that the handlers were initialized with correct parameters
                                 mock_cloudwatch_handler.assert_called_once_with(mock_server, False)
                                 mock_eks_stack_handler.assert_called_once_with(mock_server, True)
-                                mock_k8s_handler.assert_called_once_with(mock_server, True, False)
+                                mock_k8s_handler.assert_called_once_with(
+                                    mock_server, True, False, None
+                                )
                                 mock_iam_handler.assert_called_once_with(mock_server, True)
 
                                 # Verify that run was called
@@ -120,7 +126,9 @@ async def test_command_line_args():
     # Test with sensitive data access enabled
     with patch.object(argparse.ArgumentParser, 'parse_args') as mock_parse_args:
         mock_parse_args.return_value = argparse.Namespace(
-            allow_write=False, allow_sensitive_data_access=True
+            allow_write=False,
+            allow_sensitive_data_access=True,
+            informer_resources=None,
         )
 
         # Mock AWS client creation
@@ -152,7 +160,9 @@ async def test_command_line_args():
                                 # Verify that the handlers were initialized with correct parameters
                                 mock_cloudwatch_handler.assert_called_once_with(mock_server, True)
                                 mock_eks_stack_handler.assert_called_once_with(mock_server, False)
-                                mock_k8s_handler.assert_called_once_with(mock_server, False, True)
+                                mock_k8s_handler.assert_called_once_with(
+                                    mock_server, False, True, None
+                                )
                                 mock_iam_handler.assert_called_once_with(mock_server, False)
 
                                 # Verify that run was called
@@ -161,7 +171,9 @@ async def test_command_line_args():
     # Test with both write access and sensitive data access enabled
     with patch.object(argparse.ArgumentParser, 'parse_args') as mock_parse_args:
         mock_parse_args.return_value = argparse.Namespace(
-            allow_write=True, allow_sensitive_data_access=True
+            allow_write=True,
+            allow_sensitive_data_access=True,
+            informer_resources=None,
         )
 
         # Mock AWS client creation
@@ -193,7 +205,9 @@ async def test_command_line_args():
                                 # Verify that the handlers were initialized with both flags
                                 mock_cloudwatch_handler.assert_called_once_with(mock_server, True)
                                 mock_eks_stack_handler.assert_called_once_with(mock_server, True)
-                                mock_k8s_handler.assert_called_once_with(mock_server, True, True)
+                                mock_k8s_handler.assert_called_once_with(
+                                    mock_server, True, True, None
+                                )
                                 mock_iam_handler.assert_called_once_with(mock_server, True)
 
                                 # Verify that run was called
@@ -209,7 +223,7 @@ async def test_k8s_handler_initialization_default():
     K8sHandler(mock_mcp)
 
     # Verify that the tools were registered
-    assert mock_mcp.tool.call_count == 7
+    assert mock_mcp.tool.call_count == 9
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
@@ -219,8 +233,10 @@ async def test_k8s_handler_initialization_default():
 
     # Verify that all tools are registered
     assert 'list_k8s_resources' in tool_names
+    assert 'list_k8s_resources_in_clusters' in tool_names
     assert 'manage_k8s_resource' in tool_names
     assert 'get_pod_logs' in tool_names
+    assert 'get_pods_logs' in tool_names
     assert 'get_k8s_events' in tool_names
     assert 'apply_yaml' in tool_names
     assert 'generate_app_manifest' in tool_names
@@ -235,7 +251,7 @@ async def test_k8s_handler_initialization_write_access_disabled():
     K8sHandler(mock_mcp, allow_write=False)
 
     # Verify that all tools are registered
-    assert mock_mcp.tool.call_count == 7
+    assert mock_mcp.tool.call_count == 9
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
@@ -245,8 +261,10 @@ async def test_k8s_handler_initialization_write_access_disabled():
 
     # Verify that all tools are registered
     assert 'list_k8s_resources' in tool_names
+    assert 'list_k8s_resources_in_clusters' in tool_names
     assert 'manage_k8s_resource' in tool_names
     assert 'get_pod_logs' in tool_names
+    assert 'get_pods_logs' in tool_names
     assert 'get_k8s_events' in tool_names
     assert 'list_api_versions' in tool_names
     assert 'apply_yaml' in tool_names
@@ -262,7 +280,7 @@ async def test_k8s_handler_initialization_write_access_enabled():
     K8sHandler(mock_mcp, allow_write=True)
 
     # Verify that all tools were registered (now includes list_api_versions)
-    assert mock_mcp.tool.call_count == 7
+    assert mock_mcp.tool.call_count == 9
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
@@ -272,8 +290,10 @@ async def test_k8s_handler_initialization_write_access_enabled():
 
     # Verify that all tools are registered
     assert 'list_k8s_resources' in tool_names
+    assert 'list_k8s_resources_in_clusters' in tool_names
     assert 'manage_k8s_resource' in tool_names
     assert 'get_pod_logs' in tool_names
+    assert 'get_pods_logs' in tool_names
     assert 'get_k8s_events' in tool_names
     assert 'apply_yaml' in tool_names
     assert 'generate_app_manifest' in tool_names
@@ -288,7 +308,7 @@ async def test_k8s_handler_initialization_sensitive_data_access_enabled():
     K8sHandler(mock_mcp, allow_sensitive_data_access=True)
 
     # Verify that all tools are registered
-    assert mock_mcp.tool.call_count == 7
+    assert mock_mcp.tool.call_count == 9
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
@@ -298,8 +318,10 @@ async def test_k8s_handler_initialization_sensitive_data_access_enabled():
 
     # Verify that all tools are registered
     assert 'list_k8s_resources' in tool_names
+    assert 'list_k8s_resources_in_clusters' in tool_names
     assert 'manage_k8s_resource' in tool_names
     assert 'get_pod_logs' in tool_names
+    assert 'get_pods_logs' in tool_names
     assert 'get_k8s_events' in tool_names
     assert 'apply_yaml' in tool_names
     assert 'generate_app_manifest' in tool_names
@@ -314,7 +336,7 @@ async def test_k8s_handler_initialization_both_flags_enabled():
     K8sHandler(mock_mcp, allow_write=True, allow_sensitive_data_access=True)
 
     # Verify that all tools are registered
-    assert mock_mcp.tool.call_count == 7
+    assert mock_mcp.tool.call_count == 9
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
@@ -324,8 +346,10 @@ async def test_k8s_handler_initialization_both_flags_enabled():
 
     # Verify that all tools are registered
     assert 'list_k8s_resources' in tool_names
+    assert 'list_k8s_resources_in_clusters' in tool_names
     assert 'manage_k8s_resource' in tool_names
     assert 'get_pod_logs' in tool_names
+    assert 'get_pods_logs' in tool_names
     assert 'get_k8s_events' in tool_names
     assert 'apply_yaml' in tool_names
     assert 'generate_app_manifest' in tool_names
@@ -354,7 +378,7 @@ async def test_cloudwatch_handler_initialization():
     CloudWatchHandler(mock_mcp)
 
     # Verify that all tools are registered
-    assert mock_mcp.tool.call_count == 2
+    assert mock_mcp.tool.call_count == 4
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
@@ -364,7 +388,9 @@ async def test_cloudwatch_handler_initialization():
 
     # Verify that all tools are registered
     assert 'get_cloudwatch_metrics' in tool_names
+    assert 'get_cloudwatch_metrics_batch' in tool_names
     assert 'get_cloudwatch_logs' in tool_names
+    assert 'get_cloudwatch_logs_for_resources' in tool_names
 
 
 @pytest.mark.asyncio
@@ -376,16 +402,18 @@ async def test_cloudwatch_handler_initialization_with_sensitive_data_access():
     CloudWatchHandler(mock_mcp, allow_sensitive_data_access=True)
 
     # Verify that all tools were registered
-    assert mock_mcp.tool.call_count == 2
+    assert mock_mcp.tool.call_count == 4
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
 
     # Verify that get_cloudwatch_logs was registered
     assert call_args_list[0][1]['name'] == 'get_cloudwatch_logs'
+    assert call_args_list[1][1]['name'] == 'get_cloudwatch_logs_for_resources'
 
     # Verify that get_cloudwatch_metrics was registered
-    assert call_args_list[1][1]['name'] == 'get_cloudwatch_metrics'
+    assert call_args_list[2][1]['name'] == 'get_cloudwatch_metrics'
+    assert call_args_list[3][1]['name'] == 'get_cloudwatch_metrics_batch'
 
 
 @pytest.mark.asyncio
@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextvars
 import functools
 import inspect
 import json
 import logging
+import queue
+import threading
 from awslabs.mcp_lambda_handler.session import DynamoDBSessionStore, NoOpSessionStore, SessionStore
+from awslabs.mcp_lambda_handler.tool_compiler import CompiledTool, ToolArgumentError
 from awslabs.mcp_lambda_handler.types import (
     Capabilities,
     ErrorContent,
@@ -28,36 +32,90 @@ from awslabs.mcp_lambda_handler.types import (
     TextContent,
 )
 from contextvars import ContextVar
-from enum import Enum
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
     Generic,
+    Iterator,
     List,
     Optional,
     TypeVar,
     Union,
-    get_args,
-    get_origin,
-    get_type_hints,
 )
 
 
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+
 logger = logging.getLogger(__name__)
 
 # Context variable to store current session ID
 current_session_id: ContextVar[Optional[str]] = ContextVar('current_session_id', default=None)
 
+
+class _ProgressReporter:
+    """Progress notification state of a streamed tool call."""
+
+    def __init__(self, progress_token: Any, emit: Callable[[str], None]):
+        """Initialize the reporter."""
+        self.progress_token = progress_token
+        self.emit = emit
+        self.last_progress: Optional[float] = None
+        # Set once the tool reports progress itself; generator chunks then stop reporting
+        self.explicit = False
+        self._lock = threading.Lock()
+
+    def send(self, progress: float, total: Optional[float], message: Optional[str]) -> bool:
+        """Send a notification, dropping progress that does not increase."""
+        with self._lock:
+            if self.last_progress is not None and progress <= self.last_progress:
+                return False
+            self.last_progress = progress
+        params: Dict[str, Any] = {'progressToken': self.progress_token, 'progress': progress}
+        if total is not None:
+            params['total'] = total
+        if message is not None:
+            params['message'] = message
+        self.emit(
+            json.dumps({'jsonrpc': '2.0', 'method': 'notifications/progress', 'params': params})
+        )
+        return True
+
+
+# Context variable holding the progress reporter of a streamed tool call
+current_progress: ContextVar[Optional[_ProgressReporter]] = ContextVar(
+    'current_progress', default=None
+)
+
+# Maximum number of synchronous tools executed in parallel for a batch request
+MAX_CONCURRENT_TOOL_CALLS = 8
+
 T = TypeVar('T')
 
 
+def _running_loop() -> 'asyncio.AbstractEventLoop':
+    # asyncio is only imported once an async code path runs, keeping it out of the cold start
+    import asyncio
+
+    return asyncio.get_running_loop()
+
+
 class SessionData(Generic[T]):
     """Helper class for type-safe session data access."""
 
-    def __init__(self, data: Dict[str, Any]):
-        """Initialize the class."""
+    def __init__(self, data: Dict[str, Any], base: Any = None):
+        """Initialize the class.
+
+        Args:
+            data: The session data
+            base: The state the data was read at, as returned by SessionStore.checkout_session
+        """
         self._data = data
+        self._base = base
 
     def get(self, key: str, default: T = None) -> T:
         """Get a value from session data with type safety."""
@@ -96,6 +154,16 @@ class MCPLambdaHandler:
         self.version = version
         self.tools: Dict[str, Dict] = {}
         self.tool_implementations: Dict[str, Callable] = {}
+        self._compiled_tools: Dict[str, CompiledTool] = {}
+        # Serialized tools/list result, rebuilt after a tool is registered
+        self._tools_list_json: Optional[str] = None
+        # Thread pool and event loop are created on first use and reused across warm
+        # invocations, so clients bound to the loop survive between requests
+        self._executor: Optional['ThreadPoolExecutor'] = None
+        self._loop: Optional['asyncio.AbstractEventLoop'] = None
+        self._loop_lock = threading.Lock()
+        # Separate lock: the executor is requested while the loop lock is held by _run_async
+        self._executor_lock = threading.Lock()
 
         # Configure session storage
         if session_store is None:
@@ -116,8 +184,8 @@ class MCPLambdaHandler:
         session_id = current_session_id.get()
         if not session_id:
             return None
-        data = self.session_store.get_session(session_id)
-        return SessionData(data) if data is not None else None
+        checkout = self.session_store.checkout_session(session_id)
+        return SessionData(*checkout) if checkout is not None else None
 
     def set_session(self, data: Dict[str, Any]) -> bool:
         """Set the entire session data.
@@ -144,20 +212,56 @@ class MCPLambdaHandler:
             True if successful, False if no session exists
 
         """
+        session_id = current_session_id.get()
         session = self.get_session()
-        if not session:
+        if not session_id or not session:
             return False
 
         # Update the session data
         updater_func(session)
 
-        # Save back to storage
-        return self.set_session(session.raw())
+        # Save back only the changes made to the version read, so that overlapping updates
+        # of the session, e.g. by tool calls of one batch, don't overwrite each other
+        return self.session_store.commit_session(session_id, session.raw(), session._base)
+
+    def report_progress(
+        self, progress: float, total: Optional[float] = None, message: Optional[str] = None
+    ) -> bool:
+        """Report progress of the current tool call to the client.
+
+        Progress is only delivered for tool calls handled by ``handle_streaming_request``
+        that carry a progress token; otherwise this is a no-op. MCP requires progress to
+        increase, so values not greater than the last reported one are dropped. Once a tool
+        reports progress itself, the chunks of generator tools are no longer reported.
+
+        Args:
+            progress: Progress so far
+            total: Optional total, if known
+            message: Optional human readable progress message
+
+        Returns:
+            True if the notification was sent, False otherwise
+
+        """
+        reporter = current_progress.get()
+        if reporter is None:
+            return False
+        reporter.explicit = True
+        return reporter.send(progress, total, message)
+
+    def _report_chunk(self, count: int, chunk: Any) -> None:
+        """Report a generator chunk as progress, unless the tool reports progress itself."""
+        reporter = current_progress.get()
+        if reporter is not None and not reporter.explicit:
+            reporter.send(count, None, str(chunk))
 
     def tool(self):
         """Create a decorator for a function as an MCP tool.
 
         Uses function name, docstring, and type hints to generate the MCP tool schema.
+        Arguments of tools/call requests are validated and converted to the annotated
+        parameter types (enums, dataclasses, lists, dicts and Optional values), and
+        parameters with defaults are optional.
         """
 
         def decorator(func: Callable):
@@ -168,97 +272,14 @@ class MCPLambdaHandler:
                 + [word.capitalize() for word in func_name.split('_')[1:]]
             )
 
-            # Get docstring and parse into description
-            doc = inspect.getdoc(func) or ''
-            description = doc.split('\n\n')[0]  # First paragraph is description
-
-            # Get type hints
-            hints = get_type_hints(func)
-            # return_type = hints.pop('return', Any)
-            hints.pop('return', Any)
-
-            # Build input schema from type hints and docstring
-            properties = {}
-            required = []
-
-            # Parse docstring for argument descriptions
-            arg_descriptions = {}
-            if doc:
-                lines = doc.split('\n')
-                in_args = False
-                for line in lines:
-                    if line.strip().startswith('Args:'):
-                        in_args = True
-                        continue
-                    if in_args:
-                        if not line.strip() or line.strip().startswith('Returns:'):
-                            break
-                        if ':' in line:
-                            arg_name, arg_desc = line.split(':', 1)
-                            arg_descriptions[arg_name.strip()] = arg_desc.strip()
-
-            def get_type_schema(type_hint: Any) -> Dict[str, Any]:
-                # Handle basic types
-                if type_hint is int:
-                    return {'type': 'integer'}
-                elif type_hint is float:
-                    return {'type': 'number'}
-                elif type_hint is bool:
-                    return {'type': 'boolean'}
-                elif type_hint is str:
-                    return {'type': 'string'}
-
-                # Handle Enums
-                if isinstance(type_hint, type) and issubclass(type_hint, Enum):
-                    return {'type': 'string', 'enum': [e.value for e in type_hint]}
-
-                # Get origin type (e.g., Dict from Dict[str, int])
-                origin = get_origin(type_hint)
-                if origin is None:
-                    return {'type': 'string'}  # Default for unknown types
-
-                # Handle Dict types
-                if origin is dict or origin is Dict:
-                    args = get_args(type_hint)
-                    if not args:
-                        return {'type': 'object', 'additionalProperties': True}
-
-                    # Get value type schema (args[1] is value type)
-                    value_schema = get_type_schema(args[1])
-                    return {'type': 'object', 'additionalProperties': value_schema}
-
-                # Handle List types
-                if origin is list or origin is List:
-                    args = get_args(type_hint)
-                    if not args:
-                        return {'type': 'array', 'items': {}}
-
-                    item_schema = get_type_schema(args[0])
-                    return {'type': 'array', 'items': item_schema}
-
-                # Default for unknown complex types
-                return {'type': 'string'}
-
-            # Build properties from type hints
-            for param_name, param_type in hints.items():
-                param_schema = get_type_schema(param_type)
-
-                if param_name in arg_descriptions:
-                    param_schema['description'] = arg_descriptions[param_name]
-
-                properties[param_name] = param_schema
-                required.append(param_name)
-
-            # Create tool schema
-            tool_schema = {
-                'name': tool_name,
-                'description': description,
-                'inputSchema': {'type': 'object', 'properties': properties, 'required': required},
-            }
+            # Compile the schema and argument coercion once, at registration
+            compiled = CompiledTool(tool_name, func)
 
             # Register the tool
-            self.tools[tool_name] = tool_schema
+            self.tools[tool_name] = compiled.schema
             self.tool_implementations[tool_name] = func
+            self._compiled_tools[tool_name] = compiled
+            self._tools_list_json = None
 
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
@@ -278,20 +299,8 @@ class MCPLambdaHandler:
         status_code: Optional[int] = None,
     ) -> Dict:
         """Create a standardized error response."""
-        error = JSONRPCError(code=code, message=message)
-        response = JSONRPCResponse(
-            jsonrpc='2.0', id=request_id, error=error, errorContent=error_content
-        )
-
-        headers = {'Content-Type': 'application/json', 'MCP-Version': '0.6'}
-        if session_id:
-            headers['MCP-Session-Id'] = session_id
-
-        return {
-            'statusCode': status_code or self._error_code_to_http_status(code),
-            'body': response.model_dump_json(),
-            'headers': headers,
-        }
+        response = self._jsonrpc_error(code, message, request_id, error_content)
+        return self._create_lambda_response(response, session_id, status_code)
 
     def _error_code_to_http_status(self, error_code: int) -> int:
         """Map JSON-RPC error codes to HTTP status codes."""
@@ -309,12 +318,256 @@ class MCPLambdaHandler:
     ) -> Dict:
         """Create a standardized success response."""
         response = JSONRPCResponse(jsonrpc='2.0', id=request_id, result=result)
+        return self._create_lambda_response(response, session_id)
+
+    def _jsonrpc_error(
+        self,
+        code: int,
+        message: str,
+        request_id: Optional[str] = None,
+        error_content: Optional[List[Dict]] = None,
+    ) -> JSONRPCResponse:
+        """Create a JSON-RPC error response object."""
+        error = JSONRPCError(code=code, message=message)
+        return JSONRPCResponse(
+            jsonrpc='2.0', id=request_id, error=error, errorContent=error_content
+        )
+
+    def _create_lambda_response(
+        self,
+        response: JSONRPCResponse,
+        session_id: Optional[str] = None,
+        status_code: Optional[int] = None,
+    ) -> Dict:
+        """Wrap a JSON-RPC response object in a Lambda proxy response."""
+        if status_code is None:
+            status_code = (
+                self._error_code_to_http_status(response.error.code) if response.error else 200
+            )
 
         headers = {'Content-Type': 'application/json', 'MCP-Version': '0.6'}
         if session_id:
             headers['MCP-Session-Id'] = session_id
 
-        return {'statusCode': 200, 'body': response.model_dump_json(), 'headers': headers}
+        return {'statusCode': status_code, 'body': response.model_dump_json(), 'headers': headers}
+
+    def _tool_result(self, request_id: Optional[str], chunks: List[Any]) -> JSONRPCResponse:
+        """Create the JSON-RPC response for a successful tool call."""
+        content = [TextContent(text=str(chunk)).model_dump() for chunk in chunks]
+        return JSONRPCResponse(jsonrpc='2.0', id=request_id, result={'content': content})
+
+    @property
+    def _tool_executor(self) -> 'ThreadPoolExecutor':
+        """Thread pool for synchronous tools in batches and streamed tool calls."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=MAX_CONCURRENT_TOOL_CALLS, thread_name_prefix='mcp-tool'
+                    )
+        return self._executor
+
+    def _run_async(self, coroutine: Any) -> Any:
+        """Run a coroutine to completion on the handler's event loop."""
+        import asyncio
+
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+            return self._loop.run_until_complete(coroutine)
+
+    def _collect(self, tool_func: Callable, arguments: Dict[str, Any]) -> List[Any]:
+        """Call a synchronous tool, consuming and reporting the chunks of generator tools."""
+        result = tool_func(**arguments)
+        if not inspect.isgenerator(result):
+            return [result]
+
+        chunks = []
+        for chunk in result:
+            chunks.append(chunk)
+            self._report_chunk(len(chunks), chunk)
+        return chunks
+
+    async def _collect_async(self, tool_func: Callable, arguments: Dict[str, Any]) -> List[Any]:
+        """Await an async tool, consuming and reporting the chunks of async generator tools."""
+        if not inspect.isasyncgenfunction(tool_func):
+            return [await tool_func(**arguments)]
+
+        chunks = []
+        async for chunk in tool_func(**arguments):
+            chunks.append(chunk)
+            self._report_chunk(len(chunks), chunk)
+        return chunks
+
+    def _tool_error(
+        self, request_id: Optional[str], tool_name: str, error: Exception
+    ) -> JSONRPCResponse:
+        """Create the JSON-RPC response for a tool that raised an exception."""
+        logger.error(f'Error executing tool {tool_name}: {error}')
+        error_content = [ErrorContent(text=str(error)).model_dump()]
+        return self._jsonrpc_error(
+            -32603, f'Error executing tool: {str(error)}', request_id, error_content
+        )
+
+    def _call_tool(self, request: JSONRPCRequest) -> JSONRPCResponse:
+        """Execute a single tools/call request on the calling thread."""
+        tool_name = request.params.get('name')  # pyright: ignore [reportOptionalMemberAccess]
+        if tool_name not in self.tools:
+            return self._jsonrpc_error(-32601, f"Tool '{tool_name}' not found", request.id)
+
+        compiled = self._compiled_tools[tool_name]
+        if compiled.is_async:
+            return self._run_async(self._call_tool_async(request))
+
+        try:
+            converted_args = compiled.coerce_arguments(
+                request.params.get('arguments') or {}  # pyright: ignore [reportOptionalMemberAccess]
+            )
+        except ToolArgumentError as e:
+            return self._jsonrpc_error(-32602, f'Invalid params: {e}', request.id)
+
+        try:
+            return self._tool_result(request.id, self._collect(compiled.func, converted_args))
+        except Exception as e:
+            return self._tool_error(request.id, tool_name, e)
+
+    async def _call_tool_async(self, request: JSONRPCRequest) -> JSONRPCResponse:
+        """Execute a tools/call request, offloading synchronous tools to the thread pool."""
+        tool_name = request.params.get('name')  # pyright: ignore [reportOptionalMemberAccess]
+        if tool_name not in self.tools:
+            return self._jsonrpc_error(-32601, f"Tool '{tool_name}' not found", request.id)
+
+        compiled = self._compiled_tools[tool_name]
+        try:
+            converted_args = compiled.coerce_arguments(
+                request.params.get('arguments') or {}  # pyright: ignore [reportOptionalMemberAccess]
+            )
+        except ToolArgumentError as e:
+            return self._jsonrpc_error(-32602, f'Invalid params: {e}', request.id)
+
+        try:
+            if compiled.is_async:
+                chunks = await self._collect_async(compiled.func, converted_args)
+            else:
+                # Worker threads do not inherit context variables, so carry the session over
+                context = contextvars.copy_context()
+                chunks = await _running_loop().run_in_executor(
+                    self._tool_executor,
+                    functools.partial(context.run, self._collect, compiled.func, converted_args),
+                )
+            return self._tool_result(request.id, chunks)
+        except Exception as e:
+            return self._tool_error(request.id, tool_name, e)
+
+    async def _call_tools_concurrently(
+        self, requests: List[JSONRPCRequest]
+    ) -> List[JSONRPCResponse]:
+        """Execute independent tools/call requests concurrently."""
+        import asyncio
+
+        return await asyncio.gather(*(self._call_tool_async(request) for request in requests))
+
+    def _dispatch(self, request: JSONRPCRequest) -> JSONRPCResponse:
+        """Dispatch a validated request that runs within an established session."""
+        # Handle tools/list request
+        if request.method == 'tools/list':
+            logger.info('Handling tools/list request')
+            if self._tools_list_json is None:
+                self._tools_list_json = json.dumps({'tools': list(self.tools.values())})
+            return JSONRPCResponse(jsonrpc='2.0', id=request.id, result_json=self._tools_list_json)
+
+        # Handle tool calls
+        if request.method == 'tools/call' and request.params:
+            return self._call_tool(request)
+
+        # Handle pings
+        if request.method == 'ping':
+            return JSONRPCResponse(jsonrpc='2.0', id=request.id, result={})
+
+        # Handle unknown methods
+        return self._jsonrpc_error(-32601, f'Method not found: {request.method}', request.id)
+
+    def _validate_session(
+        self, session_id: Optional[str], request_id: Optional[str]
+    ) -> Optional[Dict]:
+        """Check the request session, returning an error response if it is not usable."""
+        if session_id:
+            session_data = self.session_store.get_session(session_id)
+            if session_data is None:
+                return self._create_error_response(
+                    -32000, 'Invalid or expired session', request_id, status_code=404
+                )
+        elif not isinstance(self.session_store, NoOpSessionStore):
+            return self._create_error_response(
+                -32000, 'Session required', request_id, status_code=400
+            )
+        return None
+
+    def _handle_batch(self, batch: List[Any], session_id: Optional[str]) -> Dict:
+        """Handle a JSON-RPC batch request.
+
+        The session is validated once for the whole batch. tools/call entries are executed
+        concurrently and all responses are returned in request order.
+        """
+        if not batch:
+            return self._create_error_response(-32600, 'Invalid Request')
+
+        responses: List[Optional[JSONRPCResponse]] = [None] * len(batch)
+        requests: List[tuple[int, JSONRPCRequest]] = []
+        for index, message in enumerate(batch):
+            if (
+                not isinstance(message, dict)
+                or message.get('jsonrpc') != '2.0'
+                or 'method' not in message
+            ):
+                request_id = message.get('id') if isinstance(message, dict) else None
+                responses[index] = self._jsonrpc_error(-32600, 'Invalid Request', request_id)
+            elif 'id' not in message:
+                logger.debug('Skipping notification in batch')
+            elif message['method'] == 'initialize':
+                responses[index] = self._jsonrpc_error(
+                    -32600, 'initialize must not be part of a JSON-RPC batch', message['id']
+                )
+            else:
+                try:
+                    requests.append((index, JSONRPCRequest.model_validate(message)))
+                except (KeyError, TypeError, ValueError) as e:
+                    # A malformed entry only invalidates itself, not the whole batch
+                    responses[index] = self._jsonrpc_error(
+                        -32600, f'Invalid Request: {e}', message.get('id')
+                    )
+
+        if requests:
+            session_error = self._validate_session(session_id, None)
+            if session_error:
+                return session_error
+
+        tool_calls = []
+        for index, request in requests:
+            if request.method == 'tools/call' and request.params:
+                tool_calls.append((index, request))
+            else:
+                responses[index] = self._dispatch(request)
+
+        if tool_calls:
+            logger.info(f'Executing {len(tool_calls)} tool calls from batch')
+            results = self._run_async(
+                self._call_tools_concurrently([request for _, request in tool_calls])
+            )
+            for (index, _), response in zip(tool_calls, results, strict=True):
+                responses[index] = response
+
+        headers = {'Content-Type': 'application/json', 'MCP-Version': '0.6'}
+        if session_id:
+            headers['MCP-Session-Id'] = session_id
+
+        bodies = [response.model_dump_json() for response in responses if response is not None]
+        if not bodies:
+            # A batch made only of notifications gets no response body
+            return {'statusCode': 204, 'body': '', 'headers': headers}
+        return {'statusCode': 200, 'body': f'[{",".join(bodies)}]', 'headers': headers}
 
     def handle_request(self, event: Dict, context: Any) -> Dict:
         """Handle an incoming Lambda request."""
@@ -322,9 +575,6 @@ class MCPLambdaHandler:
         session_id = None
 
         try:
-            # Log the full event for debugging
-            logger.debug(f'Received event: {event}')
-
             # Get headers (case-insensitive)
             headers = {k.lower(): v for k, v in event.get('headers', {}).items()}
 
@@ -350,7 +600,11 @@ class MCPLambdaHandler:
 
             try:
                 body = json.loads(event['body'])
-                logger.debug(f'Parsed request body: {body}')
+                logger.debug('Parsed request body: %s', body)
+
+                if isinstance(body, list):
+                    return self._handle_batch(body, session_id)
+
                 request_id = body.get('id') if isinstance(body, dict) else None
 
                 # Check if this is a notification (no id field)
@@ -375,7 +629,7 @@ class MCPLambdaHandler:
 
             # Parse and validate the request
             request = JSONRPCRequest.model_validate(body)
-            logger.debug(f'Validated request: {request}')
+            logger.debug('Validated request: %s', request)
 
             # Handle initialization request
             if request.method == 'initialize':
@@ -391,73 +645,11 @@ class MCPLambdaHandler:
                 return self._create_success_response(result.model_dump(), request.id, session_id)
 
             # For all other requests, validate session if provided
-            if session_id:
-                session_data = self.session_store.get_session(session_id)
-                if session_data is None:
-                    return self._create_error_response(
-                        -32000, 'Invalid or expired session', request.id, status_code=404
-                    )
-            elif request.method != 'initialize' and not isinstance(
-                self.session_store, NoOpSessionStore
-            ):
-                return self._create_error_response(
-                    -32000, 'Session required', request.id, status_code=400
-                )
+            session_error = self._validate_session(session_id, request.id)
+            if session_error:
+                return session_error
 
-            # Handle tools/list request
-            if request.method == 'tools/list':
-                logger.info('Handling tools/list request')
-                return self._create_success_response(
-                    {'tools': list(self.tools.values())}, request.id, session_id
-                )
-
-            # Handle tool calls
-            if request.method == 'tools/call' and request.params:
-                tool_name = request.params.get('name')
-                tool_args = request.params.get('arguments', {})
-
-                if tool_name not in self.tools:
-                    return self._create_error_response(
-                        -32601, f"Tool '{tool_name}' not found", request.id, session_id=session_id
-                    )
-
-                try:
-                    # Convert enum string values to enum objects
-                    converted_args = {}
-                    tool_func = self.tool_implementations[tool_name]
-                    hints = get_type_hints(tool_func)
-
-                    for arg_name, arg_value in tool_args.items():
-                        arg_type = hints.get(arg_name)
-                        if isinstance(arg_type, type) and issubclass(arg_type, Enum):
-                            converted_args[arg_name] = arg_type(arg_value)
-                        else:
-                            converted_args[arg_name] = arg_value
-
-                    result = tool_func(**converted_args)
-                    content = [TextContent(text=str(result)).model_dump()]
-                    return self._create_success_response(
-                        {'content': content}, request.id, session_id
-                    )
-                except Exception as e:
-                    logger.error(f'Error executing tool {tool_name}: {e}')
-                    error_content = [ErrorContent(text=str(e)).model_dump()]
-                    return self._create_error_response(
-                        -32603,
-                        f'Error executing tool: {str(e)}',
-                        request.id,
-                        error_content,
-                        session_id,
-                    )
-
-            # Handle pings
-            if request.method == 'ping':
-                return self._create_success_response({}, request.id, session_id)
-
-            # Handle unknown methods
-            return self._create_error_response(
-                -32601, f'Method not found: {request.method}', request.id, session_id=session_id
-            )
+            return self._create_lambda_response(self._dispatch(request), session_id)
 
         except Exception as e:
             logger.error(f'Error processing request: {str(e)}', exc_info=True)
@@ -465,3 +657,97 @@ class MCPLambdaHandler:
         finally:
             # Clear session context
             current_session_id.set(None)
+
+    def _parse_streamable_tool_call(self, event: Dict) -> Optional[JSONRPCRequest]:
+        """Return the tools/call request of an event that asked for an SSE response."""
+        headers = {k.lower(): v for k, v in (event.get('headers') or {}).items()}
+        if (
+            event.get('httpMethod') == 'DELETE'
+            or headers.get('content-type') != 'application/json'
+            or 'text/event-stream' not in headers.get('accept', '')
+        ):
+            return None
+
+        try:
+            body = json.loads(event['body'])
+        except (KeyError, TypeError, json.JSONDecodeError):
+            return None
+
+        if (
+            not isinstance(body, dict)
+            or body.get('jsonrpc') != '2.0'
+            or body.get('method') != 'tools/call'
+            or 'id' not in body
+            or not isinstance(body.get('params'), dict)
+        ):
+            return None
+        return JSONRPCRequest.model_validate(body)
+
+    def handle_streaming_request(self, event: Dict, context: Any) -> Dict:
+        """Handle an incoming Lambda request, streaming tool progress as server-sent events.
+
+        A tools/call request from a client that accepts ``text/event-stream`` is answered
+        with a Streamable HTTP SSE stream: progress notifications reported by the tool,
+        including each chunk yielded by generator tools, followed by the final result. The
+        ``body`` of the returned response is an iterator of SSE chunks, meant to be written
+        to a Lambda response stream as they are produced. Any other request is handled by
+        ``handle_request`` and its body returned as a single chunk.
+
+        The standard Python Lambda runtime cannot serialize an iterator body, so this entry
+        point requires a response streaming adapter (for example the Lambda Web Adapter in
+        response stream mode, or a custom runtime). Behind API Gateway with the standard
+        runtime, use ``handle_request`` instead.
+
+        Args:
+            event: The Lambda event
+            context: The Lambda context
+
+        Returns:
+            A Lambda proxy response whose body is an iterator of strings
+
+        """
+        request = self._parse_streamable_tool_call(event)
+        session_id = {k.lower(): v for k, v in (event.get('headers') or {}).items()}.get(
+            'mcp-session-id'
+        )
+        if request is None:
+            response = self.handle_request(event, context)
+        else:
+            response = self._validate_session(session_id, request.id)
+        if response is not None:
+            response['body'] = iter([response.get('body', '')])
+            return response
+
+        messages: queue.Queue = queue.Queue()
+        progress_token = (request.params.get('_meta') or {}).get('progressToken')  # pyright: ignore [reportOptionalMemberAccess]
+
+        def run_tool() -> None:
+            current_session_id.set(session_id)
+            if progress_token is not None:
+                current_progress.set(_ProgressReporter(progress_token, messages.put))
+            try:
+                result = self._call_tool(request)
+            except Exception as e:
+                logger.error(f'Error processing request: {str(e)}', exc_info=True)
+                result = self._jsonrpc_error(-32000, str(e), request.id)
+            messages.put(result.model_dump_json())
+            messages.put(None)
+
+        # Run in a fresh context so nothing leaks between calls sharing a pool thread
+        self._tool_executor.submit(contextvars.Context().run, run_tool)
+
+        def stream() -> Iterator[str]:
+            while True:
+                message = messages.get()
+                if message is None:
+                    return
+                yield f'event: message\ndata: {message}\n\n'
+
+        headers = {
+            'Content-Type': 'text/event-stream',
+            'Cache-Control': 'no-cache',
+            'MCP-Version': '0.6',
+        }
+        if session_id:
+            headers['MCP-Session-Id'] = session_id
+        return {'statusCode': 200, 'body': stream(), 'headers': headers}
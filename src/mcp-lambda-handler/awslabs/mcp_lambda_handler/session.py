@@ -14,16 +14,25 @@
 
 """Session management for MCP server with pluggable storage."""
 
-import boto3
+import copy
 import logging
+import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of sessions remembered per container
+SESSION_CACHE_MAX_ENTRIES = 1024
+
+# Number of attempts for a conditional session write before giving up
+SESSION_WRITE_ATTEMPTS = 3
+
 
 class SessionStore(ABC):
     """Abstract base class for session storage implementations."""
@@ -81,6 +90,36 @@ class SessionStore(ABC):
         """
         pass
 
+    def checkout_session(self, session_id: str) -> Optional[Tuple[Dict[str, Any], Any]]:
+        """Get session data for a read-modify-write, along with the state it was read at.
+
+        Args:
+            session_id: The session ID to look up
+
+        Returns:
+            The session data and an opaque base to pass to commit_session, or None if the
+            session was not found
+
+        """
+        data = self.get_session(session_id)
+        return (data, None) if data is not None else None
+
+    def commit_session(self, session_id: str, session_data: Dict[str, Any], base: Any) -> bool:
+        """Write back session data obtained from checkout_session.
+
+        Stores that detect concurrent updates only apply the changes made since base.
+
+        Args:
+            session_id: The session ID to update
+            session_data: New session data
+            base: The base returned by checkout_session with the data
+
+        Returns:
+            True if successful, False otherwise
+
+        """
+        return self.update_session(session_id, session_data)
+
 
 class NoOpSessionStore(SessionStore):
     """A no-op session store that doesn't actually store sessions."""
@@ -102,19 +141,92 @@ class NoOpSessionStore(SessionStore):
         return True
 
 
-class DynamoDBSessionStore(SessionStore):
-    """Manages MCP sessions using DynamoDB."""
+@dataclass
+class _SessionSnapshot:
+    """Last known state of a session item, used for caching and dirty-tracking."""
+
+    data: Dict[str, Any]
+    version: Optional[int]
+    expires_at: float
+    fetched_at: float
+
 
-    def __init__(self, table_name: str = 'mcp_sessions'):
+class DynamoDBSessionStore(SessionStore):
+    """Manages MCP sessions using DynamoDB.
+
+    The store remembers the last version of each session it has read or written in the
+    container. Updates only write the keys that changed since then, conditioned on the item
+    version, so concurrent writers from other containers are detected rather than overwritten.
+    Read-modify-writes that may overlap within the container, such as concurrent tool calls
+    of a batch, use checkout_session and commit_session to diff against the version they read.
+    When ``cache_ttl`` is set, reads within that many seconds of the last fetch are served
+    from memory without a GetItem call.
+    """
+
+    def __init__(self, table_name: str = 'mcp_sessions', cache_ttl: float = 0):
         """Initialize the session store.
 
         Args:
             table_name: Name of DynamoDB table to use for sessions
+            cache_ttl: Seconds a fetched session may be served from memory (0 disables
+                cached reads)
 
         """
         self.table_name = table_name
-        self.dynamodb = boto3.resource('dynamodb')
-        self.table = self.dynamodb.Table(table_name)  # pyright: ignore [reportAttributeAccessIssue]
+        self.cache_ttl = cache_ttl
+        # Created on first use so that boto3 stays out of the Lambda cold start
+        self._dynamodb: Any = None
+        self._table: Any = None
+        self._snapshots: OrderedDict[str, _SessionSnapshot] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _create_resources(self) -> None:
+        """Create the DynamoDB resource and table objects if they do not exist yet."""
+        with self._lock:
+            if self._table is None:
+                import boto3
+
+                self._dynamodb = boto3.resource('dynamodb')
+                self._table = self._dynamodb.Table(self.table_name)  # pyright: ignore [reportAttributeAccessIssue]
+
+    @property
+    def dynamodb(self) -> Any:
+        """The DynamoDB service resource."""
+        if self._dynamodb is None:
+            self._create_resources()
+        return self._dynamodb
+
+    @property
+    def table(self) -> Any:
+        """The DynamoDB sessions table."""
+        if self._table is None:
+            self._create_resources()
+        return self._table
+
+    def _remember(
+        self, session_id: str, data: Dict[str, Any], version: Optional[int], expires_at: float
+    ) -> _SessionSnapshot:
+        """Record the current state of a session.
+
+        Snapshots are never modified once recorded, so they can be handed out as bases.
+        """
+        snapshot = _SessionSnapshot(copy.deepcopy(data), version, expires_at, time.monotonic())
+        with self._lock:
+            self._snapshots[session_id] = snapshot
+            self._snapshots.move_to_end(session_id)
+            while len(self._snapshots) > SESSION_CACHE_MAX_ENTRIES:
+                self._snapshots.popitem(last=False)
+        return snapshot
+
+    def _forget(self, session_id: str) -> None:
+        """Drop the remembered state of a session."""
+        with self._lock:
+            self._snapshots.pop(session_id, None)
+
+    def _snapshot(self, session_id: str) -> Optional[_SessionSnapshot]:
+        """Return the remembered state of a session, if any."""
+        with self._lock:
+            return self._snapshots.get(session_id)
 
     def create_session(self, session_data: Optional[Dict[str, Any]] = None) -> str:
         """Create a new session.
@@ -138,9 +250,11 @@ class DynamoDBSessionStore(SessionStore):
             'expires_at': expires_at,
             'created_at': int(time.time()),
             'data': session_data or {},
+            'version': 1,
         }
 
         self.table.put_item(Item=item)
+        self._remember(session_id, item['data'], 1, expires_at)
         logger.info(f'Created session {session_id}')
 
         return session_id
@@ -155,27 +269,61 @@ class DynamoDBSessionStore(SessionStore):
             Session data or None if not found
 
         """
-        try:
-            response = self.table.get_item(Key={'session_id': session_id})
-            item = response.get('Item')
+        checkout = self.checkout_session(session_id)
+        return checkout[0] if checkout else None
 
-            if not item:
-                return None
+    def checkout_session(
+        self, session_id: str
+    ) -> Optional[Tuple[Dict[str, Any], Optional[_SessionSnapshot]]]:
+        """Get session data for a read-modify-write, along with the version it was read at.
+
+        Args:
+            session_id: The session ID to look up
 
-            # Check if session has expired
-            if item.get('expires_at', 0) < time.time():
-                self.delete_session(session_id)
+        Returns:
+            The session data and the snapshot to pass to commit_session, or None if the
+            session was not found
+
+        """
+        snapshot = self._snapshot(session_id)
+        if not snapshot or time.monotonic() - snapshot.fetched_at >= self.cache_ttl:
+            try:
+                snapshot = self._fetch_snapshot(session_id)
+            except Exception as e:
+                logger.error(f'Error getting session {session_id}: {e}')
                 return None
+        elif snapshot.expires_at < time.time():
+            self.delete_session(session_id)
+            return None
 
-            return item.get('data', {})
+        # Callers mutate the returned data before writing it back
+        return (copy.deepcopy(snapshot.data), snapshot) if snapshot else None
 
-        except Exception as e:
-            logger.error(f'Error getting session {session_id}: {e}')
+    def _fetch_snapshot(self, session_id: str) -> Optional[_SessionSnapshot]:
+        """Read a session item from DynamoDB, deleting it if it has expired."""
+        response = self.table.get_item(Key={'session_id': session_id})
+        item = response.get('Item')
+
+        if not item:
+            self._forget(session_id)
             return None
 
+        # Check if session has expired
+        if item.get('expires_at', 0) < time.time():
+            self.delete_session(session_id)
+            return None
+
+        return self._remember(
+            session_id, item.get('data', {}), item.get('version'), item.get('expires_at', 0)
+        )
+
     def update_session(self, session_id: str, session_data: Dict[str, Any]) -> bool:
         """Update session data.
 
+        Only the keys that differ from the last known version of the session are written.
+        If another container updated the session in the meantime, the changed keys are
+        re-applied on top of the latest version.
+
         Args:
             session_id: The session ID to update
             session_data: New session data
@@ -184,18 +332,122 @@ class DynamoDBSessionStore(SessionStore):
             True if successful, False otherwise
 
         """
+        return self.commit_session(session_id, session_data, self._snapshot(session_id))
+
+    def commit_session(
+        self,
+        session_id: str,
+        session_data: Dict[str, Any],
+        base: Any,
+    ) -> bool:
+        """Write back session data obtained from checkout_session.
+
+        Only the keys that differ from base are written, conditioned on its version. If the
+        session was updated after base was read, in this container or another, the changed
+        keys are re-applied on top of the latest version.
+
+        Args:
+            session_id: The session ID to update
+            session_data: New session data
+            base: The snapshot returned by checkout_session with the data
+
+        Returns:
+            True if successful, False otherwise
+
+        """
+        # Imported here rather than at module level to keep botocore out of the cold start
+        from botocore.exceptions import ClientError
+
+        snapshot: Optional[_SessionSnapshot] = base
         try:
-            self.table.update_item(
-                Key={'session_id': session_id},
-                UpdateExpression='SET #data = :data',
-                ExpressionAttributeNames={'#data': 'data'},
-                ExpressionAttributeValues={':data': session_data},
-            )
+            if snapshot is None:
+                # Nothing to diff against, so replace the whole data map
+                self.table.update_item(
+                    Key={'session_id': session_id},
+                    UpdateExpression='SET #data = :data, #version = if_not_exists(#version, :zero) + :one',
+                    ExpressionAttributeNames={'#data': 'data', '#version': 'version'},
+                    ExpressionAttributeValues={':data': session_data, ':zero': 0, ':one': 1},
+                )
+                return True
+
+            changed = {
+                key: value
+                for key, value in session_data.items()
+                if key not in snapshot.data or snapshot.data[key] != value
+            }
+            removed = [key for key in snapshot.data if key not in session_data]
+            if not changed and not removed:
+                return True
+
+            data, version = snapshot.data, snapshot.version
+            for _ in range(SESSION_WRITE_ATTEMPTS):
+                try:
+                    self._write_changes(session_id, changed, removed, version)
+                    break
+                except ClientError as e:
+                    if (
+                        e.response.get('Error', {}).get('Code')
+                        != 'ConditionalCheckFailedException'
+                    ):
+                        raise
+                    logger.info(f'Session {session_id} was updated concurrently, retrying')
+                    latest = self._fetch_snapshot(session_id)
+                    if latest is None:
+                        return False
+                    data, version = latest.data, latest.version
+            else:
+                self._forget(session_id)
+                logger.error(f'Error updating session {session_id}: too many concurrent updates')
+                return False
+
+            data = {key: value for key, value in data.items() if key not in removed}
+            data.update(changed)
+            self._remember(session_id, data, (version or 0) + 1, snapshot.expires_at)
             return True
         except Exception as e:
+            self._forget(session_id)
             logger.error(f'Error updating session {session_id}: {e}')
             return False
 
+    def _write_changes(
+        self,
+        session_id: str,
+        changed: Dict[str, Any],
+        removed: List[str],
+        version: Optional[int],
+    ) -> None:
+        """Write changed and removed keys, conditioned on the session version."""
+        names = {'#data': 'data', '#version': 'version'}
+        values: Dict[str, Any] = {':next': (version or 0) + 1}
+        set_actions = ['#version = :next']
+        remove_actions = []
+        for index, (key, value) in enumerate(changed.items()):
+            names[f'#k{index}'] = key
+            values[f':v{index}'] = value
+            set_actions.append(f'#data.#k{index} = :v{index}')
+        for index, key in enumerate(removed, start=len(changed)):
+            names[f'#k{index}'] = key
+            remove_actions.append(f'#data.#k{index}')
+
+        update_expression = f'SET {", ".join(set_actions)}'
+        if remove_actions:
+            update_expression += f' REMOVE {", ".join(remove_actions)}'
+
+        if version is None:
+            # Items written before versioning was introduced
+            condition = 'attribute_exists(#data) AND attribute_not_exists(#version)'
+        else:
+            condition = '#version = :expected'
+            values[':expected'] = version
+
+        self.table.update_item(
+            Key={'session_id': session_id},
+            UpdateExpression=update_expression,
+            ConditionExpression=condition,
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+        )
+
     def delete_session(self, session_id: str) -> bool:
         """Delete a session.
 
@@ -206,6 +458,7 @@ class DynamoDBSessionStore(SessionStore):
             True if successful, False otherwise
 
         """
+        self._forget(session_id)
         try:
             self.table.delete_item(Key={'session_id': session_id})
             logger.info(f'Deleted session {session_id}')
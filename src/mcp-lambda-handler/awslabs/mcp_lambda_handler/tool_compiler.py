@@ -0,0 +1,408 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compile tool functions into JSON schemas and argument coercers at registration time."""
+
+import dataclasses
+import inspect
+import types
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+
+Coercer = Callable[[Any, str], Any]
+
+
+class ToolArgumentError(ValueError):
+    """Raised when tool call arguments do not match the tool signature."""
+
+
+class _CompileContext:
+    """State shared while compiling the parameters of one tool."""
+
+    def __init__(self):
+        """Initialize the context."""
+        # Schema definitions referenced with '#/$defs/<name>', published on the input schema
+        self.defs: Dict[str, Any] = {}
+        # Coercers of dataclasses, None while their fields are still being compiled
+        self.dataclass_coercers: Dict[type, Optional[Coercer]] = {}
+        # Compiled schema and coercer of each dataclass, reused when it appears again
+        self.dataclasses: Dict[type, Tuple[Dict[str, Any], Coercer]] = {}
+
+
+def _passthrough(value: Any, path: str) -> Any:
+    return value
+
+
+def _coerce_int(value: Any, path: str) -> int:
+    if isinstance(value, bool):
+        raise ToolArgumentError(f'{path}: expected integer, got boolean')
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    raise ToolArgumentError(f'{path}: expected integer, got {type(value).__name__}')
+
+
+def _coerce_float(value: Any, path: str) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    raise ToolArgumentError(f'{path}: expected number, got {type(value).__name__}')
+
+
+def _coerce_bool(value: Any, path: str) -> bool:
+    if isinstance(value, bool):
+        return value
+    raise ToolArgumentError(f'{path}: expected boolean, got {type(value).__name__}')
+
+
+def _coerce_str(value: Any, path: str) -> str:
+    if isinstance(value, str):
+        return value
+    raise ToolArgumentError(f'{path}: expected string, got {type(value).__name__}')
+
+
+_SCALARS: Dict[Any, Tuple[Dict[str, Any], Coercer]] = {
+    int: ({'type': 'integer'}, _coerce_int),
+    float: ({'type': 'number'}, _coerce_float),
+    bool: ({'type': 'boolean'}, _coerce_bool),
+    str: ({'type': 'string'}, _coerce_str),
+}
+
+
+def _compile_enum(enum_type: type) -> Tuple[Dict[str, Any], Coercer]:
+    members = {member.value: member for member in enum_type}  # pyright: ignore [reportGeneralTypeIssues]
+    allowed = ', '.join(repr(value) for value in members)
+
+    def coerce(value: Any, path: str) -> Enum:
+        if isinstance(value, enum_type):
+            return value
+        try:
+            return members[value]
+        except (KeyError, TypeError):
+            raise ToolArgumentError(f'{path}: expected one of {allowed}, got {value!r}') from None
+
+    return {'type': 'string', 'enum': list(members)}, coerce
+
+
+def _compile_list(item_type: Any, context: _CompileContext) -> Tuple[Dict[str, Any], Coercer]:
+    if item_type is None:
+        item_schema, coerce_item = {}, _passthrough
+    else:
+        item_schema, coerce_item = compile_type(item_type, context)
+
+    def coerce(value: Any, path: str) -> List:
+        if not isinstance(value, list):
+            raise ToolArgumentError(f'{path}: expected array, got {type(value).__name__}')
+        if coerce_item is _passthrough:
+            return value
+        return [coerce_item(item, f'{path}[{index}]') for index, item in enumerate(value)]
+
+    return {'type': 'array', 'items': item_schema}, coerce
+
+
+def _compile_dict(value_type: Any, context: _CompileContext) -> Tuple[Dict[str, Any], Coercer]:
+    if value_type is None:
+        value_schema, coerce_value = True, _passthrough
+    else:
+        value_schema, coerce_value = compile_type(value_type, context)
+
+    def coerce(value: Any, path: str) -> Dict:
+        if not isinstance(value, dict):
+            raise ToolArgumentError(f'{path}: expected object, got {type(value).__name__}')
+        if coerce_value is _passthrough:
+            return value
+        return {key: coerce_value(item, f'{path}.{key}') for key, item in value.items()}
+
+    return {'type': 'object', 'additionalProperties': value_schema}, coerce
+
+
+def _compile_union(
+    members: Tuple[Any, ...], context: _CompileContext
+) -> Tuple[Dict[str, Any], Coercer]:
+    optional = type(None) in members
+    compiled = [compile_type(member, context) for member in members if member is not type(None)]
+
+    # Optional[T] is documented as T; the tool's default covers the missing case
+    if len(compiled) == 1:
+        schema, coerce_member = compiled[0]
+    else:
+        schema = {'anyOf': [member_schema for member_schema, _ in compiled]}
+        coerce_member = None
+
+    def coerce(value: Any, path: str) -> Any:
+        if value is None and optional:
+            return None
+        if coerce_member is not None:
+            return coerce_member(value, path)
+        errors = []
+        for _, coerce_option in compiled:
+            try:
+                return coerce_option(value, path)
+            except ToolArgumentError as e:
+                errors.append(str(e))
+        raise ToolArgumentError('; '.join(errors))
+
+    return schema, coerce
+
+
+def _compile_dataclass(model: type, context: _CompileContext) -> Tuple[Dict[str, Any], Coercer]:
+    if model in context.dataclasses:
+        schema, coerce = context.dataclasses[model]
+        return dict(schema), coerce
+
+    ref = {'$ref': f'#/$defs/{model.__name__}'}
+    if model in context.dataclass_coercers:
+        # Self-referencing dataclass: point at the definition and resolve the coercer lazily
+        coercers = context.dataclass_coercers
+        return ref, lambda value, path: coercers[model](value, path)  # pyright: ignore [reportOptionalCall]
+
+    context.dataclass_coercers[model] = None
+    hints = get_type_hints(model)
+    fields = {}
+    required = []
+    for field in dataclasses.fields(model):
+        fields[field.name] = compile_type(hints.get(field.name, Any), context)
+        if field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING:
+            required.append(field.name)
+
+    schema = {
+        'type': 'object',
+        'properties': {name: field_schema for name, (field_schema, _) in fields.items()},
+        'required': required,
+    }
+
+    def coerce(value: Any, path: str) -> Any:
+        if isinstance(value, model):
+            return value
+        if not isinstance(value, dict):
+            raise ToolArgumentError(f'{path}: expected object, got {type(value).__name__}')
+        return model(**_coerce_fields(fields, required, value, path))
+
+    context.dataclass_coercers[model] = coerce
+    if _references(schema, ref['$ref']):
+        context.defs[model.__name__] = schema
+        schema = ref
+    context.dataclasses[model] = (schema, coerce)
+    return dict(schema), coerce
+
+
+def _references(schema: Any, ref: str) -> bool:
+    """Return whether a schema contains the given $ref."""
+    if isinstance(schema, dict):
+        return schema.get('$ref') == ref or any(_references(v, ref) for v in schema.values())
+    if isinstance(schema, list):
+        return any(_references(item, ref) for item in schema)
+    return False
+
+
+def _compile_model(model: Any, context: _CompileContext) -> Tuple[Dict[str, Any], Coercer]:
+    # Pydantic-style models validate themselves; pydantic is not a dependency of this package
+    schema = model.model_json_schema() if hasattr(model, 'model_json_schema') else {}
+    # Nested models are emitted as '#/$defs/...' references, resolved at the input schema root
+    context.defs.update(schema.pop('$defs', {}))
+
+    def coerce(value: Any, path: str) -> Any:
+        if isinstance(value, model):
+            return value
+        try:
+            return model.model_validate(value)
+        except Exception as e:
+            raise ToolArgumentError(f'{path}: {e}') from None
+
+    return schema or {'type': 'object'}, coerce
+
+
+def compile_type(
+    type_hint: Any, context: Optional[_CompileContext] = None
+) -> Tuple[Dict[str, Any], Coercer]:
+    """Compile a type hint into a JSON schema and a function that coerces JSON values to it.
+
+    Args:
+        type_hint: The type hint to compile
+        context: Compilation state shared by the parameters of a tool; schemas of nested
+            and recursive models are collected in its ``defs``
+
+    Returns:
+        A tuple of the JSON schema and the coercer, called as ``coerce(value, path)``
+
+    """
+    if context is None:
+        context = _CompileContext()
+
+    if isinstance(type_hint, type) and type_hint in _SCALARS:
+        schema, coerce = _SCALARS[type_hint]
+        return dict(schema), coerce
+
+    if isinstance(type_hint, type) and issubclass(type_hint, Enum):
+        return _compile_enum(type_hint)
+
+    if isinstance(type_hint, type) and dataclasses.is_dataclass(type_hint):
+        return _compile_dataclass(type_hint, context)
+
+    if isinstance(type_hint, type) and hasattr(type_hint, 'model_validate'):
+        return _compile_model(type_hint, context)
+
+    origin = get_origin(type_hint)
+    args = get_args(type_hint)
+
+    if origin is list or type_hint is list:
+        return _compile_list(args[0] if args else None, context)
+
+    if origin is dict or type_hint is dict:
+        return _compile_dict(args[1] if args else None, context)
+
+    if origin is Union or origin is types.UnionType:
+        return _compile_union(args, context)
+
+    # Unknown types are described as strings and passed through unchanged
+    return {'type': 'string'}, _passthrough
+
+
+def _coerce_fields(
+    fields: Dict[str, Tuple[Dict[str, Any], Coercer]],
+    required: List[str],
+    values: Dict[str, Any],
+    path: str = '',
+    accepts_extra: bool = False,
+) -> Dict[str, Any]:
+    prefix = f'{path}.' if path else ''
+    missing = [name for name in required if name not in values]
+    if missing:
+        raise ToolArgumentError(
+            f'Missing required argument(s): {", ".join(prefix + name for name in missing)}'
+        )
+
+    coerced = {}
+    for name, value in values.items():
+        field = fields.get(name)
+        if field is None:
+            if not accepts_extra:
+                raise ToolArgumentError(f'Unexpected argument: {prefix}{name}')
+            coerced[name] = value
+        else:
+            coerced[name] = field[1](value, prefix + name)
+    return coerced
+
+
+def _parse_arg_descriptions(doc: str) -> Dict[str, str]:
+    """Parse argument descriptions from the Args section of a Google-style docstring."""
+    arg_descriptions = {}
+    in_args = False
+    for line in doc.split('\n'):
+        if line.strip().startswith('Args:'):
+            in_args = True
+            continue
+        if in_args:
+            if not line.strip() or line.strip().startswith('Returns:'):
+                break
+            if ':' in line:
+                arg_name, arg_desc = line.split(':', 1)
+                arg_descriptions[arg_name.strip()] = arg_desc.strip()
+    return arg_descriptions
+
+
+class CompiledTool:
+    """A tool function with its schema and argument coercion compiled once."""
+
+    def __init__(self, name: str, func: Callable):
+        """Compile a tool function.
+
+        Args:
+            name: The MCP tool name
+            func: The tool implementation
+
+        """
+        self.name = name
+        self.func = func
+        self.is_async = inspect.iscoroutinefunction(func) or inspect.isasyncgenfunction(func)
+
+        doc = inspect.getdoc(func) or ''
+        arg_descriptions = _parse_arg_descriptions(doc)
+        hints = get_type_hints(func)
+        hints.pop('return', None)
+        signature = inspect.signature(func)
+
+        self._fields: Dict[str, Tuple[Dict[str, Any], Coercer]] = {}
+        self._required: List[str] = []
+        self._accepts_extra = False
+        properties = {}
+        required = []
+        context = _CompileContext()
+        for param_name, param in signature.parameters.items():
+            if param.kind is inspect.Parameter.VAR_KEYWORD:
+                self._accepts_extra = True
+                continue
+            if param.kind is inspect.Parameter.VAR_POSITIONAL:
+                continue
+
+            has_default = param.default is not inspect.Parameter.empty
+            if not has_default:
+                self._required.append(param_name)
+
+            if param_name not in hints:
+                # Unannotated parameters are accepted as-is but not advertised
+                self._fields[param_name] = ({}, _passthrough)
+                continue
+
+            param_schema, coerce = compile_type(hints[param_name], context)
+            self._fields[param_name] = (param_schema, coerce)
+
+            param_schema = dict(param_schema)
+            if param_name in arg_descriptions:
+                param_schema['description'] = arg_descriptions[param_name]
+            properties[param_name] = param_schema
+            if not has_default:
+                required.append(param_name)
+
+        input_schema: Dict[str, Any] = {
+            'type': 'object',
+            'properties': properties,
+            'required': required,
+        }
+        if context.defs:
+            input_schema['$defs'] = context.defs
+        self.schema = {
+            'name': name,
+            'description': doc.split('\n\n')[0],  # First paragraph is description
+            'inputSchema': input_schema,
+        }
+
+    def coerce_arguments(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate tool call arguments and convert them to the declared parameter types.
+
+        Args:
+            arguments: The arguments from the tools/call request
+
+        Returns:
+            Keyword arguments for the tool function
+
+        Raises:
+            ToolArgumentError: If the arguments do not match the tool signature
+
+        """
+        if not isinstance(arguments, dict):
+            raise ToolArgumentError('Tool arguments must be an object')
+        return _coerce_fields(self._fields, self._required, arguments, '', self._accepts_extra)
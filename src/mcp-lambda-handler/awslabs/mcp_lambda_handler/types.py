@@ -43,6 +43,8 @@ class JSONRPCResponse:
     result: Optional[Any] = None
     error: Optional[JSONRPCError] = None
     errorContent: Optional[List[Dict]] = None
+    # Pre-serialized result, spliced into the output as-is
+    result_json: Optional[str] = None
 
     def model_dump_json(self) -> str:
         import json
@@ -54,6 +56,8 @@ class JSONRPCResponse:
             data['error'] = json.loads(self.error.model_dump_json())
         if self.errorContent is not None:
             data['errorContent'] = self.errorContent
+        if self.result_json is not None:
+            return f'{json.dumps(data)[:-1]}, "result": {self.result_json}}}'
         return json.dumps(data)
 
 
@@ -102,6 +106,10 @@ class JSONRPCRequest:
 
     @classmethod
     def model_validate(cls, data: Dict) -> 'JSONRPCRequest':
+        if not isinstance(data.get('method'), str):
+            raise ValueError('method must be a string')
+        if data.get('params') is not None and not isinstance(data['params'], dict):
+            raise ValueError('params must be an object')
         return cls(
             jsonrpc=data['jsonrpc'],
             id=data.get('id'),
@@ -0,0 +1,238 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for MCPLambdaHandler cold start, warm latency and allocations.
+
+Run from the package directory:
+
+    python tests/benchmarks/bench_handler.py [--iterations N] [--cold-runs N]
+
+Cold start is measured in fresh interpreter processes. Warm latency and allocations are
+measured in-process, with moto standing in for DynamoDB for the session-backed scenarios.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+
+# Allow running the script directly from a source checkout
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PACKAGE_ROOT)
+
+COLD_START_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import awslabs.mcp_lambda_handler
+from awslabs.mcp_lambda_handler import MCPLambdaHandler
+imported = time.perf_counter()
+
+mcp = MCPLambdaHandler('bench')
+
+@mcp.tool()
+def add(a: int, b: int) -> int:
+    '''Add two numbers.'''
+    return a + b
+
+event = {
+    'httpMethod': 'POST',
+    'headers': {'content-type': 'application/json'},
+    'body': json.dumps({'jsonrpc': '2.0', 'id': 1, 'method': 'tools/call',
+                        'params': {'name': 'add', 'arguments': {'a': 1, 'b': 2}}}),
+}
+mcp.handle_request(event, None)
+done = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'first_request_ms': (done - start) * 1000,
+    'boto3_imported': 'boto3' in sys.modules,
+    'asyncio_imported': 'asyncio' in sys.modules,
+}))
+"""
+
+
+def make_event(payload, session_id=None) -> Dict:
+    """Create a minimal API Gateway proxy event."""
+    headers = {'content-type': 'application/json'}
+    if session_id:
+        headers['mcp-session-id'] = session_id
+    return {'httpMethod': 'POST', 'headers': headers, 'body': json.dumps(payload)}
+
+
+def tool_call(name: str, arguments: Dict, request_id=1) -> Dict:
+    """Create a tools/call request."""
+    return {
+        'jsonrpc': '2.0',
+        'id': request_id,
+        'method': 'tools/call',
+        'params': {'name': name, 'arguments': arguments},
+    }
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Return the given percentile of the samples."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def bench_cold_start(runs: int) -> None:
+    """Measure import time and first request latency in fresh interpreters."""
+    env = dict(os.environ, PYTHONPATH=PACKAGE_ROOT)
+    results = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', COLD_START_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f'cold start ({runs} processes)')
+    for key in ('import_ms', 'first_request_ms'):
+        values = [result[key] for result in results]
+        print(f'  {key:<24} median {statistics.median(values):8.2f}  max {max(values):8.2f}')
+    print(f'  boto3 imported at start:  {results[0]["boto3_imported"]}')
+    print(f'  asyncio imported at start: {results[0]["asyncio_imported"]}')
+
+
+def bench_warm(name: str, handle: Callable[[], Dict], iterations: int) -> None:
+    """Measure warm latency and allocations of a request."""
+    for _ in range(min(iterations, 50)):
+        handle()
+
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        handle()
+        latencies.append((time.perf_counter_ns() - start) / 1000)
+
+    tracemalloc.start()
+    peaks = []
+    allocated = []
+    for _ in range(min(iterations, 200)):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        handle()
+        after, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+        allocated.append(after - before)
+    tracemalloc.stop()
+
+    print(
+        f'  {name:<28} p50 {percentile(latencies, 50):9.1f}us  '
+        f'p99 {percentile(latencies, 99):9.1f}us  '
+        f'peak {statistics.mean(peaks) / 1024:7.1f}KiB  '
+        f'retained {statistics.mean(allocated):8.1f}B'
+    )
+
+
+def register_tools(mcp) -> None:
+    """Register the tools used by the warm scenarios."""
+
+    @mcp.tool()
+    def add(a: int, b: int) -> int:
+        """Add two numbers."""
+        return a + b
+
+    @mcp.tool()
+    def remember(key: str, value: str) -> str:
+        """Store a value in the session."""
+        mcp.update_session(lambda session: session.set(key, value))
+        return value
+
+
+def bench_warm_noop(iterations: int) -> None:
+    """Warm scenarios without a session store."""
+    from awslabs.mcp_lambda_handler import MCPLambdaHandler
+
+    mcp = MCPLambdaHandler('bench')
+    register_tools(mcp)
+    ping = make_event({'jsonrpc': '2.0', 'id': 1, 'method': 'ping'})
+    tools_list = make_event({'jsonrpc': '2.0', 'id': 1, 'method': 'tools/list'})
+    call = make_event(tool_call('add', {'a': 1, 'b': 2}))
+    batch = make_event([tool_call('add', {'a': i, 'b': i}, i) for i in range(4)])
+
+    print(f'warm, no session store ({iterations} requests)')
+    bench_warm('ping', lambda: mcp.handle_request(ping, None), iterations)
+    bench_warm('tools/list', lambda: mcp.handle_request(tools_list, None), iterations)
+    bench_warm('tools/call', lambda: mcp.handle_request(call, None), iterations)
+    bench_warm('batch of 4 tools/call', lambda: mcp.handle_request(batch, None), iterations)
+
+
+def bench_warm_dynamodb(iterations: int) -> None:
+    """Warm scenarios against a moto DynamoDB table."""
+    try:
+        import boto3
+        from moto import mock_aws
+    except ImportError:
+        print('warm, DynamoDB sessions: skipped (moto is not installed)')
+        return
+
+    from awslabs.mcp_lambda_handler import MCPLambdaHandler
+    from awslabs.mcp_lambda_handler.session import DynamoDBSessionStore
+
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'testing')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'testing')
+
+    with mock_aws():
+        boto3.resource('dynamodb').create_table(
+            TableName='bench_sessions',
+            KeySchema=[{'AttributeName': 'session_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'session_id', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST',
+        )
+        print(f'warm, DynamoDB sessions on moto ({iterations} requests)')
+        for cache_ttl in (0, 60):
+            mcp = MCPLambdaHandler(
+                'bench',
+                session_store=DynamoDBSessionStore('bench_sessions', cache_ttl=cache_ttl),
+            )
+            register_tools(mcp)
+            response = mcp.handle_request(
+                make_event({'jsonrpc': '2.0', 'id': 1, 'method': 'initialize'}), None
+            )
+            session_id = response['headers']['MCP-Session-Id']
+            call = make_event(tool_call('add', {'a': 1, 'b': 2}), session_id)
+            write = make_event(tool_call('remember', {'key': 'k', 'value': 'v'}), session_id)
+
+            label = f'cache_ttl={cache_ttl}'
+            bench_warm(f'tools/call ({label})', lambda: mcp.handle_request(call, None), iterations)
+            bench_warm(
+                f'session write ({label})', lambda: mcp.handle_request(write, None), iterations
+            )
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--iterations', type=int, default=1000, help='warm requests per case')
+    parser.add_argument('--cold-runs', type=int, default=10, help='fresh processes to start')
+    args = parser.parse_args()
+
+    bench_cold_start(args.cold_runs)
+    bench_warm_noop(args.iterations)
+    bench_warm_dynamodb(max(1, args.iterations // 10))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,11 @@ import json
 import pytest
 import time
 import typing
-from awslabs.mcp_lambda_handler.mcp_lambda_handler import MCPLambdaHandler, SessionData
+from awslabs.mcp_lambda_handler.mcp_lambda_handler import (
+    MCPLambdaHandler,
+    SessionData,
+    current_session_id,
+)
 from awslabs.mcp_lambda_handler.session import DynamoDBSessionStore, NoOpSessionStore
 from awslabs.mcp_lambda_handler.types import (
     Capabilities,
@@ -15,6 +19,7 @@ from awslabs.mcp_lambda_handler.types import (
     ServerInfo,
     TextContent,
 )
+from dataclasses import dataclass
 from typing import Dict, List, Optional
 from unittest.mock import MagicMock, patch
 
@@ -783,3 +788,556 @@ def test_dynamodb_delete_session_exception():
         store = DynamoDBSessionStore('tbl')
         mock_table.delete_item.side_effect = Exception('fail')
         assert store.delete_session('sid') is False
+
+
+def test_handle_request_batch_runs_tool_calls_concurrently():
+    """Test a JSON-RPC batch executes sync and async tool calls concurrently."""
+    import asyncio
+    import threading
+
+    handler = MCPLambdaHandler('test-server')
+    # Both sync tools must be running at the same time for the barrier to release
+    barrier = threading.Barrier(2, timeout=5)
+
+    @handler.tool()
+    def wait_sync(x: int) -> int:
+        """Wait for the other sync tool."""
+        barrier.wait()
+        return x
+
+    @handler.tool()
+    async def wait_async(x: int) -> int:
+        """Sleep asynchronously."""
+        await asyncio.sleep(0)
+        return x * 10
+
+    batch = [
+        {
+            'jsonrpc': '2.0',
+            'id': 1,
+            'method': 'tools/call',
+            'params': {'name': 'waitSync', 'arguments': {'x': 1}},
+        },
+        {'jsonrpc': '2.0', 'method': 'notifications/initialized'},
+        {
+            'jsonrpc': '2.0',
+            'id': 2,
+            'method': 'tools/call',
+            'params': {'name': 'waitAsync', 'arguments': {'x': 2}},
+        },
+        {'jsonrpc': '2.0', 'id': 3, 'method': 'ping'},
+        {
+            'jsonrpc': '2.0',
+            'id': 4,
+            'method': 'tools/call',
+            'params': {'name': 'waitSync', 'arguments': {'x': 4}},
+        },
+        {'id': 5},
+        {'jsonrpc': '2.0', 'id': 6, 'method': 'tools/call', 'params': {'name': 'missing'}},
+        {'jsonrpc': '2.0', 'id': 7, 'method': 'tools/call', 'params': ['waitSync']},
+    ]
+    resp = handler.handle_request(make_lambda_event(json.dumps(batch)), None)
+
+    assert resp['statusCode'] == 200
+    body = json.loads(resp['body'])
+    assert [item['id'] for item in body] == [1, 2, 3, 4, 5, 6, 7]
+    assert body[0]['result']['content'][0]['text'] == '1'
+    assert body[1]['result']['content'][0]['text'] == '20'
+    assert body[2]['result'] == {}
+    assert body[3]['result']['content'][0]['text'] == '4'
+    assert body[4]['error']['code'] == -32600
+    assert body[5]['error']['code'] == -32601
+    assert body[6]['error']['code'] == -32600
+    assert 'params must be an object' in body[6]['error']['message']
+
+
+def test_handle_request_batch_validates_session_once():
+    """Test a JSON-RPC batch looks up its session a single time."""
+    store = MagicMock()
+    store.get_session.return_value = {}
+    handler = MCPLambdaHandler('test-server', session_store=store)
+
+    @handler.tool()
+    def echo(x: int) -> int:
+        """Echo tool."""
+        return x
+
+    batch = [
+        {
+            'jsonrpc': '2.0',
+            'id': i,
+            'method': 'tools/call',
+            'params': {'name': 'echo', 'arguments': {'x': i}},
+        }
+        for i in range(3)
+    ]
+    event = make_lambda_event(json.dumps(batch))
+    event['headers']['mcp-session-id'] = 'sid123'
+    resp = handler.handle_request(event, None)
+
+    store.get_session.assert_called_once_with('sid123')
+    assert resp['headers']['MCP-Session-Id'] == 'sid123'
+    assert [item['result']['content'][0]['text'] for item in json.loads(resp['body'])] == [
+        '0',
+        '1',
+        '2',
+    ]
+
+    # An expired session rejects the whole batch
+    store.get_session.return_value = None
+    resp = handler.handle_request(event, None)
+    assert resp['statusCode'] == 404
+    assert json.loads(resp['body'])['error']['code'] == -32000
+
+
+def test_handle_request_batch_edge_cases():
+    """Test empty, notification-only and initialize batches."""
+    handler = MCPLambdaHandler('test-server')
+
+    resp = handler.handle_request(make_lambda_event('[]'), None)
+    assert resp['statusCode'] == 400
+    assert json.loads(resp['body'])['error']['code'] == -32600
+
+    batch = [{'jsonrpc': '2.0', 'method': 'notifications/initialized'}]
+    resp = handler.handle_request(make_lambda_event(json.dumps(batch)), None)
+    assert resp['statusCode'] == 204
+    assert resp['body'] == ''
+
+    batch = [{'jsonrpc': '2.0', 'id': 1, 'method': 'initialize'}]
+    resp = handler.handle_request(make_lambda_event(json.dumps(batch)), None)
+    assert json.loads(resp['body'])[0]['error']['code'] == -32600
+
+
+def test_handle_request_async_tool():
+    """Test a single tools/call request for a coroutine tool."""
+    handler = MCPLambdaHandler('test-server')
+
+    @handler.tool()
+    async def double(x: int) -> int:
+        """Double a number."""
+        return x * 2
+
+    req = {
+        'jsonrpc': '2.0',
+        'id': 1,
+        'method': 'tools/call',
+        'params': {'name': 'double', 'arguments': {'x': 21}},
+    }
+    resp = handler.handle_request(make_lambda_event(req), None)
+    assert json.loads(resp['body'])['result']['content'][0]['text'] == '42'
+
+
+@pytest.fixture
+def sessions_table(monkeypatch):
+    """Create a moto-backed DynamoDB sessions table."""
+    import boto3
+    from moto import mock_aws
+
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+    with mock_aws():
+        table = boto3.resource('dynamodb').create_table(
+            TableName='sessions',
+            KeySchema=[{'AttributeName': 'session_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'session_id', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST',
+        )
+        yield table
+
+
+def test_dynamodb_session_store_writes_only_changed_keys(sessions_table):
+    """Test updates write changed keys with a version condition."""
+    store = DynamoDBSessionStore('sessions')
+    sid = store.create_session({'keep': 1, 'change': 'a', 'drop': True})
+
+    with patch.object(store.table, 'update_item', wraps=store.table.update_item) as update:
+        assert store.update_session(sid, {'keep': 1, 'change': 'b', 'add': [1]}) is True
+        # Unchanged data does not touch DynamoDB
+        assert store.update_session(sid, {'keep': 1, 'change': 'b', 'add': [1]}) is True
+
+    update.assert_called_once()
+    kwargs = update.call_args.kwargs
+    assert kwargs['ConditionExpression'] == '#version = :expected'
+    assert set(kwargs['ExpressionAttributeNames'].values()) == {
+        'data',
+        'version',
+        'change',
+        'add',
+        'drop',
+    }
+    assert 'keep' not in kwargs['ExpressionAttributeNames'].values()
+
+    item = sessions_table.get_item(Key={'session_id': sid})['Item']
+    assert item['data'] == {'keep': 1, 'change': 'b', 'add': [1]}
+    assert item['version'] == 2
+
+
+def test_dynamodb_session_store_merges_concurrent_updates(sessions_table):
+    """Test a stale writer re-applies its changed keys on top of the latest version."""
+    first = DynamoDBSessionStore('sessions')
+    second = DynamoDBSessionStore('sessions')
+    sid = first.create_session({'a': 1, 'b': 1})
+    assert second.get_session(sid) == {'a': 1, 'b': 1}
+
+    assert first.update_session(sid, {'a': 2, 'b': 1}) is True
+    assert second.update_session(sid, {'a': 1, 'b': 3}) is True
+
+    item = sessions_table.get_item(Key={'session_id': sid})['Item']
+    assert item['data'] == {'a': 2, 'b': 3}
+    assert item['version'] == 3
+    assert second.get_session(sid) == {'a': 2, 'b': 3}
+
+
+def test_dynamodb_session_store_interleaved_updates_in_one_container(sessions_table):
+    """Test overlapping read-modify-writes on one store keep each other's changes."""
+    store = DynamoDBSessionStore('sessions')
+    sid = store.create_session({'x': 0, 'y': 0})
+
+    first_data, first_base = store.checkout_session(sid)
+    second_data, second_base = store.checkout_session(sid)
+    first_data['x'] = 1
+    second_data['y'] = 1
+
+    assert store.commit_session(sid, first_data, first_base) is True
+    assert store.commit_session(sid, second_data, second_base) is True
+
+    item = sessions_table.get_item(Key={'session_id': sid})['Item']
+    assert item['data'] == {'x': 1, 'y': 1}
+    assert item['version'] == 3
+
+
+def test_handler_update_session_merges_overlapping_updates(sessions_table):
+    """Test MCPLambdaHandler.update_session calls that overlap don't lose updates."""
+    handler = MCPLambdaHandler('test', session_store=DynamoDBSessionStore('sessions'))
+    sid = handler.session_store.create_session({'x': 0, 'y': 0})
+    token = current_session_id.set(sid)
+    try:
+
+        def set_x(session):
+            # Another update of the session completes while this one is in progress
+            handler.update_session(lambda inner: inner.set('y', 1))
+            session.set('x', 1)
+
+        assert handler.update_session(set_x) is True
+        assert handler.get_session().raw() == {'x': 1, 'y': 1}
+    finally:
+        current_session_id.reset(token)
+
+
+def test_dynamodb_session_store_cache_ttl(sessions_table):
+    """Test warm reads are served from memory until the cache TTL elapses."""
+    store = DynamoDBSessionStore('sessions', cache_ttl=60)
+    sid = store.create_session({'a': 1})
+
+    with patch.object(store.table, 'get_item', wraps=store.table.get_item) as get_item:
+        data = store.get_session(sid)
+        data['a'] = 2
+        assert store.get_session(sid) == {'a': 1}
+        assert store.update_session(sid, data) is True
+        assert store.get_session(sid) == {'a': 2}
+        get_item.assert_not_called()
+
+        store.cache_ttl = 0
+        assert store.get_session(sid) == {'a': 2}
+        get_item.assert_called_once()
+
+    assert store.delete_session(sid) is True
+    store.cache_ttl = 60
+    assert store.get_session(sid) is None
+
+
+def test_tool_arguments_are_validated_and_coerced():
+    """Test compiled tools coerce nested arguments and reject invalid ones."""
+    from dataclasses import dataclass, field
+    from enum import Enum
+
+    class Size(Enum):
+        SMALL = 'small'
+        LARGE = 'large'
+
+    @dataclass
+    class Item:
+        name: str
+        sizes: List[Size]
+        quantity: int = 1
+        tags: Dict[str, str] = field(default_factory=dict)
+
+    handler = MCPLambdaHandler('test-server')
+    calls = []
+
+    @handler.tool()
+    def order(items: List[Item], note: Optional[str], rush: bool = False) -> str:
+        """Place an order.
+
+        Args:
+            items: Items to order
+            note: Optional note
+            rush: Whether to rush the order
+        """
+        calls.append((items, note, rush))
+        return 'ok'
+
+    schema = handler.tools['order']['inputSchema']
+    assert schema['required'] == ['items', 'note']
+    item_schema = schema['properties']['items']['items']
+    assert item_schema['required'] == ['name', 'sizes']
+    assert item_schema['properties']['sizes']['items']['enum'] == ['small', 'large']
+
+    def call(arguments):
+        req = {
+            'jsonrpc': '2.0',
+            'id': 1,
+            'method': 'tools/call',
+            'params': {'name': 'order', 'arguments': arguments},
+        }
+        return handler.handle_request(make_lambda_event(req), None)
+
+    resp = call({'items': [{'name': 'shirt', 'sizes': ['large'], 'quantity': 2.0}], 'note': None})
+    assert resp['statusCode'] == 200
+    assert calls == [([Item('shirt', [Size.LARGE], 2)], None, False)]
+
+    resp = call({'items': [{'name': 'shirt', 'sizes': ['huge']}], 'note': None})
+    assert resp['statusCode'] == 400
+    error = json.loads(resp['body'])['error']
+    assert error['code'] == -32602
+    assert 'items[0].sizes[0]' in error['message']
+
+    resp = call({'items': [], 'note': 'x', 'colour': 'red'})
+    assert 'Unexpected argument: colour' in json.loads(resp['body'])['error']['message']
+
+    resp = call({'items': []})
+    assert 'Missing required argument(s): note' in json.loads(resp['body'])['error']['message']
+    assert len(calls) == 1
+
+
+def test_tools_list_is_serialized_once():
+    """Test the tools/list result is cached until another tool is registered."""
+    handler = MCPLambdaHandler('test-server')
+
+    @handler.tool()
+    def first(x: int) -> int:
+        """First tool."""
+        return x
+
+    req = {'jsonrpc': '2.0', 'id': 'a', 'method': 'tools/list'}
+    body = json.loads(handler.handle_request(make_lambda_event(req), None)['body'])
+    assert body == {'jsonrpc': '2.0', 'id': 'a', 'result': {'tools': [handler.tools['first']]}}
+
+    cached = handler._tools_list_json
+    handler.handle_request(make_lambda_event(req), None)
+    assert handler._tools_list_json is cached
+
+    @handler.tool()
+    def second(y: str = 'a') -> str:
+        """Second tool."""
+        return y
+
+    body = json.loads(handler.handle_request(make_lambda_event(req), None)['body'])
+    assert [tool['name'] for tool in body['result']['tools']] == ['first', 'second']
+    assert body['result']['tools'][1]['inputSchema']['required'] == []
+
+
+def test_async_tools_reuse_event_loop():
+    """Test coroutine tools run on one event loop kept across invocations."""
+    import asyncio
+
+    handler = MCPLambdaHandler('test-server')
+    loops = []
+
+    @handler.tool()
+    async def which_loop() -> str:
+        """Record the running loop."""
+        loops.append(asyncio.get_running_loop())
+        return 'ok'
+
+    req = {
+        'jsonrpc': '2.0',
+        'id': 1,
+        'method': 'tools/call',
+        'params': {'name': 'whichLoop', 'arguments': {}},
+    }
+    for _ in range(2):
+        handler.handle_request(make_lambda_event(req), None)
+    handler.handle_request(make_lambda_event(json.dumps([req])), None)
+
+    assert len(loops) == 3
+    assert loops[0] is loops[1] is loops[2]
+    assert not loops[0].is_closed()
+
+
+def test_handle_streaming_request_streams_progress():
+    """Test streamed tool calls emit increasing progress notifications before the result."""
+    handler = MCPLambdaHandler('test-server')
+
+    @handler.tool()
+    def count(n: int):
+        """Count to n, reporting each chunk automatically."""
+        for i in range(1, n + 1):
+            yield i
+
+    @handler.tool()
+    def steps(n: int):
+        """Report progress explicitly, including a value that goes backwards."""
+        for step in range(1, n + 1):
+            handler.report_progress(step, total=n, message=f'step {step}')
+            yield step
+        assert handler.report_progress(1) is False
+
+    def stream(name):
+        req = {
+            'jsonrpc': '2.0',
+            'id': 7,
+            'method': 'tools/call',
+            'params': {'_meta': {'progressToken': 'tok'}, 'name': name, 'arguments': {'n': 2}},
+        }
+        resp = handler.handle_streaming_request(make_lambda_event(req), None)
+        assert resp['headers']['Content-Type'] == 'text/event-stream'
+        events = list(resp['body'])
+        assert all(e.startswith('event: message\ndata: ') and e.endswith('\n\n') for e in events)
+        return [json.loads(e[len('event: message\ndata: ') :]) for e in events]
+
+    messages = stream('count')
+    assert [m['params'] for m in messages[:2]] == [
+        {'progressToken': 'tok', 'progress': 1, 'message': '1'},
+        {'progressToken': 'tok', 'progress': 2, 'message': '2'},
+    ]
+    assert messages[2]['id'] == 7
+    assert [c['text'] for c in messages[2]['result']['content']] == ['1', '2']
+
+    # Explicit progress replaces the automatic per-chunk notifications
+    messages = stream('steps')
+    assert [m['params'] for m in messages[:2]] == [
+        {'progressToken': 'tok', 'progress': 1, 'total': 2, 'message': 'step 1'},
+        {'progressToken': 'tok', 'progress': 2, 'total': 2, 'message': 'step 2'},
+    ]
+    assert [c['text'] for c in messages[2]['result']['content']] == ['1', '2']
+
+    # Outside a streamed call, progress is not reported and chunks are still collected
+    assert handler.report_progress(1) is False
+    req = {
+        'jsonrpc': '2.0',
+        'id': 1,
+        'method': 'tools/call',
+        'params': {'name': 'count', 'arguments': {'n': 2}},
+    }
+    body = json.loads(handler.handle_request(make_lambda_event(req), None)['body'])
+    assert [c['text'] for c in body['result']['content']] == ['1', '2']
+
+
+def test_handle_streaming_request_falls_back_to_json():
+    """Test requests that cannot be streamed get a single JSON chunk."""
+    handler = MCPLambdaHandler('test-server')
+    req = {'jsonrpc': '2.0', 'id': 1, 'method': 'ping'}
+    resp = handler.handle_streaming_request(make_lambda_event(req), None)
+    assert resp['headers']['Content-Type'] == 'application/json'
+    assert [json.loads(chunk)['result'] for chunk in resp['body']] == [{}]
+
+    event = make_lambda_event(
+        {'jsonrpc': '2.0', 'id': 2, 'method': 'tools/call', 'params': {'name': 'missing'}}
+    )
+    event['headers']['accept'] = 'application/json'
+    resp = handler.handle_streaming_request(event, None)
+    assert resp['statusCode'] == 404
+    assert json.loads(next(resp['body']))['error']['code'] == -32601
+
+
+def test_import_does_not_load_boto3_or_asyncio():
+    """Test the package import stays free of boto3 and asyncio for fast cold starts."""
+    import subprocess
+    import sys
+
+    code = (
+        'import sys, awslabs.mcp_lambda_handler.mcp_lambda_handler;'
+        'print(sorted(m for m in ("boto3", "botocore", "asyncio") if m in sys.modules))'
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == '[]'
+
+
+def test_dynamodb_session_store_creates_resource_lazily():
+    """Test DynamoDBSessionStore only creates the DynamoDB resource on first use."""
+    with patch('boto3.resource') as mock_resource:
+        store = DynamoDBSessionStore('tbl')
+        mock_resource.assert_not_called()
+
+        store.get_session('sid')
+        store.get_session('sid')
+        mock_resource.assert_called_once_with('dynamodb')
+        assert store.dynamodb is mock_resource.return_value
+
+
+@dataclass
+class Node:
+    """Tree node used to test self-referencing tool parameters."""
+
+    name: str
+    children: List['Node']
+
+
+def test_tool_schema_recursive_dataclass():
+    """Test self-referencing dataclasses compile to a $defs reference."""
+    handler = MCPLambdaHandler('test-server')
+    seen = []
+
+    @handler.tool()
+    def walk(tree: Node, other: Optional[Node] = None) -> int:
+        """Walk a tree."""
+        seen.append(tree)
+        return len(tree.children)
+
+    schema = handler.tools['walk']['inputSchema']
+    assert schema['properties']['tree'] == {'$ref': '#/$defs/Node'}
+    assert schema['properties']['other'] == {'$ref': '#/$defs/Node'}
+    assert schema['$defs']['Node']['properties']['children']['items'] == {'$ref': '#/$defs/Node'}
+
+    req = {
+        'jsonrpc': '2.0',
+        'id': 1,
+        'method': 'tools/call',
+        'params': {
+            'name': 'walk',
+            'arguments': {'tree': {'name': 'a', 'children': [{'name': 'b', 'children': []}]}},
+        },
+    }
+    body = json.loads(handler.handle_request(make_lambda_event(req), None)['body'])
+    assert body['result']['content'][0]['text'] == '1'
+    assert seen[0].children[0] == Node('b', [])
+
+
+def test_tool_schema_pydantic_model_defs():
+    """Test nested pydantic model definitions are published on the input schema."""
+    pydantic = pytest.importorskip('pydantic')
+
+    class Address(pydantic.BaseModel):
+        city: str
+
+    class Person(pydantic.BaseModel):
+        name: str
+        address: Address
+
+    handler = MCPLambdaHandler('test-server')
+
+    @handler.tool()
+    def greet(person: Person) -> str:
+        """Greet a person."""
+        return f'{person.name} from {person.address.city}'
+
+    schema = handler.tools['greet']['inputSchema']
+    assert schema['properties']['person']['properties']['address'] == {'$ref': '#/$defs/Address'}
+    assert '$defs' not in schema['properties']['person']
+    assert schema['$defs']['Address']['properties']['city']['type'] == 'string'
+
+    req = {
+        'jsonrpc': '2.0',
+        'id': 1,
+        'method': 'tools/call',
+        'params': {
+            'name': 'greet',
+            'arguments': {'person': {'name': 'Ana', 'address': {'city': 'Lima'}}},
+        },
+    }
+    body = json.loads(handler.handle_request(make_lambda_event(req), None)['body'])
+    assert body['result']['content'][0]['text'] == 'Ana from Lima'